@@ -30,6 +30,7 @@
 #  and OutputTruth passes on the calculated truth value to the output
 #  and EternalOutput specifies whether the output Narsese tasks should be eternal
  
+import os
 import re
 import sys
 import time
@@ -39,13 +40,12 @@ from nltk import sent_tokenize, word_tokenize
 from nltk.corpus import stopwords
 from nltk import WordNetLemmatizer
 from nltk.corpus import wordnet
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "misc", "Python"))
+from nltk_resources import ensure_nltk_resources
 
 quiet = "quiet" in sys.argv
-nltk.download('punkt', quiet=quiet)
-nltk.download('averaged_perceptron_tagger', quiet=quiet)
-nltk.download('universal_tagset', quiet=quiet)
-nltk.download('wordnet', quiet=quiet)
-nltk.download('omw-1.4', quiet=quiet)
+#download the NLTK data only if it isn't found locally, so that no network attempt is made once it is installed
+ensure_nltk_resources(quiet=quiet)
 
 SyntacticalTransformations = [
     #types of tuples of words with optional members
@@ -82,6 +82,8 @@ StatementRepresentRelations = [
     (r" ADJ_NOUN_([0-9]*) ADV_VERB_([0-9]*) ", r" < ADJ_NOUN_\1 --> [ ADV_VERB_\2 ] > ", (1.0, 0.99), 0), #SV
 ]
 
+lemma = WordNetLemmatizer()
+
 #convert universal tag set to the wordnet word types
 def wordnet_tag(tag):
     if tag == "ADJ":
@@ -100,7 +102,6 @@ def sentence_and_types(text):
     tokens = [word for word in word_tokenize(text)]
     wordtypes_ordered = nltk.pos_tag(tokens, tagset='universal')
     wordtypes = dict(wordtypes_ordered)
-    lemma = WordNetLemmatizer()
     #NamedEntities = {key:value for (key,value) in [(x.lower(),x) for x in tokens]}
     handleInstance = lambda word: "{"+word+"}" if word[0].isupper() else word
     tokens = [handleInstance(lemma.lemmatize(word, pos = wordnet_tag(wordtypes[word]))) for word in tokens]
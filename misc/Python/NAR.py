@@ -1,8 +1,12 @@
 import os
 import sys
-import ast
 import signal
+import threading
 import subprocess
+from nar_protocol import (parseTruth, parseTaskSplit, TASK_PATTERN, parseTask, parseReason, parseExecution,
+                          BATCH_SENTINEL, BATCH_SENTINEL_ECHO, PRODUCT_EXPECTED, StdinOperationNARs, TrackStdinOperations,
+                          OUTPUT_CATEGORIES, OUTPUT_DEFAULTS, JSONL_PREFIX, JSONL_CATEGORIES, parseJSONTask, parseJSONLine,
+                          classifyLine, parseLine, NAROutput, ParseOutput, ParseStats)
 
 def spawnNAR():
     return subprocess.Popen(["./../../NAR", "shell"], stdin=subprocess.PIPE, stdout=subprocess.PIPE, universal_newlines=True)
@@ -15,46 +19,6 @@ def setNAR(proc):
 def terminateNAR(usedNAR=NARproc):
     os.killpg(os.getpgid(usedNAR.pid), signal.SIGTERM)
 
-def parseTruth(T):
-    return {"frequency": T.split("frequency=")[1].split(" confidence")[0].replace(",",""), "confidence": T.split(" confidence=")[1].split(" dt=")[0].split(" occurrenceTime=")[0]}
-
-def parseTask(s):
-    M = {"occurrenceTime" : "eternal"}
-    if " :|:" in s:
-        M["occurrenceTime"] = "now"
-        s = s.replace(" :|:","")
-        if "occurrenceTime" in s:
-            M["occurrenceTime"] = s.split("occurrenceTime=")[1].split(" ")[0]
-    if "Stamp" in s:
-        M["Stamp"] = ast.literal_eval(s.split("Stamp=")[1].split("]")[0]+"]")
-    sentence = s.split(" occurrenceTime=")[0] if " occurrenceTime=" in s else s.split(" Stamp=")[0].split(" Priority=")[0].split(" creationTime=")[0]
-    M["punctuation"] = sentence[-4] if ":|:" in sentence else sentence[-1]
-    M["term"] = sentence.split(" creationTime")[0].split(" occurrenceTime")[0].split(" Truth")[0].split(" Stamp=")[0][:-1]
-    if "Truth" in s:
-        M["truth"] = parseTruth(s.split("Truth: ")[1])
-    if "Priority" in s:
-        M["Priority"] = s.split("Priority=")[1].split(" ")[0]
-    return M
-
-def parseReason(sraw):
-    if "implication: " not in sraw:
-        return None
-    Implication = parseTask(sraw.split("implication: ")[-1].split("precondition: ")[0]) #last reason only (others couldn't be associated currently)
-    Precondition = parseTask(sraw.split("precondition: ")[-1].split("\n")[0])
-    Implication["occurrenceTime"] = "eternal"
-    Precondition["punctuation"] = Implication["punctuation"] = "."
-    Reason = {}
-    Reason["desire"] = sraw.split("decision expectation=")[-1].split(" ")[0]
-    Reason["hypothesis"] = Implication
-    Reason["precondition"] = Precondition
-    return Reason
-    
-def parseExecution(e):
-    if "args " not in e:
-        return {"operator" : e.split(" ")[0], "arguments" : []}
-    opname = e.split(" ")[0]
-    return {"operator": opname, "arguments": e.split("args ")[1].split("{SELF} * ")[1][:-1], 'metta': '(^ ' + opname[1:] + ')'}
-
 def GetRawOutput(usedNAR):
     usedNAR.stdin.write("0\n")
     usedNAR.stdin.flush()
@@ -64,33 +28,93 @@ def GetRawOutput(usedNAR):
     while "done with 0 additional inference steps." != ret.strip():
         if ret != "":
             before.append(ret.strip())
-        if ret.strip() == "//Operation result product expected:":
+        if ret.strip() == PRODUCT_EXPECTED:
             requestOutputArgs = True
             break
         ret = usedNAR.stdout.readline()
+        if ret == "":
+            raise EOFError("NAR process exited")
     return before[:-1], requestOutputArgs
 
-def GetOutput(usedNAR):
+def WriteAll(usedNAR, payload):
+    usedNAR.stdin.write(payload)
+    usedNAR.stdin.flush()
+
+def GetRawOutputs(usedNAR, amount):
+    #reads the output of a batch of amount statements, each followed by a sentinel comment, terminated by a single "0" step
+    chunks = [[]]
+    requestsOutputArgs = [False]
+    seen = 0
+    while True:
+        ret = usedNAR.stdout.readline()
+        if ret == "":
+            raise EOFError("NAR process exited")
+        l = ret.strip()
+        if l.startswith(BATCH_SENTINEL_ECHO):
+            seen += 1
+            chunks.append([])
+            requestsOutputArgs.append(False)
+            continue
+        if seen >= amount and l == "done with 0 additional inference steps.":
+            break
+        if l == PRODUCT_EXPECTED:
+            #NARS reads the next line as the product, so the rest of the batch is not read, as GetRawOutput stops here too
+            requestsOutputArgs[-1] = True
+            break
+        if l != "":
+            chunks[-1].append(l)
+    return chunks[:amount], requestsOutputArgs[:amount]
+
+def GetOutput(usedNAR, categories=None):
     lines, requestOutputArgs = GetRawOutput(usedNAR)
-    executions = [parseExecution(l) for l in lines if l.startswith('^')]
-    inputs = [parseTask(l.split("Input: ")[1]) for l in lines if l.startswith('Input:')]
-    derivations = [parseTask(l.split("Derived: " if l.startswith('Derived:') else "Revised: ")[1]) for l in lines if l.startswith('Derived:') or l.startswith('Revised:')]
-    answers = [parseTask(l.split("Answer: ")[1]) for l in lines if l.startswith('Answer:')]
-    selections = [parseTask(l.split("Selected: ")[1]) for l in lines if l.startswith('Selected:')]
-    reason = parseReason("\n".join(lines))
-    return {"input": inputs, "derivations": derivations, "answers": answers, "executions": executions, "reason": reason, "selections": selections, "raw": "\n".join(lines), "requestOutputArgs" : requestOutputArgs}
+    return ParseOutput(lines, requestOutputArgs, categories)
+
+def StreamOutput(narsese, usedNAR=NARproc, categories=None):
+    #yields (category, parsed) events while NARS prints them, stopping early still drains the rest of the run to keep the pipe in sync
+    #an operation expecting its product on stdin ends the stream with a ("requestOutputArgs", True) event, the product is the next input
+    stdinOperations = TrackStdinOperations([narsese], usedNAR)
+    #with stdin operations the "0" has to follow the statement directly, as it is read as the synch of a product request
+    usedNAR.stdin.write(narsese + "\n" + ("0\n" if stdinOperations else BATCH_SENTINEL + "0\n0\n"))
+    usedNAR.stdin.flush()
+    sentinelSeen = stdinOperations
+    finished = False
+    try:
+        while True:
+            ret = usedNAR.stdout.readline()
+            if ret == "":
+                finished = True
+                return
+            l = ret.strip()
+            if l == PRODUCT_EXPECTED:
+                finished = True
+                yield "requestOutputArgs", True
+                return
+            if l.startswith(BATCH_SENTINEL_ECHO):
+                sentinelSeen = True
+                break
+            if sentinelSeen and l == "done with 0 additional inference steps.":
+                finished = True
+                return
+            category, l = classifyLine(l)
+            if category is not None and (categories is None or category in categories):
+                yield category, parseLine(category, l)
+    finally:
+        while not finished:
+            ret = usedNAR.stdout.readline()
+            if ret == "":
+                break
+            l = ret.strip()
+            if l.startswith(BATCH_SENTINEL_ECHO):
+                sentinelSeen = True
+            elif l == PRODUCT_EXPECTED or (sentinelSeen and l == "done with 0 additional inference steps."):
+                break
 
 def GetStats(usedNAR):
-    Stats = {}
     lines, _ = GetRawOutput(usedNAR)
-    for l in lines:
-        if ":" in l:
-            leftside = l.split(":")[0].replace(" ", "_").strip()
-            rightside = float(l.split(":")[1].strip())
-            Stats[leftside] = rightside
-    return Stats
+    return ParseStats(lines)
 
-def AddInput(narsese, Print=True, usedNAR=NARproc):
+def AddInput(narsese, Print=True, usedNAR=NARproc, categories=None):
+    TrackStdinOperations([narsese], usedNAR)
     usedNAR.stdin.write(narsese + '\n')
     usedNAR.stdin.flush()
     ReturnStats = narsese == "*stats"
@@ -98,12 +122,41 @@ def AddInput(narsese, Print=True, usedNAR=NARproc):
         if Print:
             print("\n".join(GetRawOutput(usedNAR)[0]))
         return GetStats(usedNAR)
-    ret = GetOutput(usedNAR)
+    if Print and categories is not None:
+        categories = set(categories) | {"raw"}
+    ret = GetOutput(usedNAR, categories)
     if Print:
         print(ret["raw"])
         sys.stdout.flush()
     return ret
 
+def AddInputs(narseses, Print=True, usedNAR=NARproc, categories=None):
+    #one buffered write and a single "0" round trip for the whole batch, the output is split back per statement by sentinel comments
+    if len(narseses) == 0:
+        return []
+    if TrackStdinOperations(narseses, usedNAR):
+        #the sentinels written ahead would be read as the product, so the statements are input one by one and the batch stops at the first one expecting a product
+        rets = []
+        for narsese in narseses:
+            rets.append(AddInput(narsese, Print, usedNAR, categories))
+            if rets[-1].get("requestOutputArgs"):
+                break
+        return rets
+    payload = "".join(narsese + "\n" + BATCH_SENTINEL + str(i) + "\n" for i, narsese in enumerate(narseses)) + "0\n"
+    writer = threading.Thread(target=WriteAll, args=(usedNAR, payload), daemon=True) #writing while reading avoids a pipe deadlock on big batches
+    writer.start()
+    chunks, requestsOutputArgs = GetRawOutputs(usedNAR, len(narseses))
+    writer.join()
+    if Print and categories is not None:
+        categories = set(categories) | {"raw"}
+    rets = [ParseOutput(lines, requestOutputArgs, categories) for (lines, requestOutputArgs) in zip(chunks, requestsOutputArgs)]
+    if Print:
+        for ret in rets:
+            if ret["raw"]:
+                print(ret["raw"])
+        sys.stdout.flush()
+    return rets
+
 def Exit(usedNAR=NARproc):
     usedNAR.sendline("quit")
 
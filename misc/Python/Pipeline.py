@@ -5,10 +5,16 @@ Core pipeline for NARS-Ollama system
 import traceback
 import re
 import os
-from typing import List, Optional
+from collections import deque
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Callable
 
 from nars_client import NarsClient
+from truth_translator import DEFAULT_CONTEXT_TOKENS
 from llm_client import LlmClient
+from llm_backends import LlmBackend
+from fact_cache import FactCache
 from english_to_narsese_modular import EnglishToNarsese
 
 class NarsOllamaPipeline:
@@ -19,7 +25,14 @@ class NarsOllamaPipeline:
         model_name: str = "llama3.2", 
         fact_model: str = None,
         verbose: bool = False,
-        init_nars: bool = True
+        init_nars: bool = True,
+        context_tokens: Optional[int] = DEFAULT_CONTEXT_TOKENS,
+        fact_cache: Optional[str] = None,
+        extraction_workers: int = 1,
+        extraction_batch_size: int = 1,
+        llm_backend: Optional[Callable[[str], LlmBackend]] = None,
+        translation_cache: Optional[str] = None,
+        conversion_processes: Optional[int] = None
     ):
         """Initialize the pipeline.
         
@@ -28,16 +41,30 @@ class NarsOllamaPipeline:
             fact_model: Name of the Ollama model to use for fact extraction (optional)
             verbose: Whether to print verbose output
             init_nars: Whether to initialize NARS with default knowledge
+            context_tokens: Token budget of the NARS knowledge passed to the LLM, unlimited if None
+            fact_cache: Path of the persistent fact extraction cache, no caching if None
+            extraction_workers: Number of concurrent fact extractions when processing files
+            extraction_batch_size: Number of sentences per fact extraction request when processing files
+            llm_backend: Function creating the LLM backend of a model name (defaults to Ollama)
+            translation_cache: Path the English to Narsese translations are persisted to, not persisted if None
+            conversion_processes: Number of processes converting English to Narsese when ingesting files, all cores if None
         """
         self.verbose = verbose
+        self.extraction_workers = extraction_workers
+        self.extraction_batch_size = extraction_batch_size
+        self.conversion_processes = conversion_processes
+        self.context_tokens = context_tokens
         
         # Initialize components
         self.nars_client = NarsClient(verbose=verbose)
-        self.llm_client = LlmClient(model_name=model_name, fact_model=fact_model, verbose=verbose)
+        self.llm_client = LlmClient(model_name=model_name, fact_model=fact_model, verbose=verbose,
+                                    fact_cache=FactCache(fact_cache) if fact_cache else None,
+                                    backend=llm_backend)
         self.converter = EnglishToNarsese(
             verbose=False,
             output_truth=True,
-            eternal_output=False
+            eternal_output=False,
+            cache_path=translation_cache
         )
         
         # Reset and initialize NARS if requested
@@ -97,11 +124,36 @@ class NarsOllamaPipeline:
             return None
         
 
-    def process_input(self, user_input: str) -> str:
+    def convert_batch_to_narsese(self, texts: List[str]) -> List[Optional[str]]:
+        """Convert several English texts to Narsese, POS-tagging them in one batch.
+        
+        Args:
+            texts: English texts to convert
+            
+        Returns:
+            Narsese representation per text, None where conversion failed
+        """
+        batch = [i for i, text in enumerate(texts)
+                 if text and text.strip() != "" and not (text.startswith("(") or text.startswith("["))]
+        converted = {}
+        try:
+            converted = dict(zip(batch, self.converter.process_batch([texts[i] for i in batch])))
+            if self.verbose:
+                for i in batch:
+                    print(f"Converted '{texts[i]}' to: '{converted[i]}'")
+        except Exception as e:
+            if self.verbose:
+                print(f"Error converting batch to Narsese, converting one by one: {e}")
+                traceback.print_exc()
+        
+        return [converted[i] if i in converted else self.convert_to_narsese(text) for i, text in enumerate(texts)]
+        
+    def process_input(self, user_input: str, on_token: Optional[Callable[[str], None]] = None) -> str:
         """Process user input through the complete pipeline.
 
         Args:
             user_input: User input text
+            on_token: Optional callback receiving the response text as it is generated
             
         Returns:
             Generated response
@@ -143,7 +195,7 @@ class NarsOllamaPipeline:
                             print(f"Simple: '{statement}' → Narsese: '{narsese}'")
                         
                         # Add the Narsese statement to NARS
-                        self.nars_client.add_input(narsese)
+                        self.nars_client.add_input(narsese, categories=())
                         
                         # Run inference cycles after each fact
                         # self.nars_client.run_cycles(300)
@@ -155,23 +207,27 @@ class NarsOllamaPipeline:
                     print("\n=== SKIPPING FACT EXTRACTION (QUESTION DETECTED) ===")
             
             # Process the original input if it's a question
+            question_narsese = None
             if is_question:
                 # Try to convert the question directly
                 question_narsese = self.convert_to_narsese(user_input.strip())
                 if question_narsese:
                     if self.verbose:
                         print(f"Question → Narsese: '{question_narsese}'")
-                    self.nars_client.add_input(question_narsese)
+                    self.nars_client.add_input(question_narsese, categories=())
                     # self.nars_client.run_cycles(300)
             
             # Stage 3: Extract NARS knowledge
-            nars_knowledge = self.nars_client.extract_knowledge()
+            query = user_input
+            if isinstance(question_narsese, str):
+                query += " " + question_narsese
+            nars_knowledge = self.nars_client.extract_knowledge(query, token_budget=self.context_tokens)
             
             # Stage 4: Generate response based on NARS knowledge
             if self.verbose:
                 print("\n=== GENERATING RESPONSE ===")
                 
-            response = self.llm_client.generate_response(user_input, nars_knowledge)
+            response = self.llm_client.generate_response(user_input, nars_knowledge, on_token=on_token)
             
             if self.verbose:
                 print("\n=== FINAL RESPONSE ===")
@@ -185,7 +241,7 @@ class NarsOllamaPipeline:
                 traceback.print_exc()
             return error_msg
     
-    def process_input_without_response(self, user_input: str) -> None:
+    def process_input_without_response(self, user_input: str, simple_statements: Optional[List[str]] = None) -> None:
         """Process user input through the pipeline without generating a response.
         
         This method extracts facts, converts them to Narsese, and adds them to NARS,
@@ -193,6 +249,7 @@ class NarsOllamaPipeline:
 
         Args:
             user_input: User input text
+            simple_statements: Facts already extracted from the input, extracted here if None
         """
         if self.verbose:
             print("\n=== PROCESSING USER INPUT (NO RESPONSE GENERATION) ===")
@@ -200,7 +257,8 @@ class NarsOllamaPipeline:
 
         try:
             # Stage 1: Extract simple statements using LLM
-            simple_statements = self.llm_client.extract_facts(user_input)
+            if simple_statements is None:
+                simple_statements = self.llm_client.extract_facts(user_input)
             
             if self.verbose:
                 print("\n=== EXTRACTED SIMPLE STATEMENTS ===")
@@ -211,27 +269,25 @@ class NarsOllamaPipeline:
             if self.verbose:
                 print("\n=== ADDING FACTS TO NARS ===")
             
-            # Process and add each simple statement
-            for statement in simple_statements:
-                if not statement.strip():  # Skip empty statements
-                    continue
-                    
-                # Convert the simple statement to Narsese
-                narsese = self.convert_to_narsese(statement.strip())
-                
+            # Convert the simple statements in one batch, then add them to NARS in one batch
+            statements = [statement.strip() for statement in simple_statements if statement.strip()]  # Skip empty statements
+            batch = []
+            for statement, narsese in zip(statements, self.convert_batch_to_narsese(statements)):
                 if narsese:
                     if self.verbose:
                         print(f"Simple: '{statement}' → Narsese: '{narsese}'")
                     
                     # Add the Narsese statement to NARS
-                    self.nars_client.add_input(narsese)
+                    batch.append(narsese)
                     
                     # Run inference cycles after each fact
-                    self.nars_client.run_cycles(3)
+                    batch.append("3")
                 else:
                     if self.verbose:
                         print(f"Failed to convert: '{statement}'")
             
+            self.nars_client.add_inputs(batch, categories=())
+            
             # Process the original input if it's a question
             if "?" in user_input:
                 # Try to convert the question directly
@@ -239,7 +295,7 @@ class NarsOllamaPipeline:
                 if question_narsese:
                     if self.verbose:
                         print(f"Question → Narsese: '{question_narsese}'")
-                    self.nars_client.add_input(question_narsese)
+                    self.nars_client.add_input(question_narsese, categories=())
                     # self.nars_client.run_cycles(300)
             
             if self.verbose:
@@ -274,12 +330,32 @@ class NarsOllamaPipeline:
         
         return sentences
     
-    def process_file(self, file_path: str) -> None:
+    def _extract_facts_batch(self, sentences: List[str]) -> List[List[str]]:
+        """Extract the facts of consecutive sentences, in one request if there are several."""
+        if len(sentences) == 1:
+            return [self.llm_client.extract_facts(sentences[0])]
+        return self.llm_client.extract_facts_batch(sentences)
+    
+    def process_file(self, file_path: str, workers: Optional[int] = None, batch_size: Optional[int] = None) -> None:
         """Process a text file sentence-by-sentence through the pipeline without generating responses.
         
+        With several workers, the facts of the upcoming sentences are
+        extracted by the LLM in a thread pool while NARS ingests the current
+        one. Facts are still added to NARS in sentence order, so the
+        resulting knowledge does not depend on the number of workers. Ollama
+        only serves the requests in parallel up to its OLLAMA_NUM_PARALLEL.
+        
+        With a batch size above one, the facts of that many consecutive
+        sentences are extracted in a single request, which saves processing
+        the fact extraction prompt for every sentence.
+        
         Args:
             file_path: Path to the text file to process
+            workers: Number of concurrent fact extractions (defaults to extraction_workers)
+            batch_size: Number of sentences per extraction request (defaults to extraction_batch_size)
         """
+        workers = workers or self.extraction_workers
+        batch_size = batch_size or self.extraction_batch_size
         try:
             if not os.path.exists(file_path):
                 print(f"Error: File not found: {file_path}")
@@ -296,17 +372,33 @@ class NarsOllamaPipeline:
             print(f"Processing file: {file_path}")
             print(f"Found {total_sentences} sentences to process")
             
-            # Process each sentence individually
-            for i, sentence in enumerate(sentences, 1):
-                if self.verbose:
-                    print(f"\n=== Processing sentence {i}/{total_sentences} ===")
-                    print(f"Sentence: {sentence}")
-                else:
-                    # Show progress without being verbose
-                    print(f"Processing sentence {i}/{total_sentences}...", end='\r')
+            batches = [sentences[start:start + batch_size] for start in range(0, total_sentences, batch_size)]
+            
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # extractions run at most workers batches ahead of the ingestion
+                pending = deque()
+                upcoming = iter(batches)
+                for batch in islice(upcoming, workers):
+                    pending.append(executor.submit(self._extract_facts_batch, batch))
                 
-                # Process this sentence without generating a response
-                self.process_input_without_response(sentence)
+                i = 0
+                for batch in batches:
+                    batch_statements = pending.popleft().result()
+                    for next_batch in islice(upcoming, 1):
+                        pending.append(executor.submit(self._extract_facts_batch, next_batch))
+                    
+                    # Process each sentence individually
+                    for sentence, simple_statements in zip(batch, batch_statements):
+                        i += 1
+                        if self.verbose:
+                            print(f"\n=== Processing sentence {i}/{total_sentences} ===")
+                            print(f"Sentence: {sentence}")
+                        else:
+                            # Show progress without being verbose
+                            print(f"Processing sentence {i}/{total_sentences}...", end='\r')
+                        
+                        # Process this sentence without generating a response
+                        self.process_input_without_response(sentence, simple_statements)
             
             print("\n" + "=" * 50)
             print(f"Successfully processed {total_sentences} sentences from: {file_path}")
@@ -316,4 +408,50 @@ class NarsOllamaPipeline:
             error_msg = f"Error processing file {file_path}: {e}"
             print(error_msg)
             if self.verbose:
-                traceback.print_exc()
\ No newline at end of file
+                traceback.print_exc()
+    
+    def ingest_file(self, file_path: str, processes: Optional[int] = None, batch_size: int = 100) -> None:
+        """Convert a text file sentence-by-sentence to Narsese and add it to NARS, without LLM fact extraction.
+        
+        The sentences are converted in a pool of worker processes, since the
+        conversion is CPU bound, and added to NARS in their original order
+        while the workers convert the following ones.
+        
+        Args:
+            file_path: Path to the text file to ingest
+            processes: Number of conversion processes (defaults to conversion_processes, all cores if None)
+            batch_size: Number of converted sentences added to NARS at once
+        """
+        processes = processes or self.conversion_processes
+        try:
+            if not os.path.exists(file_path):
+                print(f"Error: File not found: {file_path}")
+                return
+            
+            with open(file_path, 'r', encoding='utf-8') as file:
+                sentences = self.split_into_sentences(file.read())
+            
+            total_sentences = len(sentences)
+            print(f"Ingesting file: {file_path}")
+            print(f"Found {total_sentences} sentences to convert")
+            
+            batch = []
+            for i, narsese in enumerate(self.converter.process_parallel(sentences, processes), 1):
+                if narsese:
+                    batch.append(narsese)
+                    # Run inference cycles after each fact
+                    batch.append("3")
+                if i % batch_size == 0 or i == total_sentences:
+                    self.nars_client.add_inputs(batch, categories=())
+                    batch = []
+                    print(f"Ingested sentence {i}/{total_sentences}...", end='\r')
+            
+            print("\n" + "=" * 50)
+            print(f"Successfully ingested {total_sentences} sentences from: {file_path}")
+            print("=" * 50)
+            
+        except Exception as e:
+            error_msg = f"Error ingesting file {file_path}: {e}"
+            print(error_msg)
+            if self.verbose:
+                traceback.print_exc()
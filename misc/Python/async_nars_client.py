@@ -0,0 +1,311 @@
+"""
+asyncio interface to the NARS system
+"""
+
+import asyncio
+from typing import Dict, Any, List, Iterable, Optional, AsyncIterator, Generator, Tuple, Union, Callable
+
+from nar_protocol import (ParseOutput, ParseStats, classifyLine, parseLine, TrackStdinOperations, BATCH_SENTINEL,
+                          BATCH_SENTINEL_ECHO, PRODUCT_EXPECTED)
+from nars_client_base import NarsClientBase, NarRequest
+from truth_translator import DEFAULT_CONTEXT_TOKENS
+
+class AsyncNarClient(NarsClientBase):
+    """Coroutine-based client owning its own NAR shell process."""
+
+    def __init__(self, verbose: bool = False, nar_path: str = "./../../NAR", resync_timeout: float = 10.0):
+        """Initialize the async NARS client, call start() before use.
+
+        Args:
+            verbose: Whether to print verbose output
+            nar_path: Path to the NAR executable
+            resync_timeout: Seconds to wait for the rest of a cancelled exchange before restarting NAR
+        """
+        super().__init__(verbose)
+        self.nar_path = nar_path
+        self.resync_timeout = resync_timeout
+        self.proc = None
+        self.lock = asyncio.Lock()
+        # False while an exchange is in progress, an exchange cancelled midway leaves unread output in the pipe
+        self.in_sync = True
+        self.resyncs = 0
+
+    async def start(self) -> "AsyncNarClient":
+        """Spawn the NAR shell process and configure it."""
+        await self._spawn()
+        return self
+
+    async def _spawn(self) -> None:
+        self.proc = await asyncio.create_subprocess_exec(
+            self.nar_path, "shell",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE
+        )
+        await self._write("*volume=100\n0\n")
+        await self._read_single()
+        self.in_sync = True
+
+    async def close(self) -> None:
+        """Terminate the NAR shell process."""
+        if self.proc is not None and self.proc.returncode is None:
+            self.proc.stdin.close()
+            self.proc.kill()
+            await self.proc.wait()
+        self.proc = None
+
+    async def _resync(self) -> None:
+        """Read the rest of a cancelled exchange up to a new sentinel, restarting NAR if that fails."""
+        self.resyncs += 1
+        echo = f"{BATCH_SENTINEL_ECHO}resync-{self.resyncs}"
+
+        async def drain():
+            sentinel_seen = False
+            while True:
+                ret = await self.proc.stdout.readline()
+                if not ret:
+                    raise EOFError("NAR exited")
+                l = ret.decode().strip()
+                if l == echo:
+                    sentinel_seen = True
+                elif sentinel_seen and l == "done with 0 additional inference steps.":
+                    return
+
+        try:
+            # NAR may be blocked on the unread output, so the sentinel is written while reading
+            await asyncio.wait_for(asyncio.gather(self._write(f"{BATCH_SENTINEL}resync-{self.resyncs}\n0\n"), drain()),
+                                   self.resync_timeout)
+            self.in_sync = True
+        except (EOFError, OSError, asyncio.TimeoutError):
+            # a cancelled operation waiting for its product or a long run, the memory is lost
+            if self.verbose:
+                print("NAR could not be resynchronized, restarting it")
+            await self.close()
+            await self._spawn()
+
+    async def __aenter__(self) -> "AsyncNarClient":
+        return await self.start()
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    async def _write(self, payload: str) -> None:
+        self.proc.stdin.write(payload.encode())
+        await self.proc.stdin.drain()
+
+    async def _read(self, amount: int) -> Tuple[List[List[str]], List[bool]]:
+        """Read the output of amount statements, split at the sentinel echoes, as NAR.GetRawOutputs."""
+        chunks = [[]]
+        requests_output_args = [False]
+        seen = 0
+        while True:
+            ret = await self.proc.stdout.readline()
+            if not ret:
+                raise EOFError("NAR exited")
+            l = ret.decode().strip()
+            if l.startswith(BATCH_SENTINEL_ECHO):
+                seen += 1
+                chunks.append([])
+                requests_output_args.append(False)
+                continue
+            if seen >= amount and l == "done with 0 additional inference steps.":
+                break
+            if l == PRODUCT_EXPECTED:
+                requests_output_args[-1] = True
+                break
+            if l != "":
+                chunks[-1].append(l)
+        return chunks[:amount], requests_output_args[:amount]
+
+    async def _read_single(self) -> Tuple[List[str], bool]:
+        """Read the output of a statement followed by a "0", up to a product request, as NAR.GetRawOutput."""
+        lines = []
+        while True:
+            ret = await self.proc.stdout.readline()
+            if not ret:
+                raise EOFError("NAR exited")
+            l = ret.decode().strip()
+            if l == PRODUCT_EXPECTED:
+                return lines, True
+            if l == "done with 0 additional inference steps.":
+                # without the "performing 0 inference steps:" line
+                return lines[:-1], False
+            if l != "":
+                lines.append(l)
+
+    async def _send(self, narseses: List[str], categories: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """Send statements with the same sentinel protocol as NAR.AddInputs."""
+        async with self.lock:
+            if not self.in_sync:
+                await self._resync()
+            self.in_sync = False
+            if TrackStdinOperations(narseses, self.proc):
+                # the sentinels written ahead would be read as the product of an operation,
+                # so the statements are sent one by one, up to the first one expecting a product
+                outputs = []
+                for narsese in narseses:
+                    await self._write(narsese + "\n0\n")
+                    lines, request_output_args = await self._read_single()
+                    outputs.append(ParseOutput(lines, request_output_args, categories))
+                    if request_output_args:
+                        break
+                self.in_sync = True
+                return outputs
+            payload = "".join(narsese + "\n" + BATCH_SENTINEL + str(i) + "\n" for i, narsese in enumerate(narseses)) + "0\n"
+            # writing and reading concurrently avoids a pipe deadlock on big batches
+            _, (chunks, requests_output_args) = await asyncio.gather(self._write(payload), self._read(len(narseses)))
+            self.in_sync = True
+        return [ParseOutput(lines, request_output_args, categories) for lines, request_output_args in zip(chunks, requests_output_args)]
+
+    async def stream_input(self, narsese: str, categories: Optional[Iterable[str]] = None) -> AsyncIterator[Tuple[str, Any]]:
+        """Add input to NARS and yield output events as NARS prints them.
+
+        The process stays locked until the generator finishes or is closed,
+        so stop early with contextlib.aclosing to release it right away.
+        An operation expecting its product on stdin ends the stream with a
+        ("requestOutputArgs", True) event, the product is the next input.
+
+        Args:
+            narsese: Narsese statement or number of cycles to run
+            categories: Event categories to yield (e.g. "answers"), all if None
+
+        Yields:
+            (category, parsed) event pairs
+        """
+        narsese = narsese.strip()
+        if not narsese:
+            return
+        async with self.lock:
+            if not self.in_sync:
+                await self._resync()
+            self.in_sync = False
+            stdin_operations = TrackStdinOperations([narsese], self.proc)
+            # with stdin operations the "0" has to follow the statement directly, as it is read as the synch of a product request
+            await self._write(narsese + "\n" + ("0\n" if stdin_operations else BATCH_SENTINEL + "0\n0\n"))
+            sentinel_seen = stdin_operations
+            finished = False
+            try:
+                while True:
+                    ret = await self.proc.stdout.readline()
+                    if not ret:
+                        finished = True
+                        return
+                    l = ret.decode().strip()
+                    if l == PRODUCT_EXPECTED:
+                        finished = True
+                        yield "requestOutputArgs", True
+                        return
+                    if l.startswith(BATCH_SENTINEL_ECHO):
+                        sentinel_seen = True
+                        break
+                    if sentinel_seen and l == "done with 0 additional inference steps.":
+                        finished = True
+                        return
+                    category, l = classifyLine(l)
+                    if category is not None and (categories is None or category in categories):
+                        yield category, parseLine(category, l)
+            finally:
+                # drain the rest of the run to keep the pipe in sync
+                while not finished:
+                    ret = await self.proc.stdout.readline()
+                    if not ret:
+                        break
+                    l = ret.decode().strip()
+                    if l.startswith(BATCH_SENTINEL_ECHO):
+                        sentinel_seen = True
+                    elif l == PRODUCT_EXPECTED or (sentinel_seen and l == "done with 0 additional inference steps."):
+                        break
+                self.in_sync = True
+
+    async def stream_cycles(self, cycles: int = 300, categories: Optional[Iterable[str]] = None) -> AsyncIterator[Tuple[str, Any]]:
+        """Run inference cycles in NARS and yield output events as they appear.
+
+        Args:
+            cycles: Number of inference cycles to run
+            categories: Event categories to yield (e.g. "answers"), all if None
+
+        Yields:
+            (category, parsed) event pairs
+        """
+        async for event in self.stream_input(str(cycles), categories=categories):
+            yield event
+
+    async def _transport(self, narseses: Union[str, List[str]], print_raw: bool, categories: Optional[Iterable[str]]) -> Any:
+        """Send a request of the client logic to the NAR process and return its output, as NAR.AddInput(s)."""
+        batch = [narseses] if isinstance(narseses, str) else narseses
+        if narseses == "*stats":
+            return ParseStats((await self._send(batch, ("raw",)))[0]["raw"].split("\n"))
+        if print_raw and categories is not None:
+            categories = set(categories) | {"raw"}
+        outputs = await self._send(batch, categories)
+        if print_raw:
+            for output in outputs:
+                if output["raw"]:
+                    print(output["raw"])
+        return outputs[0] if isinstance(narseses, str) else outputs
+
+    async def _run(self, steps: Generator[NarRequest, Any, Any], blocking: bool = False) -> Any:
+        """Run the steps of a command, raising the errors of the transport inside them.
+
+        With blocking, the steps between the requests run in a worker thread,
+        as their file I/O or computation would stall the event loop.
+        """
+        def advance(method, value) -> Tuple[bool, Any]:
+            # StopIteration cannot be raised through a future, so the end is returned
+            try:
+                return False, method(value)
+            except StopIteration as stop:
+                return True, stop.value
+
+        async def step(method, value) -> Tuple[bool, Any]:
+            if blocking:
+                return await asyncio.to_thread(advance, method, value)
+            return advance(method, value)
+
+        done, request = await step(steps.send, None)
+        while not done:
+            try:
+                output = await self._transport(*request)
+            except Exception as e:
+                done, request = await step(steps.throw, e)
+            else:
+                done, request = await step(steps.send, output)
+        return request
+
+    async def reset(self) -> None:
+        """Reset the NARS system."""
+        await self._run(self._reset_steps())
+
+    async def add_input(self, narsese: str, print_raw: bool = False, categories: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Add input to NARS and return the output, as NarsClient.add_input."""
+        return await self._run(self._add_input_steps(narsese, print_raw, categories))
+
+    async def add_inputs(self, narseses: List[str], print_raw: bool = False, categories: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """Add a batch of Narsese statements to NARS in a single round trip, as NarsClient.add_inputs."""
+        return await self._run(self._add_inputs_steps(narseses, print_raw, categories))
+
+    async def run_cycles(self, cycles: int = 300) -> Dict[str, Any]:
+        """Run inference cycles in NARS, as NarsClient.run_cycles."""
+        return await self._run(self._run_cycles_steps(cycles))
+
+    async def save_knowledge(self, filename: str, delta: bool = False, compact_ratio: float = 1.0, compact: bool = False) -> Dict[str, Any]:
+        """Save NARS knowledge to a file, as NarsClient.save_knowledge."""
+        return await self._run(self._save_knowledge_steps(filename, delta, compact_ratio, compact), blocking=True)
+
+    async def load_knowledge(self, filename: str, batch_size: int = 1000, progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """Load NARS knowledge from a file, as NarsClient.load_knowledge.
+
+        The progress callback is called from a worker thread.
+        """
+        return await self._run(self._load_knowledge_steps(filename, batch_size, progress), blocking=True)
+
+    async def save_snapshot(self, filename: str) -> Dict[str, Any]:
+        """Save the complete NARS memory to a binary snapshot file, as NarsClient.save_snapshot."""
+        return await self._run(self._save_snapshot_steps(filename))
+
+    async def load_snapshot(self, filename: str) -> Dict[str, Any]:
+        """Replace the NARS memory with a binary snapshot, as NarsClient.load_snapshot."""
+        return await self._run(self._load_snapshot_steps(filename))
+
+    async def extract_knowledge(self, question: Optional[str] = None, limit: int = 50, token_budget: Optional[int] = DEFAULT_CONTEXT_TOKENS) -> str:
+        """Extract knowledge from NARS as context, as NarsClient.extract_knowledge."""
+        return await self._run(self._extract_knowledge_steps(question, limit, token_budget), blocking=True)
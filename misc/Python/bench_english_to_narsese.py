@@ -0,0 +1,124 @@
+"""
+Benchmark of the grammar rewrite stage of the English to Narsese converter
+
+Compares reduce_typetext, which runs the precompiled rewrite rules with a
+cached syntactical reduction to a fixed point, against the previous
+implementation (8 passes of re.sub over the pattern strings per call) on the
+sentences of a text file, and checks that both convert every sentence to
+the same Narsese.
+
+Usage:
+  python bench_english_to_narsese.py [TEXT_FILE] [--repeat N]
+
+Without TEXT_FILE, the sentences of knowledge/fable_1.txt are used.
+"""
+
+import re
+import sys
+import time
+import argparse
+
+from english_to_narsese_modular import (EnglishToNarsese, SyntacticalTransformations, StatementRepresentRelations,
+                                        TermRepresentRelations, reduce_syntax)
+from nltk_resources import ensure_nltk_resources
+
+class EnglishToNarseseBaseline(EnglishToNarsese):
+    """The converter with the rewrite stage it had before the compiled rules, kept as the baseline."""
+
+    def get_word_term(self, term, cur_truth, suppress_output=True):
+        for (schema, compound, Truth) in TermRepresentRelations:
+            m = re.match(schema, term)
+            if not m:
+                continue
+            cur_truth[:] = self.truth_deduction(cur_truth, Truth)
+            modifier = term.split("_")[0] + "_" + m.group(1)
+            atomic = term.split("_")[1] + "_" + m.group(1)
+            if modifier in self.word_type:
+                if self.verbose and not suppress_output:
+                    print("// Using " + str((schema, compound, Truth)))
+                term = compound % (self.word_type[modifier], self.word_type[atomic])
+            else:
+                term = atomic
+        return self.word_type.get(term, term)
+
+    def reduce_typetext(self, typetext, apply_statement_represent=False, apply_term_represent=False, suppress_output=True):
+        cur_truth = [1.0, 0.9]
+        for i in range(len(SyntacticalTransformations)):
+            for (a, b) in SyntacticalTransformations:
+                typetext = re.sub(a, b, typetext)
+        if apply_statement_represent:
+            for (a, b, Truth, _) in self.acquired_grammar + StatementRepresentRelations:
+                typetext_new = re.sub(a, b, typetext)
+                if typetext_new != typetext:
+                    if self.verbose and not suppress_output:
+                        print("// Using " + str((a, b, Truth)))
+                    typetext = typetext_new
+                    cur_truth = self.truth_deduction(cur_truth, Truth)
+            if apply_term_represent:
+                typetext = " ".join([self.get_word_term(x, cur_truth, suppress_output=suppress_output)
+                                   if "+" not in x else
+                                   self.get_word_term(x.split("+")[0], cur_truth, suppress_output=suppress_output)+"_"+
+                                   self.get_word_term(x.split("+")[1], cur_truth, suppress_output=suppress_output)
+                                   for x in typetext.split(" ")])
+        return typetext, cur_truth
+
+def read_sentences(filename):
+    with open(filename, encoding="utf-8") as f:
+        text = f.read()
+    return [s.strip() for s in re.split(r"(?<=[.!?])\s+", text) if s.strip()]
+
+def rewrite_passes(converter, typetexts):
+    """The three reduce_typetext passes process_line makes per sentence."""
+    for typetext, word_type in typetexts:
+        converter.word_type = word_type
+        converter.reduce_typetext(typetext)
+        converter.reduce_typetext(typetext, apply_statement_represent=True)
+        converter.reduce_typetext(typetext, apply_statement_represent=True, apply_term_represent=True)
+
+def bench(function, count, repeat, before_pass=None):
+    elapsed = 0.0
+    for _ in range(repeat):
+        if before_pass is not None:
+            before_pass()
+        start = time.perf_counter()
+        function()
+        elapsed += time.perf_counter() - start
+    return count * repeat / elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description="English to Narsese rewrite stage benchmark")
+    parser.add_argument("file", nargs="?", default="knowledge/fable_1.txt", help="Text file with the sentences")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of passes over the corpus")
+    args = parser.parse_args()
+
+    missing = ensure_nltk_resources(download=False)
+    if missing:
+        print(f"Missing NLTK data: {', '.join(missing)}")
+        sys.exit(1)
+
+    sentences = read_sentences(args.file)
+    baseline = EnglishToNarseseBaseline(output_truth=True)
+    compiled = EnglishToNarsese(output_truth=True)
+    if [baseline.process_line(s) for s in sentences] != [compiled.process_line(s) for s in sentences]:
+        print("Mismatch between the compiled and the baseline rewrite stage!")
+        sys.exit(1)
+
+    typetexts = []
+    for sentence in sentences:
+        lemmatized, typetext = compiled.sentence_and_types(sentence)
+        typetexts.append((typetext, dict(zip(typetext.split(" "), lemmatized.split(" ")))))
+
+    baseline_rewrite = bench(lambda: rewrite_passes(baseline, typetexts), len(typetexts), args.repeat)
+    cold_rewrite = bench(lambda: rewrite_passes(compiled, typetexts), len(typetexts), args.repeat, reduce_syntax.cache_clear)
+    warm_rewrite = bench(lambda: rewrite_passes(compiled, typetexts), len(typetexts), args.repeat)
+    baseline_lines = bench(lambda: [baseline.process_line(s) for s in sentences], len(sentences), args.repeat)
+    compiled_lines = bench(lambda: [compiled.process_line(s) for s in sentences], len(sentences), args.repeat)
+    print(f"Corpus: {len(sentences)} sentences, {reduce_syntax.cache_info().currsize} distinct typetexts")
+    print(f"Rewrite stage, baseline:        {baseline_rewrite:10.0f} sentences/s")
+    print(f"Rewrite stage, compiled, cold:  {cold_rewrite:10.0f} sentences/s ({cold_rewrite / baseline_rewrite:.2f}x)")
+    print(f"Rewrite stage, compiled, warm:  {warm_rewrite:10.0f} sentences/s ({warm_rewrite / baseline_rewrite:.2f}x)")
+    print(f"process_line, baseline:         {baseline_lines:10.0f} sentences/s")
+    print(f"process_line, compiled:         {compiled_lines:10.0f} sentences/s ({compiled_lines / baseline_lines:.2f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Microbenchmark of the NARS output line parser
+
+Compares the single pass parser of NAR.ParseOutput against the previous
+split based parser (one pass per line category) on NARS output, and checks
+that both produce the same result. The same corpus printed with
+*format=jsonl is parsed as well for comparison.
+
+Usage:
+  python bench_nar_parser.py [OUTPUT_FILE] [--repeat N]
+
+Without OUTPUT_FILE, a corpus is generated by loading savestates/fable.nars
+into NARS at *volume=100 and running inference cycles on it.
+"""
+
+import sys
+import time
+import argparse
+
+import NAR
+from NAR import ParseOutput, parseTaskSplit, parseExecution, parseReason
+
+def ParseOutputSplit(lines, requestOutputArgs=False):
+    """The parser NAR.ParseOutput replaced, kept as the baseline."""
+    executions = [parseExecution(l) for l in lines if l.startswith('^')]
+    inputs = [parseTaskSplit(l.split("Input: ")[1]) for l in lines if l.startswith('Input:')]
+    derivations = [parseTaskSplit(l.split("Derived: " if l.startswith('Derived:') else "Revised: ")[1]) for l in lines if l.startswith('Derived:') or l.startswith('Revised:')]
+    answers = [parseTaskSplit(l.split("Answer: ")[1]) for l in lines if l.startswith('Answer:')]
+    selections = [parseTaskSplit(l.split("Selected: ")[1]) for l in lines if l.startswith('Selected:')]
+    reason = parseReason("\n".join(lines))
+    return {"input": inputs, "derivations": derivations, "answers": answers, "executions": executions, "reason": reason, "selections": selections, "raw": "\n".join(lines), "requestOutputArgs" : requestOutputArgs}
+
+def generate_corpus(output_format="text"):
+    """Collect NARS output lines from loading a savestate and reasoning on it."""
+    NAR.AddInputs(["*reset", "*volume=100", "*format=" + output_format], Print=False)
+    with open("savestates/fable.nars", encoding="utf-8") as f:
+        statements = [line.strip() for line in f if line.strip() and not line.startswith("//")]
+    statements += ["<{Edran} --> ?1>?", "<?1 --> on>?", "100"]
+    lines = []
+    for output in NAR.AddInputs(statements, Print=False):
+        lines += output["raw"].split("\n")
+    NAR.AddInput("*format=text", Print=False)
+    return [l for l in lines if l]
+
+def bench(parser, lines, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        dict(parser(lines).items())
+    return len(lines) * repeat / (time.perf_counter() - start)
+
+def main():
+    parser = argparse.ArgumentParser(description="NARS output parser microbenchmark")
+    parser.add_argument("file", nargs="?", help="File with raw NARS output lines")
+    parser.add_argument("--repeat", type=int, default=20, help="Number of passes over the corpus")
+    args = parser.parse_args()
+
+    jsonl_lines = None
+    if args.file:
+        with open(args.file, encoding="utf-8") as f:
+            lines = [line.strip() for line in f if line.strip()]
+    else:
+        lines = generate_corpus()
+        jsonl_lines = generate_corpus("jsonl")
+
+    if ParseOutput(lines) != ParseOutputSplit(lines):
+        print("Mismatch between the single pass and the split parser!")
+        sys.exit(1)
+
+    split_rate = bench(ParseOutputSplit, lines, args.repeat)
+    single_rate = bench(ParseOutput, lines, args.repeat)
+    answers_rate = bench(lambda lines: ParseOutput(lines, categories=("answers",)), lines, args.repeat)
+    print(f"Corpus: {len(lines)} lines")
+    print(f"Split parser:       {split_rate:12.0f} lines/s")
+    print(f"Single pass parser: {single_rate:12.0f} lines/s")
+    print(f"Speedup:            {single_rate / split_rate:12.2f}x")
+    print(f"Answers only:       {answers_rate:12.0f} lines/s")
+    if jsonl_lines:
+        jsonl_rate = bench(ParseOutput, jsonl_lines, args.repeat)
+        print(f"JSON lines parser:  {jsonl_rate:12.0f} lines/s ({jsonl_rate / single_rate:.2f}x single pass)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Microbenchmark of the Narsese to English translator
+
+Compares the parse tree translator of narsese_to_english.narseseToEnglish
+against the regex translator it falls back to, on the lines of a *concepts
+dump. The tree translator is measured cold (caches cleared before every
+pass) and warm (caches kept, as across the turns of a conversation).
+
+Usage:
+  python bench_narsese_to_english.py [CONCEPTS_FILE] [--repeat N] [--cycles N]
+
+Without CONCEPTS_FILE, a dump is generated by loading savestates/fable.nars
+into NARS and running inference cycles on it.
+"""
+
+import time
+import argparse
+
+import NAR
+import narsese_to_english
+from narsese_to_english import narseseToEnglish, narseseToEnglish_regex, translateTerm, NarseseParseError
+
+def generate_corpus(cycles):
+    """Collect the statement lines of a *concepts dump of the fable savestate."""
+    NAR.AddInputs(["*reset", "*volume=0"], Print=False)
+    with open("savestates/fable.nars", encoding="utf-8") as f:
+        statements = [line.strip() for line in f if line.strip() and not line.startswith("//")]
+    NAR.AddInputs(statements + [str(cycles)], Print=False)
+    output = NAR.AddInput("*concepts", Print=False, categories=("raw",))
+    NAR.AddInput("*volume=100", Print=False)
+    return output["raw"].split("\n")
+
+def clear_caches():
+    translateTerm.cache_clear()
+    narsese_to_english._render.cache_clear()
+
+def bench(translate, lines, repeat, before_pass=None):
+    elapsed = 0.0
+    for _ in range(repeat):
+        if before_pass is not None:
+            before_pass()
+        start = time.perf_counter()
+        for line in lines:
+            translate(line)
+        elapsed += time.perf_counter() - start
+    return len(lines) * repeat / elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description="Narsese to English translator microbenchmark")
+    parser.add_argument("file", nargs="?", help="File with *concepts output")
+    parser.add_argument("--repeat", type=int, default=20, help="Number of passes over the corpus")
+    parser.add_argument("--cycles", type=int, default=1000, help="Inference cycles run before dumping the concepts")
+    args = parser.parse_args()
+
+    if args.file:
+        with open(args.file, encoding="utf-8") as f:
+            lines = f.read().split("\n")
+    else:
+        lines = generate_corpus(args.cycles)
+    lines = [line for line in lines if line.strip() and not line.startswith("//")]
+
+    fallbacks = 0
+    for line in lines:
+        sentence = narsese_to_english.SENTENCE.fullmatch(line.rstrip())
+        try:
+            if sentence is None:
+                raise NarseseParseError(line)
+            translateTerm(sentence.group(1))
+        except NarseseParseError:
+            fallbacks += 1
+    untranslated_regex = sum(1 for line in lines if not narseseToEnglish_regex(line))
+
+    regex_rate = bench(narseseToEnglish_regex, lines, args.repeat)
+    cold_rate = bench(narseseToEnglish, lines, args.repeat, clear_caches)
+    warm_rate = bench(narseseToEnglish, lines, args.repeat)
+    print(f"Corpus: {len(lines)} lines, {fallbacks} fall back to the regex translator, {untranslated_regex} untranslated by it")
+    print(f"Regex translator:      {regex_rate:12.0f} lines/s")
+    print(f"Tree translator, cold: {cold_rate:12.0f} lines/s ({cold_rate / regex_rate:.2f}x)")
+    print(f"Tree translator, warm: {warm_rate:12.0f} lines/s ({warm_rate / regex_rate:.2f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Startup benchmark of the English to Narsese converter
+
+Compares the NLTK data bootstrap that EnglishToNarsese used to run on every
+construction (seven nltk.download calls, each checking the download index
+over the network) against nltk_resources.ensure_nltk_resources, which only
+looks the data up locally. The per sentence cost of sentence_and_types is
+measured as well, against creating a new WordNetLemmatizer and going through
+nltk.word_tokenize and nltk.pos_tag for every sentence as before.
+
+Usage:
+  python bench_nltk_startup.py [--constructions N] [--repeat N]
+"""
+
+import time
+import argparse
+
+import nltk
+from nltk import WordNetLemmatizer, word_tokenize
+
+import nltk_resources
+from nltk_resources import NLTK_RESOURCES, ensure_nltk_resources
+from english_to_narsese_modular import EnglishToNarsese
+
+SENTENCES = [
+    "The cat sat on the mat.",
+    "John, who is tall, has two dogs named Max and Bella.",
+    "Birds fly and they have feathers.",
+    "If it rains, the street is wet.",
+    "Tweety is a yellow bird that sings.",
+]
+
+def download_all():
+    """The bootstrap EnglishToNarsese.__init__ used to run."""
+    for resource in NLTK_RESOURCES:
+        nltk.download(resource, quiet=True)
+
+def sentence_and_types_baseline(converter, text):
+    """The tokenization, tagging and lemmatization of sentence_and_types before the shared models."""
+    tokens = [word for word in word_tokenize(text)]
+    wordtypes = dict(nltk.pos_tag(tokens, tagset='universal'))
+    lemma = WordNetLemmatizer()
+    return [lemma.lemmatize(word, pos=converter.wordnet_tag(wordtypes[word])) for word in tokens]
+
+def timed(function, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat
+
+def main():
+    parser = argparse.ArgumentParser(description="English to Narsese converter startup benchmark")
+    parser.add_argument("--constructions", type=int, default=5, help="Number of converters constructed")
+    parser.add_argument("--repeat", type=int, default=200, help="Number of passes over the sentences")
+    args = parser.parse_args()
+
+    downloads = timed(download_all, 1)
+    checks = timed(lambda: (nltk_resources._checked.clear(), ensure_nltk_resources(download=False)), 1)
+    constructions = timed(EnglishToNarsese, args.constructions)
+    print(f"nltk.download of {len(NLTK_RESOURCES)} resources: {downloads * 1000:10.2f} ms")
+    print(f"Local resource check:        {checks * 1000:10.2f} ms ({downloads / checks:.0f}x)")
+    print(f"EnglishToNarsese():          {constructions * 1000:10.4f} ms after the first construction")
+
+    missing = ensure_nltk_resources(download=False)
+    if missing:
+        print(f"Skipping the sentence benchmark, missing NLTK data: {', '.join(missing)}")
+        return
+    converter = EnglishToNarsese()
+    baseline = timed(lambda: [sentence_and_types_baseline(converter, s) for s in SENTENCES], args.repeat) / len(SENTENCES)
+    shared = timed(lambda: [converter.sentence_and_types(s) for s in SENTENCES], args.repeat) / len(SENTENCES)
+    print(f"Per sentence, new models:    {baseline * 1e6:10.1f} us")
+    print(f"Per sentence, shared models: {shared * 1e6:10.1f} us ({baseline / shared:.2f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -33,12 +33,18 @@ Updated for modularity, to be called within other scripts
 import re
 import sys
 import time
+import json
+import hashlib
 import subprocess
+import multiprocessing
+from collections import OrderedDict
+from functools import lru_cache
 import nltk as nltk
 from nltk import sent_tokenize, word_tokenize
 from nltk.corpus import stopwords
 from nltk import WordNetLemmatizer
 from nltk.corpus import wordnet
+from nltk_resources import ensure_nltk_resources, tokenize, pos_tag_universal, pos_tag_sents_universal, lemmatizer
 
 # Global variables
 SyntacticalTransformations = [
@@ -75,8 +81,144 @@ StatementRepresentRelations = [
     (r" ADJ_NOUN_([0-9]*) ADV_VERB_([0-9]*) ", r" < ADJ_NOUN_\1 --> [ ADV_VERB_\2 ] > ", (1.0, 0.99), 0), #SV
 ]
 
+# Number of syntactically reduced typetexts kept
+REDUCTION_CACHE_SIZE = 65536
+
+# Capture groups of the rewrite patterns, the rest of a pattern is literal text unless it contains regex syntax
+PATTERN_GROUP = re.compile(r"\(\[0-9\]\*\)|\(\.\*\)|\\A|\\Z")
+REGEX_SYNTAX = frozenset("\\.^$*+?{}[]()|")
+
+@lru_cache(maxsize=None)
+def compile_rule(pattern):
+    """Compile a rewrite pattern once, along with the literal pieces every text it matches contains.
+
+    Returns:
+        (compiled pattern, required pieces), no required pieces if the pattern has other regex syntax
+    """
+    pieces = PATTERN_GROUP.split(pattern)
+    if any(c in REGEX_SYNTAX for piece in pieces for c in piece):
+        return re.compile(pattern), ()
+    return re.compile(pattern), tuple(piece for piece in pieces if piece.strip())
+
+def rewrite(pattern, replacement, typetext):
+    """re.sub(pattern, replacement, typetext), skipping the regex when a required type word is absent."""
+    compiled, required = compile_rule(pattern)
+    for piece in required:
+        if piece not in typetext:
+            return typetext
+    return compiled.sub(replacement, typetext)
+
+@lru_cache(maxsize=REDUCTION_CACHE_SIZE)
+def reduce_syntax(typetext):
+    """Apply the syntactical transformations until the typetext stops changing.
+
+    As many passes over the transformations as there are transformations at
+    most, the number of passes reduce_typetext always made before.
+    """
+    for i in range(len(SyntacticalTransformations)):
+        reduced = typetext
+        for (a, b) in SyntacticalTransformations:
+            reduced = rewrite(a, b, reduced)
+        if reduced == typetext:
+            break
+        typetext = reduced
+    return typetext
+
+# Number of English to Narsese translations kept by a converter
+NARSESE_CACHE_SIZE = 20000
+
+class NarseseCache:
+    """
+    Size bounded LRU cache of English to Narsese translations.
+
+    The keys hold the normalized sentence and the converter settings it was
+    translated with. A persisted cache is only loaded back when the rewrite
+    rules and the NLTK version are the same as when it was saved.
+    """
+
+    def __init__(self, max_size=NARSESE_CACHE_SIZE, path=None):
+        """
+        Args:
+            max_size: Maximum number of cached translations
+            path: JSON file the cache is loaded from and saved to, not persisted if None
+        """
+        self.max_size = max_size
+        self.path = path
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        if path:
+            self.load()
+
+    @staticmethod
+    def fingerprint():
+        """Hash of everything besides the key that a translation depends on."""
+        rules = repr((SyntacticalTransformations, TermRepresentRelations, StatementRepresentRelations, nltk.__version__))
+        return hashlib.sha256(rules.encode("utf-8")).hexdigest()
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def get(self, key):
+        """Return the cached translation of a key, None if not cached."""
+        if key in self.entries:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return self.entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, key, translation):
+        """Store a translation, evicting the least recently used beyond max_size."""
+        self.entries[key] = translation
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def hit_rate(self):
+        """Fraction of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def invalidate(self):
+        """Drop all cached translations, as after learning grammar, keeping the hit counters."""
+        self.entries.clear()
+
+    def load(self):
+        """Load the translations saved to path, if they were made with the same rules."""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return
+        if saved.get("fingerprint") == self.fingerprint():
+            for (key, translation) in saved["entries"][-self.max_size:]:
+                self.entries[tuple(key)] = tuple(translation)
+
+    def save(self):
+        """Save the translations to path."""
+        if self.path:
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump({"fingerprint": self.fingerprint(), "entries": list(self.entries.items())}, f)
+
+# Number of consecutive sentences a conversion worker process converts per task
+CONVERSION_CHUNK_SIZE = 64
+
+# Converter of a conversion worker process, created once by _init_conversion_worker
+_worker_converter = None
+
+def _init_conversion_worker(output_truth, nltk_data_path):
+    global _worker_converter
+    _worker_converter = EnglishToNarsese(output_truth=output_truth, nltk_data_path=nltk_data_path)
+
+def _convert_chunk(task):
+    """Convert consecutive sentences in a worker process, with the converter state they were read in."""
+    (state, sentences) = task
+    _worker_converter.set_conversion_state(state)
+    return _worker_converter.process_batch(sentences)
+
 class EnglishToNarsese:
-    def __init__(self, verbose=False, output_truth=False, eternal_output=False, nltk_data_path=None):
+    def __init__(self, verbose=False, output_truth=False, eternal_output=False, nltk_data_path=None, cache_path=None):
         self.verbose = verbose
         self.output_truth = output_truth
         self.eternal = eternal_output
@@ -85,21 +227,13 @@ class EnglishToNarsese:
         self.motivation = None
         self.thinkcycles = None
         self.acquired_grammar = []
+        self.nltk_data_path = nltk_data_path
+        # Changes whenever grammar is learned, the translations of older versions are outdated
+        self.grammar_version = 0
+        self.translation_cache = NarseseCache(path=cache_path)
         
-        quiet = True;
-        # * This only needs to be done once per machine, afterwards it can stay commented out
-        # * Download required NLTK data
-        # if nltk_data_path:
-        #     nltk.data.path.append(nltk_data_path)
-        
-        # quiet = not verbose
-        nltk.download('punkt', quiet=quiet)
-        nltk.download('averaged_perceptron_tagger', quiet=quiet)
-        nltk.download('universal_tagset', quiet=quiet)
-        nltk.download('wordnet', quiet=quiet)
-        nltk.download('omw-1.4', quiet=quiet)
-        nltk.download('punkt_tab', quiet=quiet)
-        nltk.download('averaged_perceptron_tagger_eng', quiet=quiet)
+        # Download required NLTK data, only what is not found locally (checked once per process)
+        ensure_nltk_resources(data_dir=nltk_data_path, quiet=True)
     
     # Convert universal tag set to the wordnet word types
     def wordnet_tag(self, tag):
@@ -116,12 +250,26 @@ class EnglishToNarsese:
     
     # POS-tag words in the input sentence and lemmatize them using Wordnet
     def sentence_and_types(self, text):
-        tokens = [word for word in word_tokenize(text)]
-        wordtypes_ordered = nltk.pos_tag(tokens, tagset='universal')
+        tokens = tokenize(text)
+        return self.tagged_sentence_and_types(tokens, pos_tag_universal(tokens))
+
+    # sentence_and_types of several texts, POS-tagged in one call and lemmatized with a memo shared by the texts
+    def sentences_and_types(self, texts):
+        token_lists = [tokenize(text) for text in texts]
+        lemma_memo = {}
+        return [self.tagged_sentence_and_types(tokens, wordtypes_ordered, lemma_memo)
+                for (tokens, wordtypes_ordered) in zip(token_lists, pos_tag_sents_universal(token_lists))]
+
+    # Lemmatize and index POS-tagged words, lemma_memo maps (word, wordnet tag) to already computed lemmas
+    def tagged_sentence_and_types(self, tokens, wordtypes_ordered, lemma_memo=None):
         wordtypes = dict(wordtypes_ordered)
-        lemma = WordNetLemmatizer()
+        lemma = lemmatizer()
+        if lemma_memo is None:
+            lemmatize = lambda word, pos: lemma.lemmatize(word, pos=pos)
+        else:
+            lemmatize = lambda word, pos: lemma_memo[(word, pos)] if (word, pos) in lemma_memo else lemma_memo.setdefault((word, pos), lemma.lemmatize(word, pos=pos))
         handleInstance = lambda word: "{"+word+"}" if word[0].isupper() else word
-        tokens = [handleInstance(lemma.lemmatize(word, pos=self.wordnet_tag(wordtypes[word]))) for word in tokens]
+        tokens = [handleInstance(lemmatize(word, self.wordnet_tag(wordtypes[word]))) for word in tokens]
         wordtypes = dict([(tokens[i], wordtypes_ordered[i][1]) for i in range(len(tokens))])
         wordtypes = {key: ("BE" if key == "be" else ("IF" if key == "if" else ("NOUN" if value=="PRON" or value=="NUM" else ("ADP" if value=="PRT" else value)))) 
                     for (key, value) in wordtypes.items()}
@@ -162,7 +310,7 @@ class EnglishToNarsese:
     # Return the concrete word (compound) term
     def get_word_term(self, term, cur_truth, suppress_output=True):
         for (schema, compound, Truth) in TermRepresentRelations:
-            m = re.match(schema, term)
+            m = compile_rule(schema)[0].match(term)
             if not m:
                 continue
             cur_truth[:] = self.truth_deduction(cur_truth, Truth)
@@ -179,12 +327,11 @@ class EnglishToNarsese:
     # Apply syntactical reductions and wanted represent relations
     def reduce_typetext(self, typetext, apply_statement_represent=False, apply_term_represent=False, suppress_output=True):
         cur_truth = [1.0, 0.9]
-        for i in range(len(SyntacticalTransformations)):
-            for (a, b) in SyntacticalTransformations:
-                typetext = re.sub(a, b, typetext)
+        # the syntactical reduction is shared by the reduced, Narsese and concrete passes of a sentence
+        typetext = reduce_syntax(typetext)
         if apply_statement_represent:
             for (a, b, Truth, _) in self.acquired_grammar + StatementRepresentRelations:
-                typetext_new = re.sub(a, b, typetext)
+                typetext_new = rewrite(a, b, typetext)
                 if typetext_new != typetext:
                     if self.verbose and not suppress_output:
                         print("// Using " + str((a, b, Truth)))
@@ -231,11 +378,64 @@ class EnglishToNarsese:
                 self.current_time += 1
                 self.acquired_grammar.append((R, mapped, T, self.current_time))
                 self.acquired_grammar.sort(key=lambda T: (-self.truth_expectation(T[2]), -T[3]))
+                self.grammar_version += 1
+                self.translation_cache.invalidate()
             return True
         return False
 
-    def process_line(self, line):
-        """Process a single input line and return Narsese output"""
+    # Whether a line is a command or Narsese to pass on rather than an English sentence
+    def is_command(self, line):
+        return line.startswith("*") or line.startswith("//") or line.isdigit() or line.startswith('(') or line.startswith('<') or line.endswith(":|:")
+
+    # Determine tense from sentence, returning the sentence without its tense words, whether it is an event, and the tense marker
+    def sentence_tense(self, line):
+        spaced_line = (" " + line.lower() + " ")
+        punctuations = [" ", "!", "?"]
+        tenses_past = ["previously", "before"]
+        tenses_present = ["now", "currently", "afterwards"]
+        tenses_future = ["afterwards", "later"]
+        event_tenses = tenses_past + tenses_present + tenses_future
+        is_past_event = True in [" "+w+p in spaced_line for p in punctuations for w in tenses_past]
+        is_future_event = True in [" "+w+p in spaced_line for p in punctuations for w in tenses_future]
+        is_event = True in [" "+w+p in spaced_line for p in punctuations for w in event_tenses]
+        
+        if " will be " in line:  # A COMMON FUTURE EXPRESSION NOT COVERED BY ABOVE
+            line = line.replace(" will be ", " is ")
+            is_future_event = True
+            is_event = True
+            
+        non_eternal_marker = ":/:" if is_future_event else (":\\:" if is_past_event else ":|:")
+        
+        if self.tense_from_sentence:
+            for punc in punctuations:
+                for tense_word in event_tenses:
+                    if " "+tense_word+punc in spaced_line:
+                        line = ((line + " ").replace(" "+tense_word+punc, "")).lstrip().rstrip()
+        return line, is_event, non_eternal_marker
+
+    # The sentence of a line that gets POS-tagged
+    def tagged_text(self, line):
+        return " " + line.replace("!", "").replace("?", "").replace(".", "").replace(",", "").replace(" not ", " ") + " "
+
+    # Key of a sentence line in the translation cache: its normalized sentence and everything else its output depends on
+    def translation_key(self, line):
+        spaced_line = (" " + line.lower() + " ")
+        is_negated = " not " in spaced_line or " no " in spaced_line
+        (tenseless_line, is_event, _) = self.sentence_tense(line)
+        eternal = not is_event if self.tense_from_sentence else self.eternal
+        return (self.tagged_text(tenseless_line), line.endswith("?"), line.endswith("!"), is_negated,
+                line.strip() != "", tenseless_line.strip() != "", eternal, self.tense_from_sentence,
+                self.output_truth, self.motivation, self.thinkcycles, self.grammar_version)
+
+    def save_translation_cache(self):
+        """Save the translation cache to the cache_path it was created with, if any"""
+        self.translation_cache.save()
+
+    def process_line(self, line, s_and_T=None):
+        """Process a single input line and return Narsese output
+
+        s_and_T is the sentence_and_types result of the line's sentence when already computed, as by process_batch
+        """
         self.current_time += 1
         
         if len(line) == 0:
@@ -243,7 +443,7 @@ class EnglishToNarsese:
             
         is_question = line.endswith("?")
         is_goal = line.endswith("!")
-        is_command = line.startswith("*") or line.startswith("//") or line.isdigit() or line.startswith('(') or line.startswith('<') or line.endswith(":|:")
+        is_command = self.is_command(line)
         spaced_line = (" " + line.lower() + " ")
         is_negated = " not " in spaced_line or " no " in spaced_line
         
@@ -272,33 +472,28 @@ class EnglishToNarsese:
             # results.append("//Input sentence: " + line)
             results.append("")
         
-        # Determine tense from sentence
-        punctuations = [" ", "!", "?"]
-        tenses_past = ["previously", "before"]
-        tenses_present = ["now", "currently", "afterwards"]
-        tenses_future = ["afterwards", "later"]
-        event_tenses = tenses_past + tenses_present + tenses_future
-        is_past_event = True in [" "+w+p in spaced_line for p in punctuations for w in tenses_past]
-        is_future_event = True in [" "+w+p in spaced_line for p in punctuations for w in tenses_future]
-        is_event = True in [" "+w+p in spaced_line for p in punctuations for w in event_tenses]
-        
-        if " will be " in line:  # A COMMON FUTURE EXPRESSION NOT COVERED BY ABOVE
-            line = line.replace(" will be ", " is ")
-            is_future_event = True
-            is_event = True
-            
-        non_eternal_marker = ":/:" if is_future_event else (":\\:" if is_past_event else ":|:")
+        # Verbose output includes the steps of the translation, which a cached translation skips
+        cache_key = None if self.verbose else self.translation_key(line)
         
+        # Determine tense from sentence
+        (line, is_event, non_eternal_marker) = self.sentence_tense(line)
         if self.tense_from_sentence:
             self.eternal = not is_event
-            for punc in punctuations:
-                for tense_word in event_tenses:
-                    if " "+tense_word+punc in spaced_line:
-                        line = ((line + " ").replace(" "+tense_word+punc, "")).lstrip().rstrip()
+        
+        if cache_key is not None:
+            cached = self.translation_cache.get(cache_key)
+            if cached is not None:
+                # restore the state grammar learning refers to
+                (output, self.sentence, typetext, self.typetext_reduced) = cached
+                self.word_type = dict(zip(typetext.split(" "), self.sentence.split(" ")))
+                self.type_word = dict(zip(self.sentence.split(" "), typetext.split(" ")))
+                return output
+        grammar_version = self.grammar_version
         
         # Postag and bring it into canonical representation using Wordnet lemmatizer
-        self.sentence = " " + line.replace("!", "").replace("?", "").replace(".", "").replace(",", "").replace(" not ", " ") + " "
-        s_and_T = self.sentence_and_types(self.sentence)
+        self.sentence = self.tagged_text(line)
+        if s_and_T is None:
+            s_and_T = self.sentence_and_types(self.sentence)
         self.sentence = s_and_T[0]  # canonical sentence (with lemmatized words)
         typetext = s_and_T[1]  # " DET_1 ADJ_1 NOUN_1 ADV_2 VERB_2 DET_2 ADJ_2 NOUN_2 ADP_3 DET_3 ADJ_3 NOUN_3 "
         
@@ -348,16 +543,65 @@ class EnglishToNarsese:
             results.append(self.motivation)
             if self.thinkcycles is not None:
                 results.append(self.thinkcycles)
-                
-        return "\n".join(results)
+        
+        output = "\n".join(results)
+        if cache_key is not None and self.grammar_version == grammar_version:
+            self.translation_cache.put(cache_key, (output, self.sentence, typetext, self.typetext_reduced))
+        return output
+
+    def process_batch(self, sentences):
+        """Process several input lines and return their Narsese outputs in input order
+
+        The sentences are POS-tagged in one call and lemmatized with a shared memo,
+        the rest of the conversion runs line by line as in process_line.
+        """
+        # lines with a cached translation need no tagging
+        english = [i for (i, line) in enumerate(sentences) if len(line) > 0 and not self.is_command(line)
+                   and (self.verbose or self.translation_key(line) not in self.translation_cache)]
+        texts = [self.tagged_text(self.sentence_tense(sentences[i])[0]) for i in english]
+        s_and_Ts = dict(zip(english, self.sentences_and_types(texts)))
+        return [self.process_line(line, s_and_Ts.get(i)) for (i, line) in enumerate(sentences)]
+
+    # The settings commands change, which the conversion of the following sentences depends on
+    def conversion_state(self):
+        return (self.eternal, self.tense_from_sentence, self.motivation, self.thinkcycles, list(self.acquired_grammar), self.grammar_version)
+
+    def set_conversion_state(self, state):
+        (self.eternal, self.tense_from_sentence, self.motivation, self.thinkcycles, self.acquired_grammar, self.grammar_version) = state
+
+    def process_parallel(self, lines, processes=None, chunk_size=CONVERSION_CHUNK_SIZE):
+        """Process input lines in a pool of worker processes and yield their Narsese outputs in input order
+
+        Consecutive sentences are converted in chunks by workers that each create their own
+        converter once, with the state of this converter at the time the sentences were read.
+        Commands and empty lines are processed here, in order, so they apply to the sentences
+        after them. Grammar learned by a worker is not shared with the other workers.
+        """
+        tasks = []  # (converter state, sentences) for the workers
+        plan = []  # in input order: output of a line processed here, or None for the next task
+        for line in lines:
+            if len(line) == 0 or self.is_command(line):
+                plan.append(self.process_line(line))
+            elif plan and plan[-1] is None and len(tasks[-1][1]) < chunk_size:
+                tasks[-1][1].append(line)
+            else:
+                tasks.append((self.conversion_state(), [line]))
+                plan.append(None)
+        with multiprocessing.Pool(processes, initializer=_init_conversion_worker, initargs=(self.output_truth, self.nltk_data_path)) as pool:
+            # imap returns the chunks in task order while the workers convert the following ones
+            results = pool.imap(_convert_chunk, tasks)
+            for output in plan:
+                if output is None:
+                    yield from next(results)
+                else:
+                    yield output
 
     def process_text(self, text):
         """Process multiple lines of text and return Narsese outputs"""
         lines = text.strip().split('\n')
         results = []
         
-        for line in lines:
-            result = self.process_line(line)
+        for result in self.process_batch(lines):
             if result:
                 results.append(result)
                 
@@ -390,7 +634,14 @@ def main():
         eternal_output=eternal_output
     )
     
-    converter.interactive()
+    if "Parallel" in sys.argv:
+        # convert all of stdin in worker processes, for large text files
+        for result in converter.process_parallel([line.rstrip("\n") for line in sys.stdin]):
+            if result:
+                print(result)
+                sys.stdout.flush()
+    else:
+        converter.interactive()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,76 @@
+"""
+Persistent cache of extracted facts, shared between processes via SQLite
+"""
+
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from typing import List, Optional
+
+class FactCache:
+    """Size bounded LRU cache mapping (fact model, prompt template, text) to the extracted facts."""
+
+    def __init__(self, path: str = "fact_cache.sqlite", max_entries: int = 100000):
+        """Open or create the cache database.
+
+        Args:
+            path: Path of the SQLite database file
+            max_entries: Number of entries kept, the least recently used are evicted beyond it
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.local = threading.local()
+        self.hits = 0
+        self.misses = 0
+        with self._connection() as connection:
+            connection.execute("CREATE TABLE IF NOT EXISTS facts (key TEXT PRIMARY KEY, facts TEXT NOT NULL, last_used REAL NOT NULL)")
+            connection.execute("CREATE INDEX IF NOT EXISTS facts_last_used ON facts (last_used)")
+            # number of entries kept up to date by triggers, so a put does not count the table
+            connection.execute("CREATE TABLE IF NOT EXISTS facts_count (entries INTEGER NOT NULL)")
+            connection.execute("CREATE TRIGGER IF NOT EXISTS facts_inserted AFTER INSERT ON facts BEGIN UPDATE facts_count SET entries = entries + 1; END")
+            connection.execute("CREATE TRIGGER IF NOT EXISTS facts_deleted AFTER DELETE ON facts BEGIN UPDATE facts_count SET entries = entries - 1; END")
+            connection.execute("INSERT INTO facts_count (entries) SELECT COUNT(*) FROM facts WHERE NOT EXISTS (SELECT 1 FROM facts_count)")
+
+    def _connection(self) -> sqlite3.Connection:
+        """Connection of the calling thread, sqlite3 connections cannot be shared between threads."""
+        connection = getattr(self.local, "connection", None)
+        if connection is None:
+            # waits for the write locks of other processes instead of failing
+            connection = sqlite3.connect(self.path, timeout=30.0)
+            connection.execute("PRAGMA journal_mode=WAL")
+            self.local.connection = connection
+        return connection
+
+    @staticmethod
+    def key(model: str, template: str, text: str) -> str:
+        """Hash identifying an extraction request."""
+        return hashlib.sha256("\0".join((model, template, text)).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[List[str]]:
+        """Return the cached facts of a key and mark them as used, None if not cached."""
+        with self._connection() as connection:
+            row = connection.execute("SELECT facts FROM facts WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            connection.execute("UPDATE facts SET last_used = ? WHERE key = ?", (time.time(), key))
+        self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, key: str, facts: List[str]) -> None:
+        """Store the facts of a key, evicting the least recently used entries beyond max_entries."""
+        with self._connection() as connection:
+            # an upsert, as the delete of INSERT OR REPLACE would not fire the trigger
+            connection.execute("INSERT INTO facts (key, facts, last_used) VALUES (?, ?, ?) "
+                               "ON CONFLICT (key) DO UPDATE SET facts = excluded.facts, last_used = excluded.last_used",
+                               (key, json.dumps(facts), time.time()))
+            excess = connection.execute("SELECT entries FROM facts_count").fetchone()[0] - self.max_entries
+            if excess > 0:
+                connection.execute("DELETE FROM facts WHERE key IN (SELECT key FROM facts ORDER BY last_used LIMIT ?)", (excess,))
+
+    def clear(self) -> None:
+        """Remove all cached facts."""
+        with self._connection() as connection:
+            connection.execute("DELETE FROM facts")
@@ -0,0 +1,206 @@
+"""
+Language model backends of the LLM client
+
+OllamaBackend serves completions from a live Ollama daemon. RecordingBackend
+wraps another backend and captures every prompt and response to a cassette
+file, from which ReplayBackend serves them again without Ollama, optionally
+falling back to deterministic synthetic responses for prompts that were not
+recorded. Replay runs can simulate the model latency, so the NARS and
+translation side of the pipeline can be profiled reproducibly offline.
+"""
+
+import re
+import json
+import time
+import hashlib
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+# Backend kinds selectable with make_backend_factory
+BACKEND_KINDS = ("ollama", "record", "replay", "fake")
+
+# Words of the synthetic responses: lowercase alphabetic words of the input
+WORD = re.compile(r"[a-z]+")
+# Numbered sentence of a batched fact extraction prompt
+NUMBERED_LINE = re.compile(r"\[(\d+)\]\s*(.*)")
+
+def prompt_text(prompt: Any) -> str:
+    """Text of a prompt, for both prompt values of the templates and direct strings."""
+    to_string = getattr(prompt, "to_string", None)
+    return to_string() if to_string is not None else str(prompt)
+
+def synthetic_response(prompt: str) -> str:
+    """Deterministic stand-in response: simple facts about the words of the human message.
+
+    Every input line yields "<word> is <next word>." statements, tagged with
+    the line number when the input consists of numbered sentences as in
+    batched fact extraction prompts.
+    """
+    message = prompt.rsplit("Human: ", 1)[-1].strip()
+    facts = []
+    for line in message.split("\n"):
+        numbered = NUMBERED_LINE.fullmatch(line.strip())
+        tag = f"[{numbered.group(1)}] " if numbered else ""
+        words = [word for word in WORD.findall((numbered.group(2) if numbered else line).lower()) if word != "think"]
+        pairs = list(zip(words, words[1:]))[:3] or [(word, "thing") for word in words[:1]]
+        facts += [f"{tag}{subject} is {predicate}." for subject, predicate in pairs]
+    return "\n".join(facts)
+
+class LlmBackend(ABC):
+    """Completion backend of one model, consuming prompt values or strings."""
+
+    def __init__(self, model: str):
+        self.model = model
+
+    @abstractmethod
+    def invoke(self, prompt: Any) -> str:
+        """Complete the prompt."""
+
+    def stream(self, prompt: Any) -> Iterator[str]:
+        """Complete the prompt chunk by chunk, as a single chunk unless overridden."""
+        yield self.invoke(prompt)
+
+class OllamaBackend(LlmBackend):
+    """Completions of a model served by the Ollama daemon."""
+
+    def __init__(self, model: str):
+        super().__init__(model)
+        from langchain_ollama.llms import OllamaLLM
+        self.llm = OllamaLLM(model=model)
+
+    def invoke(self, prompt: Any) -> str:
+        return self.llm.invoke(prompt)
+
+    def stream(self, prompt: Any) -> Iterator[str]:
+        return self.llm.stream(prompt)
+
+class Cassette:
+    """Recorded responses keyed by (model, prompt text), stored as JSON lines."""
+
+    def __init__(self, path: str):
+        """Load the recorded responses of the cassette file, if it exists.
+
+        Args:
+            path: Path of the cassette file
+        """
+        self.path = path
+        self.lock = threading.Lock()
+        self.responses: Dict[Tuple[str, str], str] = {}
+        try:
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        # the last recording of a prompt wins
+                        self.responses[(entry["model"], entry["prompt"])] = entry["response"]
+        except FileNotFoundError:
+            pass
+
+    def get(self, model: str, prompt: str) -> Optional[str]:
+        """Return the recorded response of a prompt, None if not recorded."""
+        return self.responses.get((model, prompt))
+
+    def record(self, model: str, prompt: str, response: str) -> None:
+        """Append a prompt and its response to the cassette file."""
+        with self.lock:
+            self.responses[(model, prompt)] = response
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"model": model, "prompt": prompt, "response": response}) + "\n")
+
+class RecordingBackend(LlmBackend):
+    """Backend passing prompts to another backend and recording the responses to a cassette."""
+
+    def __init__(self, backend: LlmBackend, cassette: Cassette):
+        super().__init__(backend.model)
+        self.backend = backend
+        self.cassette = cassette
+
+    def invoke(self, prompt: Any) -> str:
+        response = self.backend.invoke(prompt)
+        self.cassette.record(self.model, prompt_text(prompt), response)
+        return response
+
+    def stream(self, prompt: Any) -> Iterator[str]:
+        chunks = []
+        for chunk in self.backend.stream(prompt):
+            chunks.append(chunk)
+            yield chunk
+        self.cassette.record(self.model, prompt_text(prompt), "".join(chunks))
+
+class ReplayBackend(LlmBackend):
+    """Backend serving recorded responses, or synthetic ones, with simulated latency."""
+
+    def __init__(self, model: str, cassette: Optional[Cassette] = None, synthetic: bool = False,
+                 latency: float = 0.0, token_latency: float = 0.0):
+        """Initialize the replay backend.
+
+        Args:
+            model: Name of the model whose recorded responses are served
+            cassette: Recorded responses, none if None
+            synthetic: Whether prompts without a recording get a synthetic response instead of an error
+            latency: Seconds waited before every response
+            token_latency: Seconds waited per streamed word
+        """
+        super().__init__(model)
+        self.cassette = cassette
+        self.synthetic = synthetic
+        self.latency = latency
+        self.token_latency = token_latency
+        self.hits = 0
+        self.misses = 0
+
+    def _response(self, prompt: Any) -> str:
+        text = prompt_text(prompt)
+        response = self.cassette.get(self.model, text) if self.cassette is not None else None
+        if response is None:
+            self.misses += 1
+            if not self.synthetic:
+                raise LookupError(f"No recorded response of {self.model} for prompt {hashlib.sha256(text.encode('utf-8')).hexdigest()[:12]}")
+            response = synthetic_response(text)
+        else:
+            self.hits += 1
+        if self.latency > 0:
+            time.sleep(self.latency)
+        return response
+
+    def invoke(self, prompt: Any) -> str:
+        response = self._response(prompt)
+        if self.token_latency > 0:
+            time.sleep(self.token_latency * len(response.split()))
+        return response
+
+    def stream(self, prompt: Any) -> Iterator[str]:
+        for chunk in re.findall(r"\S*\s*", self._response(prompt)):
+            if chunk:
+                if self.token_latency > 0:
+                    time.sleep(self.token_latency)
+                yield chunk
+
+def make_backend_factory(kind: str = "ollama", cassette: Optional[str] = None,
+                         latency: float = 0.0, token_latency: float = 0.0) -> Callable[[str], LlmBackend]:
+    """Return a function creating the backend of a model name.
+
+    Args:
+        kind: "ollama" for live completions, "record" to also record them to the cassette,
+              "replay" to serve the recorded completions only, "fake" to serve recorded
+              completions where available and synthetic ones otherwise
+        cassette: Path of the cassette file, required for "record" and "replay"
+        latency: Seconds waited before every replayed or synthetic response
+        token_latency: Seconds waited per replayed or synthetic word
+
+    Returns:
+        Function from a model name to its backend
+    """
+    if kind not in BACKEND_KINDS:
+        raise ValueError(f"Unknown LLM backend {kind!r}, expected one of {', '.join(BACKEND_KINDS)}")
+    if kind in ("record", "replay") and not cassette:
+        raise ValueError(f"The {kind} LLM backend needs a cassette file")
+    # loaded once, shared by the response and fact extraction models
+    shared = Cassette(cassette) if cassette else None
+    if kind == "ollama":
+        return OllamaBackend
+    if kind == "record":
+        return lambda model: RecordingBackend(OllamaBackend(model), shared)
+    return lambda model: ReplayBackend(model, shared, synthetic=(kind == "fake"),
+                                       latency=latency, token_latency=token_latency)
@@ -2,39 +2,128 @@
 Interface to LLM (Ollama) for the NARS-Ollama pipeline
 """
 
+import re
 import traceback
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Union, Iterable, Iterator, Callable
 
 # Import LangChain Ollama components
 try:
-    from langchain_ollama.llms import OllamaLLM
     from langchain_core.prompts import ChatPromptTemplate
     from langchain_core.messages import HumanMessage, AIMessage
 except ImportError:
     print("Warning: LangChain libraries not found. LLM functionality will be limited.")
 
+from fact_cache import FactCache
+from llm_backends import LlmBackend, OllamaBackend
+
+THINK_OPEN = "<think>"
+THINK_CLOSE = "</think>"
+
+def _partial_tag_length(text: str, tag: str) -> int:
+    """Length of the longest end of text that is the start of tag."""
+    for length in range(min(len(tag) - 1, len(text)), 0, -1):
+        if text.endswith(tag[:length]):
+            return length
+    return 0
+
+def strip_think(chunks: Iterable[str]) -> Iterator[str]:
+    """Yield the text of a token stream without its <think>...</think> sections.
+
+    Tags split across chunks are recognized: text that may be the start of
+    a tag is held back until the following chunk decides. Whitespace at the
+    start of the answer is dropped.
+
+    Args:
+        chunks: Text chunks as generated by the model
+
+    Yields:
+        Visible text chunks
+    """
+    buffer = ""
+    thinking = False
+    answer_start = True
+    for chunk in chunks:
+        buffer += chunk
+        while True:
+            if thinking:
+                end = buffer.find(THINK_CLOSE)
+                if end < 0:
+                    buffer = buffer[len(buffer) - _partial_tag_length(buffer, THINK_CLOSE):]
+                    break
+                buffer = buffer[end + len(THINK_CLOSE):]
+                thinking = False
+                answer_start = True
+            start = buffer.find(THINK_OPEN)
+            if start >= 0:
+                text, buffer = buffer[:start], buffer[start + len(THINK_OPEN):]
+                thinking = True
+            else:
+                keep = _partial_tag_length(buffer, THINK_OPEN)
+                text, buffer = buffer[:len(buffer) - keep], buffer[len(buffer) - keep:]
+            if answer_start:
+                text = text.lstrip()
+                answer_start = not text
+            if text:
+                yield text
+            if not thinking:
+                break
+    if not thinking:
+        text = buffer.lstrip() if answer_start else buffer
+        if text:
+            yield text
+
+# Fact of a batched extraction, tagged with the number of its sentence
+TAGGED_FACT = re.compile(r"\[(\d+)\]\s*(.*)")
+
+def response_text(response: Any) -> str:
+    """Text of a model response, for both objects with .content and direct strings."""
+    return response.content if hasattr(response, 'content') else response
+
+def remove_think(content: str) -> str:
+    """Remove the <think> section of a complete response."""
+    if "<think>" in content and "</think>" in content:
+        thinking_part = content.split("<think>")[1].split("</think>")[0]
+        content = content.replace(f"<think>{thinking_part}</think>", "")
+    return content
+
+def is_fact(line: str) -> bool:
+    """Whether a response line is a fact rather than thinking, formatting or metadata."""
+    return not (line.startswith('-') or line.startswith('*') or line.startswith('#') or
+                line.startswith('<') or line.startswith('>') or line.startswith('1.') or
+                "think" in line.lower())
+
+def template_fingerprint(template: Any) -> str:
+    """Text identifying a prompt template, changing whenever its messages change."""
+    pretty_repr = getattr(template, "pretty_repr", None)
+    return pretty_repr() if pretty_repr is not None else repr(template)
+
 class LlmClient:
     """Client for interacting with Ollama LLM."""
     
-    def __init__(self, model_name: str = "llama3.2", verbose: bool = False, fact_model: str = None):
+    def __init__(self, model_name: str = "llama3.2", verbose: bool = False, fact_model: str = None, fact_cache: Optional[FactCache] = None,
+                 backend: Optional[Callable[[str], LlmBackend]] = None):
         """Initialize LLM client.
         
         Args:
             model_name: Name of the Ollama model to use for response generation
             verbose: Whether to print verbose output
             fact_model: Optional separate model for fact extraction (defaults to model_name)
+            fact_cache: Optional persistent cache of extracted facts
+            backend: Function creating the backend of a model name (defaults to Ollama)
         """
         self.verbose = verbose
         self.model_name = model_name
         self.fact_model = fact_model or model_name
+        self.fact_cache = fact_cache
         
         try:
             if self.verbose:
                 print(f"Initializing main model: {model_name}")
                 print(f"Initializing fact extraction model: {self.fact_model}")
             
-            self.llm = OllamaLLM(model=model_name)
-            self.fact_llm = OllamaLLM(model=self.fact_model)
+            backend = backend or OllamaBackend
+            self.llm = backend(model_name)
+            self.fact_llm = backend(self.fact_model)
             self.chat_history = []
         except Exception as e:
             if self.verbose:
@@ -43,6 +132,12 @@ class LlmClient:
             self.llm = None
             self.fact_llm = None
     
+    def _fact_cache_key(self, text: str) -> str:
+        """Cache key of the facts of a text, the same for single and batched extraction."""
+        from prompts import fact_extraction_template, batch_fact_extraction_template
+        fingerprint = template_fingerprint(fact_extraction_template) + template_fingerprint(batch_fact_extraction_template)
+        return FactCache.key(self.fact_model, fingerprint, text)
+
     def extract_facts(self, user_input: str) -> List[str]:
         """Use LLM to extract simple statements from user input.
 
@@ -56,6 +151,23 @@ class LlmClient:
             print(f"Extracting facts from: '{user_input}'")
             print(f"Using model: {self.fact_model}")
 
+        cache_key = None
+        if self.fact_cache is not None:
+            try:
+                cache_key = self._fact_cache_key(user_input)
+                facts = self.fact_cache.get(cache_key)
+                if facts is not None:
+                    if self.verbose:
+                        print(f"Using {len(facts)} cached facts")
+                    return facts
+            except Exception as e:
+                if self.verbose:
+                    print(f"Error reading the fact cache: {e}")
+
+        return self._extract_facts_uncached(user_input, cache_key)
+
+    def _extract_facts_uncached(self, user_input: str, cache_key: Optional[str]) -> List[str]:
+        """Extract the facts of a text with the model and cache them, also when there are none."""
         if not self.fact_llm:
             if self.verbose:
                 print("Fact extraction LLM not initialized")
@@ -64,44 +176,31 @@ class LlmClient:
         try:
             from prompts import fact_extraction_template
             
-            chain = fact_extraction_template | self.fact_llm
-            response = chain.invoke({"input": user_input})
-            
-            # Handle both object with .content and direct string responses
-            if hasattr(response, 'content'):
-                content = response.content
-            else:
-                content = response
+            prompt = fact_extraction_template.invoke({"input": user_input})
+            content = response_text(self.fact_llm.invoke(prompt))
+            facts = []
                 
             if content and content.strip():
                 # Filter out thinking sections
-                if "<think>" in content and "</think>" in content:
-                    thinking_part = content.split("<think>")[1].split("</think>")[0]
-                    content = content.replace(f"<think>{thinking_part}</think>", "")
+                content = remove_think(content)
                 
                 # Split the response into lines and filter out empty ones
                 raw_facts = [line.strip() for line in content.strip().split('\n') if line.strip()]
                 
                 # Filter out any lines that are clearly not facts
-                facts = []
-                for line in raw_facts:
-                    # Skip lines that are part of the thinking process or metadata
-                    if line.startswith('-') or line.startswith('*') or line.startswith('#') or \
-                        line.startswith('<') or line.startswith('>') or line.startswith('1.') or \
-                        "think" in line.lower():
-                        continue
-                    facts.append(line)
+                facts = [line for line in raw_facts if is_fact(line)]
                 
                 if self.verbose:
                     print(f"Extracted {len(facts)} facts:")
                     for i, fact in enumerate(facts):
                         print(f"  {i+1}. {fact}")
-                        
-                return facts
-            else:
-                if self.verbose:
-                    print("No facts extracted (empty response)")
-                return []
+            elif self.verbose:
+                print("No facts extracted (empty response)")
+            
+            # a text without facts is cached as well, so it is not sent to the model again
+            if cache_key is not None:
+                self.fact_cache.put(cache_key, facts)
+            return facts
                 
         except Exception as e:
             if self.verbose:
@@ -109,12 +208,72 @@ class LlmClient:
                 traceback.print_exc()
             return []
 
-    def generate_response(self, user_input: str, nars_knowledge: str) -> str:
+    def extract_facts_batch(self, sentences: List[str]) -> List[List[str]]:
+        """Use LLM to extract simple statements from several sentences in one request.
+        
+        The sentences are numbered in the prompt and the model tags every
+        fact with the number of its sentence, so the long system prompt is
+        processed once per batch instead of once per sentence. Sentences
+        without any correctly tagged fact are extracted on their own, as by
+        extract_facts. Both share the fact cache, cached sentences are not
+        sent to the model.
+        
+        Args:
+            sentences: Sentences to extract facts from
+            
+        Returns:
+            List of simple statements per sentence, in the order of the sentences
+        """
+        if self.verbose:
+            print(f"Extracting facts from {len(sentences)} sentences in one request")
+        
+        results: List[Optional[List[str]]] = [None] * len(sentences)
+        cache_keys = [None] * len(sentences)
+        try:
+            from prompts import batch_fact_extraction_template
+            if self.fact_cache is not None:
+                for i, sentence in enumerate(sentences):
+                    cache_keys[i] = self._fact_cache_key(sentence)
+                    results[i] = self.fact_cache.get(cache_keys[i])
+            
+            missing = [i for i, facts in enumerate(results) if facts is None]
+            if missing and self.fact_llm:
+                numbered = "\n".join(f"[{number}] {sentences[i]}" for number, i in enumerate(missing, 1))
+                prompt = batch_fact_extraction_template.invoke({"input": numbered})
+                content = remove_think(response_text(self.fact_llm.invoke(prompt)) or "")
+                tagged = {}
+                for line in content.split('\n'):
+                    match = TAGGED_FACT.fullmatch(line.strip())
+                    if match and 1 <= int(match.group(1)) <= len(missing) and match.group(2).strip() and is_fact(match.group(2).strip()):
+                        tagged.setdefault(missing[int(match.group(1)) - 1], []).append(match.group(2).strip())
+                for i, facts in tagged.items():
+                    results[i] = facts
+                    if cache_keys[i] is not None:
+                        self.fact_cache.put(cache_keys[i], facts)
+        
+        except Exception as e:
+            if self.verbose:
+                print(f"Error extracting facts in a batch: {e}")
+                traceback.print_exc()
+        
+        fallbacks = [i for i, facts in enumerate(results) if facts is None]
+        if fallbacks and self.verbose:
+            print(f"Extracting {len(fallbacks)} sentences without tagged facts one by one")
+        for i in fallbacks:
+            results[i] = self._extract_facts_uncached(sentences[i], cache_keys[i])
+        return results
+
+    def generate_response(self, user_input: str, nars_knowledge: str, on_token: Optional[Callable[[str], None]] = None) -> str:
         """Generate a response based on NARS knowledge.
         
+        With on_token, the response is streamed: every chunk of the final
+        answer is passed to on_token as soon as the model generates it,
+        while the <think> section is suppressed.
+        
         Args:
             user_input: User input text
             nars_knowledge: Knowledge extracted from NARS
+            on_token: Optional callback receiving the visible answer text as it is generated
             
         Returns:
             Generated response
@@ -131,27 +290,31 @@ class LlmClient:
         try:
             from prompts import answer_template
             
-            chain = answer_template | self.llm
-            response = chain.invoke({
+            prompt = answer_template.invoke({
                 "input": user_input,
                 "chat_history": [],
                 "context": nars_knowledge
             })
             
-            # Handle both object with .content and direct string responses
-            if hasattr(response, 'content'):
-                content = response.content
+            if on_token is not None:
+                # Handle both chunk objects with .content and direct string chunks
+                chunks = (getattr(chunk, 'content', chunk) for chunk in self.llm.stream(prompt))
+                parts = []
+                for text in strip_think(chunks):
+                    parts.append(text)
+                    on_token(text)
+                final_answer = "".join(parts).strip()
             else:
-                content = response
-            
-            if self.verbose:
-                print("\n=== RAW RESPONSE ===")
-                print(content)
+                content = response_text(self.llm.invoke(prompt))
+                
+                if self.verbose:
+                    print("\n=== RAW RESPONSE ===")
+                    print(content)
 
-            if '<think>' in content and '</think>' in content:
-                final_answer = content.split('</think>')[1].strip()
-            else:
-                final_answer = content
+                if '<think>' in content and '</think>' in content:
+                    final_answer = content.split('</think>')[1].strip()
+                else:
+                    final_answer = content
             
             # Update chat history
             self.chat_history.append(HumanMessage(content=user_input))
@@ -22,6 +22,8 @@ import os
 import argparse
 import atexit
 from pipeline import NarsOllamaPipeline
+from truth_translator import DEFAULT_CONTEXT_TOKENS
+from llm_backends import BACKEND_KINDS, make_backend_factory
 
 def parse_args():
     """Parse command line arguments."""
@@ -64,13 +66,75 @@ def parse_args():
         help="Save NARS knowledge to a file on exit"
     )
     
+    parser.add_argument(
+        "--context-tokens",
+        type=int,
+        default=DEFAULT_CONTEXT_TOKENS,
+        help="Token budget of the NARS knowledge passed to the model"
+    )
+    
+    parser.add_argument(
+        "--fact-cache",
+        type=str,
+        help="Database caching extracted facts across runs (e.g. fact_cache.sqlite), no caching if not given"
+    )
+    
+    parser.add_argument(
+        "--translation-cache",
+        type=str,
+        help="File persisting English to Narsese translations across runs"
+    )
+    
+    parser.add_argument(
+        "--extract-workers",
+        type=int,
+        default=1,
+        help="Number of concurrent fact extractions in *process-file"
+    )
+    
+    parser.add_argument(
+        "--extract-batch",
+        type=int,
+        default=1,
+        help="Number of sentences per fact extraction request in *process-file"
+    )
+    
+    parser.add_argument(
+        "--convert-processes",
+        type=int,
+        help="Number of processes converting English to Narsese in *ingest-file (default: all cores)"
+    )
+    
+    parser.add_argument(
+        "--llm-backend",
+        choices=BACKEND_KINDS,
+        default="ollama",
+        help="Ollama, Ollama recorded to --cassette, replay of --cassette, or replay with synthetic responses for unrecorded prompts"
+    )
+    
+    parser.add_argument(
+        "--cassette",
+        type=str,
+        help="File of recorded prompts and responses of the record, replay and fake backends"
+    )
+    
+    parser.add_argument(
+        "--llm-latency",
+        type=float,
+        default=0.0,
+        help="Seconds of simulated latency per response of the replay and fake backends"
+    )
+    
     parser.add_argument(
         "--no-auto-save",
         action="store_true",
         help="Disable automatic saving on exit"
     )
     
-    return parser.parse_args()
+    args = parser.parse_args()
+    if args.llm_backend in ("record", "replay") and not args.cassette:
+        parser.error(f"--llm-backend {args.llm_backend} requires --cassette")
+    return args
 
 def main():
     """Main function to run the NARS-Ollama system."""
@@ -85,7 +149,14 @@ def main():
         model_name=args.model,
         fact_model=args.fact_model,
         verbose=args.verbose,
-        init_nars=not args.no_init
+        init_nars=not args.no_init,
+        context_tokens=args.context_tokens,
+        fact_cache=args.fact_cache,
+        extraction_workers=args.extract_workers,
+        extraction_batch_size=args.extract_batch,
+        llm_backend=make_backend_factory(args.llm_backend, args.cassette, args.llm_latency),
+        translation_cache=args.translation_cache,
+        conversion_processes=args.convert_processes
     )
     
     # Load knowledge if specified
@@ -101,11 +172,14 @@ def main():
     if args.save and not args.no_auto_save:
         def save_on_exit():
             print(f"\nSaving knowledge to {args.save}...")
-            result = pipeline.nars_client.save_knowledge(args.save)
+            result = pipeline.nars_client.save_knowledge(args.save, delta=True)
             print(result.get("raw", "Saving complete"))
         
         atexit.register(save_on_exit)
     
+    if args.translation_cache:
+        atexit.register(pipeline.converter.save_translation_cache)
+    
     print("\n=== NARS-OLLAMA PIPELINE READY ===")
     print("You can start asking questions or providing statements.")
     print("Type 'exit' to quit.")
@@ -113,9 +187,11 @@ def main():
     print("  *reset - Reset NARS knowledge")
     print("  *save [FILE] - Save NARS knowledge to a file")
     print("  *load [FILE] - Load NARS knowledge from a file")
+    print("  *snapshot save|load [FILE] - Save or restore the complete NARS memory")
     print("  *run N - Run N inference cycles")
     print("  *concepts - Show all concepts in NARS")
     print("  *process-file [FILE] - Process a text file without generating responses")
+    print("  *ingest-file [FILE] - Convert a text file directly to Narsese in parallel, without the LLM")
     
     # Main interaction loop
     while True:
@@ -129,7 +205,7 @@ def main():
             # Process the input
             if user_input.startswith("*"):
                 # Handle special commands
-                if user_input.startswith("*save") or user_input.startswith("*load"):
+                if user_input.startswith("*save") or user_input.startswith("*load") or user_input.startswith("*snapshot"):
                     result = pipeline.nars_client.add_input(user_input)
                     print(result.get("raw", "Command processed"))
                 elif user_input.startswith("*process-file"):
@@ -140,6 +216,12 @@ def main():
                     else:
                         file_path = parts[1].strip()
                         pipeline.process_file(file_path)
+                elif user_input.startswith("*ingest-file"):
+                    parts = user_input.split(maxsplit=1)
+                    if len(parts) < 2:
+                        print("Usage: *ingest-file [FILE]")
+                    else:
+                        pipeline.ingest_file(parts[1].strip())
                 else:
                     # Other NARS commands
                     result = pipeline.nars_client.add_input(user_input)
@@ -151,9 +233,19 @@ def main():
                     else:
                         print(result.get("raw", "Command processed"))
             else:
-                # Process regular input
-                response = pipeline.process_input(user_input)
-                print(f"\n{response}")
+                # Process regular input, showing the answer while it is generated
+                streamed = []
+                def show(text):
+                    if not streamed:
+                        print()
+                    streamed.append(text)
+                    print(text, end="", flush=True)
+                
+                response = pipeline.process_input(user_input, on_token=show)
+                if streamed:
+                    print()
+                else:
+                    print(f"\n{response}")
             
         except KeyboardInterrupt:
             print("\nExiting...")
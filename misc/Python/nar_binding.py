@@ -0,0 +1,158 @@
+"""
+In-process binding to the NARS C core (libONA) via ctypes
+
+Instead of a text pipe to the NAR binary, the reasoner runs inside the
+Python process and hands its events (inputs, derivations, selections,
+answers, decisions and executions) to a callback, so nothing is
+formatted, flushed or re-parsed. Build the library with libbuild.sh (installs libONA.so) or
+point the ONA_LIBRARY environment variable to a libONA.so.
+
+The events have the keys NAR.parseTask, NAR.parseExecution and
+NAR.parseReason give them, except that the C core does not hand over
+stamps, so there is no "Stamp", and the dt of an implication is a "dt"
+key instead of a prefix of its term. Decisions are in the "reason"
+category; as in NAR.AddInput the returned events hold only the last one,
+while on_event receives all of them.
+
+The C core keeps its state in globals, so there can only be one reasoner
+per process; use NarPool or AsyncNarClient for several knowledge bases.
+"""
+
+import os
+import ctypes
+import ctypes.util
+from typing import Any, Callable, Dict, List, Optional
+
+OCCURRENCE_ETERNAL = -1
+
+EVENT_CATEGORIES = {b"I": "input", b"D": "derivations", b"R": "derivations", b"S": "selections", b"A": "answers", b"E": "executions",
+                    b"C": "reason"}
+
+EVENT_HANDLER = ctypes.CFUNCTYPE(None, ctypes.c_char, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char,
+                                 ctypes.c_double, ctypes.c_double, ctypes.c_long, ctypes.c_double, ctypes.c_double)
+
+def find_library() -> Optional[str]:
+    """Locate libONA: ONA_LIBRARY, the repository root, then the system library path."""
+    candidates = [os.environ.get("ONA_LIBRARY"), os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "libONA.so")]
+    for candidate in candidates:
+        if candidate and os.path.exists(candidate):
+            return candidate
+    return ctypes.util.find_library("ONA")
+
+class InProcessNar:
+    """NARS reasoner running inside this process."""
+
+    _active = False
+
+    def __init__(self, library_path: Optional[str] = None, on_event: Optional[Callable[[str, Dict[str, Any]], None]] = None, verbose: bool = False):
+        """Load libONA and initialize the reasoner.
+
+        Args:
+            library_path: Path to libONA.so (located automatically if None)
+            on_event: Optional callback receiving (category, event) for every event
+            verbose: Whether to print verbose output
+        """
+        if InProcessNar._active:
+            raise RuntimeError("Only one InProcessNar can exist per process, the C core state is global")
+        path = library_path or find_library()
+        if not path:
+            raise OSError("libONA not found, run libbuild.sh or set ONA_LIBRARY")
+        self.verbose = verbose
+        self.on_event = on_event
+        self.collected = None
+        # the precondition of the decision reported next
+        self.precondition = None
+        self.lib = ctypes.CDLL(path)
+        self.lib.NAR_Cycles.argtypes = [ctypes.c_int]
+        self.lib.NAR_AddInputNarsese.argtypes = [ctypes.c_char_p]
+        self.lib.Shell_ProcessInput.argtypes = [ctypes.c_char_p]
+        self.lib.Shell_ProcessInput.restype = ctypes.c_int
+        # keep a reference to the callback, ctypes does not
+        self.handler = EVENT_HANDLER(self._handle)
+        ctypes.c_void_p.in_dll(self.lib, "Memory_eventHandler").value = ctypes.cast(self.handler, ctypes.c_void_p).value
+        InProcessNar._active = True
+        self.reset()
+        if self.verbose:
+            print(f"Loaded NARS core from {path}")
+
+    def _handle(self, kind, term, args, punctuation, frequency, confidence, occurrence_time, occurrence_time_offset, priority):
+        if kind == b"P":
+            self.precondition = {"occurrenceTime": str(occurrence_time), "punctuation": ".", "term": term.decode(),
+                                 "truth": {"frequency": "%f" % frequency, "confidence": "%f" % confidence}}
+            return
+        category = EVENT_CATEGORIES.get(kind)
+        if category is None:
+            return
+        term = term.decode()
+        if category == "reason":
+            # shape of NAR.parseReason without the Stamps, the text output has no dt in the hypothesis
+            hypothesis = {"occurrenceTime": "eternal", "punctuation": ".", "term": term,
+                          "truth": {"frequency": "%f" % frequency, "confidence": "%f" % confidence}}
+            event = {"desire": "%f" % priority, "hypothesis": hypothesis, "precondition": self.precondition}
+            self.precondition = None
+        elif category == "executions":
+            args = args.decode()
+            if args.startswith("({SELF} * "):
+                event = {"operator": term, "arguments": args[len("({SELF} * "):-1], "metta": "(^ " + term[1:] + ")"}
+            else:
+                event = {"operator": term, "arguments": []}
+        else:
+            # shape of NAR.parseTask without the Stamp
+            event = {"occurrenceTime": "eternal" if occurrence_time == OCCURRENCE_ETERNAL else str(occurrence_time)}
+            event["punctuation"] = punctuation.decode()
+            event["term"] = term
+            if confidence > 0.0 and not (category == "answers" and term == "None"):
+                event["truth"] = {"frequency": "%f" % frequency, "confidence": "%f" % confidence}
+            if category != "answers" and event["punctuation"] != "?":
+                event["Priority"] = "%f" % priority
+            if occurrence_time_offset:
+                event["dt"] = "%f" % occurrence_time_offset
+        if self.collected is not None:
+            if category == "reason":
+                # the last decision, as NAR.AddInput
+                self.collected[category] = event
+            else:
+                self.collected[category].append(event)
+        if self.on_event is not None:
+            self.on_event(category, event)
+
+    def _collect(self, func, *args) -> Dict[str, List[Dict[str, Any]]]:
+        self.collected = {"input": [], "derivations": [], "answers": [], "executions": [], "selections": [], "reason": None}
+        try:
+            func(*args)
+            return self.collected
+        finally:
+            self.collected = None
+
+    def reset(self) -> None:
+        """Reset the reasoner and register the default shell operations."""
+        self.lib.Shell_NARInit()
+        ctypes.c_double.in_dll(self.lib, "PRINT_EVENTS_PRIORITY_THRESHOLD").value = 0.0  # *volume=100
+
+    def add_input(self, narsese: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Add a Narsese sentence, a cycle count or a shell command.
+
+        Args:
+            narsese: Narsese sentence, number of cycles, or *command
+
+        Returns:
+            Events produced while processing the input, grouped by category
+        """
+        narsese = narsese.strip()
+        if not narsese or narsese.startswith("//"):
+            return self._collect(lambda: None)
+        if narsese.isdigit():
+            return self.cycles(int(narsese))
+        if narsese == "*reset":
+            return self._collect(self.reset)
+        if narsese.startswith("*"):
+            return self._collect(self.lib.Shell_ProcessInput, ctypes.create_string_buffer(narsese.encode()))
+        return self._collect(self.lib.NAR_AddInputNarsese, ctypes.create_string_buffer(narsese.encode()))
+
+    def add_inputs(self, narseses: List[str]) -> List[Dict[str, List[Dict[str, Any]]]]:
+        """Add several inputs, returning the events of each one in order."""
+        return [self.add_input(narsese) for narsese in narseses]
+
+    def cycles(self, cycles: int) -> Dict[str, List[Dict[str, Any]]]:
+        """Run inference cycles and return the events they produced."""
+        return self._collect(self.lib.NAR_Cycles, cycles)
@@ -0,0 +1,91 @@
+"""
+Pool of NAR shell processes with session affinity
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+from NAR import AddInput, spawnNAR
+
+class NarPool:
+    """Pool of NAR shell processes, each session is pinned to one of them."""
+
+    def __init__(self, size: Optional[int] = None, verbose: bool = False):
+        """Start the pool.
+
+        Args:
+            size: Number of NAR processes (defaults to the number of cores)
+            verbose: Whether to print verbose output
+        """
+        self.verbose = verbose
+        self.size = size or os.cpu_count() or 1
+        self.processes = [self._spawn() for _ in range(self.size)]
+        self.locks = [threading.Lock() for _ in range(self.size)]
+        self.sessions: Dict[str, int] = {}
+        self.sessions_lock = threading.Lock()
+
+    def _spawn(self):
+        """Start and configure a single NAR process."""
+        proc = spawnNAR()
+        AddInput("*volume=100", Print=False, usedNAR=proc)
+        return proc
+
+    def _restart(self, index: int) -> None:
+        """Replace the process at index, the knowledge of its sessions is lost."""
+        if self.verbose:
+            print(f"Restarting NAR process {index}")
+        proc = self.processes[index]
+        if proc.poll() is None:
+            proc.kill()
+        proc.wait()
+        self.processes[index] = self._spawn()
+
+    def index_of(self, session_id: str) -> int:
+        """Return the process index of a session, pinning new sessions to the least used process."""
+        with self.sessions_lock:
+            if session_id not in self.sessions:
+                load = [0] * self.size
+                for index in self.sessions.values():
+                    load[index] += 1
+                self.sessions[session_id] = load.index(min(load))
+            return self.sessions[session_id]
+
+    def release(self, session_id: str) -> None:
+        """Unpin a session so that its slot can be used by new sessions."""
+        with self.sessions_lock:
+            self.sessions.pop(session_id, None)
+
+    @contextmanager
+    def session(self, session_id: str) -> Iterator:
+        """Lock and yield the live NAR process of a session.
+
+        A dead process is restarted before use, and a process that fails
+        during use is restarted before the error is re-raised.
+        """
+        index = self.index_of(session_id)
+        with self.locks[index]:
+            if self.processes[index].poll() is not None:
+                self._restart(index)
+            try:
+                yield self.processes[index]
+            except (BrokenPipeError, EOFError, OSError):
+                self._restart(index)
+                raise
+
+    def client(self, session_id: str, verbose: Optional[bool] = None):
+        """Return a NarsClient bound to the process of a session."""
+        from nars_client import NarsClient
+        return NarsClient(verbose=self.verbose if verbose is None else verbose, pool=self, session_id=session_id)
+
+    def close(self) -> None:
+        """Terminate all processes of the pool."""
+        for index, proc in enumerate(self.processes):
+            with self.locks[index]:
+                if proc.poll() is None:
+                    proc.stdin.close()
+                    proc.kill()
+                proc.wait()
+        with self.sessions_lock:
+            self.sessions.clear()
@@ -0,0 +1,232 @@
+"""
+Parsing of the output of the NAR shell and the constants of its pipe protocol
+
+Unlike NAR, importing this module starts no NAR process.
+"""
+
+import re
+import ast
+import json
+import weakref
+
+def parseTruth(T):
+    return {"frequency": T.split("frequency=")[1].split(" confidence")[0].replace(",",""), "confidence": T.split(" confidence=")[1].split(" dt=")[0].split(" occurrenceTime=")[0]}
+
+def parseTaskSplit(s):
+    M = {"occurrenceTime" : "eternal"}
+    if " :|:" in s:
+        M["occurrenceTime"] = "now"
+        s = s.replace(" :|:","")
+        if "occurrenceTime" in s:
+            M["occurrenceTime"] = s.split("occurrenceTime=")[1].split(" ")[0]
+    if "Stamp" in s:
+        M["Stamp"] = ast.literal_eval(s.split("Stamp=")[1].split("]")[0]+"]")
+    sentence = s.split(" occurrenceTime=")[0] if " occurrenceTime=" in s else s.split(" Stamp=")[0].split(" Priority=")[0].split(" creationTime=")[0]
+    M["punctuation"] = sentence[-4] if ":|:" in sentence else sentence[-1]
+    M["term"] = sentence.split(" creationTime")[0].split(" occurrenceTime")[0].split(" Truth")[0].split(" Stamp=")[0][:-1]
+    if "Truth" in s:
+        M["truth"] = parseTruth(s.split("Truth: ")[1])
+    if "Priority" in s:
+        M["Priority"] = s.split("Priority=")[1].split(" ")[0]
+    return M
+
+#single pass parser for the canonical task formats (Input/Derived/Revised/Selected/Answer), anything else falls back to parseTaskSplit
+TASK_PATTERN = re.compile(r"(.*?)([.!?])(?: (:\|:)(?: occurrenceTime=(-?[0-9]+))?)?(?: creationTime=-?[0-9]+)?(?: Priority=(\S+))?(?: Stamp=\[([0-9,]*)\])?(?: Truth: frequency=([^,\s]+), confidence=(\S+))?")
+
+def parseTask(s):
+    m = TASK_PATTERN.fullmatch(s)
+    if m is None:
+        return parseTaskSplit(s)
+    term, punctuation, tense, occurrenceTime, priority, stamp, frequency, confidence = m.groups()
+    M = {"occurrenceTime" : "eternal" if tense is None else (occurrenceTime or "now")}
+    if stamp is not None:
+        M["Stamp"] = [int(x) for x in stamp.split(",") if x]
+    M["punctuation"] = punctuation
+    M["term"] = term
+    if frequency is not None:
+        M["truth"] = {"frequency": frequency, "confidence": confidence}
+    if priority is not None:
+        M["Priority"] = priority
+    return M
+
+def parseReason(sraw):
+    if "implication: " not in sraw:
+        return None
+    Implication = parseTask(sraw.split("implication: ")[-1].split("precondition: ")[0]) #last reason only (others couldn't be associated currently)
+    Precondition = parseTask(sraw.split("precondition: ")[-1].split("\n")[0])
+    Implication["occurrenceTime"] = "eternal"
+    Precondition["punctuation"] = Implication["punctuation"] = "."
+    Reason = {}
+    Reason["desire"] = sraw.split("decision expectation=")[-1].split(" ")[0]
+    Reason["hypothesis"] = Implication
+    Reason["precondition"] = Precondition
+    return Reason
+    
+def parseExecution(e):
+    if "args " not in e:
+        return {"operator" : e.split(" ")[0], "arguments" : []}
+    opname = e.split(" ")[0]
+    return {"operator": opname, "arguments": e.split("args ")[1].split("{SELF} * ")[1][:-1], 'metta': '(^ ' + opname[1:] + ')'}
+
+BATCH_SENTINEL = "//batch-sentinel "
+BATCH_SENTINEL_ECHO = "Comment: batch-sentinel "
+PRODUCT_EXPECTED = "//Operation result product expected:"
+
+#processes with operations registered by *setopstdin, executing one makes NARS read a "0" and then the product from stdin
+StdinOperationNARs = weakref.WeakSet()
+
+def TrackStdinOperations(narseses, usedNAR):
+    #returns whether an operation may read its product from stdin while the statements are input, lines written ahead would be taken for it
+    stdinOperations = usedNAR in StdinOperationNARs
+    for narsese in narseses:
+        if narsese.startswith("*setopstdin "):
+            StdinOperationNARs.add(usedNAR)
+            stdinOperations = True
+        elif narsese == "*reset":
+            StdinOperationNARs.discard(usedNAR)
+    return stdinOperations
+
+OUTPUT_CATEGORIES = ("input", "derivations", "answers", "executions", "reason", "selections", "raw")
+OUTPUT_DEFAULTS = {"input": [], "derivations": [], "answers": [], "executions": [], "reason": None, "selections": [], "raw": ""}
+
+#categories of the "type" field of the lines NARS prints with *format=jsonl
+JSONL_PREFIX = '{"type": "'
+JSONL_CATEGORIES = {"input": "input", "derived": "derivations", "revised": "derivations", "answer": "answers", "execution": "executions", "decision": "reason", "selected": "selections"}
+
+def parseJSONTask(M):
+    #JSONL tasks in the shape of parseTask: dt= prefix of the term, no creationTime, as the text output is parsed
+    if "dt" in M:
+        M["term"] = "dt=" + M.pop("dt") + " " + M["term"]
+    M.pop("creationTime", None)
+    if "Stamp" in M:
+        M["Stamp"] = [int(x) for x in M["Stamp"]]
+    return M
+
+def parseJSONLine(l):
+    #JSONL events have the parseTask/parseExecution/parseReason shape, numbers are kept as the strings NARS printed like the text parsers return them
+    M = json.loads(l, parse_int=str, parse_float=str)
+    eventType = M.pop("type")
+    if eventType == "decision":
+        #the text output of decisions has no dt in the implication
+        M["hypothesis"].pop("dt", None)
+        parseJSONTask(M["hypothesis"])
+        parseJSONTask(M["precondition"])
+    elif eventType == "execution":
+        if M["arguments"]:
+            M["metta"] = '(^ ' + M["operator"][1:] + ')'
+    elif "punctuation" in M:
+        parseJSONTask(M)
+    return M
+
+def classifyLine(l):
+    #returns the output category of a line and the part of it to parse, None if it belongs to no category
+    if l.startswith(JSONL_PREFIX):
+        return JSONL_CATEGORIES.get(l[len(JSONL_PREFIX):l.find('"', len(JSONL_PREFIX))]), l
+    if l.startswith('^'):
+        return "executions", l
+    if l.startswith('Input: '):
+        return "input", l[7:]
+    if l.startswith('Derived: ') or l.startswith('Revised: '):
+        return "derivations", l[9:]
+    if l.startswith('Answer: '):
+        return "answers", l[8:]
+    if l.startswith('Selected: '):
+        return "selections", l[10:]
+    if "implication: " in l:
+        return "reason", l
+    return None, l
+
+def parseLine(category, l):
+    if l.startswith(JSONL_PREFIX):
+        return parseJSONLine(l)
+    if category == "executions":
+        return parseExecution(l)
+    if category == "reason":
+        return parseReason(l)
+    return parseTask(l)
+
+class NAROutput(dict):
+    #output dict whose categories are parsed on first access, lines of categories that were not requested are not kept
+    def __init__(self, lines, requestOutputArgs=False, categories=None):
+        dict.__init__(self, requestOutputArgs=requestOutputArgs)
+        requested = OUTPUT_CATEGORIES if categories is None else categories
+        for category in OUTPUT_CATEGORIES:
+            if category not in requested:
+                default = OUTPUT_DEFAULTS[category]
+                dict.__setitem__(self, category, list(default) if isinstance(default, list) else default)
+        self.pending = {category: [] for category in OUTPUT_CATEGORIES if category in requested}
+        if "raw" in self.pending:
+            self.pending["raw"] = lines
+        for l in lines:
+            category, l = classifyLine(l)
+            if category in self.pending:
+                self.pending[category].append(l)
+
+    def __missing__(self, key):
+        if key not in self.pending:
+            raise KeyError(key)
+        lines = self.pending.pop(key)
+        if key == "reason":
+            if lines and lines[-1].startswith(JSONL_PREFIX):
+                value = parseJSONLine(lines[-1])
+            else:
+                value = parseReason("\n".join(lines))
+        elif key == "raw":
+            value = "\n".join(lines)
+        else:
+            value = [parseLine(key, l) for l in lines]
+        dict.__setitem__(self, key, value)
+        return value
+
+    def __contains__(self, key):
+        return key in self.pending or dict.__contains__(self, key)
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def materialize(self):
+        for key in list(self.pending):
+            self[key]
+        return self
+
+    def keys(self):
+        return dict.keys(self.materialize())
+
+    def values(self):
+        return dict.values(self.materialize())
+
+    def items(self):
+        return dict.items(self.materialize())
+
+    def __iter__(self):
+        return dict.__iter__(self.materialize())
+
+    def __len__(self):
+        return dict.__len__(self.materialize())
+
+    def __eq__(self, other):
+        return dict.__eq__(self.materialize(), other.materialize() if isinstance(other, NAROutput) else other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return dict.__repr__(self.materialize())
+
+    def copy(self):
+        return dict(self.items())
+
+def ParseOutput(lines, requestOutputArgs=False, categories=None):
+    #classifies every line once, the categories are parsed lazily when accessed
+    return NAROutput(lines, requestOutputArgs, categories)
+
+def ParseStats(lines):
+    Stats = {}
+    for l in lines:
+        if l.startswith(JSONL_PREFIX):
+            return {k: float(v) for (k, v) in parseJSONLine(l).items()}
+        if ":" in l:
+            leftside = l.split(":")[0].replace(" ", "_").strip()
+            rightside = float(l.split(":")[1].strip())
+            Stats[leftside] = rightside
+    return Stats
@@ -2,110 +2,149 @@
 Interface to the NARS system
 """
 
-import os
-import re
-import traceback
-from typing import Dict, Any, Optional, Union, List
+from typing import Dict, Any, Optional, Union, List, Iterable, Iterator, Generator, Tuple, Callable
 
 # Import the original NAR module functions
 try:
-    from NAR import AddInput, Reset
+    from NAR import AddInput, AddInputs, StreamOutput
 except ImportError:
     # Create stub functions if module not available
-    def AddInput(input_str: str, Print: bool = False) -> Dict[str, Any]:
+    def AddInput(input_str: str, Print: bool = False, usedNAR: Any = None, categories: Any = None) -> Dict[str, Any]:
         """Stub for AddInput function when NAR module is not available."""
         print(f"[STUB] AddInput: {input_str}")
         return {"raw": f"STUB OUTPUT for: {input_str}"}
 
-    def Reset() -> None:
-        """Stub for Reset function when NAR module is not available."""
-        print("[STUB] Reset NARS")
+    def AddInputs(input_strs: List[str], Print: bool = False, usedNAR: Any = None, categories: Any = None) -> List[Dict[str, Any]]:
+        """Stub for AddInputs function when NAR module is not available."""
+        return [AddInput(input_str, Print=Print) for input_str in input_strs]
 
-class NarsClient:
+    def StreamOutput(input_str: str, usedNAR: Any = None, categories: Any = None) -> Iterator[Tuple[str, Any]]:
+        """Stub for StreamOutput function when NAR module is not available."""
+        print(f"[STUB] StreamOutput: {input_str}")
+        return iter(())
+
+from nars_client_base import (LOADABLE_TRUTH, SENTENCE_END, SHELL_LINE_MAX, DELTA_HEADER, CONCEPTS_SINCE_HEADER,
+                              STATEMENT_KEY, NarRequest, loadable_to_narsese, is_shell_command, is_wellformed_statement,
+                              read_knowledge_batches, ATOM_TOKEN, query_atoms, latest_statement_lines, is_delta_knowledge,
+                              NarsClientBase)
+from truth_translator import DEFAULT_CONTEXT_TOKENS
+
+class NarsClient(NarsClientBase):
     """Client for interacting with the NARS system."""
 
-    def __init__(self, verbose: bool = False):
+    def __init__(self, verbose: bool = False, pool: Any = None, session_id: Optional[str] = None):
         """Initialize NARS client.
         
         Args:
             verbose: Whether to print verbose output
+            pool: Optional NarPool to run on instead of the shared NAR process
+            session_id: Session id pinning this client to a process of the pool
         """
-        self.verbose = verbose
+        super().__init__(verbose)
+        self.pool = pool
+        self.session_id = session_id
+    
+    def _nar_call(self, func, *args, **kwargs):
+        """Call a NAR module function on the process this client is bound to."""
+        if self.pool is None:
+            return func(*args, **kwargs)
+        with self.pool.session(self.session_id) as nar:
+            return func(*args, usedNAR=nar, **kwargs)
+    
+    def _transport(self, narseses: Union[str, List[str]], print_raw: bool, categories: Optional[Iterable[str]]) -> Any:
+        """Send a request of the client logic to the NAR process and return its output."""
+        if isinstance(narseses, list):
+            return self._nar_call(AddInputs, narseses, Print=print_raw, categories=categories)
+        return self._nar_call(AddInput, narseses, Print=print_raw, categories=categories)
+    
+    def _run(self, steps: Generator[NarRequest, Any, Any]) -> Any:
+        """Run the steps of a command, raising the errors of the transport inside them."""
+        try:
+            request = next(steps)
+            while True:
+                try:
+                    output = self._transport(*request)
+                except Exception as e:
+                    request = steps.throw(e)
+                else:
+                    request = steps.send(output)
+        except StopIteration as stop:
+            return stop.value
     
     def reset(self) -> None:
         """Reset the NARS system."""
-        if self.verbose:
-            print("Resetting NARS...")
-        Reset()
+        self._run(self._reset_steps())
     
-    def add_input(self, narsese: str, print_raw: bool = False) -> Dict[str, Any]:
+    def add_input(self, narsese: str, print_raw: bool = False, categories: Optional[Iterable[str]] = None) -> Dict[str, Any]:
         """Add input to NARS and return the output.
         
         Args:
             narsese: Narsese statement to add
             print_raw: Whether to print raw output
+            categories: Output categories to parse (e.g. "answers", "raw"), all if None
             
         Returns:
             Raw output from NARS
         """
-        if not narsese or narsese.strip() == "":
-            if self.verbose:
-                print("Skipping empty Narsese")
-            return {"raw": ""}
+        return self._run(self._add_input_steps(narsese, print_raw, categories))
+    
+    def add_inputs(self, narseses: List[str], print_raw: bool = False, categories: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """Add a batch of Narsese statements to NARS in a single round trip.
         
-        try:
-            # Handle save knowledge command
-            if narsese.startswith("*save"):
-                parts = narsese.split(maxsplit=1)
-                filename = parts[1].strip() if len(parts) > 1 else "nars_knowledge.nal"
-                return self.save_knowledge(filename)
-                    
-            # Handle load knowledge command
-            elif narsese.startswith("*load"):
-                parts = narsese.split(maxsplit=1)
-                filename = parts[1].strip() if len(parts) > 1 else "nars_knowledge.nal"
-                return self.load_knowledge(filename)
-            
-            elif narsese.startswith("*run"):
-                parts = narsese.split(maxsplit=1)
-                cycles = parts[1].strip()
-                try:
-                    cycles = int(cycles)
-                    return self.run_cycles(cycles)
-                except ValueError:
-                    error_msg = f"Invalid number of cycles: {cycles}"
-                    if self.verbose:
-                        print(error_msg)
-                    return {"raw": error_msg}
-
-            elif narsese.startswith("*dump"):
-                concepts_output = self.add_input("*concepts", print_raw=False)
-                return concepts_output
-
-            # Normal NARS command processing
-            if self.verbose:
-                print(f"Adding to NARS: '{narsese}'")
+        Unlike add_input, shell commands such as *save or *load are not
+        interpreted here; the batch is sent to NARS as it is.
+        
+        Args:
+            narseses: Narsese statements to add, in order
+            print_raw: Whether to print raw output
+            categories: Output categories to parse (e.g. "answers", "raw"), all if None
             
-            narsese = narsese.strip()
-
-            if narsese.startswith("(") or narsese.startswith("["):
-                if self.verbose:
-                    print("Skipping statement starting with '(' or '['")
-                return {"raw": ""}
-
-            # Send the input to NARS
-            raw_output = AddInput(narsese, Print=print_raw)
+        Returns:
+            One output per statement, aligned with the input order. The statements
+            after one whose operation expects its product on stdin are not input,
+            their output stays {"raw": ""}
+        """
+        return self._run(self._add_inputs_steps(narseses, print_raw, categories))
+    
+    def stream_input(self, narsese: str, categories: Optional[Iterable[str]] = None) -> Iterator[Tuple[str, Any]]:
+        """Add input to NARS and yield output events as NARS prints them.
+        
+        Events are (category, parsed) pairs such as ("answers", task) or
+        ("executions", execution). Stopping the iteration early returns
+        control at once, but the rest of the run is still read (without
+        being parsed) when the generator is closed. An operation expecting
+        its product on stdin ends the stream with a ("requestOutputArgs", True)
+        event, the product is the next input.
+        
+        Args:
+            narsese: Narsese statement or number of cycles to run
+            categories: Event categories to yield (e.g. "answers"), all if None
             
-            if self.verbose and isinstance(raw_output, dict) and "raw" in raw_output:
-                print(f"NARS responded with {len(raw_output['raw'])} characters")
-            return raw_output
+        Yields:
+            (category, parsed) event pairs
+        """
+        narsese = narsese.strip()
+        if not narsese:
+            return
+        if self.verbose:
+            print(f"Streaming from NARS: '{narsese}'")
+        if self.pool is None:
+            yield from StreamOutput(narsese, categories=categories)
+        else:
+            with self.pool.session(self.session_id) as nar:
+                yield from StreamOutput(narsese, usedNAR=nar, categories=categories)
+    
+    def stream_cycles(self, cycles: int = 300, categories: Optional[Iterable[str]] = None) -> Iterator[Tuple[str, Any]]:
+        """Run inference cycles in NARS and yield output events as they appear.
+        
+        Args:
+            cycles: Number of inference cycles to run
+            categories: Event categories to yield (e.g. "answers"), all if None
             
-        except Exception as e:
-            error_msg = f"Error adding to NARS: {e}"
-            if self.verbose:
-                print(error_msg)
-                traceback.print_exc()
-            return {"raw": error_msg}
+        Yields:
+            (category, parsed) event pairs
+        """
+        return self.stream_input(str(cycles), categories=categories)
     
     def run_cycles(self, cycles: int = 300) -> Dict[str, Any]:
         """Run inference cycles in NARS.
@@ -116,156 +155,92 @@ class NarsClient:
         Returns:
             Output from running cycles
         """
-        return self.add_input(str(cycles))
+        return self._run(self._run_cycles_steps(cycles))
     
-    def save_knowledge(self, filename: str) -> Dict[str, Any]:
+    def save_knowledge(self, filename: str, delta: bool = False, compact_ratio: float = 1.0, compact: bool = False) -> Dict[str, Any]:
         """Save NARS knowledge to a file.
         
+        In delta mode only the concepts that changed since the previous save
+        to the same file are appended, so the cost scales with the changes
+        instead of the memory size. The file is rewritten in full on the
+        first save of a session, after a reset, once the appended segments
+        and superseded statements outgrow compact_ratio times the latest
+        statements, and when compact is set. A full rewrite only keeps the
+        concepts NARS still has, so statements of forgotten concepts are
+        dropped from the file.
+        
         Args:
             filename: Path to save the knowledge
+            delta: Whether to append only the changes since the last save
+            compact_ratio: Appended size relative to the last full save that triggers a full rewrite
+            compact: Whether a delta save rewrites the file in full
             
         Returns:
             Result of the operation
         """
-        if self.verbose:
-            print(f"Saving NARS knowledge to {filename}...")
-        
-        try:
-            # Create the directory if it doesn't exist
-            directory = os.path.dirname(os.path.abspath(filename))
-            if directory and not os.path.exists(directory):
-                os.makedirs(directory, exist_ok=True)
-            
-            # Get all concepts from NARS
-            concepts_output = self.add_input("*concepts", print_raw=False)
-            
-            # Extract all valid Narsese statements
-            knowledge_lines = []
-            
-            if isinstance(concepts_output, dict) and "raw" in concepts_output:
-                raw_output = concepts_output["raw"]
-                
-                # Process each line of the output
-                for line in raw_output.split("\n"):
-                    # Skip comments and empty lines
-                    if line.startswith("//") or not line.strip():
-                        continue
-
-                    # try no need to match {}?
-                    knowledge_lines.append(line)
-            
-            # Write to file
-            if knowledge_lines:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    for line in knowledge_lines:
-                        f.write(line + "\n")
-                
-                if self.verbose:
-                    print(f"Saved {len(knowledge_lines)} statements to {filename}")
-                return {"raw": f"Saved {len(knowledge_lines)} statements to {filename}"}
-            else:
-                error_msg = "No knowledge statements found to save"
-                if self.verbose:
-                    print(error_msg)
-                return {"raw": error_msg}
-                
-        except Exception as e:
-            error_msg = f"Error saving knowledge: {e}"
-            if self.verbose:
-                print(error_msg)
-                traceback.print_exc()
-            return {"raw": error_msg}
+        return self._run(self._save_knowledge_steps(filename, delta, compact_ratio, compact))
     
-    def load_knowledge(self, filename: str) -> Dict[str, Any]:
+    def load_knowledge(self, filename: str, batch_size: int = 1000, progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
         """Load NARS knowledge from a file.
         
+        The file is streamed: lines are read and converted in a background
+        thread while the previous batch is processed by NARS, so even very
+        large files are loaded in constant memory. A statement counts as
+        loaded when NARS echoes it as input, malformed lines count as failed
+        without being sent. Of delta saved files only the latest version of
+        each statement is loaded, the file itself is not modified.
+        
         Args:
             filename: Path to load the knowledge from
+            batch_size: Number of statements sent to NARS per round trip
+            progress: Optional callback receiving the progress after each batch
+                (loaded, failed, bytes_read, total_bytes, seconds, statements_per_second)
             
+        Returns:
+            Result of the operation, with the loaded and failed counts
+        """
+        return self._run(self._load_knowledge_steps(filename, batch_size, progress))
+    
+    def save_snapshot(self, filename: str) -> Dict[str, Any]:
+        """Save the complete NARS memory to a binary snapshot file.
+
+        Unlike save_knowledge, priorities, usefulness, stamps, implication
+        tables, event queues and indices are kept as they are.
+
+        Args:
+            filename: Path to save the snapshot
+
+        Returns:
+            Result of the operation
+        """
+        return self._run(self._save_snapshot_steps(filename))
+    
+    def load_snapshot(self, filename: str) -> Dict[str, Any]:
+        """Replace the NARS memory with a binary snapshot saved by save_snapshot.
+
+        Args:
+            filename: Path to load the snapshot from
+
         Returns:
             Result of the operation
         """
-        if not os.path.exists(filename):
-            error_msg = f"Knowledge file not found: {filename}"
-            if self.verbose:
-                print(error_msg)
-            return {"raw": error_msg}
+        return self._run(self._load_snapshot_steps(filename))
+    
+    def extract_knowledge(self, question: Optional[str] = None, limit: int = 50, token_budget: Optional[int] = DEFAULT_CONTEXT_TOKENS) -> str:
+        """Extract knowledge from NARS as context.
         
-        if self.verbose:
-            print(f"Loading knowledge from {filename}...")
+        With a question, only the concepts sharing an atom with it are
+        extracted, highest priority first, so the context does not grow
+        with the size of memory. The statements are deduplicated, ranked by
+        truth expectation and concept priority and packed into the token
+        budget.
         
-        try:
-            # Read statements from file
-            with open(filename, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            # Process and add each statement
-            successful_loads = 0
-            
-            for line in lines:
-                line = line.strip()
-                
-                # Skip comments and empty lines
-                if not line or line.startswith("//"):
-                    continue
-                
-                # Convert from loadable format to NARS format if needed
-                if "%" in line:
-                    # Extract statement and truth values
-                    match = re.search(r"(.*)\s+%([0-9.]+);([0-9.]+)%", line)
-                    if match:
-                        statement = match.group(1)
-                        frequency = match.group(2)
-                        confidence = match.group(3)
-                        
-                        # Format for NARS
-                        narsese = f"{statement} {{{frequency} {confidence}}}"
-                    else:
-                        narsese = line
-                else:
-                    narsese = line
-                
-                # Add to NARS
-                result = self.add_input(narsese, print_raw=False)
-                if result and "error" not in result.get("raw", "").lower():
-                    successful_loads += 1
+        Args:
+            question: Question (English or Narsese) to extract the relevant knowledge for, all knowledge if None
+            limit: Maximum number of concepts extracted for a question
+            token_budget: Maximum estimated number of tokens of the knowledge, unlimited if None
             
-            result_msg = f"Loaded {successful_loads} statements from {filename}"
-            if self.verbose:
-                print(result_msg)
-            return {"raw": result_msg}
-                
-        except Exception as e:
-            error_msg = f"Error loading knowledge: {e}"
-            if self.verbose:
-                print(error_msg)
-                traceback.print_exc()
-            return {"raw": error_msg}
-    
-    def extract_knowledge(self) -> str:
-        """Extract all knowledge from NARS as context.
-        
         Returns:
             Knowledge extracted from NARS
         """
-        if self.verbose:
-            print("Extracting knowledge from NARS...")
-        
-        try:
-            # Get concepts from NARS
-            concepts_output = self.add_input("*concepts", print_raw=False)
-            
-            from truth_translator import process_nars_output
-            knowledge = process_nars_output(concepts_output, with_colors=False)
-            
-            if self.verbose:
-                print(f"Extracted {len(knowledge)} characters of knowledge")
-                
-            return knowledge
-            
-        except Exception as e:
-            error_msg = f"Error extracting knowledge: {e}"
-            if self.verbose:
-                print(error_msg)
-                traceback.print_exc()
-            return "No knowledge available"
\ No newline at end of file
+        return self._run(self._extract_knowledge_steps(question, limit, token_budget))
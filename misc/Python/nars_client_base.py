@@ -0,0 +1,560 @@
+"""
+Client logic shared by the NARS clients
+
+Unlike nars_client, importing this module starts no NAR process, so the
+asyncio client can share the logic with its own process.
+"""
+
+import os
+import re
+import time
+import queue
+import threading
+import traceback
+from typing import Dict, Any, Optional, Union, List, Iterable, Iterator, Generator, Tuple, Callable, Set
+
+from truth_translator import DEFAULT_CONTEXT_TOKENS
+
+# Truth value in loadable format: statement %f;c%
+LOADABLE_TRUTH = re.compile(r"(.*)\s+%([0-9.]+);([0-9.]+)%")
+
+# End of a Narsese sentence: punctuation, optional tense and optional truth value
+SENTENCE_END = re.compile(r"[.!?](?: :[|/\\]:)?(?: \{[0-9.]+ [0-9.]+\})?$")
+
+# Size of the line buffer of the NAR shell, longer input lines are split
+SHELL_LINE_MAX = 1024
+
+# Comment starting each segment of a delta saved knowledge file
+DELTA_HEADER = "//*delta"
+
+# Header printed by the *concepts_since shell command
+CONCEPTS_SINCE_HEADER = re.compile(r"//\*concepts_since -?[0-9]+ currentTime=([0-9]+)")
+
+# Saved statement without its dt= prefix and truth value, identifying it across delta segments
+STATEMENT_KEY = re.compile(r"(?:dt=\S+ )?(.*?)(?: \{[0-9.]+ [0-9.]+\}| %[0-9.]+;[0-9.]+%)?$")
+
+# Request of the client logic to NARS: (statement or batch of statements, print_raw, categories)
+NarRequest = Tuple[Union[str, List[str]], bool, Optional[Iterable[str]]]
+
+def loadable_to_narsese(line: str) -> str:
+    """Convert a line in loadable format (statement %f;c%) to NARS format.
+    
+    Args:
+        line: Stripped line of a knowledge file
+        
+    Returns:
+        Narsese statement with the truth value in braces
+    """
+    if "%" in line:
+        # Extract statement and truth values
+        match = LOADABLE_TRUTH.search(line)
+        if match:
+            statement = match.group(1)
+            frequency = match.group(2)
+            confidence = match.group(3)
+            
+            # Format for NARS
+            return f"{statement} {{{frequency} {confidence}}}"
+    return line
+
+def is_shell_command(line: str) -> bool:
+    """Whether a knowledge file line is a shell command or cycle count instead of a statement."""
+    return line.startswith("*") or line.isdigit()
+
+def is_wellformed_statement(statement: str) -> bool:
+    """Cheap syntax check of a Narsese statement.
+
+    NARS exits on a parsing error, so statements failing this check are not
+    sent. It is no full parser, NARS can still reject a statement passing it.
+    The statement and its newline have to fit into one read of the shell,
+    which would split a longer line into parts that fail to parse.
+    """
+    return (len(statement) + 1 < SHELL_LINE_MAX and SENTENCE_END.search(statement) is not None
+            and statement.count("(") == statement.count(")") and statement.count("[") == statement.count("]"))
+
+def read_knowledge_batches(filename: str, batch_size: int = 1000, max_pending: int = 4,
+                           lines: Optional[Set[int]] = None) -> Iterator[Tuple[List[str], int, int]]:
+    """Read and convert a knowledge file in a background thread, in batches.
+
+    The reader stays at most max_pending batches ahead of the consumer, so
+    memory use does not depend on the size of the file.
+
+    Args:
+        filename: Path of the knowledge file
+        batch_size: Number of statements per batch
+        max_pending: Number of converted batches to buffer
+        lines: Numbers of the lines to read (starting at 0), all if None
+
+    Yields:
+        (statements, rejected, bytes_read) with the converted statements and
+        shell commands, the number of malformed lines that were left out and
+        the file position reached
+    """
+    batches = queue.Queue(maxsize=max_pending)
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        # gives up when the consumer stopped early
+        while not stop.is_set():
+            try:
+                batches.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def convert() -> None:
+        try:
+            statements, rejected, bytes_read = [], 0, 0
+            with open(filename, "rb") as f:
+                for number, raw in enumerate(f):
+                    bytes_read += len(raw)
+                    if lines is not None and number not in lines:
+                        continue
+                    line = raw.decode("utf-8", errors="replace").strip()
+                    if not line or line.startswith("//"):
+                        continue
+                    statement = loadable_to_narsese(line)
+                    if is_shell_command(statement) or is_wellformed_statement(statement):
+                        statements.append(statement)
+                    else:
+                        rejected += 1
+                    if len(statements) >= batch_size:
+                        if not put((statements, rejected, bytes_read)):
+                            return
+                        statements, rejected = [], 0
+            if (statements or rejected) and not put((statements, rejected, bytes_read)):
+                return
+            put(None)
+        except Exception as e:
+            put(e)
+
+    converter = threading.Thread(target=convert, daemon=True)
+    converter.start()
+    try:
+        while True:
+            item = batches.get()
+            if item is None:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
+
+# Candidate atom in English or Narsese text
+ATOM_TOKEN = re.compile(r"[A-Za-z0-9_'-]+")
+
+def query_atoms(text: str) -> List[str]:
+    """Candidate NARS atoms of a question, as written, lowercase and capitalized.
+
+    Atoms NARS has never seen are ignored by *concepts_for, so guessing
+    spellings costs nothing.
+    """
+    atoms = {}
+    for token in ATOM_TOKEN.findall(text):
+        for atom in (token, token.lower(), token.capitalize()):
+            atoms[atom] = None
+    return list(atoms)
+
+def latest_statement_lines(filename: str) -> Tuple[Set[int], int]:
+    """Find the latest version of each statement of a delta saved knowledge file.
+
+    Later segments of a delta save hold revised versions of earlier
+    statements, loading both would count the same evidence twice.
+
+    Args:
+        filename: Path of the knowledge file
+
+    Returns:
+        Numbers of the lines holding the latest versions (starting at 0) and their size in bytes
+    """
+    latest = {}
+    with open(filename, "rb") as f:
+        for number, raw in enumerate(f):
+            line = raw.decode("utf-8", errors="replace").strip()
+            if not line or line.startswith("//"):
+                continue
+            latest[STATEMENT_KEY.match(line).group(1)] = (number, len(raw))
+    return {number for (number, _) in latest.values()}, sum(size for (_, size) in latest.values())
+
+def is_delta_knowledge(filename: str) -> bool:
+    """Whether a knowledge file was written by a delta save."""
+    with open(filename, "r", encoding="utf-8") as f:
+        return f.readline().startswith(DELTA_HEADER)
+
+class NarsClientBase:
+    """Client logic shared by NarsClient and the asyncio AsyncNarClient.
+
+    The commands are generators yielding requests (statement or batch of
+    statements, print_raw, categories) and receiving the outputs of NARS,
+    so the clients only differ in how they send the requests.
+    """
+
+    def __init__(self, verbose: bool = False):
+        """Initialize the client logic.
+
+        Args:
+            verbose: Whether to print verbose output
+        """
+        self.verbose = verbose
+        # absolute path of each delta saved file -> {"time": currentTime of its last save, "base_bytes": size after its last full save}
+        self.delta_saves: Dict[str, Dict[str, int]] = {}
+    
+    def _reset_steps(self) -> Generator[NarRequest, Any, None]:
+        """Steps of reset."""
+        if self.verbose:
+            print("Resetting NARS...")
+        yield ("*reset", False, ())
+    
+    def _add_input_steps(self, narsese: str, print_raw: bool = False, categories: Optional[Iterable[str]] = None) -> Generator[NarRequest, Any, Dict[str, Any]]:
+        """Steps of add_input."""
+        if not narsese or narsese.strip() == "":
+            if self.verbose:
+                print("Skipping empty Narsese")
+            return {"raw": ""}
+        
+        try:
+            # Handle snapshot commands
+            if narsese.startswith("*snapshot "):
+                parts = narsese.split(maxsplit=2)
+                filename = parts[2].strip() if len(parts) > 2 else "nars_memory.snapshot"
+                if parts[1] == "save":
+                    return (yield from self._save_snapshot_steps(filename))
+                elif parts[1] == "load":
+                    return (yield from self._load_snapshot_steps(filename))
+                error_msg = f"Unknown snapshot command: {parts[1]}"
+                if self.verbose:
+                    print(error_msg)
+                return {"raw": error_msg}
+
+            # Handle save knowledge command
+            elif narsese.startswith("*save"):
+                parts = narsese.split(maxsplit=1)
+                filename = parts[1].strip() if len(parts) > 1 else "nars_knowledge.nal"
+                return (yield from self._save_knowledge_steps(filename))
+                    
+            # Handle load knowledge command
+            elif narsese.startswith("*load"):
+                parts = narsese.split(maxsplit=1)
+                filename = parts[1].strip() if len(parts) > 1 else "nars_knowledge.nal"
+                return (yield from self._load_knowledge_steps(filename))
+            
+            elif narsese.startswith("*run"):
+                parts = narsese.split(maxsplit=1)
+                cycles = parts[1].strip()
+                try:
+                    cycles = int(cycles)
+                    return (yield from self._run_cycles_steps(cycles))
+                except ValueError:
+                    error_msg = f"Invalid number of cycles: {cycles}"
+                    if self.verbose:
+                        print(error_msg)
+                    return {"raw": error_msg}
+
+            elif narsese.startswith("*dump"):
+                concepts_output = yield from self._add_input_steps("*concepts", print_raw=False, categories=("raw",))
+                return concepts_output
+
+            # Normal NARS command processing
+            if self.verbose:
+                print(f"Adding to NARS: '{narsese}'")
+            
+            narsese = narsese.strip()
+
+            if narsese.startswith("(") or narsese.startswith("["):
+                if self.verbose:
+                    print("Skipping statement starting with '(' or '['")
+                return {"raw": ""}
+
+            # Send the input to NARS
+            raw_output = yield (narsese, print_raw, categories)
+            
+            if self.verbose and isinstance(raw_output, dict) and "raw" in raw_output:
+                print(f"NARS responded with {len(raw_output['raw'])} characters")
+            return raw_output
+            
+        except Exception as e:
+            error_msg = f"Error adding to NARS: {e}"
+            if self.verbose:
+                print(error_msg)
+                traceback.print_exc()
+            return {"raw": error_msg}
+    
+    def _add_inputs_steps(self, narseses: List[str], print_raw: bool = False, categories: Optional[Iterable[str]] = None) -> Generator[NarRequest, Any, List[Dict[str, Any]]]:
+        """Steps of add_inputs."""
+        results = [{"raw": ""} for _ in narseses]
+        batch = []
+        positions = []
+        for i, narsese in enumerate(narseses):
+            narsese = narsese.strip() if isinstance(narsese, str) else ""
+            # Same filtering as add_input
+            if narsese == "" or narsese.startswith("(") or narsese.startswith("["):
+                continue
+            batch.append(narsese)
+            positions.append(i)
+        
+        if not batch:
+            return results
+        
+        try:
+            if self.verbose:
+                print(f"Adding batch of {len(batch)} statements to NARS")
+            
+            for position, output in zip(positions, (yield (batch, print_raw, categories))):
+                results[position] = output
+            return results
+            
+        except Exception as e:
+            error_msg = f"Error adding to NARS: {e}"
+            if self.verbose:
+                print(error_msg)
+                traceback.print_exc()
+            return [{"raw": error_msg} for _ in narseses]
+    
+    def _run_cycles_steps(self, cycles: int = 300) -> Generator[NarRequest, Any, Dict[str, Any]]:
+        """Steps of run_cycles."""
+        return (yield from self._add_input_steps(str(cycles)))
+    
+    def _save_knowledge_steps(self, filename: str, delta: bool = False, compact_ratio: float = 1.0, compact: bool = False) -> Generator[NarRequest, Any, Dict[str, Any]]:
+        """Steps of save_knowledge."""
+        if self.verbose:
+            print(f"Saving NARS knowledge to {filename}...")
+        
+        try:
+            # Create the directory if it doesn't exist
+            directory = os.path.dirname(os.path.abspath(filename))
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory, exist_ok=True)
+            
+            if delta:
+                return (yield from self._save_knowledge_delta_steps(filename, compact_ratio, compact))
+            
+            # Get all concepts from NARS
+            concepts_output = yield from self._add_input_steps("*concepts", print_raw=False, categories=("raw",))
+            
+            # Extract all valid Narsese statements
+            knowledge_lines = []
+            
+            if isinstance(concepts_output, dict) and "raw" in concepts_output:
+                raw_output = concepts_output["raw"]
+                
+                # Process each line of the output
+                for line in raw_output.split("\n"):
+                    # Skip comments and empty lines
+                    if line.startswith("//") or not line.strip():
+                        continue
+
+                    # try no need to match {}?
+                    knowledge_lines.append(line)
+            
+            # Write to file
+            if knowledge_lines:
+                with open(filename, 'w', encoding='utf-8') as f:
+                    for line in knowledge_lines:
+                        f.write(line + "\n")
+                
+                if self.verbose:
+                    print(f"Saved {len(knowledge_lines)} statements to {filename}")
+                return {"raw": f"Saved {len(knowledge_lines)} statements to {filename}"}
+            else:
+                error_msg = "No knowledge statements found to save"
+                if self.verbose:
+                    print(error_msg)
+                return {"raw": error_msg}
+                
+        except Exception as e:
+            error_msg = f"Error saving knowledge: {e}"
+            if self.verbose:
+                print(error_msg)
+                traceback.print_exc()
+            return {"raw": error_msg}
+    
+    def _concepts_since_steps(self, since: int) -> Generator[NarRequest, Any, Tuple[int, List[str]]]:
+        """Return the current time and the statements of the concepts changed since a time."""
+        output = yield from self._add_input_steps(f"*concepts_since {since}", print_raw=False, categories=("raw",))
+        current_time = since
+        statements = []
+        for line in output.get("raw", "").split("\n"):
+            header = CONCEPTS_SINCE_HEADER.match(line)
+            if header:
+                current_time = int(header.group(1))
+            elif line.strip() and not line.startswith("//"):
+                statements.append(line)
+        return current_time, statements
+    
+    def _save_knowledge_delta_steps(self, filename: str, compact_ratio: float, compact: bool) -> Generator[NarRequest, Any, Dict[str, Any]]:
+        """Append the changes since the last save to a file, rewriting it when due."""
+        path = os.path.abspath(filename)
+        state = self.delta_saves.get(path)
+        full = (compact or state is None or not os.path.exists(path)
+                or os.path.getsize(path) > (1.0 + compact_ratio) * state["base_bytes"])
+        current_time, statements = yield from self._concepts_since_steps(0 if full else state["time"])
+        if not full and current_time < state["time"]:
+            # NARS was reset, its time restarted
+            full = True
+            current_time, statements = yield from self._concepts_since_steps(0)
+        
+        if full and not statements:
+            error_msg = "No knowledge statements found to save"
+            if self.verbose:
+                print(error_msg)
+            return {"raw": error_msg}
+        
+        header = f"{DELTA_HEADER} since={0 if full else state['time']} currentTime={current_time}\n"
+        if full or statements:
+            with open(path, "w" if full else "a", encoding="utf-8") as f:
+                f.write(header)
+                for line in statements:
+                    f.write(line + "\n")
+        self.delta_saves[path] = {"time": current_time,
+                                  "base_bytes": os.path.getsize(path) if full else state["base_bytes"]}
+        
+        result_msg = f"Saved {len(statements)} {'statements' if full else 'changed statements'} to {filename}"
+        if self.verbose:
+            print(result_msg)
+        return {"raw": result_msg, "statements": len(statements), "compacted": full}
+    
+    def _load_knowledge_steps(self, filename: str, batch_size: int = 1000, progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Generator[NarRequest, Any, Dict[str, Any]]:
+        """Steps of load_knowledge."""
+        if not os.path.exists(filename):
+            error_msg = f"Knowledge file not found: {filename}"
+            if self.verbose:
+                print(error_msg)
+            return {"raw": error_msg}
+        
+        if self.verbose:
+            print(f"Loading knowledge from {filename}...")
+        
+        try:
+            delta = is_delta_knowledge(filename)
+            lines, latest_bytes = latest_statement_lines(filename) if delta else (None, 0)
+            total_bytes = os.path.getsize(filename)
+            start = time.perf_counter()
+            loaded = failed = 0
+            state = {}
+            for statements, rejected, bytes_read in read_knowledge_batches(filename, batch_size, lines=lines):
+                failed += rejected
+                # only the input echoes are parsed, to tell accepted statements apart
+                for statement, result in zip(statements, (yield from self._add_inputs_steps(statements, print_raw=False, categories=("input",)))):
+                    if is_shell_command(statement):
+                        continue
+                    if result.get("input"):
+                        loaded += 1
+                    else:
+                        failed += 1
+                seconds = time.perf_counter() - start
+                state = {"loaded": loaded, "failed": failed, "bytes_read": bytes_read, "total_bytes": total_bytes,
+                         "seconds": seconds, "statements_per_second": (loaded + failed) / seconds if seconds > 0 else 0.0}
+                if progress is not None:
+                    progress(state)
+                if self.verbose:
+                    print(f"Loaded {loaded} statements ({100.0 * bytes_read / max(total_bytes, 1):.1f}%, "
+                          f"{state['statements_per_second']:.0f} statements/s)")
+            
+            if delta:
+                # later delta saves to the file can append, its superseded statements count towards the next full rewrite
+                stats = yield ("*stats", False, None)
+                self.delta_saves[os.path.abspath(filename)] = {"time": int(stats.get("currentTime", 0)), "base_bytes": latest_bytes}
+            
+            result_msg = f"Loaded {loaded} statements from {filename}"
+            if failed:
+                result_msg += f", {failed} failed"
+            if self.verbose:
+                print(result_msg)
+            return {"raw": result_msg, "loaded": loaded, "failed": failed, "seconds": state.get("seconds", 0.0),
+                    "statements_per_second": state.get("statements_per_second", 0.0)}
+                
+        except Exception as e:
+            error_msg = f"Error loading knowledge: {e}"
+            if self.verbose:
+                print(error_msg)
+                traceback.print_exc()
+            return {"raw": error_msg}
+    
+    def _save_snapshot_steps(self, filename: str) -> Generator[NarRequest, Any, Dict[str, Any]]:
+        """Steps of save_snapshot."""
+        if self.verbose:
+            print(f"Saving NARS snapshot to {filename}...")
+
+        try:
+            directory = os.path.dirname(os.path.abspath(filename))
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory, exist_ok=True)
+            output = yield (f"*snapshot save {os.path.abspath(filename)}", False, ("raw",))
+            if "//*snapshot saved" in output.get("raw", ""):
+                result_msg = f"Saved snapshot to {filename}"
+            else:
+                result_msg = f"Error saving snapshot to {filename}"
+            if self.verbose:
+                print(result_msg)
+            return {"raw": result_msg}
+
+        except Exception as e:
+            error_msg = f"Error saving snapshot: {e}"
+            if self.verbose:
+                print(error_msg)
+                traceback.print_exc()
+            return {"raw": error_msg}
+    
+    def _load_snapshot_steps(self, filename: str) -> Generator[NarRequest, Any, Dict[str, Any]]:
+        """Steps of load_snapshot."""
+        if not os.path.exists(filename):
+            error_msg = f"Snapshot file not found: {filename}"
+            if self.verbose:
+                print(error_msg)
+            return {"raw": error_msg}
+
+        if self.verbose:
+            print(f"Loading NARS snapshot from {filename}...")
+
+        try:
+            output = yield (f"*snapshot load {os.path.abspath(filename)}", False, ("raw",))
+            if "//*snapshot loaded" in output.get("raw", ""):
+                result_msg = f"Loaded snapshot from {filename}"
+            else:
+                result_msg = f"Error loading snapshot from {filename} (incompatible or damaged)"
+            if self.verbose:
+                print(result_msg)
+            return {"raw": result_msg}
+
+        except Exception as e:
+            error_msg = f"Error loading snapshot: {e}"
+            if self.verbose:
+                print(error_msg)
+                traceback.print_exc()
+            return {"raw": error_msg}
+    
+    def _extract_knowledge_steps(self, question: Optional[str] = None, limit: int = 50, token_budget: Optional[int] = DEFAULT_CONTEXT_TOKENS) -> Generator[NarRequest, Any, str]:
+        """Steps of extract_knowledge."""
+        if self.verbose:
+            print("Extracting knowledge from NARS...")
+        
+        try:
+            # Get concepts from NARS
+            if question is None:
+                concepts_output = yield from self._add_input_steps("*concepts", print_raw=False, categories=("raw",))
+            else:
+                command = "*concepts_for"
+                for atom in query_atoms(question):
+                    if len(command) + len(atom) + 16 >= SHELL_LINE_MAX:
+                        break
+                    command += " " + atom
+                if command == "*concepts_for":
+                    return ""
+                concepts_output = yield from self._add_input_steps(f"{command} {limit}", print_raw=False, categories=("raw",))
+            
+            from truth_translator import build_context
+            knowledge = build_context(concepts_output, token_budget=token_budget)
+            
+            if self.verbose:
+                print(f"Extracted {len(knowledge)} characters of knowledge")
+                
+            return knowledge
+            
+        except Exception as e:
+            error_msg = f"Error extracting knowledge: {e}"
+            if self.verbose:
+                print(error_msg)
+                traceback.print_exc()
+            return "No knowledge available"
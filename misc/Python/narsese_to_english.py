@@ -24,6 +24,7 @@
 
 import sys
 import re
+from functools import lru_cache
 
 GREEN = "\x1B[32m"
 YELLOW = "\x1B[33m"
@@ -47,7 +48,81 @@ def narseseToEnglish_noColors():
     
 narseseToEnglish_noColors()
 
-def narseseToEnglish(line):
+# Number of translated terms and subterms kept by the memoizing translator
+TERM_CACHE_SIZE = 65536
+
+# Sentence as NARS prints it in *concepts and saved knowledge: dt, term, punctuation, tense and truth value
+SENTENCE = re.compile(r"(?:dt=\S+ )?(.+?)([.!?])(?: :[|/\\]:)?(?: \{([0-9.]+) ([0-9.]+)\})?")
+
+STATEMENT_WORDS = {"-->": " is ", "<->": " resembles ", "|->": " has ", "==>": " implies ", "<=>": " equals ", "=/>": " leads to "}
+COMPOUND_WORDS = {"*": " ", "&": " ", "|": " or ", "-": " but not ", "~": " but not ", "&&": " and ", "&/": " and ", "||": " or ",
+                  "/1": " ", "\\1": " ", "/2": " by ", "\\2": " by "}
+PREFIX_WORDS = {"!": "not ", "*": ""}
+VARIABLE_WORDS = {"$1": "it", "#1": "it", "$2": "thing", "#2": "thing"}
+ATOM_END = frozenset(" )>}]")
+SET_END = {"{": "}", "[": "]"}
+
+class NarseseParseError(ValueError):
+    """Raised for Narsese the tree translator does not understand."""
+
+def _parse_operator(text, i, words):
+    """Parse " op " at i, returning the operator and the position after it."""
+    j = text.find(" ", i+1)
+    if j == -1:
+        raise NarseseParseError("Operator without a term after it")
+    operator = text[i+1:j]
+    if text[i] != " " or operator not in words:
+        raise NarseseParseError(f"Unknown operator {operator!r}")
+    return operator, j+1
+
+def _parse_term(text, i):
+    """Parse the term starting at i into a tree of tuples and atom strings.
+
+    Returns:
+        (tree, position after the term)
+    """
+    c = text[i]
+    if c == "<":
+        left, i = _parse_term(text, i+1)
+        copula, i = _parse_operator(text, i, STATEMENT_WORDS)
+        right, i = _parse_term(text, i)
+        if text[i] != ">":
+            raise NarseseParseError("Unterminated statement")
+        return ("statement", copula, left, right), i+1
+    if c == "(":
+        if text[i+2] == " " and text[i+1] in PREFIX_WORDS:
+            # negation and singular product: (! a), (* a)
+            prefix = text[i+1]
+            operand, i = _parse_term(text, i+3)
+            if text[i] != ")":
+                raise NarseseParseError("Unterminated prefix term")
+            return ("prefix", prefix, operand), i+1
+        left, i = _parse_term(text, i+1)
+        while text[i] == " ":
+            operator, i = _parse_operator(text, i, COMPOUND_WORDS)
+            right, i = _parse_term(text, i)
+            left = ("compound", operator, left, right)
+        if text[i] != ")":
+            raise NarseseParseError("Unterminated compound term")
+        return left, i+1
+    if c in SET_END:
+        elements = []
+        while True:
+            element, i = _parse_term(text, i+1)
+            elements.append(element)
+            if text[i] != " ":
+                break
+        if text[i] != SET_END[c]:
+            raise NarseseParseError("Unterminated set")
+        return elements[0] if len(elements) == 1 else ("set", tuple(elements)), i+1
+    j = i
+    while j < len(text) and text[j] not in ATOM_END:
+        j += 1
+    if j == i:
+        raise NarseseParseError(f"Expected a term at {i}")
+    return text[i:j], j
+
+def narseseToEnglish_regex(line):
     COLOR = GREEN
     line = line.rstrip().replace("(! ", CYAN + "not " + COLOR).replace("#1","it").replace("$1","it").replace("#2","thing").replace("$2","thing")
     if line.startswith("performing ") or line.startswith("done with"):
@@ -80,6 +155,50 @@ def narseseToEnglish(line):
         return COLOR + l.replace(")","").replace("(","").replace("||", MAGENTA + "or" + COLOR).replace("==>", CYAN + "implies" + COLOR).replace("<=>", CYAN + "equals" + COLOR).replace(">","").replace("<","").replace("&/","and").replace(" * "," ").replace(" & "," ").replace(" /1","").replace("/2","by") + RESET
     return ""
 
+@lru_cache(maxsize=TERM_CACHE_SIZE)
+def _render(tree):
+    """English for a parsed term, memoized so repeated subterms are rendered once."""
+    if isinstance(tree, str):
+        return VARIABLE_WORDS.get(tree, tree)
+    kind = tree[0]
+    if kind == "statement":
+        return _render(tree[2]) + STATEMENT_WORDS[tree[1]] + _render(tree[3])
+    if kind == "compound":
+        return _render(tree[2]) + COMPOUND_WORDS[tree[1]] + _render(tree[3])
+    if kind == "prefix":
+        return PREFIX_WORDS[tree[1]] + _render(tree[2])
+    return " and ".join(_render(element) for element in tree[1])
+
+@lru_cache(maxsize=TERM_CACHE_SIZE)
+def translateTerm(term):
+    """English for a Narsese term, parsed into a tree and rendered in one pass.
+
+    Raises:
+        NarseseParseError: If the term is not understood
+    """
+    try:
+        tree, end = _parse_term(term, 0)
+    except IndexError:
+        raise NarseseParseError("Unexpected end of term")
+    if end != len(term):
+        raise NarseseParseError(f"Unexpected {term[end:]!r} after the term")
+    return _render(tree)
+
+def narseseToEnglish(line):
+    """English for a NARS sentence, falling back to the regex translator for other lines."""
+    sentence = SENTENCE.fullmatch(line.rstrip())
+    if sentence:
+        term, punctuation, frequency, confidence = sentence.groups()
+        try:
+            english = translateTerm(term) + punctuation
+        except NarseseParseError:
+            return narseseToEnglish_regex(line)
+        if frequency is not None:
+            # the truth value as the regex translator leaves it
+            english += " " + frequency + " " + confidence
+        return english
+    return narseseToEnglish_regex(line)
+
 if __name__ == "__main__":
     for line in sys.stdin:
         line = narseseToEnglish(line)
@@ -0,0 +1,98 @@
+"""
+NLTK data bootstrap and process-wide NLTK models
+
+ensure_nltk_resources looks the required NLTK data up locally and only
+downloads what is missing, so startup makes no network attempt once the data
+is installed. The tokenizer, tagger and lemmatizer are loaded on first use
+and shared by all English to Narsese converters of the process.
+"""
+
+import nltk
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# NLTK data needed by the English to Narsese converter: download id -> path looked up in the NLTK data directories
+NLTK_RESOURCES: Dict[str, str] = {
+    "punkt": "tokenizers/punkt",
+    "punkt_tab": "tokenizers/punkt_tab",
+    "averaged_perceptron_tagger": "taggers/averaged_perceptron_tagger",
+    "averaged_perceptron_tagger_eng": "taggers/averaged_perceptron_tagger_eng",
+    "universal_tagset": "taggers/universal_tagset",
+    "wordnet": "corpora/wordnet",
+    "omw-1.4": "corpora/omw-1.4",
+}
+
+# Resources checked in this process: download id -> whether available, missing ones are not downloaded again
+_checked: Dict[str, bool] = {}
+
+def ensure_nltk_resources(resources: Iterable[str] = NLTK_RESOURCES, data_dir: Optional[str] = None,
+                          download: bool = True, quiet: bool = True) -> List[str]:
+    """Make sure the NLTK data is available, downloading only what is not found locally.
+
+    Args:
+        resources: Download ids of the resources, keys of NLTK_RESOURCES
+        data_dir: Directory searched first and downloaded to, NLTK's default directories if None
+        download: Whether missing resources are downloaded, False for air-gapped hosts
+        quiet: Whether the download progress is hidden
+
+    Returns:
+        Download ids of the resources that are still missing
+    """
+    if data_dir and data_dir not in nltk.data.path:
+        nltk.data.path.insert(0, data_dir)
+    missing = []
+    for resource in resources:
+        if resource not in _checked:
+            try:
+                nltk.data.find(NLTK_RESOURCES[resource])
+                _checked[resource] = True
+            except LookupError:
+                _checked[resource] = bool(download and nltk.download(resource, download_dir=data_dir, quiet=quiet))
+                if not _checked[resource]:
+                    print(f"Warning: NLTK data {resource} not found")
+        if not _checked[resource]:
+            missing.append(resource)
+    return missing
+
+@lru_cache(maxsize=None)
+def sentence_tokenizer():
+    """Punkt sentence tokenizer for English."""
+    try:
+        from nltk.tokenize import PunktTokenizer
+        return PunktTokenizer("english")
+    except ImportError:
+        # NLTK versions before punkt_tab
+        return nltk.data.load("tokenizers/punkt/english.pickle")
+
+@lru_cache(maxsize=None)
+def word_tokenizer():
+    """Treebank word tokenizer used by nltk.word_tokenize."""
+    from nltk.tokenize import NLTKWordTokenizer
+    return NLTKWordTokenizer()
+
+@lru_cache(maxsize=None)
+def tagger():
+    """Averaged perceptron POS tagger used by nltk.pos_tag."""
+    from nltk.tag import PerceptronTagger
+    return PerceptronTagger()
+
+@lru_cache(maxsize=None)
+def lemmatizer():
+    """WordNet lemmatizer."""
+    from nltk import WordNetLemmatizer
+    return WordNetLemmatizer()
+
+def tokenize(text: str) -> List[str]:
+    """Same tokens as nltk.word_tokenize(text), with the shared tokenizers."""
+    return [token for sentence in sentence_tokenizer().tokenize(text) for token in word_tokenizer().tokenize(sentence)]
+
+def pos_tag_universal(tokens: List[str]) -> List[Tuple[str, str]]:
+    """Same tags as nltk.pos_tag(tokens, tagset='universal'), with the shared tagger."""
+    from nltk.tag import map_tag
+    return [(token, map_tag("en-ptb", "universal", tag)) for (token, tag) in tagger().tag(tokens)]
+
+def pos_tag_sents_universal(sentences: List[List[str]]) -> List[List[Tuple[str, str]]]:
+    """pos_tag_universal of several tokenized sentences, in one call of the shared tagger."""
+    from nltk.tag import map_tag
+    return [[(token, map_tag("en-ptb", "universal", tag)) for (token, tag) in tagged]
+            for tagged in tagger().tag_sents(sentences)]
@@ -47,6 +47,47 @@ Dog is Bella.
     ("human", "{input}")
 ])
 
+# Prompt template for extracting facts from several numbered sentences at once
+batch_fact_extraction_template = ChatPromptTemplate.from_messages([
+    (
+        "system",
+        """
+```
+You are a simple fact extraction tool. You receive numbered sentences and convert each of them into very simple statements about the subjects present.
+
+RULES:
+1. Only output the simple statements, nothing else
+2. Start every statement with the number of its sentence in square brackets, like [2]
+3. Each statement should have at most ONE well-defined relationship
+4. No explanations, no thinking out loud
+5. You are FORBIDDEN from including formatting beyond linebreaks and the sentence numbers.
+6. You are FORBIDDEN from explaining yourself.
+7. You MUST output extremely simple facts about the subjects. Stick to the format: [number] [subject] [relationship] [subject].
+8. If something is UNTRUE, note it as such: [number] [subject] is not [subject].
+9. VERY IMPORTANT!!! : A statement should not be more than four words.
+
+EXAMPLES:
+
+Input:
+[1] Birds fly and they have feathers.
+[2] Tweety is a yellow bird that sings.
+[3] John, who is tall, has two dogs named Max and Bella.
+Output:
+[1] Birds fly.
+[1] Birds have feathers.
+[2] Tweety is bird.
+[2] Tweety is yellow.
+[2] Tweety sings.
+[3] John is tall.
+[3] John has dogs.
+[3] Dog is Max.
+[3] Dog is Bella.
+```
+"""
+    ),
+    ("human", "{input}")
+])
+
 # Prompt template for generating responses based on NARS knowledge
 answer_template = ChatPromptTemplate.from_messages([
     (
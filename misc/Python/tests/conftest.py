@@ -0,0 +1,42 @@
+"""
+Shared setup of the tests of the Python NARS interface
+
+The modules are imported from misc/Python and spawn the NAR binary relative
+to it, so the tests run from there whatever directory pytest is started in.
+"""
+
+import os
+import sys
+import pytest
+
+PYTHON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+NAR_BINARY = os.path.join(PYTHON_DIR, "..", "..", "NAR")
+
+os.chdir(PYTHON_DIR)
+if PYTHON_DIR not in sys.path:
+    sys.path.insert(0, PYTHON_DIR)
+
+@pytest.fixture
+def NAR():
+    """The NAR module, skipping the test if the NAR binary is not built."""
+    if not os.path.exists(NAR_BINARY):
+        pytest.skip("NAR binary not built")
+    import NAR
+    return NAR
+
+@pytest.fixture
+def nar(NAR):
+    """A NAR shell process of its own, printing every event."""
+    proc = NAR.spawnNAR()
+    NAR.AddInput("*volume=100", Print=False, usedNAR=proc)
+    yield proc
+    proc.kill()
+    proc.wait()
+
+@pytest.fixture
+def client(NAR):
+    """A NarsClient on a NAR process of its own."""
+    from nar_pool import NarPool
+    pool = NarPool(size=1)
+    yield pool.client("test")
+    pool.close()
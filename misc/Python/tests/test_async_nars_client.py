@@ -0,0 +1,101 @@
+"""
+Tests of AsyncNarClient, which shares the client logic of NarsClient
+"""
+
+import os
+import sys
+import asyncio
+import threading
+import subprocess
+
+import pytest
+
+from test_nar_batch import STDIN_OPERATION
+
+STATEMENTS = ["<a --> b>.", "<b --> c>.", "<x --> y>."]
+
+def run_async(NAR, steps, **kwargs):
+    """Run a coroutine function on a started AsyncNarClient."""
+    from conftest import NAR_BINARY
+    from async_nars_client import AsyncNarClient
+
+    async def run():
+        async with AsyncNarClient(nar_path=NAR_BINARY, **kwargs) as client:
+            return await steps(client)
+
+    return asyncio.run(run())
+
+def terms(tasks):
+    return [task["term"] for task in tasks]
+
+def test_async_client_matches_client(NAR, client, tmp_path):
+    path = str(tmp_path / "knowledge.nal")
+    client.add_inputs(STATEMENTS)
+    expected_answers = terms(client.add_input("<a --> c>?")["answers"])
+    expected_saved = client.save_knowledge(path, delta=True)
+    client.reset()
+    expected_loaded = client.load_knowledge(path)
+
+    async def steps(async_client):
+        await async_client.add_inputs(STATEMENTS)
+        answers = terms((await async_client.add_input("<a --> c>?"))["answers"])
+        async_path = str(tmp_path / "async_knowledge.nal")
+        saved = await async_client.save_knowledge(async_path, delta=True)
+        await async_client.reset()
+        loaded = await async_client.load_knowledge(async_path)
+        knowledge = await async_client.extract_knowledge("Is a a c?")
+        return answers, saved, loaded, knowledge
+
+    answers, saved, loaded, knowledge = run_async(NAR, steps)
+    assert answers == expected_answers == ["<a --> c>"]
+    assert (saved["statements"], saved["compacted"]) == (expected_saved["statements"], expected_saved["compacted"])
+    assert (loaded["loaded"], loaded["failed"]) == (expected_loaded["loaded"], expected_loaded["failed"])
+    assert loaded["loaded"] == saved["statements"] and "a is b" in knowledge.lower()
+
+def test_cancelled_batch_is_drained(NAR):
+    async def steps(client):
+        proc = client.proc
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(client.add_inputs([f"<a{i} --> b{i}>." for i in range(2000)]), 0.01)
+        output = await client.add_input("<c --> d>.")
+        return proc, client.proc, output
+
+    proc, proc_after, output = run_async(NAR, steps)
+    assert proc_after is proc
+    assert terms(output["input"]) == ["<c --> d>"]
+
+def test_cancelled_product_request_restarts_nar(NAR):
+    async def steps(client):
+        await client.add_inputs(STDIN_OPERATION + ["a. :|:"])
+        proc = client.proc
+        # an exchange cancelled while the operation waits for its product
+        await client._write("<x --> picked>! :|:\n0\n")
+        client.in_sync = False
+        output = await client.add_input("<c --> d>.")
+        return proc, client.proc, output
+
+    proc, proc_after, output = run_async(NAR, steps, resync_timeout=1.0)
+    assert proc_after is not proc and proc.returncode is not None
+    assert terms(output["input"]) == ["<c --> d>"]
+
+def test_import_starts_no_nar_process(tmp_path):
+    # outside misc/Python, where NAR could not even spawn the shared process
+    python_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    check = f"import sys; sys.path.insert(0, {python_dir!r}); import async_nars_client; print('NAR' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", check], cwd=str(tmp_path), capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "False"
+
+def test_knowledge_file_is_read_off_the_event_loop(NAR, tmp_path):
+    path = str(tmp_path / "knowledge.nal")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(STATEMENTS) + "\n")
+    threads = []
+
+    async def steps(client):
+        loaded = await client.load_knowledge(path, batch_size=1, progress=lambda state: threads.append(threading.current_thread()))
+        return loaded, threading.current_thread()
+
+    loaded, loop_thread = run_async(NAR, steps)
+    assert loaded["loaded"] == len(STATEMENTS)
+    assert len(threads) == len(STATEMENTS) and loop_thread not in threads
@@ -0,0 +1,87 @@
+"""
+Tests of the batched, cached and parallel conversion of english_to_narsese_modular
+"""
+
+import multiprocessing
+from types import SimpleNamespace
+
+import pytest
+
+import english_to_narsese_modular
+from english_to_narsese_modular import EnglishToNarsese
+from nltk_resources import ensure_nltk_resources
+
+SENTENCES = [
+    "Tweety is a yellow bird.",
+    "Birds sing.",
+    "Tweety is not a cat.",
+    "*eternal=false",
+    "Cats chase birds now.",
+    "Is Tweety a bird?",
+    "",
+    "Tweety is a yellow bird.",
+    "Tweety will be a singer.",
+    "Birds sing!",
+]
+
+# Universal tags and lemmas standing in for the NLTK tagger and WordNet when their data is not installed
+TAGS = {"is": "VERB", "be": "VERB", "will": "VERB", "a": "DET", "yellow": "ADJ", "not": "ADV", "now": "ADV",
+        "sing": "VERB", "sings": "VERB", "chase": "VERB"}
+LEMMAS = {"is": "be", "birds": "bird", "cats": "cat", "sings": "sing"}
+
+class ToyLemmatizer:
+    def lemmatize(self, word, pos="n"):
+        return LEMMAS.get(word.lower(), word) if word[0].islower() else word
+
+def toy_tag(tokens):
+    return [(token, TAGS.get(token.lower(), "NOUN")) for token in tokens]
+
+@pytest.fixture
+def toy_nltk():
+    """Whether the toy tagger stands in for NLTK, whose data is not installed."""
+    return bool(ensure_nltk_resources(download=False))
+
+@pytest.fixture
+def converter(toy_nltk, monkeypatch):
+    if toy_nltk:
+        monkeypatch.setattr(english_to_narsese_modular, "ensure_nltk_resources", lambda **kwargs: [])
+        monkeypatch.setattr(english_to_narsese_modular, "wordnet", SimpleNamespace(ADJ="a", VERB="v", NOUN="n", ADV="r"))
+        monkeypatch.setattr(english_to_narsese_modular, "tokenize", str.split)
+        monkeypatch.setattr(english_to_narsese_modular, "pos_tag_universal", toy_tag)
+        monkeypatch.setattr(english_to_narsese_modular, "pos_tag_sents_universal", lambda sentences: [toy_tag(s) for s in sentences])
+        monkeypatch.setattr(english_to_narsese_modular, "lemmatizer", ToyLemmatizer)
+    return lambda: EnglishToNarsese(output_truth=True)
+
+def test_process_batch_matches_process_line(converter):
+    single = converter()
+    expected = [single.process_line(line) for line in SENTENCES]
+    assert converter().process_batch(SENTENCES) == expected
+    assert any(output.strip() for output in expected)
+
+def test_process_batch_with_cached_translations(converter):
+    single = converter()
+    expected = [single.process_line(line) for line in SENTENCES]
+    batched = converter()
+    batched.process_batch(SENTENCES[:3])
+    assert batched.process_batch(SENTENCES[3:]) == expected[3:]
+    assert batched.translation_cache.hits > 0
+
+def test_process_parallel_matches_process_line(converter, toy_nltk):
+    if toy_nltk and multiprocessing.get_start_method() != "fork":
+        pytest.skip("the toy tagger only reaches forked worker processes")
+    single = converter()
+    expected = [single.process_line(line) for line in SENTENCES]
+    assert list(converter().process_parallel(SENTENCES, processes=2, chunk_size=2)) == expected
+
+def test_translation_key_separates_inputs(converter):
+    c = converter()
+    keys = [c.translation_key(line) for line in ["Tweety is a bird.", "Tweety is a bird?", "Tweety is a bird!",
+                                                   "Tweety is not a bird.", "Tweety is a bird now.", "Tweety is a cat."]]
+    assert len(set(keys)) == len(keys)
+    assert c.translation_key("Tweety is a bird.") == c.translation_key("Tweety is a bird.")
+    key = c.translation_key("Tweety is a bird.")
+    c.output_truth = False
+    assert c.translation_key("Tweety is a bird.") != key
+    c.output_truth = True
+    c.motivation = "5"
+    assert c.translation_key("Tweety is a bird.") != key
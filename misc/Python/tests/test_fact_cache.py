@@ -0,0 +1,94 @@
+"""
+Tests of the persistent cache of extracted facts
+"""
+
+import sqlite3
+import itertools
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+import fact_cache
+from fact_cache import FactCache
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Strictly increasing time of the cache, so the order of use is never a tie."""
+    monkeypatch.setattr(fact_cache, "time", SimpleNamespace(time=itertools.count().__next__))
+
+def test_least_recently_used_entries_are_evicted(tmp_path, clock):
+    cache = FactCache(str(tmp_path / "facts.sqlite"), max_entries=2)
+    cache.put("a", ["A is a."])
+    cache.put("b", ["B is b."])
+    assert cache.get("a") == ["A is a."]
+    cache.put("c", ["C is c."])
+    assert cache.get("b") is None
+    assert cache.get("a") == ["A is a."] and cache.get("c") == ["C is c."]
+    assert (cache.hits, cache.misses) == (3, 1)
+
+def test_replaced_entries_are_evicted_by_last_used(tmp_path, clock):
+    cache = FactCache(str(tmp_path / "facts.sqlite"), max_entries=3)
+    for key in "abc":
+        cache.put(key, [key])
+    # replacing an entry marks it as used without adding one
+    cache.put("a", ["A"])
+    cache.put("d", ["d"])
+    assert [cache.get(key) for key in "abcd"] == [["A"], None, ["c"], ["d"]]
+    # the gets used "a" first
+    cache.put("e", ["e"])
+    assert [cache.get(key) for key in "acde"] == [None, ["c"], ["d"], ["e"]]
+
+def test_put_does_not_count_the_table(tmp_path):
+    cache = FactCache(str(tmp_path / "facts.sqlite"), max_entries=2)
+    statements = []
+    cache._connection().set_trace_callback(statements.append)
+    for key in "abcab":
+        cache.put(key, [key])
+    assert statements and not any("COUNT(" in statement.upper() for statement in statements)
+    cache.clear()
+    cache.put("a", ["a"])
+    assert cache._connection().execute("SELECT entries, (SELECT COUNT(*) FROM facts) FROM facts_count").fetchone() == (1, 1)
+
+def test_count_of_an_existing_database_is_initialized(tmp_path, clock):
+    path = str(tmp_path / "facts.sqlite")
+    with sqlite3.connect(path) as connection:
+        connection.execute("CREATE TABLE facts (key TEXT PRIMARY KEY, facts TEXT NOT NULL, last_used REAL NOT NULL)")
+        connection.executemany("INSERT INTO facts VALUES (?, '[]', ?)", [("a", -2), ("b", -1)])
+    cache = FactCache(path, max_entries=2)
+    cache.put("c", [])
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == (None, [], [])
+
+def test_empty_facts_are_cached(tmp_path):
+    cache = FactCache(str(tmp_path / "facts.sqlite"))
+    cache.put("none", [])
+    assert cache.get("none") == []
+
+def test_entries_persist_across_instances(tmp_path):
+    path = str(tmp_path / "facts.sqlite")
+    FactCache(path).put("a", ["A is a."])
+    assert FactCache(path).get("a") == ["A is a."]
+
+def test_connection_is_reused_per_thread(tmp_path):
+    cache = FactCache(str(tmp_path / "facts.sqlite"))
+    cache.put("a", ["A is a."])
+    connection = cache._connection()
+    assert cache._connection() is connection
+    seen = {}
+
+    def worker():
+        seen["connection"] = cache._connection()
+        seen["same"] = cache._connection() is seen["connection"]
+        seen["facts"] = cache.get("a")
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+    assert seen["connection"] is not connection and seen["same"]
+    assert seen["facts"] == ["A is a."]
+
+def test_key_depends_on_model_template_and_text():
+    key = FactCache.key("model", "template", "text")
+    assert key == FactCache.key("model", "template", "text")
+    assert len({key, FactCache.key("other", "template", "text"), FactCache.key("model", "other", "text"),
+                FactCache.key("model", "template", "other")}) == 4
@@ -0,0 +1,49 @@
+"""
+Tests of the cached single and batched fact extraction of LlmClient
+"""
+
+import pytest
+
+pytest.importorskip("langchain_core")
+
+from fact_cache import FactCache
+from llm_backends import LlmBackend, synthetic_response, prompt_text
+from llm_client import LlmClient
+
+class CountingBackend(LlmBackend):
+    """Synthetic responses without the facts about "silent", counting the prompts."""
+
+    def __init__(self, model: str):
+        super().__init__(model)
+        self.prompts = 0
+
+    def invoke(self, prompt):
+        self.prompts += 1
+        return "\n".join(line for line in synthetic_response(prompt_text(prompt)).split("\n") if "silent" not in line)
+
+@pytest.fixture
+def llm(tmp_path):
+    return LlmClient(model_name="test", fact_cache=FactCache(str(tmp_path / "facts.sqlite")), backend=CountingBackend)
+
+def test_single_and_batched_extraction_share_the_cache(llm):
+    facts = llm.extract_facts("Birds have feathers.")
+    assert facts and llm.fact_llm.prompts == 1
+    assert llm.extract_facts_batch(["Birds have feathers."]) == [facts]
+    assert llm.fact_llm.prompts == 1
+    batched = llm.extract_facts_batch(["Cats chase mice."])
+    assert llm.fact_llm.prompts == 2
+    assert [llm.extract_facts("Cats chase mice.")] == batched
+    assert llm.fact_llm.prompts == 2
+
+def test_empty_result_is_cached(llm):
+    assert llm.extract_facts("A silent sentence.") == []
+    assert llm.extract_facts("A silent sentence.") == []
+    assert llm.fact_llm.prompts == 1
+
+def test_batch_fallback_result_is_cached(llm):
+    # the batch response has no facts of the silent sentence, so it is extracted on its own
+    results = llm.extract_facts_batch(["Birds have feathers.", "A silent sentence."])
+    assert results[0] and results[1] == []
+    assert llm.fact_llm.prompts == 1 + 1
+    assert llm.extract_facts_batch(["Birds have feathers.", "A silent sentence."]) == results
+    assert llm.fact_llm.prompts == 2
@@ -0,0 +1,51 @@
+"""
+Tests of the streamed answers of LlmClient, without their <think> section
+"""
+
+import pytest
+
+from llm_backends import LlmBackend
+from llm_client import LlmClient, remove_think, strip_think
+
+# a response with the tags split across chunks, and a "<" that starts no tag
+CHUNKS = ["<th", "ink>", "Tweety is a bird, so", "...</", "think", ">\n\n", "Yes, Tweety ", "is a bird <", "3", " <t", "he end>"]
+
+ANSWER = "Yes, Tweety is a bird <3 <the end>"
+
+RESPONSES = [
+    "".join(CHUNKS),
+    "No thinking at all.",
+    "<think></think>Empty thinking.",
+    "  <think>\nthoughts</think> Answer with a <b>tag</b>.",
+    "Text ending in a partial tag <thi",
+]
+
+def test_split_tags_are_removed():
+    tokens = list(strip_think(CHUNKS))
+    assert tokens == ["Yes, Tweety ", "is a bird ", "<3", " ", "<the end>"]
+    assert "".join(tokens) == ANSWER
+
+@pytest.mark.parametrize("response", RESPONSES)
+def test_any_split_gives_the_complete_answer(response):
+    expected = remove_think(response).strip()
+    for size in range(1, len(response) + 1):
+        chunks = [response[i:i + size] for i in range(0, len(response), size)]
+        assert "".join(strip_think(chunks)).strip() == expected, size
+
+class StreamingBackend(LlmBackend):
+    """Streams CHUNKS whatever the prompt."""
+
+    def invoke(self, prompt):
+        return "".join(CHUNKS)
+
+    def stream(self, prompt):
+        return iter(CHUNKS)
+
+def test_generated_tokens_are_forwarded_without_think():
+    pytest.importorskip("langchain_core")
+    llm = LlmClient(model_name="test", backend=StreamingBackend)
+    tokens = []
+    answer = llm.generate_response("Is Tweety a bird?", "Tweety is a bird.", on_token=tokens.append)
+    assert tokens == list(strip_think(CHUNKS))
+    assert answer == "".join(tokens) == ANSWER
+    assert llm.generate_response("Is Tweety a bird?", "Tweety is a bird.") == answer
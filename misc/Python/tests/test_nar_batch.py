@@ -0,0 +1,41 @@
+"""
+Tests of the batched input of NAR.AddInputs
+"""
+
+# operation ^pick registered to read its product from stdin, and the hypothesis to execute it
+STDIN_OPERATION = ["*setopname 1 ^pick", "*setopstdin 1", "<(a &/ <({SELF} * #1) --> ^pick>) =/> <#1 --> picked>>."]
+
+def test_batch_matches_single_inputs(NAR, nar):
+    statements = ["<a --> b>.", "<b --> c>.", "<a --> c>?"]
+    single = NAR.spawnNAR()
+    try:
+        NAR.AddInput("*volume=100", Print=False, usedNAR=single)
+        expected = [NAR.AddInput(s, Print=False, usedNAR=single).copy() for s in statements]
+    finally:
+        single.kill()
+        single.wait()
+    assert [ret.copy() for ret in NAR.AddInputs(statements, Print=False, usedNAR=nar)] == expected
+
+def test_batch_stops_at_operation_expecting_product(NAR, nar):
+    NAR.AddInputs(STDIN_OPERATION, Print=False, usedNAR=nar)
+    rets = NAR.AddInputs(["a. :|:", "<x --> picked>! :|:", "<c --> d>."], Print=False, usedNAR=nar)
+    assert [ret["requestOutputArgs"] for ret in rets] == [False, True]
+    assert rets[1]["executions"] == [{"operator": "^pick", "arguments": "x", "metta": "(^ pick)"}]
+    assert NAR.PRODUCT_EXPECTED not in rets[1]["raw"]
+    # the product answers the operation, after which the pipe is still in sync
+    NAR.AddInput("({SELF} * x)", Print=False, usedNAR=nar)
+    ret = NAR.AddInput("<c --> d>.", Print=False, usedNAR=nar)
+    assert [task["term"] for task in ret["input"]] == ["<c --> d>"]
+    assert nar.poll() is None
+
+def test_batch_registering_stdin_operation(NAR, nar):
+    rets = NAR.AddInputs(STDIN_OPERATION + ["a. :|:", "<x --> picked>! :|:", "<c --> d>."], Print=False, usedNAR=nar)
+    assert len(rets) == len(STDIN_OPERATION) + 2 and rets[-1]["requestOutputArgs"]
+    NAR.AddInput("({SELF} * x)", Print=False, usedNAR=nar)
+    assert nar.poll() is None
+
+def test_reset_clears_stdin_operations(NAR, nar):
+    NAR.AddInputs(STDIN_OPERATION, Print=False, usedNAR=nar)
+    assert nar in NAR.StdinOperationNARs
+    NAR.Reset(usedNAR=nar)
+    assert nar not in NAR.StdinOperationNARs
@@ -0,0 +1,63 @@
+"""
+Tests of the events of the in-process binding nar_binding.InProcessNar
+"""
+
+import ctypes
+
+import pytest
+
+from nar_binding import InProcessNar, find_library
+
+STATEMENTS = ["<a --> b>.", "<b --> c>.", "<a --> c>?", "x. :|:", "<(x &/ ^left) =/> y>.", "x. :|:", "y! :|:", "5"]
+
+CATEGORIES = ("input", "derivations", "answers", "selections", "executions", "reason")
+
+DECISION = ["<(x &/ ^left) =/> y>.", "x. :|:", "y! :|:"]
+
+@pytest.fixture(scope="module")
+def binding():
+    """The reasoner of this process, skipping the tests if libONA is not built."""
+    if not find_library():
+        pytest.skip("libONA not built")
+    return InProcessNar()
+
+def without_stamp(task):
+    return {key: value for key, value in task.items() if key != "Stamp"}
+
+def reason_without_stamps(reason):
+    if reason is None:
+        return None
+    return dict(reason, hypothesis=without_stamp(reason["hypothesis"]), precondition=without_stamp(reason["precondition"]))
+
+def test_events_match_text_output_without_stamp(NAR, nar, binding):
+    binding.reset()
+    for statement in STATEMENTS:
+        events = binding.add_input(statement)
+        output = NAR.AddInput(statement, Print=False, usedNAR=nar)
+        for category in CATEGORIES:
+            if category == "executions":
+                expected = output[category]
+            elif category == "reason":
+                expected = reason_without_stamps(output[category])
+            else:
+                expected = [without_stamp(task) for task in output[category]]
+            if statement.startswith("<(") and category == "input":
+                # the dt of an implication is a key of its own instead of a prefix of the term
+                expected = [dict(task, term=task["term"].split(" ", 1)[1]) for task in expected]
+            assert events[category] == expected, (statement, category)
+
+def test_decisions_reach_the_callback_instead_of_stdout(NAR, nar, binding, capfd):
+    binding.reset()
+    received = []
+    binding.on_event = lambda category, event: received.append((category, event))
+    capfd.readouterr()
+    try:
+        binding.add_inputs(DECISION)
+    finally:
+        binding.on_event = None
+        ctypes.CDLL(None).fflush(None)
+    assert capfd.readouterr().out == ""
+    decisions = [event for (category, event) in received if category == "reason"]
+    expected = [NAR.AddInput(statement, Print=False, usedNAR=nar)["reason"] for statement in DECISION][-1]
+    assert decisions == [reason_without_stamps(expected)]
+    assert [category for (category, _) in received].index("reason") < [category for (category, _) in received].index("executions")
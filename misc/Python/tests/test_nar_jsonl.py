@@ -0,0 +1,53 @@
+"""
+Tests of the parsing of the *format=jsonl output against the text output
+"""
+
+import pytest
+
+# statements covering inputs, derivations with dt=, answers, decisions and executions with and without arguments
+STATEMENTS = ["*setopname 1 ^left", "*setopname 2 ^pick",
+              "<a --> b>.", "<b --> c>.", "<a --> c>?", "<(a &/ ^left) =/> b>.",
+              "<(a &/ <({SELF} * #1) --> ^pick>) =/> <#1 --> picked>>.",
+              "a. :|:", "b! :|:", "a. :|:", "<x --> picked>! :|:", "5", "<a --> b>. :|:", "<a --> b>?", "<x --> y>?"]
+
+CATEGORIES = ("input", "derivations", "answers", "executions", "reason", "selections")
+
+@pytest.fixture
+def outputs(NAR):
+    """Outputs of STATEMENTS by a NAR process in text format and one in JSONL format."""
+    outputs = {}
+    for format in ("text", "jsonl"):
+        proc = NAR.spawnNAR()
+        try:
+            NAR.AddInputs(["*volume=100", "*format=" + format], Print=False, usedNAR=proc)
+            outputs[format] = ([NAR.AddInput(s, Print=False, usedNAR=proc) for s in STATEMENTS],
+                               NAR.AddInput("*stats", Print=False, usedNAR=proc))
+        finally:
+            proc.kill()
+            proc.wait()
+    return outputs
+
+def test_jsonl_events_equal_text_events(outputs):
+    text, jsonl = outputs["text"][0], outputs["jsonl"][0]
+    for statement, text_output, jsonl_output in zip(STATEMENTS, text, jsonl):
+        for category in CATEGORIES:
+            assert jsonl_output[category] == text_output[category], (statement, category)
+
+def test_jsonl_output_covers_every_category(outputs):
+    jsonl = outputs["jsonl"][0]
+    assert all(line.startswith("{") for statement, output in zip(STATEMENTS, jsonl) if statement != "5"
+               for line in output["raw"].split("\n") if line)
+    for category in CATEGORIES:
+        assert any(output[category] for output in jsonl), category
+    assert any(task["term"].startswith("dt=") for output in jsonl for task in output["derivations"])
+    assert any(execution["arguments"] == [] for output in jsonl for execution in output["executions"])
+    assert any(execution["arguments"] == "x" for output in jsonl for execution in output["executions"])
+
+def test_jsonl_stats_equal_text_stats(outputs):
+    assert outputs["jsonl"][1] == outputs["text"][1]
+    assert isinstance(outputs["jsonl"][1]["currentTime"], float)
+
+def test_printed_task_of_jsonl_output(NAR, outputs):
+    for text_output, jsonl_output in zip(outputs["text"][0], outputs["jsonl"][0]):
+        for text_task, jsonl_task in zip(text_output["input"], jsonl_output["input"]):
+            assert NAR.PrintedTask(jsonl_task) == NAR.PrintedTask(text_task)
@@ -0,0 +1,70 @@
+"""
+Tests of the lazily parsed, category filtered NAROutput of nar_protocol.ParseOutput
+"""
+
+import json
+
+import pytest
+
+from test_nar_parser import OUTPUT
+
+@pytest.fixture
+def parsed(NAR, monkeypatch):
+    """Counts of the parseTask calls, which parse the task lines."""
+    import nar_protocol
+    calls = []
+    parseTask = nar_protocol.parseTask
+    monkeypatch.setattr(nar_protocol, "parseTask", lambda s: calls.append(s) or parseTask(s))
+    return calls
+
+def test_categories_are_parsed_on_first_access(NAR, parsed):
+    output = NAR.ParseOutput(OUTPUT)
+    assert parsed == []
+    answers = output["answers"]
+    assert len(answers) == 3 and len(parsed) == 3
+    assert output["answers"] is answers and len(parsed) == 3
+    assert output["requestOutputArgs"] is False and len(parsed) == 3
+
+def test_filtered_output_has_defaults_for_excluded_categories(NAR, parsed):
+    output = NAR.ParseOutput(OUTPUT, categories=("answers",))
+    for category in NAR.OUTPUT_CATEGORIES:
+        if category != "answers":
+            assert category in output
+            assert output[category] == NAR.OUTPUT_DEFAULTS[category]
+            assert output.get(category) == NAR.OUTPUT_DEFAULTS[category]
+    assert parsed == []
+    assert [task["term"] for task in output["answers"]] == ["<a --> c>", "<a --> c>", "None"]
+    assert len(parsed) == 3
+
+def test_output_without_categories(NAR, parsed):
+    # as requested when only the raw output is read
+    output = NAR.ParseOutput(OUTPUT, categories=())
+    assert output.get("raw") == ""
+    assert output["input"] == [] and output["reason"] is None
+    assert output == dict(NAR.OUTPUT_DEFAULTS, requestOutputArgs=False)
+    assert parsed == []
+    assert output.get("unknown") is None
+    with pytest.raises(KeyError):
+        output["unknown"]
+
+def test_defaults_are_not_shared(NAR):
+    first = NAR.ParseOutput(OUTPUT, categories=())
+    first["answers"].append("changed")
+    assert NAR.ParseOutput(OUTPUT, categories=())["answers"] == []
+    assert NAR.OUTPUT_DEFAULTS["answers"] == []
+
+def test_filtered_output_equals_full_output_in_its_categories(NAR):
+    full = NAR.ParseOutput(OUTPUT)
+    for category in NAR.OUTPUT_CATEGORIES:
+        assert NAR.ParseOutput(OUTPUT, categories=(category,))[category] == full[category]
+
+def test_output_behaves_as_dict(NAR):
+    expected = NAR.ParseOutput(OUTPUT).copy()
+    assert set(expected) == set(NAR.OUTPUT_CATEGORIES) | {"requestOutputArgs"}
+    assert NAR.ParseOutput(OUTPUT) == expected
+    assert NAR.ParseOutput(OUTPUT) == NAR.ParseOutput(OUTPUT)
+    assert not NAR.ParseOutput(OUTPUT) != NAR.ParseOutput(OUTPUT)
+    assert NAR.ParseOutput(OUTPUT) != NAR.ParseOutput(OUTPUT[:1])
+    assert dict(NAR.ParseOutput(OUTPUT)) == expected
+    assert json.loads(json.dumps(NAR.ParseOutput(OUTPUT))) == json.loads(json.dumps(expected))
+    assert len(NAR.ParseOutput(OUTPUT)) == len(expected)
@@ -0,0 +1,53 @@
+"""
+Tests of the single pass task parser of NAR.py against the split based parser it replaced
+"""
+
+import pytest
+
+# NARS output lines in text format, with their category prefix
+OUTPUT = """Input: <a --> b>. Priority=1.000000 Stamp=[1] Truth: frequency=1.000000, confidence=0.900000
+Selected: <a --> b>. Priority=1.000000 Stamp=[1] Truth: frequency=1.000000, confidence=0.900000
+Input: <b --> c>. :|: occurrenceTime=2 Priority=1.000000 Stamp=[2] Truth: frequency=1.000000, confidence=0.900000
+Derived: <a --> c>. :|: occurrenceTime=2 Priority=0.407250 Stamp=[2,1] Truth: frequency=1.000000, confidence=0.810000
+Derived: <c --> a>. Priority=0.325691 Stamp=[2,1] Truth: frequency=1.000000, confidence=0.447514
+Revised: <a --> b>. Priority=0.512000 Stamp=[3,1] Truth: frequency=0.500000, confidence=0.947368
+Input: dt=0.000000 <(a &/ ^left) =/> b>. Priority=1.000000 Stamp=[4] Truth: frequency=1.000000, confidence=0.900000
+Derived: dt=2.000000 <((<$1 --> b> &/ $1) &/ ^left) =/> <$1 --> b>>. Priority=0.164151 Stamp=[1,6,5,3] Truth: frequency=1.000000, confidence=0.150345
+Derived: dt=-3.000000 <a =\\> <a --> b>>. Priority=0.250129 Stamp=[3,6] Truth: frequency=0.000000, confidence=0.226692
+Input: b! :|: occurrenceTime=7 Priority=1.000000 Stamp=[7] Truth: frequency=1.000000, confidence=0.900000
+Input: <a --> c>?
+Input: <a --> c>? :|:
+Input: <?1 --> c>?
+Answer: <a --> c>. creationTime=2 Stamp=[2,1] Truth: frequency=1.000000, confidence=0.810000
+Answer: <a --> c>. :|: occurrenceTime=2 creationTime=2 Stamp=[2,1] Truth: frequency=1.000000, confidence=0.810000
+Answer: None.
+Input: <{SELF} --> [good]>! :|: occurrenceTime=12 Priority=1.000000 Stamp=[12] Truth: frequency=1.000000, confidence=0.900000
+Input: (a &/ b). :|: occurrenceTime=13 Priority=1.000000 Stamp=[13,14] Truth: frequency=1.000000, confidence=0.900000
+^left executed with args
+^pick executed with args ({SELF} * x)
+decision expectation=0.791600 implication: <(a &/ ^left) =/> b>. Stamp=[2] Truth: frequency=1.000000 confidence=0.900000 dt=0.000000 precondition: a. :|: Stamp=[3] Truth: frequency=1.000000 confidence=0.900000 occurrenceTime=3""".split("\n")
+
+PREFIXES = ("Input: ", "Derived: ", "Revised: ", "Answer: ", "Selected: ")
+
+TASKS = [line.split(": ", 1)[1] for line in OUTPUT if line.startswith(PREFIXES)]
+
+@pytest.mark.parametrize("task", TASKS)
+def test_parse_task_equals_split_parser(NAR, task):
+    assert NAR.parseTask(task) == NAR.parseTaskSplit(task)
+
+def test_parse_task_takes_the_single_pass(NAR):
+    # the split parser is only the fallback, the pattern has to cover the task formats
+    for task in TASKS:
+        assert NAR.TASK_PATTERN.fullmatch(task) is not None, task
+
+def test_parse_task_fields(NAR):
+    assert NAR.parseTask(TASKS[2]) == {"occurrenceTime": "2", "Stamp": [2], "punctuation": ".", "term": "<b --> c>",
+                                       "truth": {"frequency": "1.000000", "confidence": "0.900000"}, "Priority": "1.000000"}
+    assert NAR.parseTask("<a --> c>?") == {"occurrenceTime": "eternal", "punctuation": "?", "term": "<a --> c>"}
+    assert NAR.parseTask("<a --> c>? :|:")["occurrenceTime"] == "now"
+    assert NAR.parseTask(TASKS[7])["term"] == "dt=2.000000 <((<$1 --> b> &/ $1) &/ ^left) =/> <$1 --> b>>"
+    assert NAR.parseTask(TASKS[7])["Stamp"] == [1, 6, 5, 3]
+
+def test_parse_output_equals_split_parser(NAR):
+    from bench_nar_parser import ParseOutputSplit
+    assert NAR.ParseOutput(OUTPUT).copy() == ParseOutputSplit(OUTPUT)
@@ -0,0 +1,45 @@
+"""
+Tests of the session affinity and the restarts of NarPool
+"""
+
+import pytest
+
+@pytest.fixture
+def pool(NAR):
+    from nar_pool import NarPool
+    pool = NarPool(size=2)
+    yield pool
+    pool.close()
+
+def terms(output):
+    return [task["term"] for task in output["input"]]
+
+def test_sessions_are_pinned_to_the_least_used_process(pool):
+    assert [pool.index_of(session) for session in ["a", "b", "c", "a", "b"]] == [0, 1, 0, 0, 1]
+    pool.release("b")
+    assert pool.index_of("d") == 1
+    with pool.session("a") as first, pool.session("d") as second:
+        assert first is pool.processes[0] and second is pool.processes[1]
+
+def test_sessions_keep_their_knowledge(pool):
+    a, b = pool.client("a"), pool.client("b")
+    a.add_input("<x --> y>.")
+    assert [task["term"] for task in a.add_input("<x --> y>?")["answers"]] == ["<x --> y>"]
+    # NARS answers None to a question it has no belief for
+    assert [task["term"] for task in b.add_input("<x --> y>?")["answers"]] == ["None"]
+
+def test_dead_process_is_restarted_before_use(pool):
+    client = pool.client("a")
+    proc = pool.processes[0]
+    proc.kill()
+    proc.wait()
+    assert terms(client.add_input("<c --> d>.")) == ["<c --> d>"]
+    assert pool.processes[0] is not proc
+
+def test_process_exiting_during_use_is_restarted(pool):
+    client = pool.client("a")
+    proc = pool.processes[0]
+    # NARS exits on a parsing error instead of printing the "0" step
+    assert client.add_input("<a --> b")["raw"].startswith("Error adding to NARS")
+    assert proc.poll() is not None and pool.processes[0] is not proc
+    assert terms(client.add_input("<c --> d>.")) == ["<c --> d>"]
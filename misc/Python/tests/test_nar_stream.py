@@ -0,0 +1,69 @@
+"""
+Tests of the streamed input of NAR.StreamOutput and the NARS clients
+"""
+
+import asyncio
+
+import pytest
+
+from test_nar_batch import STDIN_OPERATION
+
+def test_stream_matches_add_input(NAR, nar):
+    NAR.AddInputs(["<a --> b>.", "<b --> c>."], Print=False, usedNAR=nar)
+    events = list(NAR.StreamOutput("<a --> c>?", usedNAR=nar, categories=("answers",)))
+    assert [(category, task["term"]) for category, task in events] == [("answers", "<a --> c>")]
+    assert NAR.AddInput("<a --> c>?", Print=False, usedNAR=nar)["answers"] == [task for _, task in events]
+
+def test_stream_closed_early_stays_in_sync(NAR, nar):
+    stream = NAR.StreamOutput("<a --> b>.", usedNAR=nar)
+    assert next(stream)[0] == "input"
+    stream.close()
+    assert [task["term"] for task in NAR.AddInput("<c --> d>.", Print=False, usedNAR=nar)["input"]] == ["<c --> d>"]
+
+def test_stream_ends_at_operation_expecting_product(NAR, nar):
+    NAR.AddInputs(STDIN_OPERATION + ["a. :|:"], Print=False, usedNAR=nar)
+    events = list(NAR.StreamOutput("<x --> picked>! :|:", usedNAR=nar, categories=("executions",)))
+    assert events == [("executions", {"operator": "^pick", "arguments": "x", "metta": "(^ pick)"}),
+                      ("requestOutputArgs", True)]
+    NAR.AddInput("({SELF} * x)", Print=False, usedNAR=nar)
+    assert [task["term"] for task in NAR.AddInput("<c --> d>.", Print=False, usedNAR=nar)["input"]] == ["<c --> d>"]
+    assert nar.poll() is None
+
+def test_client_stream_ends_at_operation_expecting_product(NAR, nar):
+    from nars_client import NarsClient
+
+    class Pool:
+        def session(self, session_id):
+            class Session:
+                def __enter__(self):
+                    return nar
+                def __exit__(self, *exc):
+                    return False
+            return Session()
+
+    client = NarsClient(pool=Pool())
+    client.add_inputs(STDIN_OPERATION + ["a. :|:"])
+    events = list(client.stream_input("<x --> picked>! :|:", categories=("executions",)))
+    assert events[-1] == ("requestOutputArgs", True)
+    # add_input skips lines starting with "(", the product is written to the process directly
+    NAR.AddInput("({SELF} * x)", Print=False, usedNAR=nar)
+    assert [task["term"] for task in client.add_input("<c --> d>.")["input"]] == ["<c --> d>"]
+
+def test_async_client_operation_expecting_product(NAR):
+    from conftest import NAR_BINARY
+    from async_nars_client import AsyncNarClient
+
+    async def run():
+        async with AsyncNarClient(nar_path=NAR_BINARY) as client:
+            await client.add_inputs(STDIN_OPERATION + ["a. :|:"])
+            events = [event async for event in client.stream_input("<x --> picked>! :|:", categories=("executions",))]
+            assert events[-1] == ("requestOutputArgs", True)
+            await client._send(["({SELF} * x)"])
+            await client.add_input("a. :|:")
+            outputs = await client.add_inputs(["<x --> picked>! :|:", "<c --> d>."])
+            assert outputs[0]["requestOutputArgs"] and outputs[1] == {"raw": ""}
+            await client._send(["({SELF} * x)"])
+            assert [task["term"] for task in (await client.add_input("<c --> d>."))["input"]] == ["<c --> d>"]
+            assert client.proc.returncode is None
+
+    asyncio.run(run())
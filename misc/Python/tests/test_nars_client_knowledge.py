@@ -0,0 +1,86 @@
+"""
+Tests of the delta saved knowledge files of NarsClient
+"""
+
+from nars_client import DELTA_HEADER, SHELL_LINE_MAX, is_wellformed_statement, latest_statement_lines
+
+def read(path):
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+def statements(path):
+    return [line for line in read(path).split("\n") if line and not line.startswith("//")]
+
+def belief(client, term):
+    answers = client.add_input(term + "?", categories=("answers",))["answers"]
+    return answers[0]["truth"] if answers and answers[0]["term"] == term else None
+
+def test_delta_save_appends_changes(client, tmp_path):
+    path = str(tmp_path / "knowledge.nal")
+    client.add_inputs(["<a --> b>.", "<x --> y>."])
+    assert client.save_knowledge(path, delta=True)["compacted"]
+    client.add_input("<a --> b>. {0.0 0.9}")
+    result = client.save_knowledge(path, delta=True)
+    assert not result["compacted"] and result["statements"] >= 1
+    saved = statements(path)
+    assert len([line for line in saved if line.startswith("<a --> b>.")]) == 2
+    assert len([line for line in saved if line.startswith("<x --> y>.")]) == 1
+    assert read(path).count(DELTA_HEADER) == 2
+
+def test_load_reads_latest_versions_without_modifying_the_file(client, tmp_path):
+    path = str(tmp_path / "knowledge.nal")
+    client.add_inputs(["<a --> b>.", "<x --> y>."])
+    client.save_knowledge(path, delta=True)
+    client.add_input("<a --> b>. {0.0 0.9}")
+    client.save_knowledge(path, delta=True)
+    expected = belief(client, "<a --> b>")
+    before = read(path)
+    lines, _ = latest_statement_lines(path)
+    client.reset()
+    result = client.load_knowledge(path)
+    assert read(path) == before
+    assert result["loaded"] == len(lines) and result["failed"] == 0
+    # the revised version is loaded alone, not revised with the version it replaced
+    assert belief(client, "<a --> b>") == expected
+
+def test_superseded_statements_trigger_full_rewrite_after_load(client, tmp_path):
+    path = str(tmp_path / "knowledge.nal")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f"{DELTA_HEADER} since=0 currentTime=1\n<a --> b>. {{1.0 0.9}}\n")
+        for time in range(2, 6):
+            f.write(f"{DELTA_HEADER} since={time-1} currentTime={time}\n<a --> b>. {{1.0 0.9{time}}}\n")
+    client.load_knowledge(path)
+    assert statements(path)[-1] == "<a --> b>. {1.0 0.95}"
+    client.add_input("<c --> d>.")
+    assert client.save_knowledge(path, delta=True)["compacted"]
+    assert read(path).count(DELTA_HEADER) == 1
+
+def test_explicit_compaction_drops_forgotten_concepts(client, tmp_path):
+    path = str(tmp_path / "knowledge.nal")
+    client.add_inputs(["<a --> b>.", "<x --> y>."])
+    client.save_knowledge(path, delta=True)
+    # a statement of a concept NARS no longer has, as left by forgetting
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(f"{DELTA_HEADER} since=1 currentTime=2\n<gone --> away>. {{1.0 0.9}}\n")
+    client.add_input("<a --> b>. {0.0 0.9}")
+    assert not client.save_knowledge(path, delta=True)["compacted"]
+    assert any(line.startswith("<gone --> away>.") for line in statements(path))
+    assert client.save_knowledge(path, delta=True, compact=True)["compacted"]
+    saved = statements(path)
+    assert not any(line.startswith("<gone --> away>.") for line in saved)
+    assert len([line for line in saved if line.startswith("<a --> b>.")]) == 1
+    assert read(path).count(DELTA_HEADER) == 1
+
+def test_statements_longer_than_a_shell_line_are_not_sent(client, tmp_path):
+    # "<a --> b>." with a long subject, the shell reads lines in parts of SHELL_LINE_MAX - 1 characters
+    fitting = "<" + "a" * (SHELL_LINE_MAX - 11) + " --> b>."
+    too_long = "<" + "a" * (SHELL_LINE_MAX - 5) + " --> b>."
+    assert len(fitting) == SHELL_LINE_MAX - 2 and is_wellformed_statement(fitting)
+    assert len(too_long) == SHELL_LINE_MAX + 4 and not is_wellformed_statement(too_long)
+    path = str(tmp_path / "knowledge.nal")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("<a --> b>.\n" + too_long + "\n<x --> y>.\n")
+    proc = client.pool.processes[0]
+    result = client.load_knowledge(path)
+    assert (result["loaded"], result["failed"]) == (2, 1)
+    assert client.pool.processes[0] is proc and proc.poll() is None
@@ -0,0 +1,24 @@
+"""
+Tests of the question specific knowledge extraction of NarsClient
+"""
+
+from nars_client import SHELL_LINE_MAX, query_atoms
+
+def test_query_atoms_spellings():
+    assert query_atoms("Is Tweety a bird?") == ["Is", "is", "Tweety", "tweety", "a", "A", "bird", "Bird"]
+
+def test_extract_knowledge_of_question(client):
+    client.add_inputs(["<tweety --> bird>.", "<sky --> blue>."])
+    knowledge = client.extract_knowledge("Is Tweety a bird?")
+    assert "tweety" in knowledge.lower() and "sky" not in knowledge.lower()
+    assert client.extract_knowledge("Unicorns?") == ""
+
+def test_extract_knowledge_of_question_longer_than_the_shell_line(client):
+    client.add_inputs(["<tweety --> bird>."])
+    sent = []
+    transport = client._transport
+    client._transport = lambda narsese, *args: sent.append(narsese) or transport(narsese, *args)
+    question = "Is Tweety " + " ".join(f"word{i}" for i in range(SHELL_LINE_MAX)) + "?"
+    assert "tweety" in client.extract_knowledge(question).lower()
+    assert len(sent) == 1 and len(sent[0]) < SHELL_LINE_MAX - 1
+    assert client.pool.processes[0].poll() is None
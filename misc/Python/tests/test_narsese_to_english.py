@@ -0,0 +1,51 @@
+"""
+Tests of the parse tree translator of narsese_to_english against the regex translator
+"""
+
+import pytest
+
+from narsese_to_english import narseseToEnglish, narseseToEnglish_regex, translateTerm, NarseseParseError
+
+# Lines both translators understand and translate alike
+GOOD_LINES = [
+    "<a --> b>.",
+    "<{tweety} --> [yellow]>. {1.0 0.9}",
+    "<(a * b) --> like>.",
+    "<(a & b) --> c>.",
+    "(! <a --> b>).",
+    "<a <-> b>. {0.8 0.5}",
+    "<(a &/ b) =/> c>.",
+    "<{Edran} --> knight>?",
+]
+
+# Lines the tree translator does not understand, which fall back to the regex translator
+MALFORMED_LINES = [
+    "<a -->b>.",
+    "<a ==>b>.",
+    "<a --> (/1 b)>.",
+    "<a --> (b * >.",
+    "<a --> b",
+    "<a --> b>> .",
+    "<(&/, a, b) =/> c>.",
+    "<a --> {b c>.",
+    "",
+    "Comment: expected: <a --> b>.",
+]
+
+@pytest.mark.parametrize("line", GOOD_LINES)
+def test_tree_translator_matches_regex_translator(line):
+    assert narseseToEnglish(line) == narseseToEnglish_regex(line)
+
+@pytest.mark.parametrize("line", MALFORMED_LINES)
+def test_malformed_lines_fall_back_to_regex_translator(line):
+    assert narseseToEnglish(line) == narseseToEnglish_regex(line)
+
+@pytest.mark.parametrize("term", ["<a -->b>", "<a ==>b>", "(a *b)", "<a --> (b", "<a --> b> c", "<a ~~> b>"])
+def test_malformed_terms_raise_parse_error(term):
+    with pytest.raises(NarseseParseError):
+        translateTerm(term)
+
+def test_tree_translator_renders_compounds():
+    assert narseseToEnglish("<(a | b) --> c>.") == "a or b is c."
+    assert narseseToEnglish("<a --> (b - c)>.") == "a is b but not c."
+    assert narseseToEnglish("<a ==> b>.") == "a implies b."
@@ -0,0 +1,85 @@
+"""
+Tests of the local NLTK data lookup and the shared NLTK models of nltk_resources
+"""
+
+import nltk
+import nltk.tag
+import nltk.tokenize
+import pytest
+
+import nltk_resources
+from nltk_resources import NLTK_RESOURCES, ensure_nltk_resources
+
+@pytest.fixture
+def nltk_data(monkeypatch):
+    """Stand-ins for the NLTK data lookup and download: the installed data paths and the recorded calls."""
+    calls = {"find": [], "download": []}
+    installed = set(NLTK_RESOURCES.values())
+
+    def find(path):
+        calls["find"].append(path)
+        if path not in installed:
+            raise LookupError(path)
+        return path
+
+    def download(resource, download_dir=None, quiet=False):
+        calls["download"].append((resource, download_dir))
+        return False
+
+    monkeypatch.setattr(nltk_resources, "_checked", {})
+    monkeypatch.setattr(nltk.data, "path", list(nltk.data.path))
+    monkeypatch.setattr(nltk.data, "find", find)
+    monkeypatch.setattr(nltk, "download", download)
+    return installed, calls
+
+def test_installed_resources_are_not_downloaded(nltk_data):
+    installed, calls = nltk_data
+    assert ensure_nltk_resources() == []
+    assert sorted(calls["find"]) == sorted(NLTK_RESOURCES.values())
+    assert ensure_nltk_resources() == []
+    assert len(calls["find"]) == len(NLTK_RESOURCES) and calls["download"] == []
+
+def test_only_missing_resources_are_downloaded_once(nltk_data, tmp_path):
+    installed, calls = nltk_data
+    installed.discard(NLTK_RESOURCES["wordnet"])
+    data_dir = str(tmp_path)
+    assert ensure_nltk_resources(data_dir=data_dir) == ["wordnet"]
+    assert calls["download"] == [("wordnet", data_dir)]
+    assert nltk.data.path[0] == data_dir
+    assert ensure_nltk_resources(data_dir=data_dir) == ["wordnet"]
+    assert len(calls["download"]) == 1 and nltk.data.path.count(data_dir) == 1
+
+def test_missing_resources_are_reported_without_download(nltk_data):
+    installed, calls = nltk_data
+    installed.clear()
+    assert ensure_nltk_resources(["punkt", "wordnet"], download=False) == ["punkt", "wordnet"]
+    assert calls["download"] == []
+
+class Counted:
+    """Stand-in for an NLTK model class, counting its instances."""
+    instances = 0
+
+    def __init__(self, *args):
+        type(self).instances += 1
+
+@pytest.fixture
+def models(monkeypatch):
+    """Counted stand-ins for the NLTK model classes, with the shared models cleared."""
+    constructors = {}
+    for module, name in [(nltk.tokenize, "PunktTokenizer"), (nltk.tokenize, "NLTKWordTokenizer"),
+                         (nltk.tag, "PerceptronTagger"), (nltk, "WordNetLemmatizer")]:
+        constructors[name] = type(name, (Counted,), {"instances": 0})
+        monkeypatch.setattr(module, name, constructors[name], raising=False)
+    shared = [nltk_resources.sentence_tokenizer, nltk_resources.word_tokenizer, nltk_resources.tagger, nltk_resources.lemmatizer]
+    for model in shared:
+        model.cache_clear()
+    yield constructors
+    for model in shared:
+        model.cache_clear()
+
+def test_models_are_built_once_per_process(models):
+    for model, name in [(nltk_resources.sentence_tokenizer, "PunktTokenizer"), (nltk_resources.word_tokenizer, "NLTKWordTokenizer"),
+                        (nltk_resources.tagger, "PerceptronTagger"), (nltk_resources.lemmatizer, "WordNetLemmatizer")]:
+        first = model()
+        assert isinstance(first, models[name])
+        assert model() is first and models[name].instances == 1
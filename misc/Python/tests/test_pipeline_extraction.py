@@ -0,0 +1,94 @@
+"""
+Tests of the look-ahead fact extraction of Pipeline.process_file, on synthetic LLM responses
+"""
+
+import threading
+import time
+
+import pytest
+
+import english_to_narsese_modular
+from llm_backends import ReplayBackend, prompt_text
+
+SENTENCES = ["Tweety is a small canary.", "Canaries sing songs.", "Cats chase mice.", "Mice eat cheese.", "Dogs bark loudly."]
+
+# seconds every extraction takes, the first sentences taking longest so the extractions finish in reverse order
+LATENCY = {sentence: 0.05 * (len(SENTENCES) - number) for number, sentence in enumerate(SENTENCES)}
+
+class SlowFirstBackend(ReplayBackend):
+    """Synthetic responses with the latency of the sentence in the prompt, recording the completion order."""
+
+    def __init__(self, model, failing=None):
+        super().__init__(model, synthetic=True)
+        self.failing = failing
+        self.completed = []
+        self.lock = threading.Lock()
+
+    def _response(self, prompt):
+        message = prompt_text(prompt).rsplit("Human: ", 1)[-1]
+        sentence = next(sentence for sentence in SENTENCES if sentence in message)
+        time.sleep(LATENCY[sentence])
+        with self.lock:
+            self.completed.append(sentence)
+        if sentence == self.failing:
+            raise ConnectionError("model unavailable")
+        return super()._response(prompt)
+
+@pytest.fixture
+def text_file(tmp_path):
+    path = tmp_path / "text.txt"
+    path.write_text(" ".join(SENTENCES), encoding="utf-8")
+    return str(path)
+
+@pytest.fixture
+def pipeline(monkeypatch):
+    """A pipeline recording the facts it would add to NARS instead of converting them."""
+    pytest.importorskip("langchain_core")
+    monkeypatch.setattr(english_to_narsese_modular, "ensure_nltk_resources", lambda **kwargs: [])
+    from Pipeline import NarsOllamaPipeline
+
+    def make(workers, failing=None):
+        backends = []
+
+        def backend(model):
+            backends.append(SlowFirstBackend(model, failing))
+            return backends[-1]
+
+        pipeline = NarsOllamaPipeline(model_name="test", init_nars=False, extraction_workers=workers, llm_backend=backend)
+        pipeline.fact_backend = backends[-1]
+        pipeline.ingested = []
+        pipeline.process_input_without_response = lambda sentence, facts: pipeline.ingested.append((sentence, facts))
+        return pipeline
+
+    return make
+
+def test_facts_reach_nars_in_input_order(pipeline, text_file):
+    sequential = pipeline(workers=1)
+    sequential.process_file(text_file)
+    parallel = pipeline(workers=len(SENTENCES))
+    parallel.process_file(text_file)
+    assert parallel.fact_backend.completed == SENTENCES[::-1]
+    assert [sentence for sentence, facts in parallel.ingested] == SENTENCES
+    assert parallel.ingested == sequential.ingested
+    assert all(facts for sentence, facts in parallel.ingested)
+
+def test_failed_extraction_leaves_its_sentence_without_facts(pipeline, text_file):
+    parallel = pipeline(workers=3, failing=SENTENCES[1])
+    parallel.process_file(text_file)
+    assert [sentence for sentence, facts in parallel.ingested] == SENTENCES
+    assert [bool(facts) for sentence, facts in parallel.ingested] == [True, False, True, True, True]
+
+def test_extraction_error_stops_the_ingestion_in_order(pipeline, text_file, capsys):
+    parallel = pipeline(workers=3)
+    extract_facts = parallel.llm_client.extract_facts
+
+    def failing(sentence):
+        facts = extract_facts(sentence)
+        if sentence == SENTENCES[2]:
+            raise RuntimeError("extraction failed")
+        return facts
+
+    parallel.llm_client.extract_facts = failing
+    parallel.process_file(text_file)
+    assert [sentence for sentence, facts in parallel.ingested] == SENTENCES[:2]
+    assert f"Error processing file {text_file}: extraction failed" in capsys.readouterr().out
@@ -0,0 +1,55 @@
+"""
+End to end test of the pipeline on recorded LLM responses, without Ollama
+"""
+
+import pytest
+
+from llm_backends import Cassette, LlmBackend, RecordingBackend, ReplayBackend, make_backend_factory
+
+TEXT = "Tweety is a yellow bird. Birds have feathers. Cats chase mice."
+QUESTION = "Is Tweety a bird?"
+
+def test_backend_without_invoke_is_rejected():
+    class Incomplete(LlmBackend):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete("test")
+
+@pytest.fixture
+def pipeline_class(NAR):
+    """The pipeline, skipping the test if LangChain or the NLTK data are not installed."""
+    pytest.importorskip("langchain_core")
+    from nltk_resources import ensure_nltk_resources
+    if ensure_nltk_resources(download=False):
+        pytest.skip("NLTK data not installed")
+    from Pipeline import NarsOllamaPipeline
+    return NarsOllamaPipeline
+
+def run(pipeline_class, backend, path):
+    pipeline = pipeline_class(model_name="test", llm_backend=backend, extraction_batch_size=2)
+    pipeline.process_file(path)
+    response = pipeline.process_input(QUESTION)
+    return pipeline, response, pipeline.nars_client.extract_knowledge(token_budget=None)
+
+def test_replayed_run_matches_recorded_run(pipeline_class, tmp_path):
+    path = str(tmp_path / "text.txt")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(TEXT)
+    cassette = str(tmp_path / "cassette.jsonl")
+    # synthetic responses recorded to the cassette stand in for a recorded Ollama session
+    shared = Cassette(cassette)
+    recorded = run(pipeline_class, lambda model: RecordingBackend(ReplayBackend(model, synthetic=True), shared), path)
+    pipeline, response, knowledge = run(pipeline_class, make_backend_factory("replay", cassette), path)
+    assert pipeline.llm_client.llm.misses == pipeline.llm_client.fact_llm.misses == 0
+    assert pipeline.llm_client.fact_llm.hits > 0
+    assert (response, knowledge) == recorded[1:]
+    assert knowledge
+
+def test_fake_backend_serves_unrecorded_prompts(pipeline_class, tmp_path):
+    path = str(tmp_path / "text.txt")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(TEXT)
+    pipeline, response, knowledge = run(pipeline_class, make_backend_factory("fake", str(tmp_path / "missing.jsonl")), path)
+    assert pipeline.llm_client.fact_llm.misses > 0 and response and not response.startswith("Error")
+    assert knowledge
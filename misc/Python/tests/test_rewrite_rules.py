@@ -0,0 +1,107 @@
+"""
+Tests that the compiled rewrite rules of english_to_narsese_modular give the same
+results as the sequential re.sub passes of the baseline kept by bench_english_to_narsese
+"""
+
+import random
+from types import SimpleNamespace
+
+import pytest
+
+import english_to_narsese_modular
+from bench_english_to_narsese import EnglishToNarseseBaseline
+from english_to_narsese_modular import EnglishToNarsese, reduce_syntax
+
+# sentences with the universal tags of the NLTK tagger, so no NLTK data is needed
+TAGGED = [
+    [("Tweety", "NOUN"), ("is", "VERB"), ("a", "DET"), ("yellow", "ADJ"), ("bird", "NOUN")],
+    [("birds", "NOUN"), ("sing", "VERB")],
+    [("birds", "NOUN"), ("sing", "VERB"), ("loudly", "ADV")],
+    [("cats", "NOUN"), ("quickly", "ADV"), ("chase", "VERB"), ("small", "ADJ"), ("birds", "NOUN")],
+    [("the", "DET"), ("cat", "NOUN"), ("is", "VERB"), ("in", "ADP"), ("the", "DET"), ("house", "NOUN")],
+    [("the", "DET"), ("cat", "NOUN"), ("lies", "VERB"), ("on", "ADP"), ("the", "DET"), ("mat", "NOUN")],
+    [("an", "DET"), ("elephant", "NOUN"), ("is", "VERB"), ("larger", "ADJ"), ("than", "ADP"), ("a", "DET"), ("mouse", "NOUN")],
+    [("the", "DET"), ("box", "NOUN"), ("is", "VERB"), ("the", "DET"), ("left", "NOUN"), ("of", "ADP"), ("the", "DET"), ("ball", "NOUN")],
+    [("John", "NOUN"), ("gives", "VERB"), ("Mary", "NOUN"), ("flowers", "NOUN")],
+    [("if", "ADP"), ("it", "PRON"), ("rains", "VERB"), ("the", "DET"), ("street", "NOUN"), ("is", "VERB"), ("wet", "ADJ")],
+    [("the", "DET"), ("street", "NOUN"), ("is", "VERB"), ("wet", "ADJ"), ("if", "ADP"), ("it", "PRON"), ("rains", "VERB")],
+    [("Tweety", "NOUN"), ("can", "VERB"), ("fly", "VERB")],
+    [("two", "NUM"), ("birds", "NOUN"), ("sit", "VERB"), ("on", "ADP"), ("a", "DET"), ("tree", "NOUN"), ("in", "ADP"), ("the", "DET"), ("garden", "NOUN")],
+    [("the", "DET"), ("bird", "NOUN"), ("flies", "VERB"), ("away", "PRT")],
+    [("what", "PRON"), ("is", "VERB"), ("a", "DET"), ("bird", "NOUN")],
+    [("the", "DET"), ("big", "ADJ"), ("old", "ADJ"), ("dog", "NOUN"), ("eats", "VERB"), ("meat", "NOUN"), ("now", "ADV")],
+]
+
+LEMMAS = {"is": "be", "birds": "bird", "cats": "cat", "lies": "lie", "gives": "give", "flowers": "flower",
+          "rains": "rain", "flies": "fly", "eats": "eat", "larger": "large"}
+
+# grammar rules a converter may acquire, with and without regex syntax beyond the capture groups
+ACQUIRED_GRAMMAR = [
+    (r" ADJ_NOUN_([0-9]*) ADV_VERB_([0-9]*) ADV_([0-9]*) ", r" < ADJ_NOUN_\1 --> [ ADV_VERB_\2 ] > ", (1.0, 0.9), 1),
+    (r" ADJ_NOUN_([0-9]+) BE_([0-9]*) (ADJ|ADP)_([0-9]*) ", r" < ADJ_NOUN_\1 --> [ \3_\4 ] > ", (1.0, 0.8), 2),
+]
+
+class ToyLemmatizer:
+    def lemmatize(self, word, pos="n"):
+        return LEMMAS.get(word.lower(), word) if word[0].islower() else word
+
+@pytest.fixture
+def converters(monkeypatch):
+    """A converter with the compiled rules and one with the baseline rules, lemmatizing with the toy lemmatizer."""
+    monkeypatch.setattr(english_to_narsese_modular, "ensure_nltk_resources", lambda **kwargs: [])
+    monkeypatch.setattr(english_to_narsese_modular, "wordnet", SimpleNamespace(ADJ="a", VERB="v", NOUN="n", ADV="r"))
+    monkeypatch.setattr(english_to_narsese_modular, "lemmatizer", ToyLemmatizer)
+    reduce_syntax.cache_clear()
+    return EnglishToNarsese(output_truth=True), EnglishToNarseseBaseline(output_truth=True)
+
+def sentence_and_types(converter, tagged):
+    tokens = [word for (word, tag) in tagged]
+    return converter.tagged_sentence_and_types(tokens, tagged)
+
+def rewrite_passes(converter, typetext, word_type):
+    """The three reduce_typetext passes process_line makes per sentence."""
+    converter.word_type = word_type
+    return [converter.reduce_typetext(typetext),
+            converter.reduce_typetext(typetext, apply_statement_represent=True),
+            converter.reduce_typetext(typetext, apply_statement_represent=True, apply_term_represent=True)]
+
+def random_typetexts(count, seed=0):
+    """Random sequences of the tags tagged_sentence_and_types produces, indexed as it indexes them."""
+    rng = random.Random(seed)
+    tags = ["NOUN", "VERB", "ADJ", "ADV", "ADP", "DET", "BE", "IF", "CONJ", "X"]
+    typetexts = []
+    for _ in range(count):
+        words, index = [], 0
+        for tag in rng.choices(tags, k=rng.randint(1, 12)):
+            if not words or words[-1].startswith("NOUN") or tag in ("ADP", "IF"):
+                index += 1
+            words.append(f"{tag}_{index}")
+        typetexts.append(" " + " ".join(words) + " ")
+    return typetexts
+
+@pytest.mark.parametrize("acquired_grammar", [[], ACQUIRED_GRAMMAR])
+def test_tagged_sentences_are_rewritten_as_before(converters, acquired_grammar):
+    compiled, baseline = converters
+    for tagged in TAGGED:
+        sentence, typetext = sentence_and_types(compiled, tagged)
+        word_type = dict(zip(typetext.split(" "), sentence.split(" ")))
+        compiled.acquired_grammar = baseline.acquired_grammar = list(acquired_grammar)
+        assert rewrite_passes(compiled, typetext, word_type) == rewrite_passes(baseline, typetext, word_type), typetext
+
+@pytest.mark.parametrize("acquired_grammar", [[], ACQUIRED_GRAMMAR])
+def test_random_typetexts_are_rewritten_as_before(converters, acquired_grammar):
+    compiled, baseline = converters
+    compiled.acquired_grammar = baseline.acquired_grammar = list(acquired_grammar)
+    for typetext in random_typetexts(2000):
+        word_type = {word: word.lower() for word in typetext.split(" ")}
+        assert rewrite_passes(compiled, typetext, word_type) == rewrite_passes(baseline, typetext, word_type), typetext
+
+def test_tagged_sentences_are_converted_as_before(converters):
+    compiled, baseline = converters
+    for tagged in TAGGED:
+        for punctuation in ".?!":
+            line = " ".join(word for (word, tag) in tagged) + punctuation
+            s_and_T = sentence_and_types(compiled, tagged)
+            assert compiled.process_line(line, s_and_T) == baseline.process_line(line, s_and_T), line
+    assert any("-->" in compiled.process_line(" ".join(word for (word, tag) in tagged) + ".", sentence_and_types(compiled, tagged))
+               for tagged in TAGGED)
@@ -0,0 +1,109 @@
+"""
+Tests of the ranked, token budgeted knowledge context and the translation cache of truth_translator
+"""
+
+import pytest
+
+import truth_translator
+from truth_translator import (TranslationCache, build_context, enhanced_narsese_translation, estimate_tokens,
+                              process_nars_output, rank_statements, truth_expectation)
+
+def concept(term, priority, usefulness=0.0, use_count=1):
+    return f'//{term}: {{ "priority": {priority:f}, "usefulness": {usefulness:f}, "useCount": {use_count}, "lastUsed": 1}}'
+
+# *concepts output, scored by truth expectation times the higher of priority and usefulness
+CONCEPTS = "\n".join([
+    "//*concepts",
+    concept("<cat --> animal>", 0.9),
+    "<cat --> animal>. {1.000000 0.900000}",      # 0.95 * 0.9
+    concept("<dog --> animal>", 0.9, 0.1),
+    "<dog --> animal>. {0.000000 0.900000}",      # 0.05 * 0.9
+    concept("<cat --> pet>", 0.1, 0.5),
+    "<cat --> pet>. {1.000000 0.900000}",         # 0.95 * 0.5
+    "<cat --> animal>. {1.000000 0.900000}",      # listed again with a lower score
+    concept("<bird --> animal>", 0.25),
+    "<bird --> animal>. {1.000000 0.500000}",     # 0.75 * 0.25
+    concept("<bird --> pet>", 0.3, use_count=1),
+    "<bird --> pet>. {1.000000 0.000000}",        # 0.5 * 0.3
+    concept("<fish --> pet>", 0.3, use_count=5),
+    "<fish --> pet>. {1.000000 0.000000}",        # 0.5 * 0.3, used more often
+    "//*done",
+])
+
+RANKED = ["<cat --> animal>", "<cat --> pet>", "<bird --> animal>", "<fish --> pet>", "<bird --> pet>", "<dog --> animal>"]
+
+def test_estimate_tokens_rounds_up():
+    assert [estimate_tokens(text) for text in ["", "a", "abcd", "abcde"]] == [0, 1, 1, 2]
+
+def test_truth_expectation():
+    assert truth_expectation(1.0, 0.9) == pytest.approx(0.95)
+    assert truth_expectation(0.0, 0.9) == pytest.approx(0.05)
+    assert truth_expectation(0.3, 0.0) == pytest.approx(0.5)
+
+def test_statements_are_ranked_by_expectation_and_relevance():
+    ranked = rank_statements(CONCEPTS.split("\n"))
+    assert [line.split(".")[0] for line in ranked] == RANKED
+
+def test_context_never_exceeds_the_token_budget():
+    for token_budget in range(0, 120, 3):
+        context = build_context(CONCEPTS, token_budget=token_budget)
+        lines = context.split("\n") if context else []
+        assert estimate_tokens(context) <= token_budget
+        assert sum(estimate_tokens(line) + 1 for line in lines) <= token_budget
+
+def test_context_keeps_the_best_statements_within_the_budget():
+    everything = build_context(CONCEPTS, token_budget=None).split("\n")
+    first = everything[0]
+    assert build_context(CONCEPTS, token_budget=estimate_tokens(first) + 1) == first
+
+def test_context_without_budget_holds_every_statement():
+    everything = build_context({"raw": CONCEPTS}, token_budget=None).split("\n")
+    assert len(everything) == len(RANKED)
+    assert "cat" in everything[0].lower() and "animal" in everything[0].lower()
+
+OUTPUT = "\n".join([
+    "Input: <cat --> animal>. Priority=1.000000 Truth: frequency=1.000000, confidence=0.900000",
+    "Derived: <cat --> pet>. Priority=0.245189 Truth: frequency=1.000000, confidence=0.447514",
+    "",
+    "//a comment",
+    "Answer: <cat --> animal>. creationTime=1 Truth: frequency=1.000000, confidence=0.900000",
+])
+
+@pytest.fixture
+def cache(monkeypatch):
+    """A translation cache of its own in place of the shared one."""
+    cache = TranslationCache()
+    monkeypatch.setattr(truth_translator, "translation_cache", cache)
+    return cache
+
+def test_least_recently_used_translations_are_evicted():
+    cache = TranslationCache(max_size=2)
+    cache.translate("<a --> b>.")
+    cache.translate("<c --> d>.")
+    cache.translate("<a --> b>.")
+    cache.translate("<e --> f>.")
+    assert list(cache.entries) == [("<a --> b>.", True), ("<e --> f>.", True)]
+    cache.translate("<c --> d>.")
+    assert (cache.hits, cache.misses) == (1, 4)
+
+def test_lines_with_and_without_colors_are_cached_apart():
+    cache = TranslationCache()
+    line = "<a --> b>. {1.0 0.9}"
+    colored, plain = cache.translate(line, True), cache.translate(line, False)
+    assert colored != plain and "\x1B[" in colored and "\x1B[" not in plain
+    assert (cache.translate(line, True), cache.translate(line, False)) == (colored, plain)
+    assert (cache.hits, cache.misses) == (2, 2)
+
+def test_comments_are_not_cached():
+    cache = TranslationCache()
+    assert cache.translate("//*concepts") is None
+    assert not cache.entries and cache.misses == 0
+
+@pytest.mark.parametrize("with_colors", [True, False])
+def test_cached_output_matches_uncached_output(cache, with_colors):
+    uncached = "\n".join(translation for translation in (enhanced_narsese_translation(line, with_colors)
+                                                          for line in OUTPUT.split("\n") if line.strip()) if translation)
+    assert process_nars_output(OUTPUT, with_colors) == uncached
+    misses = cache.misses
+    assert process_nars_output({"raw": OUTPUT}, with_colors) == uncached
+    assert cache.misses == misses and cache.hits > 0
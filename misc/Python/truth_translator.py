@@ -6,7 +6,9 @@ into natural language descriptions optimized for LLM consumption.
 
 import re
 import sys
-from typing import Tuple, Union, Dict, Any, Optional
+import json
+from collections import OrderedDict
+from typing import Tuple, Union, Dict, Any, Optional, List, Iterable
 
 # Import the original translator if available
 try:
@@ -26,6 +28,27 @@ BLUE = "\x1B[34m"
 RESET = "\x1B[0m"
 BOLD = "\x1B[1m"
 
+# Prefix of the lines NARS prints with *format=jsonl
+JSONL_PREFIX = '{"type": "'
+
+# Default size of the knowledge context handed to the LLM, in tokens
+DEFAULT_CONTEXT_TOKENS = 2048
+
+# Average number of characters per token of English text in common LLM tokenizers
+CHARS_PER_TOKEN = 4
+
+# Remaining budget below which no further statement is expected to fit
+MIN_LINE_TOKENS = 8
+
+# Number of translated lines kept by the translation cache
+TRANSLATION_CACHE_SIZE = 20000
+
+# Concept attributes in the comment line *concepts prints before the statements of a concept
+CONCEPT_ATTRIBUTE = re.compile(r'"(priority|usefulness|useCount)": ([0-9.e+-]+)')
+
+# Statement of a *concepts line without its dt= prefix and truth value
+STATEMENT_TERM = re.compile(r"(?:dt=\S+ )?(.*?)(?: \{[0-9.]+ [0-9.]+\})?$")
+
 def get_frequency_descriptor(frequency: float) -> str:
     """Get plain text descriptor for frequency without colors.
     
@@ -165,16 +188,25 @@ def enhanced_narsese_translation(line: str, with_colors: bool = True) -> Optiona
     if line.strip().startswith("//"):
         return None
     
-    # Get the basic English translation
-    translation = narseseToEnglish(line)
+    # JSON lines carry term and truth as fields, no need to scrape them
+    if line.startswith(JSONL_PREFIX):
+        event = json.loads(line)
+        # concepts, decisions, executions and stats are no statements
+        if "punctuation" not in event:
+            return None
+        translation = narseseToEnglish(event["term"] + event["punctuation"])
+        truth = event.get("truth")
+        frequency, confidence = (truth["frequency"], truth["confidence"]) if truth else (None, None)
+    else:
+        # Get the basic English translation
+        translation = narseseToEnglish(line)
+        # Extract truth values
+        frequency, confidence = parse_narsese_truth(line)
     
     # If no translation was produced, return None
     if not translation:
         return None
     
-    # Extract truth values
-    frequency, confidence = parse_narsese_truth(line)
-    
     # Format the result with truth descriptors at the beginning
     if frequency is not None and confidence is not None:
         # Remove any numeric patterns that look like truth values from the translation
@@ -196,6 +228,140 @@ def enhanced_narsese_translation(line: str, with_colors: bool = True) -> Optiona
     
     return translation
 
+class TranslationCache:
+    """
+    Size bounded LRU cache of translated NARS output lines.
+    
+    A line holds the statement and its truth value, so it is the key: a
+    belief translates again only once its truth changes, and the entries
+    of outdated truth values are evicted as the least recently used.
+    """
+    
+    def __init__(self, max_size: int = TRANSLATION_CACHE_SIZE):
+        """
+        Args:
+            max_size: Maximum number of cached translations
+        """
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def translate(self, line: str, with_colors: bool = True) -> Optional[str]:
+        """Translate a line with enhanced_narsese_translation, reusing earlier translations."""
+        key = (line.strip(), with_colors)
+        # comments such as the concept attributes change every turn and translate to nothing
+        if key[0].startswith("//"):
+            return None
+        if key in self.entries:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return self.entries[key]
+        self.misses += 1
+        translation = enhanced_narsese_translation(line, with_colors)
+        self.entries[key] = translation
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+        return translation
+    
+    def clear(self) -> None:
+        """Drop all cached translations."""
+        self.entries.clear()
+        self.hits = self.misses = 0
+
+# Shared by build_context and process_nars_output across turns
+translation_cache = TranslationCache()
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of LLM tokens of a text without running a tokenizer."""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+def truth_expectation(frequency: float, confidence: float) -> float:
+    """Truth expectation as defined by NAL: c * (f - 0.5) + 0.5."""
+    return confidence * (frequency - 0.5) + 0.5
+
+def rank_statements(lines: Iterable[str]) -> List[str]:
+    """
+    Deduplicate the statements of *concepts output and rank them, best first.
+    
+    Each statement is scored by its truth expectation times the relevance of
+    the concept it is listed under, the higher of the concept's priority and
+    usefulness, with the use count breaking ties. A statement listed several
+    times keeps its best score.
+    
+    Args:
+        lines: Lines of *concepts output, text or JSON
+    
+    Returns:
+        Statement lines in rank order
+    """
+    concept = {}
+    best = {}
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith(JSONL_PREFIX):
+            event = json.loads(line)
+            if event["type"] == "concept":
+                concept = event
+                continue
+            if "punctuation" not in event:
+                continue
+            key = event["term"] + event["punctuation"]
+            truth = event.get("truth")
+            frequency, confidence = (float(truth["frequency"]), float(truth["confidence"])) if truth else (None, None)
+        elif line.startswith("//"):
+            # the comment line before the statements of a concept holds its attributes
+            concept = {name: float(value) for name, value in CONCEPT_ATTRIBUTE.findall(line)}
+            continue
+        else:
+            key = STATEMENT_TERM.match(line).group(1)
+            frequency, confidence = parse_narsese_truth(line)
+        expectation = truth_expectation(frequency, confidence) if confidence is not None else 0.5
+        relevance = max(concept.get("priority", 0.0), concept.get("usefulness", 0.0))
+        rank = (expectation * relevance, concept.get("useCount", 0))
+        if key not in best or rank > best[key][0]:
+            best[key] = (rank, line)
+    return [line for _, line in sorted(best.values(), key=lambda item: item[0], reverse=True)]
+
+def build_context(output: Union[Dict[str, Any], str], token_budget: Optional[int] = DEFAULT_CONTEXT_TOKENS, with_colors: bool = False) -> str:
+    """
+    Build an LLM context from *concepts output within a token budget.
+    
+    Statements are deduplicated and ranked with rank_statements, then
+    translated and packed greedily in rank order: a translation that does
+    not fit in the remaining budget is skipped in favor of shorter ones,
+    and one that reads the same as an earlier one is dropped. Only
+    statements considered for packing are translated.
+    
+    Args:
+        output: *concepts output (dict with 'raw' key or string)
+        token_budget: Maximum estimated number of tokens of the context, unlimited if None
+        with_colors: Whether to include ANSI color codes
+    
+    Returns:
+        Translated statements, most relevant first
+    """
+    raw = output["raw"] if isinstance(output, dict) else output
+    context = []
+    seen = set()
+    used = 0
+    for line in rank_statements(raw.split("\n")):
+        if token_budget is not None and token_budget - used < MIN_LINE_TOKENS:
+            break
+        translation = translation_cache.translate(line, with_colors)
+        # different statements can read the same in English
+        if not translation or translation in seen:
+            continue
+        seen.add(translation)
+        tokens = estimate_tokens(translation) + 1  # line break
+        if token_budget is not None and used + tokens > token_budget:
+            continue
+        context.append(translation)
+        used += tokens
+    return "\n".join(context)
+
 def process_nars_output(output: Union[Dict[str, Any], str], with_colors: bool = True) -> str:
     """
     Process NARS output dictionary or string and translate to enhanced natural language.
@@ -220,7 +386,7 @@ def process_nars_output(output: Union[Dict[str, Any], str], with_colors: bool =
     
     for line in lines:
         if line.strip():
-            translation = enhanced_narsese_translation(line, with_colors)
+            translation = translation_cache.translate(line, with_colors)
             if translation:  # Only add non-None translations
                 translated_lines.append(translation)
     
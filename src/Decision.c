@@ -31,13 +31,14 @@ double ANTICIPATION_CONFIDENCE = ANTICIPATION_CONFIDENCE_INITIAL;
 double MOTOR_BABBLING_CHANCE = MOTOR_BABBLING_CHANCE_INITIAL;
 int BABBLING_OPS = OPERATIONS_MAX;
 
-static void Decision_AddNegativeConfirmation(Event *precondition, Implication imp, int operationID, Concept *postc)
+static void Decision_AddNegativeConfirmation(Event *precondition, Implication imp, int operationID, Concept *postc, long currentTime)
 {
     Implication negative_confirmation = imp;
     Truth TNew = { .frequency = 0.0, .confidence = ANTICIPATION_CONFIDENCE };
     Truth TPast = Truth_Projection(precondition->truth, 0, round(imp.occurrenceTimeOffset));
     negative_confirmation.truth = Truth_Eternalize(Truth_Induction(TNew, TPast));
     negative_confirmation.stamp = (Stamp) {0}; //precondition->stamp;
+    negative_confirmation.creationTime = currentTime; //revision time, for *concepts_since
     assert(negative_confirmation.truth.confidence >= 0.0 && negative_confirmation.truth.confidence <= 1.0, "(666) confidence out of bounds");
     Implication *added = Table_AddAndRevise(&postc->precondition_beliefs[operationID], &negative_confirmation);
     if(added != NULL)
@@ -204,7 +205,35 @@ void Decision_Execute(long currentTime, Decision *decision)
             }
             feedbackTerm = operation;
         }
-        Narsese_PrintTerm(&decision->op[i].term); fputs(" executed with args ", stdout); Narsese_PrintTerm(&decision->arguments[i]); puts(""); fflush(stdout);
+        if(Memory_eventHandler != NULL)
+        {
+            char opname[NARSESE_LEN_MAX] = {0};
+            char args[NARSESE_LEN_MAX] = {0};
+            Narsese_SprintTerm(&decision->op[i].term, opname, NARSESE_LEN_MAX);
+            Narsese_SprintTerm(&decision->arguments[i], args, NARSESE_LEN_MAX);
+            Memory_eventHandler('E', opname, args, '!', 1.0, 0.0, currentTime, 0.0, decision->desire);
+        }
+        else
+        if(PRINT_JSONL)
+        {
+            fputs("{\"type\": \"execution\", \"operator\": ", stdout);
+            Narsese_PrintTermJSON(&decision->op[i].term);
+            fputs(", \"arguments\": ", stdout);
+            if(decision->arguments[i].atoms[0])
+            {
+                Term args = Term_ExtractSubterm(&decision->arguments[i], 2);
+                Narsese_PrintTermJSON(&args);
+            }
+            else
+            {
+                fputs("[]", stdout);
+            }
+            puts("}"); fflush(stdout);
+        }
+        else
+        {
+            Narsese_PrintTerm(&decision->op[i].term); fputs(" executed with args ", stdout); Narsese_PrintTerm(&decision->arguments[i]); puts(""); fflush(stdout);
+        }
         Feedback feedback = (*decision->op[i].action)(decision->arguments[i]);
         if(feedback.failed) //TODO improve (leaves option for operation to fail, but we don't want each op having to set it to true...)
         {
@@ -257,7 +286,7 @@ void Decision_Execute(long currentTime, Decision *decision)
                 Concept *postc = Memory_Conceptualize(&postcondition, currentTime);
                 if(postc != NULL)
                 {
-                    Decision_AddNegativeConfirmation(decision->reason, decision->missing_specific_implication, decision->operationID[i], postc);
+                    Decision_AddNegativeConfirmation(decision->reason, decision->missing_specific_implication, decision->operationID[i], postc, currentTime);
                 }
             }
         }
@@ -545,10 +574,42 @@ Decision Decision_BestCandidate(Concept *goalconcept, Event *goal, long currentT
         return (Decision) {0}; 
     }
     //set execute and return execution
-    printf("decision expectation=%f implication: ", decision.desire);
-    Narsese_PrintTerm(&bestImp.term); fputs(". ", stdout); Stamp_print(&bestImp.stamp); printf(" Truth: frequency=%f confidence=%f dt=%f", bestImp.truth.frequency, bestImp.truth.confidence, bestImp.occurrenceTimeOffset);
-    fputs(" precondition: ", stdout); Narsese_PrintTerm(&decision.reason->term); fputs(". :|: ", stdout); Stamp_print(&decision.reason->stamp); printf(" Truth: frequency=%f confidence=%f", decision.reason->truth.frequency, decision.reason->truth.confidence);
-    printf(" occurrenceTime=%ld\n", decision.reason->occurrenceTime);
+    if(Memory_eventHandler != NULL)
+    {
+        //the precondition, then the decision with the implication and the precondition term as args
+        char implication[NARSESE_LEN_MAX] = {0};
+        char precondition[NARSESE_LEN_MAX] = {0};
+        Narsese_SprintTerm(&bestImp.term, implication, NARSESE_LEN_MAX);
+        Narsese_SprintTerm(&decision.reason->term, precondition, NARSESE_LEN_MAX);
+        Memory_eventHandler('P', precondition, "", '.', decision.reason->truth.frequency, decision.reason->truth.confidence, decision.reason->occurrenceTime, 0.0, 0.0);
+        Memory_eventHandler('C', implication, precondition, '.', bestImp.truth.frequency, bestImp.truth.confidence, OCCURRENCE_ETERNAL, bestImp.occurrenceTimeOffset, decision.desire);
+    }
+    else
+    if(PRINT_JSONL)
+    {
+        printf("{\"type\": \"decision\", \"desire\": %f, \"hypothesis\": {\"term\": ", decision.desire);
+        Narsese_PrintTermJSON(&bestImp.term);
+        fputs(", \"punctuation\": \".\", \"occurrenceTime\": \"eternal\", \"dt\": ", stdout);
+        printf("%f, \"Stamp\": ", bestImp.occurrenceTimeOffset);
+        Stamp_printJSON(&bestImp.stamp);
+        fputs(", \"truth\": ", stdout);
+        Truth_PrintJSON(&bestImp.truth);
+        fputs("}, \"precondition\": {\"term\": ", stdout);
+        Narsese_PrintTermJSON(&decision.reason->term);
+        printf(", \"punctuation\": \".\", \"occurrenceTime\": %ld, \"Stamp\": ", decision.reason->occurrenceTime);
+        Stamp_printJSON(&decision.reason->stamp);
+        fputs(", \"truth\": ", stdout);
+        Truth_PrintJSON(&decision.reason->truth);
+        puts("}}");
+        fflush(stdout);
+    }
+    else
+    {
+        printf("decision expectation=%f implication: ", decision.desire);
+        Narsese_PrintTerm(&bestImp.term); fputs(". ", stdout); Stamp_print(&bestImp.stamp); printf(" Truth: frequency=%f confidence=%f dt=%f", bestImp.truth.frequency, bestImp.truth.confidence, bestImp.occurrenceTimeOffset);
+        fputs(" precondition: ", stdout); Narsese_PrintTerm(&decision.reason->term); fputs(". :|: ", stdout); Stamp_print(&decision.reason->stamp); printf(" Truth: frequency=%f confidence=%f", decision.reason->truth.frequency, decision.reason->truth.confidence);
+        printf(" occurrenceTime=%ld\n", decision.reason->occurrenceTime);
+    }
     decision.execute = true;
     return decision;
 }
@@ -666,7 +727,7 @@ void Decision_Anticipate(int operationID, Term opTerm, bool declarative, long cu
                                 {
                                     if(Narsese_copulaEquals(imp.term.atoms[0], TEMPORAL_IMPLICATION))
                                     {
-                                        Decision_AddNegativeConfirmation(prec_event, imp, operationID, postc);
+                                        Decision_AddNegativeConfirmation(prec_event, imp, operationID, postc, currentTime);
                                     }
                                 }
                                 bool success2eternal, success2event;
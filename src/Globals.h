@@ -54,6 +54,8 @@
 #define PRINT_SURPRISE false
 //Priority threshold for printing derivations
 #define PRINT_EVENTS_PRIORITY_THRESHOLD_INITIAL 0.0
+//Whether output should be one JSON object per line instead of human readable text
+#define PRINT_JSONL_INITIAL false
 //Debug macros, debug printing, assert:
 #define IN_DEBUG(x) {if(DEBUG){ x } }
 //assert, printing message and exiting if b=false
@@ -39,6 +39,7 @@ Operation operations[OPERATIONS_MAX];
 bool RESTRICTED_CONCEPT_CREATION = RESTRICTED_CONCEPT_CREATION_INITIAL;
 bool PRINT_DERIVATIONS = PRINT_DERIVATIONS_INITIAL;
 bool PRINT_INPUT = PRINT_INPUT_INITIAL;
+bool PRINT_JSONL = PRINT_JSONL_INITIAL;
 //Storage arrays for the data structures
 Concept concept_storage[CONCEPTS_MAX];
 Item concept_items_storage[CONCEPTS_MAX];
@@ -50,6 +51,8 @@ Item cycling_goal_event_items_storage[CYCLING_GOAL_EVENTS_LAYERS][CYCLING_GOAL_E
 double conceptPriorityThreshold = 0.0;
 //Priority threshold for printing derivations
 double PRINT_EVENTS_PRIORITY_THRESHOLD = PRINT_EVENTS_PRIORITY_THRESHOLD_INITIAL;
+//Handler which receives events instead of stdout when set
+EventHandler Memory_eventHandler = NULL;
 
 static void Memory_ResetEvents()
 {
@@ -238,6 +241,42 @@ static void Memory_printAddedKnowledge(Stamp *stamp, Term *term, char type, Trut
 {
     if((input && PRINT_INPUT) || (!input && PRINT_DERIVATIONS && priority > PRINT_EVENTS_PRIORITY_THRESHOLD))
     {
+        if(Memory_eventHandler != NULL && controlInfo)
+        {
+            char narsese[NARSESE_LEN_MAX] = {0};
+            Narsese_SprintTerm(term, narsese, NARSESE_LEN_MAX);
+            char kind = selected ? 'S' : (revised ? 'R' : (input ? 'I' : 'D'));
+            Memory_eventHandler(kind, narsese, "", type == EVENT_TYPE_BELIEF ? '.' : '!', truth->frequency, truth->confidence, occurrenceTime, occurrenceTimeOffset, priority);
+            return;
+        }
+        if(PRINT_JSONL)
+        {
+            fputs("{\"type\": \"", stdout);
+            fputs(controlInfo ? (selected ? "selected" : (revised ? "revised" : (input ? "input" : "derived"))) : "belief", stdout);
+            fputs("\", \"term\": ", stdout);
+            Narsese_PrintTermJSON(term);
+            printf(", \"punctuation\": \"%c\"", type == EVENT_TYPE_BELIEF ? '.' : '!');
+            if(occurrenceTime == OCCURRENCE_ETERNAL)
+            {
+                fputs(", \"occurrenceTime\": \"eternal\"", stdout);
+            }
+            else
+            {
+                printf(", \"occurrenceTime\": %ld", occurrenceTime);
+            }
+            if(Narsese_copulaEquals(term->atoms[0], TEMPORAL_IMPLICATION))
+                printf(", \"dt\": %f", occurrenceTimeOffset);
+            if(controlInfo)
+            {
+                printf(", \"Priority\": %f, \"Stamp\": ", priority);
+                Stamp_printJSON(stamp);
+            }
+            fputs(", \"truth\": ", stdout);
+            Truth_PrintJSON(truth);
+            puts("}");
+            fflush(stdout);
+            return;
+        }
         if(controlInfo)
             fputs(selected ? "Selected: " : (revised ? "Revised: " : (input ? "Input: " : "Derived: ")), stdout);
         if(Narsese_copulaEquals(term->atoms[0], TEMPORAL_IMPLICATION))
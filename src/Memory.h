@@ -50,6 +50,7 @@
 extern bool RESTRICTED_CONCEPT_CREATION;
 extern bool PRINT_DERIVATIONS;
 extern bool PRINT_INPUT;
+extern bool PRINT_JSONL;
 extern double conceptPriorityThreshold;
 
 //Data structure//
@@ -60,6 +61,10 @@ typedef struct
     bool failed;
 }Feedback; //operation feedback
 typedef Feedback (*Action)(Term);
+//Receives the events which would otherwise be printed, kind is 'I'nput, 'D'erived, 'R'evised, 'S'elected, 'A'nswer, 'E'xecution,
+//or the 'P'recondition of a decision followed by the de'C'ision with its implication, desire as priority and the precondition term as args
+//args is only non-empty for executions and decisions, occurrenceTime is OCCURRENCE_ETERNAL for eternal events
+typedef void (*EventHandler)(char kind, char *term, char *args, char punctuation, double frequency, double confidence, long occurrenceTime, double occurrenceTimeOffset, double priority);
 typedef struct
 {
     Term term;
@@ -87,6 +92,10 @@ extern OccurrenceTimeIndex occurrenceTimeIndex;
 extern Operation operations[OPERATIONS_MAX];
 //Priority threshold for printing derivations
 extern double PRINT_EVENTS_PRIORITY_THRESHOLD;
+//Handler which receives events instead of stdout when set, NULL by default
+extern EventHandler Memory_eventHandler;
+//Storage of the concepts, for snapshots
+extern Concept concept_storage[CONCEPTS_MAX];
 
 //Methods//
 //-------//
@@ -97,6 +97,45 @@ void NAR_AddOperation(char *operator_name, Action procedure)
 
 static void NAR_PrintAnswer(Stamp stamp, Term best_term, Truth best_truth, long answerOccurrenceTime, long answerCreationTime)
 {
+    if(Memory_eventHandler != NULL)
+    {
+        char narsese[NARSESE_LEN_MAX] = "None";
+        if(best_truth.confidence != 1.1)
+        {
+            Narsese_SprintTerm(&best_term, narsese, NARSESE_LEN_MAX);
+        }
+        Memory_eventHandler('A', narsese, "", '.', best_truth.frequency, best_truth.confidence, answerOccurrenceTime, 0.0, 0.0);
+        return;
+    }
+    if(PRINT_JSONL)
+    {
+        fputs("{\"type\": \"answer\", ", stdout);
+        if(best_truth.confidence == 1.1)
+        {
+            puts("\"term\": \"None\", \"punctuation\": \".\", \"occurrenceTime\": \"eternal\"}");
+        }
+        else
+        {
+            fputs("\"term\": ", stdout);
+            Narsese_PrintTermJSON(&best_term);
+            fputs(", \"punctuation\": \".\", ", stdout);
+            if(answerOccurrenceTime == OCCURRENCE_ETERNAL)
+            {
+                fputs("\"occurrenceTime\": \"eternal\"", stdout);
+            }
+            else
+            {
+                printf("\"occurrenceTime\": %ld", answerOccurrenceTime);
+            }
+            printf(", \"creationTime\": %ld, \"Stamp\": ", answerCreationTime);
+            Stamp_printJSON(&stamp);
+            fputs(", \"truth\": ", stdout);
+            Truth_PrintJSON(&best_truth);
+            puts("}");
+        }
+        fflush(stdout);
+        return;
+    }
     fputs("Answer: ", stdout);
     if(best_truth.confidence == 1.1)
     {
@@ -143,11 +182,28 @@ void NAR_AddInputNarsese2(char *narsese_sentence, bool queryCommand, double answ
         long answerOccurrenceTime = OCCURRENCE_ETERNAL;
         long answerCreationTime = 0;
         bool isImplication = Narsese_copulaEquals(term.atoms[0], TEMPORAL_IMPLICATION);
-        fputs("Input: ", stdout);
-        Narsese_PrintTerm(&term);
-        fputs("?", stdout);
-        puts(tense == 1 ? " :|:" : (tense == 2 ? " :\\:" : (tense == 3 ? " :/:" : ""))); 
-        fflush(stdout);
+        if(Memory_eventHandler != NULL)
+        {
+            char narsese[NARSESE_LEN_MAX] = {0};
+            Narsese_SprintTerm(&term, narsese, NARSESE_LEN_MAX);
+            Memory_eventHandler('I', narsese, "", '?', 0.0, 0.0, tense ? currentTime : OCCURRENCE_ETERNAL, 0.0, 0.0);
+        }
+        else
+        if(PRINT_JSONL)
+        {
+            fputs("{\"type\": \"input\", \"term\": ", stdout);
+            Narsese_PrintTermJSON(&term);
+            printf(", \"punctuation\": \"?\", \"occurrenceTime\": \"%s\"}\n", tense == 1 ? "now" : (tense == 2 ? "past" : (tense == 3 ? "future" : "eternal")));
+            fflush(stdout);
+        }
+        else
+        {
+            fputs("Input: ", stdout);
+            Narsese_PrintTerm(&term);
+            fputs("?", stdout);
+            puts(tense == 1 ? " :|:" : (tense == 2 ? " :\\:" : (tense == 3 ? " :/:" : ""))); 
+            fflush(stdout);
+        }
         for(int i=0; i<concepts.itemsAmount; i++)
         {
             Concept *c = concepts.items[i].address;
@@ -318,6 +318,15 @@ int Narsese_AtomicTermIndex(char *name)
     return ret_index;
 }
 
+//Returns the index of an already seen atomic term without adding it, 0 if it was not seen
+Atom Narsese_FindAtom(char *name)
+{
+    char blockname[ATOMIC_TERM_LEN_MAX] = {0};
+    strncpy(blockname, name, ATOMIC_TERM_LEN_MAX-1);
+    void* retptr = HashTable_Get(&HTatoms, blockname);
+    return retptr == NULL ? 0 : (Atom) (long) retptr;
+}
+
 int Narsese_CopulaIndex(char name)
 {
     char copname[2] = {0};
@@ -463,82 +472,101 @@ Term Narsese_AtomicTerm(char *name)
     return ret;
 }
 
+//Destination of the term printing, stdout unless Narsese_SprintTerm redirects it to a buffer
+static char *Narsese_printBuffer = NULL;
+static int Narsese_printBufferSize = 0;
+static int Narsese_printBufferPos = 0;
+
+static void Narsese_Puts(char *str)
+{
+    if(Narsese_printBuffer == NULL)
+    {
+        fputs(str, stdout);
+        return;
+    }
+    for(; *str && Narsese_printBufferPos < Narsese_printBufferSize-1; str++)
+    {
+        Narsese_printBuffer[Narsese_printBufferPos++] = *str;
+    }
+    Narsese_printBuffer[Narsese_printBufferPos] = 0;
+}
+
 void Narsese_PrintAtom(Atom atom)
 {
     if(atom)
     {
         if(Narsese_copulaEquals(atom, INHERITANCE))
         {
-            fputs("-->", stdout);
+            Narsese_Puts("-->");
         }
         else
         if(Narsese_copulaEquals(atom, TEMPORAL_IMPLICATION))
         {
-            fputs("=/>", stdout);
+            Narsese_Puts("=/>");
         }
         else
         if(Narsese_copulaEquals(atom, EQUIVALENCE))
         {
-            fputs("<=>", stdout);
+            Narsese_Puts("<=>");
         }
         else
         if(Narsese_copulaEquals(atom, DISJUNCTION))
         {
-            fputs("||", stdout);
+            Narsese_Puts("||");
         }
         else
         if(Narsese_copulaEquals(atom, SEQUENCE))
         {
-            fputs("&/", stdout);
+            Narsese_Puts("&/");
         }
         else
         if(Narsese_copulaEquals(atom, HAS_CONTINUOUS_PROPERTY))
         {
-            fputs("|->", stdout);
+            Narsese_Puts("|->");
         }
         else
         if(Narsese_copulaEquals(atom, IMPLICATION))
         {
-            fputs("==>", stdout);
+            Narsese_Puts("==>");
         }
         else
         if(Narsese_copulaEquals(atom, CONJUNCTION))
         {
-            fputs("&&", stdout);
+            Narsese_Puts("&&");
         }
         else
         if(Narsese_copulaEquals(atom, SIMILARITY))
         {
-            fputs("<->", stdout);
+            Narsese_Puts("<->");
         }
         else
         if(Narsese_copulaEquals(atom, EXT_IMAGE1))
         {
-            fputs("/1", stdout);
+            Narsese_Puts("/1");
         }
         else
         if(Narsese_copulaEquals(atom, EXT_IMAGE2))
         {
-            fputs("/2", stdout);
+            Narsese_Puts("/2");
         }
         else
         if(Narsese_copulaEquals(atom, INT_IMAGE1))
         {
-            fputs("\\1", stdout);
+            Narsese_Puts("\\1");
         }
         else
         if(Narsese_copulaEquals(atom, INT_IMAGE2))
         {
-            fputs("\\2", stdout);
+            Narsese_Puts("\\2");
         }
         else
         {
-            fputs(Narsese_atomNames[atom-1], stdout);
+            Narsese_Puts(Narsese_atomNames[atom-1]);
         }
     }
     else
     {
-        fputs("@", stdout);
+        Narsese_Puts("@");
     }
 }
 
@@ -563,37 +591,37 @@ void Narsese_PrintTermPrettyRecursive(Term *term, int index) //start with index=
                        Narsese_copulaEquals(atom, IMPLICATION) || Narsese_copulaEquals(atom, EQUIVALENCE) || Narsese_copulaEquals(atom, HAS_CONTINUOUS_PROPERTY));
     if(isExtSet)
     {
-        fputs(hasLeftChild ? "{" : "", stdout);
+        Narsese_Puts(hasLeftChild ? "{" : "");
     }
     else
     if(isIntSet)
     {
-        fputs(hasLeftChild ? "[" : "", stdout);
+        Narsese_Puts(hasLeftChild ? "[" : "");
     }
     else
     if(isStatement)
     {
-        fputs(hasLeftChild ? "<" : "", stdout);
+        Narsese_Puts(hasLeftChild ? "<" : "");
     }
     else
     {
-        fputs(hasLeftChild ? "(" : "", stdout);
+        Narsese_Puts(hasLeftChild ? "(" : "");
         if(isNegation || isSingularProduct || isFrequencyGreater || isFrequencyEqual)
         {
             if(isFrequencyGreater)
             {
-                fputs("+", stdout);
+                Narsese_Puts("+");
             }
             else
             if(isFrequencyEqual)
             {
-                fputs("=", stdout);
+                Narsese_Puts("=");
             }
             else
             {
                 Narsese_PrintAtom(atom);
             }
-            fputs(" ", stdout);
+            Narsese_Puts(" ");
         }
     }
     if(child1 < COMPOUND_TERM_SIZE_MAX)
@@ -602,14 +630,14 @@ void Narsese_PrintTermPrettyRecursive(Term *term, int index) //start with index=
     }
     if(hasRightChild)
     {
-        fputs(hasLeftChild ? " " : "", stdout);
+        Narsese_Puts(hasLeftChild ? " " : "");
     }
     if(!isExtSet && !isIntSet && !Narsese_copulaEquals(atom, SET_TERMINATOR))
     {
         if(!isNegation && !isSingularProduct && !isFrequencyEqual && !isFrequencyGreater)
         {
             Narsese_PrintAtom(atom);
-            fputs(hasLeftChild ? " " : "", stdout);
+            Narsese_Puts(hasLeftChild ? " " : "");
         }
     }
     if(child2 < COMPOUND_TERM_SIZE_MAX)
@@ -618,21 +646,21 @@ void Narsese_PrintTermPrettyRecursive(Term *term, int index) //start with index=
     }
     if(isExtSet)
     {
-        fputs(hasLeftChild ? "}" : "", stdout);
+        Narsese_Puts(hasLeftChild ? "}" : "");
     }
     else
     if(isIntSet)
     {
-        fputs(hasLeftChild ? "]" : "", stdout);
+        Narsese_Puts(hasLeftChild ? "]" : "");
     }
     else
     if(isStatement)
     {
-        fputs(hasLeftChild ? ">" : "", stdout);
+        Narsese_Puts(hasLeftChild ? ">" : "");
     }
     else
     {
-        fputs(hasLeftChild ? ")" : "", stdout);
+        Narsese_Puts(hasLeftChild ? ")" : "");
     }
 }
 
@@ -641,6 +669,33 @@ void Narsese_PrintTerm(Term *term)
     Narsese_PrintTermPrettyRecursive(term, 1);
 }
 
+void Narsese_SprintTerm(Term *term, char *buffer, int size)
+{
+    assert(size > 0, "Narsese_SprintTerm: Buffer size has to be positive");
+    Narsese_printBuffer = buffer;
+    Narsese_printBufferSize = size;
+    Narsese_printBufferPos = 0;
+    buffer[0] = 0;
+    Narsese_PrintTerm(term);
+    Narsese_printBuffer = NULL;
+}
+
+void Narsese_PrintTermJSON(Term *term)
+{
+    char narsese[NARSESE_LEN_MAX] = {0};
+    Narsese_SprintTerm(term, narsese, NARSESE_LEN_MAX);
+    putchar('"');
+    for(char *c = narsese; *c; c++)
+    {
+        if(*c == '"' || *c == '\\')
+        {
+            putchar('\\');
+        }
+        putchar(*c);
+    }
+    putchar('"');
+}
+
 HASH_TYPE Narsese_StringHash(char *name)
 {
     assert(name != NULL, "NULL ptr in Narsese_StringHash");
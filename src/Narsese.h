@@ -50,6 +50,7 @@ extern bool Narsese_atomHasValue[ATOMS_MAX];
 extern char Narsese_atomMeasurementNames[ATOMS_MAX][ATOMIC_TERM_LEN_MAX];
 //Atomic term names:
 extern char Narsese_atomNames[ATOMS_MAX][ATOMIC_TERM_LEN_MAX];
+extern int term_index;
 extern Atom SELF;
 #define Narsese_RuleTableVars "ABCMRSPXYZ"
 #define Narsese_CanonicalCopulas "@*&|;:=$'\"/\\.-%#~+!?^_,"
@@ -95,11 +96,17 @@ Term Narsese_Sequence(Term *a, Term *b, bool *success);
 Term Narsese_AtomicTerm(char *name);
 //Index of atomic term
 int Narsese_AtomicTermIndex(char *name);
+//Index of an already seen atomic term, 0 if unknown
+Atom Narsese_FindAtom(char *name);
 int Narsese_CopulaIndex(char name);
 //Print an atom
 void Narsese_PrintAtom(Atom atom);
 //Print a term
 void Narsese_PrintTerm(Term *term);
+//Print a term into a buffer of given size instead of stdout
+void Narsese_SprintTerm(Term *term, char *buffer, int size);
+//Print a term as JSON string
+void Narsese_PrintTermJSON(Term *term);
 //Whether it is a certain copula:
 bool Narsese_copulaEquals(Atom atom, char name);
 //Whether it is an operator
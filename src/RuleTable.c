@@ -0,0 +1,6259 @@
+#include "RuleTable.h"
+void RuleTable_Apply(Term term1, Term term2, Truth truth1, Truth truth2, long conclusionOccurrence, double occurrenceTimeOffset, Stamp conclusionStamp, long currentTime, double parentPriority, double conceptPriority, bool doublePremise, Concept *validation_concept, long validation_cid, bool eternalize)
+{
+goto RULE_0;
+RULE_0:
+{
+if(!doublePremise) { goto RULE_1; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_1; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_1; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_1; }
+substitutions[31] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_1; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_1; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_1; }
+substitutions[34] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[33])){ goto RULE_1; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[34])){ goto RULE_1; }
+Truth conclusionTruth = Truth_Deduction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_1:
+{
+if(!doublePremise) { goto RULE_2; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_2; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_2; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_2; }
+substitutions[34] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_2; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_2; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_2; }
+substitutions[31] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[33])){ goto RULE_2; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[34])){ goto RULE_2; }
+Truth conclusionTruth = Truth_Deduction(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_2:
+{
+if(!doublePremise) { goto RULE_3; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_3; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_3; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_3; }
+substitutions[29] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_3; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_3; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_3; }
+substitutions[30] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[30])){ goto RULE_3; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[29])){ goto RULE_3; }
+Truth conclusionTruth = Truth_Induction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_3:
+{
+if(!doublePremise) { goto RULE_4; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_4; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_4; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_4; }
+substitutions[30] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_4; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_4; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_4; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[30])){ goto RULE_4; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[29])){ goto RULE_4; }
+Truth conclusionTruth = Truth_Induction(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_4:
+{
+if(!doublePremise) { goto RULE_5; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_5; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_5; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_5; }
+substitutions[30] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_5; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_5; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_5; }
+substitutions[30] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[29])){ goto RULE_5; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[28])){ goto RULE_5; }
+Truth conclusionTruth = Truth_Abduction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_5:
+{
+if(!doublePremise) { goto RULE_6; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_6; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_6; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_6; }
+substitutions[30] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_6; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_6; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_6; }
+substitutions[30] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[29])){ goto RULE_6; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[28])){ goto RULE_6; }
+Truth conclusionTruth = Truth_Abduction(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_6:
+{
+if(!doublePremise) { goto RULE_7; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_7; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_7; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_7; }
+substitutions[29] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_7; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_7; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_7; }
+substitutions[30] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[30])){ goto RULE_7; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[28])){ goto RULE_7; }
+Truth conclusionTruth = Truth_Exemplification(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_7:
+{
+if(!doublePremise) { goto RULE_8; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_8; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_8; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_8; }
+substitutions[30] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_8; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_8; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_8; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[30])){ goto RULE_8; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[28])){ goto RULE_8; }
+Truth conclusionTruth = Truth_Exemplification(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_8:
+{
+if(doublePremise) { goto RULE_9; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 46){ goto RULE_9; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_9; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_9; }
+substitutions[34] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 46;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[34])){ goto RULE_9; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[33])){ goto RULE_9; }
+Truth conclusionTruth = Truth_StructuralIntersection(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_9:
+{
+if(!doublePremise) { goto RULE_10; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 46){ goto RULE_10; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_10; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_10; }
+substitutions[34] = subtree;
+if(term2.atoms[0] != 46){ goto RULE_10; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_10; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_10; }
+substitutions[31] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 46;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[33])){ goto RULE_10; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[34])){ goto RULE_10; }
+Truth conclusionTruth = Truth_Resemblance(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_10:
+{
+if(!doublePremise) { goto RULE_11; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 46){ goto RULE_11; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_11; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_11; }
+substitutions[31] = subtree;
+if(term2.atoms[0] != 46){ goto RULE_11; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_11; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_11; }
+substitutions[34] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 46;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[33])){ goto RULE_11; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[34])){ goto RULE_11; }
+Truth conclusionTruth = Truth_Resemblance(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_11:
+{
+if(!doublePremise) { goto RULE_12; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_12; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_12; }
+substitutions[34] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_12; }
+substitutions[31] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_12; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_12; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_12; }
+substitutions[31] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 46;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[33])){ goto RULE_12; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[34])){ goto RULE_12; }
+Truth conclusionTruth = Truth_Comparison(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_12:
+{
+if(!doublePremise) { goto RULE_13; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_13; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_13; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_13; }
+substitutions[31] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_13; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_13; }
+substitutions[34] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_13; }
+substitutions[31] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 46;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[33])){ goto RULE_13; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[34])){ goto RULE_13; }
+Truth conclusionTruth = Truth_Comparison(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_13:
+{
+if(!doublePremise) { goto RULE_14; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_14; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_14; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_14; }
+substitutions[34] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_14; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_14; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_14; }
+substitutions[33] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 46;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[33])){ goto RULE_14; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[34])){ goto RULE_14; }
+Truth conclusionTruth = Truth_Comparison(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_14:
+{
+if(!doublePremise) { goto RULE_15; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_15; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_15; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_15; }
+substitutions[33] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_15; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_15; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_15; }
+substitutions[34] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 46;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[33])){ goto RULE_15; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[34])){ goto RULE_15; }
+Truth conclusionTruth = Truth_Comparison(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_15:
+{
+if(!doublePremise) { goto RULE_16; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_16; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_16; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_16; }
+substitutions[34] = subtree;
+if(term2.atoms[0] != 46){ goto RULE_16; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_16; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_16; }
+substitutions[31] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[33])){ goto RULE_16; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[34])){ goto RULE_16; }
+Truth conclusionTruth = Truth_Analogy(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_16:
+{
+if(!doublePremise) { goto RULE_17; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 46){ goto RULE_17; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_17; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_17; }
+substitutions[31] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_17; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_17; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_17; }
+substitutions[34] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[33])){ goto RULE_17; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[34])){ goto RULE_17; }
+Truth conclusionTruth = Truth_Analogy(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_17:
+{
+if(!doublePremise) { goto RULE_18; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_18; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_18; }
+substitutions[34] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_18; }
+substitutions[31] = subtree;
+if(term2.atoms[0] != 46){ goto RULE_18; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_18; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_18; }
+substitutions[31] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[34])){ goto RULE_18; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[33])){ goto RULE_18; }
+Truth conclusionTruth = Truth_Analogy(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_18:
+{
+if(!doublePremise) { goto RULE_19; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 46){ goto RULE_19; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_19; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_19; }
+substitutions[31] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_19; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_19; }
+substitutions[34] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_19; }
+substitutions[31] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[34])){ goto RULE_19; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[33])){ goto RULE_19; }
+Truth conclusionTruth = Truth_Analogy(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_19:
+{
+if(!doublePremise) { goto RULE_20; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+subtree = Term_ExtractSubterm(&term1, 0);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_20; }
+substitutions[33] = subtree;
+if(term2.atoms[0] != 46){ goto RULE_20; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_20; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_20; }
+substitutions[34] = subtree;
+Term conclusion = {0};
+if(!Term_OverrideSubterm(&conclusion,0,&substitutions[34])){ goto RULE_20; }
+Truth conclusionTruth = Truth_Analogy(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_20:
+{
+if(!doublePremise) { goto RULE_21; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 46){ goto RULE_21; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_21; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_21; }
+substitutions[34] = subtree;
+subtree = Term_ExtractSubterm(&term2, 0);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_21; }
+substitutions[33] = subtree;
+Term conclusion = {0};
+if(!Term_OverrideSubterm(&conclusion,0,&substitutions[34])){ goto RULE_21; }
+Truth conclusionTruth = Truth_Analogy(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_21:
+{
+if(!doublePremise) { goto RULE_22; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+subtree = Term_ExtractSubterm(&term1, 0);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_22; }
+substitutions[33] = subtree;
+if(term2.atoms[0] != 46){ goto RULE_22; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_22; }
+substitutions[34] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_22; }
+substitutions[33] = subtree;
+Term conclusion = {0};
+if(!Term_OverrideSubterm(&conclusion,0,&substitutions[34])){ goto RULE_22; }
+Truth conclusionTruth = Truth_Analogy(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_22:
+{
+if(!doublePremise) { goto RULE_23; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 46){ goto RULE_23; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_23; }
+substitutions[34] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_23; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term2, 0);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_23; }
+substitutions[33] = subtree;
+Term conclusion = {0};
+if(!Term_OverrideSubterm(&conclusion,0,&substitutions[34])){ goto RULE_23; }
+Truth conclusionTruth = Truth_Analogy(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_23:
+{
+if(doublePremise) { goto RULE_24; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_24; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_24; }
+substitutions[33] = subtree;
+if(term1.atoms[2] != 49){ goto RULE_24; }
+subtree = Term_ExtractSubterm(&term1, 5);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_24; }
+substitutions[34] = subtree;
+if(term1.atoms[6] != 40){ goto RULE_24; }
+Term conclusion = {0};
+conclusion.atoms[0] = 46;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[33])){ goto RULE_24; }
+conclusion.atoms[2] = 49;
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[34])){ goto RULE_24; }
+conclusion.atoms[6] = 40;
+Truth conclusionTruth = Truth_StructuralIntersection(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_24:
+{
+if(doublePremise) { goto RULE_25; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_25; }
+if(term1.atoms[1] != 48){ goto RULE_25; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_25; }
+substitutions[34] = subtree;
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_25; }
+substitutions[33] = subtree;
+if(term1.atoms[4] != 40){ goto RULE_25; }
+Term conclusion = {0};
+conclusion.atoms[0] = 46;
+conclusion.atoms[1] = 48;
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[34])){ goto RULE_25; }
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[33])){ goto RULE_25; }
+conclusion.atoms[4] = 40;
+Truth conclusionTruth = Truth_StructuralIntersection(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_25:
+{
+if(!doublePremise) { goto RULE_26; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_26; }
+if(term1.atoms[1] != 49){ goto RULE_26; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_26; }
+substitutions[34] = subtree;
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_26; }
+substitutions[31] = subtree;
+if(term1.atoms[4] != 40){ goto RULE_26; }
+if(term2.atoms[0] != 46){ goto RULE_26; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_26; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_26; }
+substitutions[31] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+conclusion.atoms[1] = 49;
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[34])){ goto RULE_26; }
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[33])){ goto RULE_26; }
+conclusion.atoms[4] = 40;
+Truth conclusionTruth = Truth_Analogy(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_26:
+{
+if(!doublePremise) { goto RULE_27; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 46){ goto RULE_27; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_27; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_27; }
+substitutions[31] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_27; }
+if(term2.atoms[1] != 49){ goto RULE_27; }
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_27; }
+substitutions[34] = subtree;
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_27; }
+substitutions[31] = subtree;
+if(term2.atoms[4] != 40){ goto RULE_27; }
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+conclusion.atoms[1] = 49;
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[34])){ goto RULE_27; }
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[33])){ goto RULE_27; }
+conclusion.atoms[4] = 40;
+Truth conclusionTruth = Truth_Analogy(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_27:
+{
+if(!doublePremise) { goto RULE_28; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_28; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_28; }
+substitutions[34] = subtree;
+if(term1.atoms[2] != 48){ goto RULE_28; }
+subtree = Term_ExtractSubterm(&term1, 5);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_28; }
+substitutions[31] = subtree;
+if(term1.atoms[6] != 40){ goto RULE_28; }
+if(term2.atoms[0] != 46){ goto RULE_28; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_28; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_28; }
+substitutions[31] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[34])){ goto RULE_28; }
+conclusion.atoms[2] = 48;
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[33])){ goto RULE_28; }
+conclusion.atoms[6] = 40;
+Truth conclusionTruth = Truth_Analogy(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_28:
+{
+if(!doublePremise) { goto RULE_29; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 46){ goto RULE_29; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_29; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_29; }
+substitutions[31] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_29; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_29; }
+substitutions[34] = subtree;
+if(term2.atoms[2] != 48){ goto RULE_29; }
+subtree = Term_ExtractSubterm(&term2, 5);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_29; }
+substitutions[31] = subtree;
+if(term2.atoms[6] != 40){ goto RULE_29; }
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[34])){ goto RULE_29; }
+conclusion.atoms[2] = 48;
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[33])){ goto RULE_29; }
+conclusion.atoms[6] = 40;
+Truth conclusionTruth = Truth_Analogy(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_29:
+{
+if(doublePremise) { goto RULE_30; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 46){ goto RULE_30; }
+if(term1.atoms[1] != 49){ goto RULE_30; }
+if(term1.atoms[2] != 49){ goto RULE_30; }
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_30; }
+substitutions[28] = subtree;
+if(term1.atoms[4] != 40){ goto RULE_30; }
+subtree = Term_ExtractSubterm(&term1, 5);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_30; }
+substitutions[29] = subtree;
+if(term1.atoms[6] != 40){ goto RULE_30; }
+Term conclusion = {0};
+conclusion.atoms[0] = 46;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[28])){ goto RULE_30; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[29])){ goto RULE_30; }
+Truth conclusionTruth = Truth_StructuralIntersection(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_30:
+{
+if(doublePremise) { goto RULE_31; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 46){ goto RULE_31; }
+if(term1.atoms[1] != 48){ goto RULE_31; }
+if(term1.atoms[2] != 48){ goto RULE_31; }
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_31; }
+substitutions[28] = subtree;
+if(term1.atoms[4] != 40){ goto RULE_31; }
+subtree = Term_ExtractSubterm(&term1, 5);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_31; }
+substitutions[29] = subtree;
+if(term1.atoms[6] != 40){ goto RULE_31; }
+Term conclusion = {0};
+conclusion.atoms[0] = 46;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[28])){ goto RULE_31; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[29])){ goto RULE_31; }
+Truth conclusionTruth = Truth_StructuralIntersection(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_31:
+{
+if(doublePremise) { goto RULE_32; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_32; }
+if(term1.atoms[1] != 49){ goto RULE_32; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_32; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_32; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_32; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+conclusion.atoms[1] = 49;
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[31])){ goto RULE_32; }
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[28])){ goto RULE_32; }
+conclusion.atoms[4] = 40;
+Truth conclusionTruth = Truth_StructuralDeduction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_32:
+{
+if(doublePremise) { goto RULE_33; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_33; }
+if(term1.atoms[1] != 49){ goto RULE_33; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_33; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_33; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_33; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+conclusion.atoms[1] = 49;
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[31])){ goto RULE_33; }
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[29])){ goto RULE_33; }
+conclusion.atoms[4] = 40;
+Truth conclusionTruth = Truth_StructuralDeduction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_33:
+{
+if(doublePremise) { goto RULE_34; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_34; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_34; }
+substitutions[31] = subtree;
+if(term1.atoms[2] != 48){ goto RULE_34; }
+subtree = Term_ExtractSubterm(&term1, 5);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_34; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 6);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_34; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[31])){ goto RULE_34; }
+conclusion.atoms[2] = 48;
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[28])){ goto RULE_34; }
+conclusion.atoms[6] = 40;
+Truth conclusionTruth = Truth_StructuralDeduction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_34:
+{
+if(doublePremise) { goto RULE_35; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_35; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_35; }
+substitutions[31] = subtree;
+if(term1.atoms[2] != 48){ goto RULE_35; }
+subtree = Term_ExtractSubterm(&term1, 5);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_35; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 6);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_35; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[31])){ goto RULE_35; }
+conclusion.atoms[2] = 48;
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[29])){ goto RULE_35; }
+conclusion.atoms[6] = 40;
+Truth conclusionTruth = Truth_StructuralDeduction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_35:
+{
+if(doublePremise) { goto RULE_36; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_36; }
+if(term1.atoms[1] != 43){ goto RULE_36; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_36; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_36; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_36; }
+substitutions[34] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[33])){ goto RULE_36; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[31])){ goto RULE_36; }
+Truth conclusionTruth = Truth_StructuralDeduction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_36:
+{
+if(doublePremise) { goto RULE_37; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_37; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_37; }
+substitutions[31] = subtree;
+if(term1.atoms[2] != 42){ goto RULE_37; }
+subtree = Term_ExtractSubterm(&term1, 5);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_37; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term1, 6);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_37; }
+substitutions[34] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[31])){ goto RULE_37; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[33])){ goto RULE_37; }
+Truth conclusionTruth = Truth_StructuralDeduction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_37:
+{
+if(doublePremise) { goto RULE_38; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_38; }
+if(term1.atoms[1] != 43){ goto RULE_38; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_38; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_38; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_38; }
+substitutions[34] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[34])){ goto RULE_38; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[31])){ goto RULE_38; }
+Truth conclusionTruth = Truth_StructuralDeduction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_38:
+{
+if(doublePremise) { goto RULE_39; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_39; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_39; }
+substitutions[31] = subtree;
+if(term1.atoms[2] != 42){ goto RULE_39; }
+subtree = Term_ExtractSubterm(&term1, 5);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_39; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term1, 6);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_39; }
+substitutions[34] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[31])){ goto RULE_39; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[34])){ goto RULE_39; }
+Truth conclusionTruth = Truth_StructuralDeduction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_39:
+{
+if(doublePremise) { goto RULE_40; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_40; }
+if(term1.atoms[1] != 56){ goto RULE_40; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_40; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_40; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_40; }
+substitutions[33] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[28])){ goto RULE_40; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[31])){ goto RULE_40; }
+Truth conclusionTruth = Truth_StructuralDeduction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_40:
+{
+if(doublePremise) { goto RULE_41; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_41; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_41; }
+substitutions[31] = subtree;
+if(term1.atoms[2] != 53){ goto RULE_41; }
+subtree = Term_ExtractSubterm(&term1, 5);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_41; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term1, 6);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_41; }
+substitutions[33] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[31])){ goto RULE_41; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[29])){ goto RULE_41; }
+Truth conclusionTruth = Truth_StructuralDeduction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_41:
+{
+if(doublePremise) { goto RULE_42; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_42; }
+if(term1.atoms[1] != 56){ goto RULE_42; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_42; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_42; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_42; }
+substitutions[33] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[33])){ goto RULE_42; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[31])){ goto RULE_42; }
+Truth conclusionTruth = Truth_StructuralDeductionNegated(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_42:
+{
+if(doublePremise) { goto RULE_43; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_43; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_43; }
+substitutions[31] = subtree;
+if(term1.atoms[2] != 53){ goto RULE_43; }
+subtree = Term_ExtractSubterm(&term1, 5);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_43; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term1, 6);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_43; }
+substitutions[33] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[31])){ goto RULE_43; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[33])){ goto RULE_43; }
+Truth conclusionTruth = Truth_StructuralDeductionNegated(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_43:
+{
+if(!doublePremise) { goto RULE_44; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_44; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_44; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_44; }
+substitutions[31] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_44; }
+if(term2.atoms[1] != 43){ goto RULE_44; }
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_44; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_44; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term2, 4);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_44; }
+substitutions[34] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[34])){ goto RULE_44; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[31])){ goto RULE_44; }
+Truth conclusionTruth = Truth_DecomposePNN(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_44:
+{
+if(!doublePremise) { goto RULE_45; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_45; }
+if(term1.atoms[1] != 43){ goto RULE_45; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_45; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_45; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_45; }
+substitutions[34] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_45; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_45; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_45; }
+substitutions[31] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[34])){ goto RULE_45; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[31])){ goto RULE_45; }
+Truth conclusionTruth = Truth_DecomposePNN(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_45:
+{
+if(!doublePremise) { goto RULE_46; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_46; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_46; }
+substitutions[34] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_46; }
+substitutions[31] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_46; }
+if(term2.atoms[1] != 43){ goto RULE_46; }
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_46; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_46; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term2, 4);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_46; }
+substitutions[34] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[33])){ goto RULE_46; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[31])){ goto RULE_46; }
+Truth conclusionTruth = Truth_DecomposePNN(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_46:
+{
+if(!doublePremise) { goto RULE_47; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_47; }
+if(term1.atoms[1] != 43){ goto RULE_47; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_47; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_47; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_47; }
+substitutions[34] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_47; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_47; }
+substitutions[34] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_47; }
+substitutions[31] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[33])){ goto RULE_47; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[31])){ goto RULE_47; }
+Truth conclusionTruth = Truth_DecomposePNN(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_47:
+{
+if(!doublePremise) { goto RULE_48; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_48; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_48; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_48; }
+substitutions[31] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_48; }
+if(term2.atoms[1] != 42){ goto RULE_48; }
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_48; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_48; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term2, 4);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_48; }
+substitutions[34] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[34])){ goto RULE_48; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[31])){ goto RULE_48; }
+Truth conclusionTruth = Truth_DecomposeNPP(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_48:
+{
+if(!doublePremise) { goto RULE_49; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_49; }
+if(term1.atoms[1] != 42){ goto RULE_49; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_49; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_49; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_49; }
+substitutions[34] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_49; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_49; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_49; }
+substitutions[31] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[34])){ goto RULE_49; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[31])){ goto RULE_49; }
+Truth conclusionTruth = Truth_DecomposeNPP(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_49:
+{
+if(!doublePremise) { goto RULE_50; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_50; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_50; }
+substitutions[34] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_50; }
+substitutions[31] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_50; }
+if(term2.atoms[1] != 42){ goto RULE_50; }
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_50; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_50; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term2, 4);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_50; }
+substitutions[34] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[33])){ goto RULE_50; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[31])){ goto RULE_50; }
+Truth conclusionTruth = Truth_DecomposeNPP(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_50:
+{
+if(!doublePremise) { goto RULE_51; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_51; }
+if(term1.atoms[1] != 42){ goto RULE_51; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_51; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_51; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_51; }
+substitutions[34] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_51; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_51; }
+substitutions[34] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_51; }
+substitutions[31] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[33])){ goto RULE_51; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[31])){ goto RULE_51; }
+Truth conclusionTruth = Truth_DecomposeNPP(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_51:
+{
+if(!doublePremise) { goto RULE_52; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_52; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_52; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_52; }
+substitutions[31] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_52; }
+if(term2.atoms[1] != 56){ goto RULE_52; }
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_52; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_52; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term2, 4);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_52; }
+substitutions[34] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[34])){ goto RULE_52; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[31])){ goto RULE_52; }
+Truth conclusionTruth = Truth_DecomposePNP(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_52:
+{
+if(!doublePremise) { goto RULE_53; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_53; }
+if(term1.atoms[1] != 56){ goto RULE_53; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_53; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_53; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_53; }
+substitutions[34] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_53; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_53; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_53; }
+substitutions[31] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[34])){ goto RULE_53; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[31])){ goto RULE_53; }
+Truth conclusionTruth = Truth_DecomposePNP(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_53:
+{
+if(!doublePremise) { goto RULE_54; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_54; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_54; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_54; }
+substitutions[31] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_54; }
+if(term2.atoms[1] != 56){ goto RULE_54; }
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_54; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_54; }
+substitutions[34] = subtree;
+subtree = Term_ExtractSubterm(&term2, 4);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_54; }
+substitutions[33] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[34])){ goto RULE_54; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[31])){ goto RULE_54; }
+Truth conclusionTruth = Truth_DecomposeNNN(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_54:
+{
+if(!doublePremise) { goto RULE_55; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_55; }
+if(term1.atoms[1] != 56){ goto RULE_55; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_55; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_55; }
+substitutions[34] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_55; }
+substitutions[33] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_55; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_55; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_55; }
+substitutions[31] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[34])){ goto RULE_55; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[31])){ goto RULE_55; }
+Truth conclusionTruth = Truth_DecomposeNNN(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_55:
+{
+if(!doublePremise) { goto RULE_56; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_56; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_56; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_56; }
+substitutions[33] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_56; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_56; }
+substitutions[31] = subtree;
+if(term2.atoms[2] != 42){ goto RULE_56; }
+subtree = Term_ExtractSubterm(&term2, 5);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_56; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term2, 6);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_56; }
+substitutions[34] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[31])){ goto RULE_56; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[34])){ goto RULE_56; }
+Truth conclusionTruth = Truth_DecomposePNN(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_56:
+{
+if(!doublePremise) { goto RULE_57; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_57; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_57; }
+substitutions[31] = subtree;
+if(term1.atoms[2] != 42){ goto RULE_57; }
+subtree = Term_ExtractSubterm(&term1, 5);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_57; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term1, 6);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_57; }
+substitutions[34] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_57; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_57; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_57; }
+substitutions[33] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[31])){ goto RULE_57; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[34])){ goto RULE_57; }
+Truth conclusionTruth = Truth_DecomposePNN(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_57:
+{
+if(!doublePremise) { goto RULE_58; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_58; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_58; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_58; }
+substitutions[34] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_58; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_58; }
+substitutions[31] = subtree;
+if(term2.atoms[2] != 42){ goto RULE_58; }
+subtree = Term_ExtractSubterm(&term2, 5);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_58; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term2, 6);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_58; }
+substitutions[34] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[31])){ goto RULE_58; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[33])){ goto RULE_58; }
+Truth conclusionTruth = Truth_DecomposePNN(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_58:
+{
+if(!doublePremise) { goto RULE_59; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_59; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_59; }
+substitutions[31] = subtree;
+if(term1.atoms[2] != 42){ goto RULE_59; }
+subtree = Term_ExtractSubterm(&term1, 5);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_59; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term1, 6);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_59; }
+substitutions[34] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_59; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_59; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_59; }
+substitutions[34] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[31])){ goto RULE_59; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[33])){ goto RULE_59; }
+Truth conclusionTruth = Truth_DecomposePNN(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_59:
+{
+if(!doublePremise) { goto RULE_60; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_60; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_60; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_60; }
+substitutions[33] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_60; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_60; }
+substitutions[31] = subtree;
+if(term2.atoms[2] != 43){ goto RULE_60; }
+subtree = Term_ExtractSubterm(&term2, 5);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_60; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term2, 6);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_60; }
+substitutions[34] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[31])){ goto RULE_60; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[34])){ goto RULE_60; }
+Truth conclusionTruth = Truth_DecomposeNPP(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_60:
+{
+if(!doublePremise) { goto RULE_61; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_61; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_61; }
+substitutions[31] = subtree;
+if(term1.atoms[2] != 43){ goto RULE_61; }
+subtree = Term_ExtractSubterm(&term1, 5);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_61; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term1, 6);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_61; }
+substitutions[34] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_61; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_61; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_61; }
+substitutions[33] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[31])){ goto RULE_61; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[34])){ goto RULE_61; }
+Truth conclusionTruth = Truth_DecomposeNPP(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_61:
+{
+if(!doublePremise) { goto RULE_62; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_62; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_62; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_62; }
+substitutions[34] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_62; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_62; }
+substitutions[31] = subtree;
+if(term2.atoms[2] != 43){ goto RULE_62; }
+subtree = Term_ExtractSubterm(&term2, 5);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_62; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term2, 6);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_62; }
+substitutions[34] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[31])){ goto RULE_62; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[33])){ goto RULE_62; }
+Truth conclusionTruth = Truth_DecomposeNPP(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_62:
+{
+if(!doublePremise) { goto RULE_63; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_63; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_63; }
+substitutions[31] = subtree;
+if(term1.atoms[2] != 43){ goto RULE_63; }
+subtree = Term_ExtractSubterm(&term1, 5);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_63; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term1, 6);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_63; }
+substitutions[34] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_63; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_63; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_63; }
+substitutions[34] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[31])){ goto RULE_63; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[33])){ goto RULE_63; }
+Truth conclusionTruth = Truth_DecomposeNPP(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_63:
+{
+if(!doublePremise) { goto RULE_64; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_64; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_64; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_64; }
+substitutions[33] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_64; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_64; }
+substitutions[31] = subtree;
+if(term2.atoms[2] != 53){ goto RULE_64; }
+subtree = Term_ExtractSubterm(&term2, 5);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_64; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term2, 6);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_64; }
+substitutions[34] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[31])){ goto RULE_64; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[34])){ goto RULE_64; }
+Truth conclusionTruth = Truth_DecomposePNP(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_64:
+{
+if(!doublePremise) { goto RULE_65; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_65; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_65; }
+substitutions[31] = subtree;
+if(term1.atoms[2] != 53){ goto RULE_65; }
+subtree = Term_ExtractSubterm(&term1, 5);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_65; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term1, 6);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_65; }
+substitutions[34] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_65; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_65; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_65; }
+substitutions[33] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[31])){ goto RULE_65; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[34])){ goto RULE_65; }
+Truth conclusionTruth = Truth_DecomposePNP(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_65:
+{
+if(!doublePremise) { goto RULE_66; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_66; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_66; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_66; }
+substitutions[33] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_66; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_66; }
+substitutions[31] = subtree;
+if(term2.atoms[2] != 53){ goto RULE_66; }
+subtree = Term_ExtractSubterm(&term2, 5);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_66; }
+substitutions[34] = subtree;
+subtree = Term_ExtractSubterm(&term2, 6);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_66; }
+substitutions[33] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[31])){ goto RULE_66; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[34])){ goto RULE_66; }
+Truth conclusionTruth = Truth_DecomposeNNN(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_66:
+{
+if(!doublePremise) { goto RULE_67; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_67; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_67; }
+substitutions[31] = subtree;
+if(term1.atoms[2] != 53){ goto RULE_67; }
+subtree = Term_ExtractSubterm(&term1, 5);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_67; }
+substitutions[34] = subtree;
+subtree = Term_ExtractSubterm(&term1, 6);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_67; }
+substitutions[33] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_67; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_67; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_67; }
+substitutions[33] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[31])){ goto RULE_67; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[34])){ goto RULE_67; }
+Truth conclusionTruth = Truth_DecomposeNNN(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_67:
+{
+if(doublePremise) { goto RULE_68; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_68; }
+if(term1.atoms[1] != 41){ goto RULE_68; }
+if(term1.atoms[2] != 41){ goto RULE_68; }
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_68; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_68; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term1, 5);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_68; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term1, 6);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_68; }
+substitutions[31] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[28])){ goto RULE_68; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[33])){ goto RULE_68; }
+Truth conclusionTruth = Truth_StructuralDeduction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_68:
+{
+if(doublePremise) { goto RULE_69; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_69; }
+if(term1.atoms[1] != 41){ goto RULE_69; }
+if(term1.atoms[2] != 41){ goto RULE_69; }
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_69; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_69; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term1, 5);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_69; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term1, 6);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_69; }
+substitutions[31] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[29])){ goto RULE_69; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[31])){ goto RULE_69; }
+Truth conclusionTruth = Truth_StructuralDeduction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_69:
+{
+if(!doublePremise) { goto RULE_70; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 62){ goto RULE_70; }
+if(term1.atoms[1] != 49){ goto RULE_70; }
+if(term1.atoms[2] != 48){ goto RULE_70; }
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_70; }
+substitutions[32] = subtree;
+if(term1.atoms[4] != 40){ goto RULE_70; }
+subtree = Term_ExtractSubterm(&term1, 5);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_70; }
+substitutions[34] = subtree;
+if(term1.atoms[6] != 40){ goto RULE_70; }
+if(term2.atoms[0] != 62){ goto RULE_70; }
+if(term2.atoms[1] != 49){ goto RULE_70; }
+if(term2.atoms[2] != 48){ goto RULE_70; }
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_70; }
+substitutions[33] = subtree;
+if(term2.atoms[4] != 40){ goto RULE_70; }
+subtree = Term_ExtractSubterm(&term2, 5);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_70; }
+substitutions[34] = subtree;
+if(term2.atoms[6] != 40){ goto RULE_70; }
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+conclusion.atoms[1] = 41;
+conclusion.atoms[2] = 57;
+conclusion.atoms[3] = 49;
+conclusion.atoms[4] = 49;
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[34])){ goto RULE_70; }
+conclusion.atoms[6] = 40;
+if(!Term_OverrideSubterm(&conclusion,7,&substitutions[32])){ goto RULE_70; }
+conclusion.atoms[8] = 40;
+if(!Term_OverrideSubterm(&conclusion,9,&substitutions[33])){ goto RULE_70; }
+conclusion.atoms[10] = 40;
+Truth conclusionTruth = Truth_FrequencyGreater(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_70:
+{
+if(!doublePremise) { goto RULE_71; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 62){ goto RULE_71; }
+if(term1.atoms[1] != 49){ goto RULE_71; }
+if(term1.atoms[2] != 48){ goto RULE_71; }
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_71; }
+substitutions[33] = subtree;
+if(term1.atoms[4] != 40){ goto RULE_71; }
+subtree = Term_ExtractSubterm(&term1, 5);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_71; }
+substitutions[34] = subtree;
+if(term1.atoms[6] != 40){ goto RULE_71; }
+if(term2.atoms[0] != 62){ goto RULE_71; }
+if(term2.atoms[1] != 49){ goto RULE_71; }
+if(term2.atoms[2] != 48){ goto RULE_71; }
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_71; }
+substitutions[32] = subtree;
+if(term2.atoms[4] != 40){ goto RULE_71; }
+subtree = Term_ExtractSubterm(&term2, 5);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_71; }
+substitutions[34] = subtree;
+if(term2.atoms[6] != 40){ goto RULE_71; }
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+conclusion.atoms[1] = 41;
+conclusion.atoms[2] = 57;
+conclusion.atoms[3] = 49;
+conclusion.atoms[4] = 49;
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[34])){ goto RULE_71; }
+conclusion.atoms[6] = 40;
+if(!Term_OverrideSubterm(&conclusion,7,&substitutions[32])){ goto RULE_71; }
+conclusion.atoms[8] = 40;
+if(!Term_OverrideSubterm(&conclusion,9,&substitutions[33])){ goto RULE_71; }
+conclusion.atoms[10] = 40;
+Truth conclusionTruth = Truth_FrequencyGreater(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_71:
+{
+if(!doublePremise) { goto RULE_72; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_72; }
+if(term1.atoms[1] != 41){ goto RULE_72; }
+if(term1.atoms[2] != 57){ goto RULE_72; }
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_72; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_72; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term1, 5);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_72; }
+substitutions[34] = subtree;
+if(term1.atoms[6] != 40){ goto RULE_72; }
+if(term2.atoms[0] != 45){ goto RULE_72; }
+if(term2.atoms[1] != 41){ goto RULE_72; }
+if(term2.atoms[2] != 57){ goto RULE_72; }
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_72; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term2, 4);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_72; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term2, 5);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_72; }
+substitutions[34] = subtree;
+if(term2.atoms[6] != 40){ goto RULE_72; }
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+conclusion.atoms[1] = 41;
+conclusion.atoms[2] = 57;
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[28])){ goto RULE_72; }
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[30])){ goto RULE_72; }
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[34])){ goto RULE_72; }
+conclusion.atoms[6] = 40;
+Truth conclusionTruth = Truth_Deduction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_72:
+{
+if(!doublePremise) { goto RULE_73; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_73; }
+if(term1.atoms[1] != 41){ goto RULE_73; }
+if(term1.atoms[2] != 57){ goto RULE_73; }
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_73; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_73; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term1, 5);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_73; }
+substitutions[34] = subtree;
+if(term1.atoms[6] != 40){ goto RULE_73; }
+if(term2.atoms[0] != 45){ goto RULE_73; }
+if(term2.atoms[1] != 41){ goto RULE_73; }
+if(term2.atoms[2] != 57){ goto RULE_73; }
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_73; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 4);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_73; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term2, 5);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_73; }
+substitutions[34] = subtree;
+if(term2.atoms[6] != 40){ goto RULE_73; }
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+conclusion.atoms[1] = 41;
+conclusion.atoms[2] = 57;
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[28])){ goto RULE_73; }
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[30])){ goto RULE_73; }
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[34])){ goto RULE_73; }
+conclusion.atoms[6] = 40;
+Truth conclusionTruth = Truth_Deduction(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_73:
+{
+if(!doublePremise) { goto RULE_74; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 62){ goto RULE_74; }
+if(term1.atoms[1] != 49){ goto RULE_74; }
+if(term1.atoms[2] != 48){ goto RULE_74; }
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_74; }
+substitutions[32] = subtree;
+if(term1.atoms[4] != 40){ goto RULE_74; }
+subtree = Term_ExtractSubterm(&term1, 5);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_74; }
+substitutions[34] = subtree;
+if(term1.atoms[6] != 40){ goto RULE_74; }
+if(term2.atoms[0] != 62){ goto RULE_74; }
+if(term2.atoms[1] != 49){ goto RULE_74; }
+if(term2.atoms[2] != 48){ goto RULE_74; }
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_74; }
+substitutions[33] = subtree;
+if(term2.atoms[4] != 40){ goto RULE_74; }
+subtree = Term_ExtractSubterm(&term2, 5);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_74; }
+substitutions[34] = subtree;
+if(term2.atoms[6] != 40){ goto RULE_74; }
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+conclusion.atoms[1] = 41;
+conclusion.atoms[2] = 46;
+conclusion.atoms[3] = 49;
+conclusion.atoms[4] = 49;
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[34])){ goto RULE_74; }
+conclusion.atoms[6] = 40;
+if(!Term_OverrideSubterm(&conclusion,7,&substitutions[32])){ goto RULE_74; }
+conclusion.atoms[8] = 40;
+if(!Term_OverrideSubterm(&conclusion,9,&substitutions[33])){ goto RULE_74; }
+conclusion.atoms[10] = 40;
+Truth conclusionTruth = Truth_FrequencyEqual(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_74:
+{
+if(!doublePremise) { goto RULE_75; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 62){ goto RULE_75; }
+if(term1.atoms[1] != 49){ goto RULE_75; }
+if(term1.atoms[2] != 48){ goto RULE_75; }
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_75; }
+substitutions[33] = subtree;
+if(term1.atoms[4] != 40){ goto RULE_75; }
+subtree = Term_ExtractSubterm(&term1, 5);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_75; }
+substitutions[34] = subtree;
+if(term1.atoms[6] != 40){ goto RULE_75; }
+if(term2.atoms[0] != 62){ goto RULE_75; }
+if(term2.atoms[1] != 49){ goto RULE_75; }
+if(term2.atoms[2] != 48){ goto RULE_75; }
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_75; }
+substitutions[32] = subtree;
+if(term2.atoms[4] != 40){ goto RULE_75; }
+subtree = Term_ExtractSubterm(&term2, 5);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_75; }
+substitutions[34] = subtree;
+if(term2.atoms[6] != 40){ goto RULE_75; }
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+conclusion.atoms[1] = 41;
+conclusion.atoms[2] = 46;
+conclusion.atoms[3] = 49;
+conclusion.atoms[4] = 49;
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[34])){ goto RULE_75; }
+conclusion.atoms[6] = 40;
+if(!Term_OverrideSubterm(&conclusion,7,&substitutions[32])){ goto RULE_75; }
+conclusion.atoms[8] = 40;
+if(!Term_OverrideSubterm(&conclusion,9,&substitutions[33])){ goto RULE_75; }
+conclusion.atoms[10] = 40;
+Truth conclusionTruth = Truth_FrequencyEqual(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_75:
+{
+if(!doublePremise) { goto RULE_76; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_76; }
+if(term1.atoms[1] != 41){ goto RULE_76; }
+if(term1.atoms[2] != 46){ goto RULE_76; }
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_76; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_76; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term1, 5);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_76; }
+substitutions[34] = subtree;
+if(term1.atoms[6] != 40){ goto RULE_76; }
+if(term2.atoms[0] != 45){ goto RULE_76; }
+if(term2.atoms[1] != 41){ goto RULE_76; }
+if(term2.atoms[2] != 46){ goto RULE_76; }
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_76; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term2, 4);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_76; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term2, 5);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_76; }
+substitutions[34] = subtree;
+if(term2.atoms[6] != 40){ goto RULE_76; }
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+conclusion.atoms[1] = 41;
+conclusion.atoms[2] = 46;
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[28])){ goto RULE_76; }
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[30])){ goto RULE_76; }
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[34])){ goto RULE_76; }
+conclusion.atoms[6] = 40;
+Truth conclusionTruth = Truth_Deduction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_76:
+{
+if(!doublePremise) { goto RULE_77; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_77; }
+if(term1.atoms[1] != 41){ goto RULE_77; }
+if(term1.atoms[2] != 46){ goto RULE_77; }
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_77; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_77; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term1, 5);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_77; }
+substitutions[34] = subtree;
+if(term1.atoms[6] != 40){ goto RULE_77; }
+if(term2.atoms[0] != 45){ goto RULE_77; }
+if(term2.atoms[1] != 41){ goto RULE_77; }
+if(term2.atoms[2] != 46){ goto RULE_77; }
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_77; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 4);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_77; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term2, 5);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_77; }
+substitutions[34] = subtree;
+if(term2.atoms[6] != 40){ goto RULE_77; }
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+conclusion.atoms[1] = 41;
+conclusion.atoms[2] = 46;
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[28])){ goto RULE_77; }
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[30])){ goto RULE_77; }
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[34])){ goto RULE_77; }
+conclusion.atoms[6] = 40;
+Truth conclusionTruth = Truth_Deduction(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_77:
+{
+if(doublePremise) { goto RULE_78; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_78; }
+if(term1.atoms[1] != 41){ goto RULE_78; }
+if(term1.atoms[2] != 46){ goto RULE_78; }
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_78; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_78; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term1, 5);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_78; }
+substitutions[34] = subtree;
+if(term1.atoms[6] != 40){ goto RULE_78; }
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+conclusion.atoms[1] = 41;
+conclusion.atoms[2] = 46;
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[29])){ goto RULE_78; }
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[28])){ goto RULE_78; }
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[34])){ goto RULE_78; }
+conclusion.atoms[6] = 40;
+Truth conclusionTruth = Truth_StructuralIntersection(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_78:
+{
+if(!doublePremise) { goto RULE_79; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_79; }
+if(term1.atoms[1] != 41){ goto RULE_79; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_79; }
+substitutions[32] = subtree;
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_79; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_79; }
+substitutions[29] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_79; }
+if(term2.atoms[1] != 41){ goto RULE_79; }
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_79; }
+substitutions[32] = subtree;
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_79; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term2, 4);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_79; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[30])){ goto RULE_79; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[28])){ goto RULE_79; }
+Truth conclusionTruth = Truth_Abduction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_79:
+{
+if(!doublePremise) { goto RULE_80; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_80; }
+if(term1.atoms[1] != 41){ goto RULE_80; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_80; }
+substitutions[32] = subtree;
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_80; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_80; }
+substitutions[29] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_80; }
+if(term2.atoms[1] != 41){ goto RULE_80; }
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_80; }
+substitutions[32] = subtree;
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_80; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 4);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_80; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[30])){ goto RULE_80; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[28])){ goto RULE_80; }
+Truth conclusionTruth = Truth_Abduction(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_80:
+{
+if(!doublePremise) { goto RULE_81; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_81; }
+if(term1.atoms[1] != 41){ goto RULE_81; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_81; }
+substitutions[32] = subtree;
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_81; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_81; }
+substitutions[29] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_81; }
+if(term2.atoms[1] != 41){ goto RULE_81; }
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_81; }
+substitutions[32] = subtree;
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_81; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 4);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_81; }
+substitutions[30] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[30])){ goto RULE_81; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[29])){ goto RULE_81; }
+Truth conclusionTruth = Truth_Abduction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_81:
+{
+if(!doublePremise) { goto RULE_82; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_82; }
+if(term1.atoms[1] != 41){ goto RULE_82; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_82; }
+substitutions[32] = subtree;
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_82; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_82; }
+substitutions[30] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_82; }
+if(term2.atoms[1] != 41){ goto RULE_82; }
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_82; }
+substitutions[32] = subtree;
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_82; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 4);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_82; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[30])){ goto RULE_82; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[29])){ goto RULE_82; }
+Truth conclusionTruth = Truth_Abduction(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_82:
+{
+if(!doublePremise) { goto RULE_83; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_83; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_83; }
+substitutions[32] = subtree;
+if(term1.atoms[2] != 41){ goto RULE_83; }
+subtree = Term_ExtractSubterm(&term1, 5);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_83; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 6);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_83; }
+substitutions[29] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_83; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_83; }
+substitutions[32] = subtree;
+if(term2.atoms[2] != 41){ goto RULE_83; }
+subtree = Term_ExtractSubterm(&term2, 5);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_83; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term2, 6);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_83; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[30])){ goto RULE_83; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[28])){ goto RULE_83; }
+Truth conclusionTruth = Truth_Induction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_83:
+{
+if(!doublePremise) { goto RULE_84; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_84; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_84; }
+substitutions[32] = subtree;
+if(term1.atoms[2] != 41){ goto RULE_84; }
+subtree = Term_ExtractSubterm(&term1, 5);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_84; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term1, 6);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_84; }
+substitutions[29] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_84; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_84; }
+substitutions[32] = subtree;
+if(term2.atoms[2] != 41){ goto RULE_84; }
+subtree = Term_ExtractSubterm(&term2, 5);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_84; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 6);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_84; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[30])){ goto RULE_84; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[28])){ goto RULE_84; }
+Truth conclusionTruth = Truth_Induction(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_84:
+{
+if(!doublePremise) { goto RULE_85; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_85; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_85; }
+substitutions[32] = subtree;
+if(term1.atoms[2] != 41){ goto RULE_85; }
+subtree = Term_ExtractSubterm(&term1, 5);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_85; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 6);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_85; }
+substitutions[29] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_85; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_85; }
+substitutions[32] = subtree;
+if(term2.atoms[2] != 41){ goto RULE_85; }
+subtree = Term_ExtractSubterm(&term2, 5);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_85; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 6);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_85; }
+substitutions[30] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[30])){ goto RULE_85; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[29])){ goto RULE_85; }
+Truth conclusionTruth = Truth_Induction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_85:
+{
+if(!doublePremise) { goto RULE_86; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_86; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_86; }
+substitutions[32] = subtree;
+if(term1.atoms[2] != 41){ goto RULE_86; }
+subtree = Term_ExtractSubterm(&term1, 5);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_86; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 6);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_86; }
+substitutions[30] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_86; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_86; }
+substitutions[32] = subtree;
+if(term2.atoms[2] != 41){ goto RULE_86; }
+subtree = Term_ExtractSubterm(&term2, 5);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_86; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 6);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_86; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[30])){ goto RULE_86; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[29])){ goto RULE_86; }
+Truth conclusionTruth = Truth_Induction(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_86:
+{
+if(!doublePremise) { goto RULE_87; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_87; }
+if(term1.atoms[1] != 41){ goto RULE_87; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_87; }
+substitutions[32] = subtree;
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_87; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_87; }
+substitutions[29] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_87; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_87; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_87; }
+substitutions[28] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+conclusion.atoms[1] = 41;
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[32])){ goto RULE_87; }
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[30])){ goto RULE_87; }
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[29])){ goto RULE_87; }
+Truth conclusionTruth = Truth_Deduction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_87:
+{
+if(!doublePremise) { goto RULE_88; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_88; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_88; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_88; }
+substitutions[28] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_88; }
+if(term2.atoms[1] != 41){ goto RULE_88; }
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_88; }
+substitutions[32] = subtree;
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_88; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 4);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_88; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+conclusion.atoms[1] = 41;
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[32])){ goto RULE_88; }
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[30])){ goto RULE_88; }
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[29])){ goto RULE_88; }
+Truth conclusionTruth = Truth_Deduction(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_88:
+{
+if(!doublePremise) { goto RULE_89; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_89; }
+if(term1.atoms[1] != 41){ goto RULE_89; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_89; }
+substitutions[32] = subtree;
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_89; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_89; }
+substitutions[29] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_89; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_89; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_89; }
+substitutions[30] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+conclusion.atoms[1] = 41;
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[32])){ goto RULE_89; }
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[30])){ goto RULE_89; }
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[29])){ goto RULE_89; }
+Truth conclusionTruth = Truth_Induction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_89:
+{
+if(!doublePremise) { goto RULE_90; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_90; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_90; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_90; }
+substitutions[30] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_90; }
+if(term2.atoms[1] != 41){ goto RULE_90; }
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_90; }
+substitutions[32] = subtree;
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_90; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 4);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_90; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+conclusion.atoms[1] = 41;
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[32])){ goto RULE_90; }
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[30])){ goto RULE_90; }
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[29])){ goto RULE_90; }
+Truth conclusionTruth = Truth_Induction(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_90:
+{
+if(!doublePremise) { goto RULE_91; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_91; }
+if(term1.atoms[1] != 41){ goto RULE_91; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_91; }
+substitutions[32] = subtree;
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_91; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_91; }
+substitutions[29] = subtree;
+if(term2.atoms[0] != 46){ goto RULE_91; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_91; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_91; }
+substitutions[28] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+conclusion.atoms[1] = 41;
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[32])){ goto RULE_91; }
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[30])){ goto RULE_91; }
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[29])){ goto RULE_91; }
+Truth conclusionTruth = Truth_Analogy(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_91:
+{
+if(!doublePremise) { goto RULE_92; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 46){ goto RULE_92; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_92; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_92; }
+substitutions[28] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_92; }
+if(term2.atoms[1] != 41){ goto RULE_92; }
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_92; }
+substitutions[32] = subtree;
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_92; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 4);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_92; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+conclusion.atoms[1] = 41;
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[32])){ goto RULE_92; }
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[30])){ goto RULE_92; }
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[29])){ goto RULE_92; }
+Truth conclusionTruth = Truth_Analogy(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_92:
+{
+if(!doublePremise) { goto RULE_93; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_93; }
+if(term1.atoms[1] != 41){ goto RULE_93; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_93; }
+substitutions[32] = subtree;
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_93; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_93; }
+substitutions[29] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_93; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_93; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_93; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+conclusion.atoms[1] = 41;
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[32])){ goto RULE_93; }
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[28])){ goto RULE_93; }
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[30])){ goto RULE_93; }
+Truth conclusionTruth = Truth_Deduction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_93:
+{
+if(!doublePremise) { goto RULE_94; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_94; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_94; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_94; }
+substitutions[29] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_94; }
+if(term2.atoms[1] != 41){ goto RULE_94; }
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_94; }
+substitutions[32] = subtree;
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_94; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 4);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_94; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+conclusion.atoms[1] = 41;
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[32])){ goto RULE_94; }
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[28])){ goto RULE_94; }
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[30])){ goto RULE_94; }
+Truth conclusionTruth = Truth_Deduction(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_94:
+{
+if(!doublePremise) { goto RULE_95; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_95; }
+if(term1.atoms[1] != 41){ goto RULE_95; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_95; }
+substitutions[32] = subtree;
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_95; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_95; }
+substitutions[29] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_95; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_95; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_95; }
+substitutions[30] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+conclusion.atoms[1] = 41;
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[32])){ goto RULE_95; }
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[28])){ goto RULE_95; }
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[30])){ goto RULE_95; }
+Truth conclusionTruth = Truth_Induction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_95:
+{
+if(!doublePremise) { goto RULE_96; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_96; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_96; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_96; }
+substitutions[30] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_96; }
+if(term2.atoms[1] != 41){ goto RULE_96; }
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_96; }
+substitutions[32] = subtree;
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_96; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 4);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_96; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+conclusion.atoms[1] = 41;
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[32])){ goto RULE_96; }
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[28])){ goto RULE_96; }
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[30])){ goto RULE_96; }
+Truth conclusionTruth = Truth_Induction(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_96:
+{
+if(!doublePremise) { goto RULE_97; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_97; }
+if(term1.atoms[1] != 41){ goto RULE_97; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_97; }
+substitutions[32] = subtree;
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_97; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_97; }
+substitutions[29] = subtree;
+if(term2.atoms[0] != 46){ goto RULE_97; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_97; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_97; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+conclusion.atoms[1] = 41;
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[32])){ goto RULE_97; }
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[28])){ goto RULE_97; }
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[30])){ goto RULE_97; }
+Truth conclusionTruth = Truth_Analogy(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_97:
+{
+if(!doublePremise) { goto RULE_98; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 46){ goto RULE_98; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_98; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_98; }
+substitutions[29] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_98; }
+if(term2.atoms[1] != 41){ goto RULE_98; }
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_98; }
+substitutions[32] = subtree;
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_98; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 4);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_98; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+conclusion.atoms[1] = 41;
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[32])){ goto RULE_98; }
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[28])){ goto RULE_98; }
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[30])){ goto RULE_98; }
+Truth conclusionTruth = Truth_Analogy(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_98:
+{
+if(!doublePremise) { goto RULE_99; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_99; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_99; }
+substitutions[32] = subtree;
+if(term1.atoms[2] != 41){ goto RULE_99; }
+subtree = Term_ExtractSubterm(&term1, 5);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_99; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 6);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_99; }
+substitutions[29] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_99; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_99; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_99; }
+substitutions[30] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[32])){ goto RULE_99; }
+conclusion.atoms[2] = 41;
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[30])){ goto RULE_99; }
+if(!Term_OverrideSubterm(&conclusion,6,&substitutions[29])){ goto RULE_99; }
+Truth conclusionTruth = Truth_Deduction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_99:
+{
+if(!doublePremise) { goto RULE_100; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_100; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_100; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_100; }
+substitutions[30] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_100; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_100; }
+substitutions[32] = subtree;
+if(term2.atoms[2] != 41){ goto RULE_100; }
+subtree = Term_ExtractSubterm(&term2, 5);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_100; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 6);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_100; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[32])){ goto RULE_100; }
+conclusion.atoms[2] = 41;
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[30])){ goto RULE_100; }
+if(!Term_OverrideSubterm(&conclusion,6,&substitutions[29])){ goto RULE_100; }
+Truth conclusionTruth = Truth_Deduction(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_100:
+{
+if(!doublePremise) { goto RULE_101; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_101; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_101; }
+substitutions[32] = subtree;
+if(term1.atoms[2] != 41){ goto RULE_101; }
+subtree = Term_ExtractSubterm(&term1, 5);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_101; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 6);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_101; }
+substitutions[29] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_101; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_101; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_101; }
+substitutions[28] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[32])){ goto RULE_101; }
+conclusion.atoms[2] = 41;
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[30])){ goto RULE_101; }
+if(!Term_OverrideSubterm(&conclusion,6,&substitutions[29])){ goto RULE_101; }
+Truth conclusionTruth = Truth_Abduction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_101:
+{
+if(!doublePremise) { goto RULE_102; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_102; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_102; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_102; }
+substitutions[28] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_102; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_102; }
+substitutions[32] = subtree;
+if(term2.atoms[2] != 41){ goto RULE_102; }
+subtree = Term_ExtractSubterm(&term2, 5);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_102; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 6);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_102; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[32])){ goto RULE_102; }
+conclusion.atoms[2] = 41;
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[30])){ goto RULE_102; }
+if(!Term_OverrideSubterm(&conclusion,6,&substitutions[29])){ goto RULE_102; }
+Truth conclusionTruth = Truth_Abduction(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_102:
+{
+if(!doublePremise) { goto RULE_103; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_103; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_103; }
+substitutions[32] = subtree;
+if(term1.atoms[2] != 41){ goto RULE_103; }
+subtree = Term_ExtractSubterm(&term1, 5);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_103; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 6);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_103; }
+substitutions[29] = subtree;
+if(term2.atoms[0] != 46){ goto RULE_103; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_103; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_103; }
+substitutions[28] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[32])){ goto RULE_103; }
+conclusion.atoms[2] = 41;
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[30])){ goto RULE_103; }
+if(!Term_OverrideSubterm(&conclusion,6,&substitutions[29])){ goto RULE_103; }
+Truth conclusionTruth = Truth_Analogy(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_103:
+{
+if(!doublePremise) { goto RULE_104; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 46){ goto RULE_104; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_104; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_104; }
+substitutions[28] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_104; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_104; }
+substitutions[32] = subtree;
+if(term2.atoms[2] != 41){ goto RULE_104; }
+subtree = Term_ExtractSubterm(&term2, 5);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_104; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 6);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_104; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[32])){ goto RULE_104; }
+conclusion.atoms[2] = 41;
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[30])){ goto RULE_104; }
+if(!Term_OverrideSubterm(&conclusion,6,&substitutions[29])){ goto RULE_104; }
+Truth conclusionTruth = Truth_Analogy(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_104:
+{
+if(!doublePremise) { goto RULE_105; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_105; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_105; }
+substitutions[32] = subtree;
+if(term1.atoms[2] != 41){ goto RULE_105; }
+subtree = Term_ExtractSubterm(&term1, 5);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_105; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 6);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_105; }
+substitutions[29] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_105; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_105; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_105; }
+substitutions[30] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[32])){ goto RULE_105; }
+conclusion.atoms[2] = 41;
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[28])){ goto RULE_105; }
+if(!Term_OverrideSubterm(&conclusion,6,&substitutions[30])){ goto RULE_105; }
+Truth conclusionTruth = Truth_Deduction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_105:
+{
+if(!doublePremise) { goto RULE_106; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_106; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_106; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_106; }
+substitutions[30] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_106; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_106; }
+substitutions[32] = subtree;
+if(term2.atoms[2] != 41){ goto RULE_106; }
+subtree = Term_ExtractSubterm(&term2, 5);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_106; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 6);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_106; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[32])){ goto RULE_106; }
+conclusion.atoms[2] = 41;
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[28])){ goto RULE_106; }
+if(!Term_OverrideSubterm(&conclusion,6,&substitutions[30])){ goto RULE_106; }
+Truth conclusionTruth = Truth_Deduction(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_106:
+{
+if(!doublePremise) { goto RULE_107; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_107; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_107; }
+substitutions[32] = subtree;
+if(term1.atoms[2] != 41){ goto RULE_107; }
+subtree = Term_ExtractSubterm(&term1, 5);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_107; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 6);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_107; }
+substitutions[29] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_107; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_107; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_107; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[32])){ goto RULE_107; }
+conclusion.atoms[2] = 41;
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[28])){ goto RULE_107; }
+if(!Term_OverrideSubterm(&conclusion,6,&substitutions[30])){ goto RULE_107; }
+Truth conclusionTruth = Truth_Abduction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_107:
+{
+if(!doublePremise) { goto RULE_108; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_108; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_108; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_108; }
+substitutions[29] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_108; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_108; }
+substitutions[32] = subtree;
+if(term2.atoms[2] != 41){ goto RULE_108; }
+subtree = Term_ExtractSubterm(&term2, 5);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_108; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 6);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_108; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[32])){ goto RULE_108; }
+conclusion.atoms[2] = 41;
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[28])){ goto RULE_108; }
+if(!Term_OverrideSubterm(&conclusion,6,&substitutions[30])){ goto RULE_108; }
+Truth conclusionTruth = Truth_Abduction(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_108:
+{
+if(!doublePremise) { goto RULE_109; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_109; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_109; }
+substitutions[32] = subtree;
+if(term1.atoms[2] != 41){ goto RULE_109; }
+subtree = Term_ExtractSubterm(&term1, 5);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_109; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 6);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_109; }
+substitutions[29] = subtree;
+if(term2.atoms[0] != 46){ goto RULE_109; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_109; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_109; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[32])){ goto RULE_109; }
+conclusion.atoms[2] = 41;
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[28])){ goto RULE_109; }
+if(!Term_OverrideSubterm(&conclusion,6,&substitutions[30])){ goto RULE_109; }
+Truth conclusionTruth = Truth_Analogy(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_109:
+{
+if(!doublePremise) { goto RULE_110; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 46){ goto RULE_110; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_110; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_110; }
+substitutions[29] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_110; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_110; }
+substitutions[32] = subtree;
+if(term2.atoms[2] != 41){ goto RULE_110; }
+subtree = Term_ExtractSubterm(&term2, 5);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_110; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 6);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_110; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[32])){ goto RULE_110; }
+conclusion.atoms[2] = 41;
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[28])){ goto RULE_110; }
+if(!Term_OverrideSubterm(&conclusion,6,&substitutions[30])){ goto RULE_110; }
+Truth conclusionTruth = Truth_Analogy(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_110:
+{
+if(!doublePremise) { goto RULE_111; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_111; }
+if(term1.atoms[1] != 41){ goto RULE_111; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_111; }
+substitutions[32] = subtree;
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_111; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_111; }
+substitutions[29] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_111; }
+if(term2.atoms[1] != 41){ goto RULE_111; }
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_111; }
+substitutions[32] = subtree;
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_111; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term2, 4);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_111; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 46;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[28])){ goto RULE_111; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[30])){ goto RULE_111; }
+Truth conclusionTruth = Truth_Comparison(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_111:
+{
+if(!doublePremise) { goto RULE_112; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_112; }
+if(term1.atoms[1] != 41){ goto RULE_112; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_112; }
+substitutions[32] = subtree;
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_112; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_112; }
+substitutions[29] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_112; }
+if(term2.atoms[1] != 41){ goto RULE_112; }
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_112; }
+substitutions[32] = subtree;
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_112; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 4);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_112; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 46;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[28])){ goto RULE_112; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[30])){ goto RULE_112; }
+Truth conclusionTruth = Truth_Comparison(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_112:
+{
+if(!doublePremise) { goto RULE_113; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_113; }
+if(term1.atoms[1] != 41){ goto RULE_113; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_113; }
+substitutions[32] = subtree;
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_113; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_113; }
+substitutions[29] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_113; }
+if(term2.atoms[1] != 41){ goto RULE_113; }
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_113; }
+substitutions[32] = subtree;
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_113; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 4);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_113; }
+substitutions[30] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 46;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[29])){ goto RULE_113; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[30])){ goto RULE_113; }
+Truth conclusionTruth = Truth_Comparison(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_113:
+{
+if(!doublePremise) { goto RULE_114; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_114; }
+if(term1.atoms[1] != 41){ goto RULE_114; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_114; }
+substitutions[32] = subtree;
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_114; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_114; }
+substitutions[30] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_114; }
+if(term2.atoms[1] != 41){ goto RULE_114; }
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_114; }
+substitutions[32] = subtree;
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_114; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 4);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_114; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 46;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[29])){ goto RULE_114; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[30])){ goto RULE_114; }
+Truth conclusionTruth = Truth_Comparison(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_114:
+{
+if(!doublePremise) { goto RULE_115; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_115; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_115; }
+substitutions[32] = subtree;
+if(term1.atoms[2] != 41){ goto RULE_115; }
+subtree = Term_ExtractSubterm(&term1, 5);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_115; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 6);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_115; }
+substitutions[29] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_115; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_115; }
+substitutions[32] = subtree;
+if(term2.atoms[2] != 41){ goto RULE_115; }
+subtree = Term_ExtractSubterm(&term2, 5);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_115; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term2, 6);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_115; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 46;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[28])){ goto RULE_115; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[30])){ goto RULE_115; }
+Truth conclusionTruth = Truth_Comparison(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_115:
+{
+if(!doublePremise) { goto RULE_116; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_116; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_116; }
+substitutions[32] = subtree;
+if(term1.atoms[2] != 41){ goto RULE_116; }
+subtree = Term_ExtractSubterm(&term1, 5);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_116; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term1, 6);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_116; }
+substitutions[29] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_116; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_116; }
+substitutions[32] = subtree;
+if(term2.atoms[2] != 41){ goto RULE_116; }
+subtree = Term_ExtractSubterm(&term2, 5);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_116; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 6);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_116; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 46;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[28])){ goto RULE_116; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[30])){ goto RULE_116; }
+Truth conclusionTruth = Truth_Comparison(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_116:
+{
+if(!doublePremise) { goto RULE_117; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_117; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_117; }
+substitutions[32] = subtree;
+if(term1.atoms[2] != 41){ goto RULE_117; }
+subtree = Term_ExtractSubterm(&term1, 5);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_117; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 6);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_117; }
+substitutions[29] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_117; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_117; }
+substitutions[32] = subtree;
+if(term2.atoms[2] != 41){ goto RULE_117; }
+subtree = Term_ExtractSubterm(&term2, 5);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_117; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 6);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_117; }
+substitutions[30] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 46;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[29])){ goto RULE_117; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[30])){ goto RULE_117; }
+Truth conclusionTruth = Truth_Comparison(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_117:
+{
+if(!doublePremise) { goto RULE_118; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_118; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_118; }
+substitutions[32] = subtree;
+if(term1.atoms[2] != 41){ goto RULE_118; }
+subtree = Term_ExtractSubterm(&term1, 5);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_118; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 6);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_118; }
+substitutions[30] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_118; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_118; }
+substitutions[32] = subtree;
+if(term2.atoms[2] != 41){ goto RULE_118; }
+subtree = Term_ExtractSubterm(&term2, 5);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_118; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 6);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_118; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 46;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[29])){ goto RULE_118; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[30])){ goto RULE_118; }
+Truth conclusionTruth = Truth_Comparison(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_118:
+{
+if(doublePremise) { goto RULE_119; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 58){ goto RULE_119; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_119; }
+substitutions[28] = subtree;
+if(term1.atoms[2] != 40){ goto RULE_119; }
+Term conclusion = {0};
+if(!Term_OverrideSubterm(&conclusion,0,&substitutions[28])){ goto RULE_119; }
+Truth conclusionTruth = Truth_Negation(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_119:
+{
+if(doublePremise) { goto RULE_120; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 44){ goto RULE_120; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_120; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_120; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+if(!Term_OverrideSubterm(&conclusion,0,&substitutions[28])){ goto RULE_120; }
+Truth conclusionTruth = Truth_StructuralDeduction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_120:
+{
+if(doublePremise) { goto RULE_121; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 44){ goto RULE_121; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_121; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_121; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+if(!Term_OverrideSubterm(&conclusion,0,&substitutions[29])){ goto RULE_121; }
+Truth conclusionTruth = Truth_StructuralDeduction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_121:
+{
+if(doublePremise) { goto RULE_122; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 44){ goto RULE_122; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_122; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_122; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 44;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[29])){ goto RULE_122; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[28])){ goto RULE_122; }
+Truth conclusionTruth = Truth_StructuralIntersection(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_122:
+{
+if(!doublePremise) { goto RULE_123; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+subtree = Term_ExtractSubterm(&term1, 0);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_123; }
+substitutions[33] = subtree;
+if(term2.atoms[0] != 44){ goto RULE_123; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_123; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_123; }
+substitutions[28] = subtree;
+Term conclusion = {0};
+if(!Term_OverrideSubterm(&conclusion,0,&substitutions[28])){ goto RULE_123; }
+Truth conclusionTruth = Truth_DecomposePNN(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_123:
+{
+if(!doublePremise) { goto RULE_124; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 44){ goto RULE_124; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_124; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_124; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 0);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_124; }
+substitutions[33] = subtree;
+Term conclusion = {0};
+if(!Term_OverrideSubterm(&conclusion,0,&substitutions[28])){ goto RULE_124; }
+Truth conclusionTruth = Truth_DecomposePNN(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_124:
+{
+if(!doublePremise) { goto RULE_125; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+subtree = Term_ExtractSubterm(&term1, 0);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_125; }
+substitutions[33] = subtree;
+if(term2.atoms[0] != 61){ goto RULE_125; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_125; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_125; }
+substitutions[28] = subtree;
+Term conclusion = {0};
+if(!Term_OverrideSubterm(&conclusion,0,&substitutions[28])){ goto RULE_125; }
+Truth conclusionTruth = Truth_DecomposeNPP(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_125:
+{
+if(!doublePremise) { goto RULE_126; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 61){ goto RULE_126; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_126; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_126; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 0);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_126; }
+substitutions[33] = subtree;
+Term conclusion = {0};
+if(!Term_OverrideSubterm(&conclusion,0,&substitutions[28])){ goto RULE_126; }
+Truth conclusionTruth = Truth_DecomposeNPP(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_126:
+{
+if(!doublePremise) { goto RULE_127; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+subtree = Term_ExtractSubterm(&term1, 0);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_127; }
+substitutions[33] = subtree;
+if(term2.atoms[0] != 44){ goto RULE_127; }
+if(term2.atoms[1] != 58){ goto RULE_127; }
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_127; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_127; }
+substitutions[33] = subtree;
+if(term2.atoms[4] != 40){ goto RULE_127; }
+Term conclusion = {0};
+if(!Term_OverrideSubterm(&conclusion,0,&substitutions[28])){ goto RULE_127; }
+Truth conclusionTruth = Truth_DecomposeNNN(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_127:
+{
+if(!doublePremise) { goto RULE_128; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 44){ goto RULE_128; }
+if(term1.atoms[1] != 58){ goto RULE_128; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_128; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_128; }
+substitutions[33] = subtree;
+if(term1.atoms[4] != 40){ goto RULE_128; }
+subtree = Term_ExtractSubterm(&term2, 0);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_128; }
+substitutions[33] = subtree;
+Term conclusion = {0};
+if(!Term_OverrideSubterm(&conclusion,0,&substitutions[28])){ goto RULE_128; }
+Truth conclusionTruth = Truth_DecomposeNNN(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_128:
+{
+if(!doublePremise) { goto RULE_129; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+subtree = Term_ExtractSubterm(&term1, 0);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_129; }
+substitutions[33] = subtree;
+if(term2.atoms[0] != 61){ goto RULE_129; }
+if(term2.atoms[1] != 58){ goto RULE_129; }
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_129; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_129; }
+substitutions[33] = subtree;
+if(term2.atoms[4] != 40){ goto RULE_129; }
+Term conclusion = {0};
+if(!Term_OverrideSubterm(&conclusion,0,&substitutions[28])){ goto RULE_129; }
+Truth conclusionTruth = Truth_DecomposePPP(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_129:
+{
+if(!doublePremise) { goto RULE_130; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 61){ goto RULE_130; }
+if(term1.atoms[1] != 58){ goto RULE_130; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_130; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_130; }
+substitutions[33] = subtree;
+if(term1.atoms[4] != 40){ goto RULE_130; }
+subtree = Term_ExtractSubterm(&term2, 0);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_130; }
+substitutions[33] = subtree;
+Term conclusion = {0};
+if(!Term_OverrideSubterm(&conclusion,0,&substitutions[28])){ goto RULE_130; }
+Truth conclusionTruth = Truth_DecomposePPP(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_130:
+{
+if(!doublePremise) { goto RULE_131; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 59){ goto RULE_131; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_131; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_131; }
+substitutions[31] = subtree;
+if(term2.atoms[0] != 59){ goto RULE_131; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_131; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_131; }
+substitutions[34] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 59;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[33])){ goto RULE_131; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[34])){ goto RULE_131; }
+Truth conclusionTruth = Truth_Deduction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_131:
+{
+if(!doublePremise) { goto RULE_132; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 59){ goto RULE_132; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_132; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_132; }
+substitutions[34] = subtree;
+if(term2.atoms[0] != 59){ goto RULE_132; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_132; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_132; }
+substitutions[31] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 59;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[33])){ goto RULE_132; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[34])){ goto RULE_132; }
+Truth conclusionTruth = Truth_Deduction(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_132:
+{
+if(!doublePremise) { goto RULE_133; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 59){ goto RULE_133; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_133; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_133; }
+substitutions[29] = subtree;
+if(term2.atoms[0] != 59){ goto RULE_133; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_133; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_133; }
+substitutions[30] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 59;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[30])){ goto RULE_133; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[29])){ goto RULE_133; }
+Truth conclusionTruth = Truth_Induction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_133:
+{
+if(!doublePremise) { goto RULE_134; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 59){ goto RULE_134; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_134; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_134; }
+substitutions[30] = subtree;
+if(term2.atoms[0] != 59){ goto RULE_134; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_134; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_134; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 59;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[30])){ goto RULE_134; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[29])){ goto RULE_134; }
+Truth conclusionTruth = Truth_Induction(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_134:
+{
+if(!doublePremise) { goto RULE_135; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 59){ goto RULE_135; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_135; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_135; }
+substitutions[30] = subtree;
+if(term2.atoms[0] != 59){ goto RULE_135; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_135; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_135; }
+substitutions[30] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 59;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[29])){ goto RULE_135; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[28])){ goto RULE_135; }
+Truth conclusionTruth = Truth_Abduction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_135:
+{
+if(!doublePremise) { goto RULE_136; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 59){ goto RULE_136; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_136; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_136; }
+substitutions[30] = subtree;
+if(term2.atoms[0] != 59){ goto RULE_136; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_136; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_136; }
+substitutions[30] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 59;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[29])){ goto RULE_136; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[28])){ goto RULE_136; }
+Truth conclusionTruth = Truth_Abduction(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_136:
+{
+if(!doublePremise) { goto RULE_137; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 59){ goto RULE_137; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_137; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_137; }
+substitutions[29] = subtree;
+if(term2.atoms[0] != 59){ goto RULE_137; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_137; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_137; }
+substitutions[30] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 59;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[30])){ goto RULE_137; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[28])){ goto RULE_137; }
+Truth conclusionTruth = Truth_Exemplification(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_137:
+{
+if(!doublePremise) { goto RULE_138; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 59){ goto RULE_138; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_138; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_138; }
+substitutions[30] = subtree;
+if(term2.atoms[0] != 59){ goto RULE_138; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_138; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_138; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 59;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[30])){ goto RULE_138; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[28])){ goto RULE_138; }
+Truth conclusionTruth = Truth_Exemplification(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_138:
+{
+if(!doublePremise) { goto RULE_139; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 59){ goto RULE_139; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_139; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_139; }
+substitutions[30] = subtree;
+if(term2.atoms[0] != 59){ goto RULE_139; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_139; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_139; }
+substitutions[30] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 59;
+conclusion.atoms[1] = 44;
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[30])){ goto RULE_139; }
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[28])){ goto RULE_139; }
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[29])){ goto RULE_139; }
+Truth conclusionTruth = Truth_Union(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_139:
+{
+if(!doublePremise) { goto RULE_140; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 59){ goto RULE_140; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_140; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_140; }
+substitutions[30] = subtree;
+if(term2.atoms[0] != 59){ goto RULE_140; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_140; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_140; }
+substitutions[30] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 59;
+conclusion.atoms[1] = 44;
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[30])){ goto RULE_140; }
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[28])){ goto RULE_140; }
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[29])){ goto RULE_140; }
+Truth conclusionTruth = Truth_Union(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_140:
+{
+if(!doublePremise) { goto RULE_141; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 59){ goto RULE_141; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_141; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_141; }
+substitutions[30] = subtree;
+if(term2.atoms[0] != 59){ goto RULE_141; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_141; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_141; }
+substitutions[30] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 59;
+conclusion.atoms[1] = 61;
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[30])){ goto RULE_141; }
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[28])){ goto RULE_141; }
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[29])){ goto RULE_141; }
+Truth conclusionTruth = Truth_Intersection(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_141:
+{
+if(!doublePremise) { goto RULE_142; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 59){ goto RULE_142; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_142; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_142; }
+substitutions[30] = subtree;
+if(term2.atoms[0] != 59){ goto RULE_142; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_142; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_142; }
+substitutions[30] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 59;
+conclusion.atoms[1] = 61;
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[30])){ goto RULE_142; }
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[28])){ goto RULE_142; }
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[29])){ goto RULE_142; }
+Truth conclusionTruth = Truth_Intersection(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_142:
+{
+if(!doublePremise) { goto RULE_143; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 59){ goto RULE_143; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_143; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_143; }
+substitutions[28] = subtree;
+if(term2.atoms[0] != 59){ goto RULE_143; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_143; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_143; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 59;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[30])){ goto RULE_143; }
+conclusion.atoms[2] = 44;
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[28])){ goto RULE_143; }
+if(!Term_OverrideSubterm(&conclusion,6,&substitutions[29])){ goto RULE_143; }
+Truth conclusionTruth = Truth_Intersection(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_143:
+{
+if(!doublePremise) { goto RULE_144; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 59){ goto RULE_144; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_144; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_144; }
+substitutions[29] = subtree;
+if(term2.atoms[0] != 59){ goto RULE_144; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_144; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_144; }
+substitutions[28] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 59;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[30])){ goto RULE_144; }
+conclusion.atoms[2] = 44;
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[28])){ goto RULE_144; }
+if(!Term_OverrideSubterm(&conclusion,6,&substitutions[29])){ goto RULE_144; }
+Truth conclusionTruth = Truth_Intersection(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_144:
+{
+if(!doublePremise) { goto RULE_145; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 59){ goto RULE_145; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_145; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_145; }
+substitutions[28] = subtree;
+if(term2.atoms[0] != 59){ goto RULE_145; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_145; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_145; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 59;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[30])){ goto RULE_145; }
+conclusion.atoms[2] = 61;
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[28])){ goto RULE_145; }
+if(!Term_OverrideSubterm(&conclusion,6,&substitutions[29])){ goto RULE_145; }
+Truth conclusionTruth = Truth_Union(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_145:
+{
+if(!doublePremise) { goto RULE_146; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 59){ goto RULE_146; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_146; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_146; }
+substitutions[29] = subtree;
+if(term2.atoms[0] != 59){ goto RULE_146; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_146; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_146; }
+substitutions[28] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 59;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[30])){ goto RULE_146; }
+conclusion.atoms[2] = 61;
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[28])){ goto RULE_146; }
+if(!Term_OverrideSubterm(&conclusion,6,&substitutions[29])){ goto RULE_146; }
+Truth conclusionTruth = Truth_Union(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_146:
+{
+if(!doublePremise) { goto RULE_147; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 59){ goto RULE_147; }
+if(term1.atoms[1] != 44){ goto RULE_147; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_147; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_147; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_147; }
+substitutions[34] = subtree;
+if(term2.atoms[0] != 59){ goto RULE_147; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_147; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_147; }
+substitutions[31] = subtree;
+Term conclusion = {0};
+if(!Term_OverrideSubterm(&conclusion,0,&substitutions[34])){ goto RULE_147; }
+Truth conclusionTruth = Truth_Abduction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_147:
+{
+if(!doublePremise) { goto RULE_148; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 59){ goto RULE_148; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_148; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_148; }
+substitutions[31] = subtree;
+if(term2.atoms[0] != 59){ goto RULE_148; }
+if(term2.atoms[1] != 44){ goto RULE_148; }
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_148; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_148; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term2, 4);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_148; }
+substitutions[34] = subtree;
+Term conclusion = {0};
+if(!Term_OverrideSubterm(&conclusion,0,&substitutions[34])){ goto RULE_148; }
+Truth conclusionTruth = Truth_Abduction(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_148:
+{
+if(!doublePremise) { goto RULE_149; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 59){ goto RULE_149; }
+if(term1.atoms[1] != 44){ goto RULE_149; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_149; }
+substitutions[34] = subtree;
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_149; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_149; }
+substitutions[31] = subtree;
+if(term2.atoms[0] != 59){ goto RULE_149; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_149; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_149; }
+substitutions[31] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 59;
+conclusion.atoms[1] = 44;
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[34])){ goto RULE_149; }
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[30])){ goto RULE_149; }
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[33])){ goto RULE_149; }
+Truth conclusionTruth = Truth_Deduction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_149:
+{
+if(!doublePremise) { goto RULE_150; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 59){ goto RULE_150; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_150; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_150; }
+substitutions[31] = subtree;
+if(term2.atoms[0] != 59){ goto RULE_150; }
+if(term2.atoms[1] != 44){ goto RULE_150; }
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_150; }
+substitutions[34] = subtree;
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_150; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term2, 4);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_150; }
+substitutions[31] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 59;
+conclusion.atoms[1] = 44;
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[34])){ goto RULE_150; }
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[30])){ goto RULE_150; }
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[33])){ goto RULE_150; }
+Truth conclusionTruth = Truth_Deduction(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_150:
+{
+if(!doublePremise) { goto RULE_151; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 59){ goto RULE_151; }
+if(term1.atoms[1] != 44){ goto RULE_151; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_151; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_151; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_151; }
+substitutions[34] = subtree;
+if(term2.atoms[0] != 59){ goto RULE_151; }
+if(term2.atoms[1] != 44){ goto RULE_151; }
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_151; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_151; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term2, 4);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_151; }
+substitutions[33] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 59;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[33])){ goto RULE_151; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[34])){ goto RULE_151; }
+Truth conclusionTruth = Truth_Abduction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_151:
+{
+if(!doublePremise) { goto RULE_152; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 59){ goto RULE_152; }
+if(term1.atoms[1] != 44){ goto RULE_152; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_152; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_152; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_152; }
+substitutions[33] = subtree;
+if(term2.atoms[0] != 59){ goto RULE_152; }
+if(term2.atoms[1] != 44){ goto RULE_152; }
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_152; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_152; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term2, 4);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_152; }
+substitutions[34] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 59;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[33])){ goto RULE_152; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[34])){ goto RULE_152; }
+Truth conclusionTruth = Truth_Abduction(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_152:
+{
+if(!doublePremise) { goto RULE_153; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 59){ goto RULE_153; }
+if(term1.atoms[1] != 44){ goto RULE_153; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_153; }
+substitutions[34] = subtree;
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_153; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_153; }
+substitutions[31] = subtree;
+if(term2.atoms[0] != 59){ goto RULE_153; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_153; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_153; }
+substitutions[33] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 59;
+conclusion.atoms[1] = 44;
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[34])){ goto RULE_153; }
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[30])){ goto RULE_153; }
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[33])){ goto RULE_153; }
+Truth conclusionTruth = Truth_Induction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_153:
+{
+if(!doublePremise) { goto RULE_154; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 59){ goto RULE_154; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_154; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_154; }
+substitutions[33] = subtree;
+if(term2.atoms[0] != 59){ goto RULE_154; }
+if(term2.atoms[1] != 44){ goto RULE_154; }
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_154; }
+substitutions[34] = subtree;
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_154; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term2, 4);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_154; }
+substitutions[31] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 59;
+conclusion.atoms[1] = 44;
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[34])){ goto RULE_154; }
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[30])){ goto RULE_154; }
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[33])){ goto RULE_154; }
+Truth conclusionTruth = Truth_Induction(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_154:
+{
+if(doublePremise) { goto RULE_155; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 60){ goto RULE_155; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_155; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_155; }
+substitutions[34] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 60;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[34])){ goto RULE_155; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[33])){ goto RULE_155; }
+Truth conclusionTruth = Truth_StructuralIntersection(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_155:
+{
+if(!doublePremise) { goto RULE_156; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 59){ goto RULE_156; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_156; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_156; }
+substitutions[34] = subtree;
+if(term2.atoms[0] != 59){ goto RULE_156; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_156; }
+substitutions[34] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_156; }
+substitutions[33] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 60;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[33])){ goto RULE_156; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[34])){ goto RULE_156; }
+Truth conclusionTruth = Truth_Intersection(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_156:
+{
+if(!doublePremise) { goto RULE_157; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 59){ goto RULE_157; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_157; }
+substitutions[34] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_157; }
+substitutions[33] = subtree;
+if(term2.atoms[0] != 59){ goto RULE_157; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_157; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_157; }
+substitutions[34] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 60;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[33])){ goto RULE_157; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[34])){ goto RULE_157; }
+Truth conclusionTruth = Truth_Intersection(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_157:
+{
+if(!doublePremise) { goto RULE_158; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 59){ goto RULE_158; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_158; }
+substitutions[34] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_158; }
+substitutions[31] = subtree;
+if(term2.atoms[0] != 59){ goto RULE_158; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_158; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_158; }
+substitutions[31] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 60;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[33])){ goto RULE_158; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[34])){ goto RULE_158; }
+Truth conclusionTruth = Truth_Comparison(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_158:
+{
+if(!doublePremise) { goto RULE_159; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 59){ goto RULE_159; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_159; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_159; }
+substitutions[31] = subtree;
+if(term2.atoms[0] != 59){ goto RULE_159; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_159; }
+substitutions[34] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_159; }
+substitutions[31] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 60;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[33])){ goto RULE_159; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[34])){ goto RULE_159; }
+Truth conclusionTruth = Truth_Comparison(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_159:
+{
+if(!doublePremise) { goto RULE_160; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 59){ goto RULE_160; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_160; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_160; }
+substitutions[34] = subtree;
+if(term2.atoms[0] != 59){ goto RULE_160; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_160; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_160; }
+substitutions[33] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 60;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[33])){ goto RULE_160; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[34])){ goto RULE_160; }
+Truth conclusionTruth = Truth_Comparison(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_160:
+{
+if(!doublePremise) { goto RULE_161; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 59){ goto RULE_161; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_161; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_161; }
+substitutions[33] = subtree;
+if(term2.atoms[0] != 59){ goto RULE_161; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_161; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_161; }
+substitutions[34] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 60;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[33])){ goto RULE_161; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[34])){ goto RULE_161; }
+Truth conclusionTruth = Truth_Comparison(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_161:
+{
+if(!doublePremise) { goto RULE_162; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 59){ goto RULE_162; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_162; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_162; }
+substitutions[34] = subtree;
+if(term2.atoms[0] != 60){ goto RULE_162; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_162; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_162; }
+substitutions[31] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 59;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[33])){ goto RULE_162; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[34])){ goto RULE_162; }
+Truth conclusionTruth = Truth_Analogy(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_162:
+{
+if(!doublePremise) { goto RULE_163; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 60){ goto RULE_163; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_163; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_163; }
+substitutions[31] = subtree;
+if(term2.atoms[0] != 59){ goto RULE_163; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_163; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_163; }
+substitutions[34] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 59;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[33])){ goto RULE_163; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[34])){ goto RULE_163; }
+Truth conclusionTruth = Truth_Analogy(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_163:
+{
+if(!doublePremise) { goto RULE_164; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 59){ goto RULE_164; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_164; }
+substitutions[34] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_164; }
+substitutions[31] = subtree;
+if(term2.atoms[0] != 60){ goto RULE_164; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_164; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_164; }
+substitutions[31] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 59;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[34])){ goto RULE_164; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[33])){ goto RULE_164; }
+Truth conclusionTruth = Truth_Analogy(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_164:
+{
+if(!doublePremise) { goto RULE_165; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 60){ goto RULE_165; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_165; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_165; }
+substitutions[31] = subtree;
+if(term2.atoms[0] != 59){ goto RULE_165; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_165; }
+substitutions[34] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_165; }
+substitutions[31] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 59;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[34])){ goto RULE_165; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[33])){ goto RULE_165; }
+Truth conclusionTruth = Truth_Analogy(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_165:
+{
+if(!doublePremise) { goto RULE_166; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 60){ goto RULE_166; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_166; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_166; }
+substitutions[34] = subtree;
+if(term2.atoms[0] != 60){ goto RULE_166; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_166; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_166; }
+substitutions[31] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 60;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[33])){ goto RULE_166; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[34])){ goto RULE_166; }
+Truth conclusionTruth = Truth_Resemblance(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_166:
+{
+if(!doublePremise) { goto RULE_167; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 60){ goto RULE_167; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_167; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_167; }
+substitutions[31] = subtree;
+if(term2.atoms[0] != 60){ goto RULE_167; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_167; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_167; }
+substitutions[34] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 60;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[33])){ goto RULE_167; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[34])){ goto RULE_167; }
+Truth conclusionTruth = Truth_Resemblance(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_167:
+{
+if(doublePremise) { goto RULE_168; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 60){ goto RULE_168; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_168; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_168; }
+substitutions[34] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 59;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[31])){ goto RULE_168; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[34])){ goto RULE_168; }
+Truth conclusionTruth = Truth_StructuralDeduction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_168:
+{
+if(doublePremise) { goto RULE_169; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 60){ goto RULE_169; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_169; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[34].atoms[0]!=0 && !Term_Equal(&substitutions[34], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_169; }
+substitutions[34] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 59;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[34])){ goto RULE_169; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[31])){ goto RULE_169; }
+Truth conclusionTruth = Truth_StructuralDeduction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 0, false, eternalize);}
+RULE_169:
+{
+if(!doublePremise) { goto RULE_170; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_170; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_170; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_170; }
+substitutions[28] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_170; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_170; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_170; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 59;
+conclusion.atoms[1] = 45;
+conclusion.atoms[2] = 45;
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[30])){ goto RULE_170; }
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[29])){ goto RULE_170; }
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[30])){ goto RULE_170; }
+if(!Term_OverrideSubterm(&conclusion,6,&substitutions[28])){ goto RULE_170; }
+Truth conclusionTruth = Truth_Induction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 1, false, eternalize);}
+RULE_170:
+{
+if(!doublePremise) { goto RULE_171; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_171; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_171; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_171; }
+substitutions[29] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_171; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_171; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_171; }
+substitutions[28] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 59;
+conclusion.atoms[1] = 45;
+conclusion.atoms[2] = 45;
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[30])){ goto RULE_171; }
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[29])){ goto RULE_171; }
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[30])){ goto RULE_171; }
+if(!Term_OverrideSubterm(&conclusion,6,&substitutions[28])){ goto RULE_171; }
+Truth conclusionTruth = Truth_Induction(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 1, false, eternalize);}
+RULE_171:
+{
+if(!doublePremise) { goto RULE_172; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_172; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_172; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_172; }
+substitutions[30] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_172; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_172; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_172; }
+substitutions[30] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 59;
+conclusion.atoms[1] = 45;
+conclusion.atoms[2] = 45;
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[29])){ goto RULE_172; }
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[30])){ goto RULE_172; }
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[28])){ goto RULE_172; }
+if(!Term_OverrideSubterm(&conclusion,6,&substitutions[30])){ goto RULE_172; }
+Truth conclusionTruth = Truth_Induction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 1, false, eternalize);}
+RULE_172:
+{
+if(!doublePremise) { goto RULE_173; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_173; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_173; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_173; }
+substitutions[30] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_173; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_173; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_173; }
+substitutions[30] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 59;
+conclusion.atoms[1] = 45;
+conclusion.atoms[2] = 45;
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[29])){ goto RULE_173; }
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[30])){ goto RULE_173; }
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[28])){ goto RULE_173; }
+if(!Term_OverrideSubterm(&conclusion,6,&substitutions[30])){ goto RULE_173; }
+Truth conclusionTruth = Truth_Induction(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 1, false, eternalize);}
+RULE_173:
+{
+if(!doublePremise) { goto RULE_174; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_174; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_174; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_174; }
+substitutions[28] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_174; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_174; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_174; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 60;
+conclusion.atoms[1] = 45;
+conclusion.atoms[2] = 45;
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[30])){ goto RULE_174; }
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[29])){ goto RULE_174; }
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[30])){ goto RULE_174; }
+if(!Term_OverrideSubterm(&conclusion,6,&substitutions[28])){ goto RULE_174; }
+Truth conclusionTruth = Truth_Comparison(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 1, false, eternalize);}
+RULE_174:
+{
+if(!doublePremise) { goto RULE_175; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_175; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_175; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_175; }
+substitutions[29] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_175; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_175; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_175; }
+substitutions[28] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 60;
+conclusion.atoms[1] = 45;
+conclusion.atoms[2] = 45;
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[30])){ goto RULE_175; }
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[29])){ goto RULE_175; }
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[30])){ goto RULE_175; }
+if(!Term_OverrideSubterm(&conclusion,6,&substitutions[28])){ goto RULE_175; }
+Truth conclusionTruth = Truth_Comparison(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 1, false, eternalize);}
+RULE_175:
+{
+if(!doublePremise) { goto RULE_176; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_176; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_176; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_176; }
+substitutions[30] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_176; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_176; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_176; }
+substitutions[30] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 60;
+conclusion.atoms[1] = 45;
+conclusion.atoms[2] = 45;
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[29])){ goto RULE_176; }
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[30])){ goto RULE_176; }
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[28])){ goto RULE_176; }
+if(!Term_OverrideSubterm(&conclusion,6,&substitutions[30])){ goto RULE_176; }
+Truth conclusionTruth = Truth_Comparison(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 1, false, eternalize);}
+RULE_176:
+{
+if(!doublePremise) { goto RULE_177; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_177; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_177; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_177; }
+substitutions[30] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_177; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_177; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_177; }
+substitutions[30] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 60;
+conclusion.atoms[1] = 45;
+conclusion.atoms[2] = 45;
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[29])){ goto RULE_177; }
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[30])){ goto RULE_177; }
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[28])){ goto RULE_177; }
+if(!Term_OverrideSubterm(&conclusion,6,&substitutions[30])){ goto RULE_177; }
+Truth conclusionTruth = Truth_Comparison(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 1, false, eternalize);}
+RULE_177:
+{
+if(!doublePremise) { goto RULE_178; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 58){ goto RULE_178; }
+if(term1.atoms[1] != 45){ goto RULE_178; }
+if(term1.atoms[2] != 40){ goto RULE_178; }
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_178; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_178; }
+substitutions[28] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_178; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_178; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_178; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 59;
+conclusion.atoms[1] = 45;
+conclusion.atoms[2] = 58;
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[30])){ goto RULE_178; }
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[29])){ goto RULE_178; }
+conclusion.atoms[5] = 45;
+conclusion.atoms[6] = 40;
+if(!Term_OverrideSubterm(&conclusion,11,&substitutions[30])){ goto RULE_178; }
+if(!Term_OverrideSubterm(&conclusion,12,&substitutions[28])){ goto RULE_178; }
+Truth conclusionTruth = Truth_Induction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 1, false, eternalize);}
+RULE_178:
+{
+if(!doublePremise) { goto RULE_179; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_179; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_179; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_179; }
+substitutions[29] = subtree;
+if(term2.atoms[0] != 58){ goto RULE_179; }
+if(term2.atoms[1] != 45){ goto RULE_179; }
+if(term2.atoms[2] != 40){ goto RULE_179; }
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_179; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term2, 4);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_179; }
+substitutions[28] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 59;
+conclusion.atoms[1] = 45;
+conclusion.atoms[2] = 58;
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[30])){ goto RULE_179; }
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[29])){ goto RULE_179; }
+conclusion.atoms[5] = 45;
+conclusion.atoms[6] = 40;
+if(!Term_OverrideSubterm(&conclusion,11,&substitutions[30])){ goto RULE_179; }
+if(!Term_OverrideSubterm(&conclusion,12,&substitutions[28])){ goto RULE_179; }
+Truth conclusionTruth = Truth_Induction(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 1, false, eternalize);}
+RULE_179:
+{
+if(!doublePremise) { goto RULE_180; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 58){ goto RULE_180; }
+if(term1.atoms[1] != 45){ goto RULE_180; }
+if(term1.atoms[2] != 40){ goto RULE_180; }
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_180; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_180; }
+substitutions[30] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_180; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_180; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_180; }
+substitutions[30] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 59;
+conclusion.atoms[1] = 45;
+conclusion.atoms[2] = 58;
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[29])){ goto RULE_180; }
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[30])){ goto RULE_180; }
+conclusion.atoms[5] = 45;
+conclusion.atoms[6] = 40;
+if(!Term_OverrideSubterm(&conclusion,11,&substitutions[28])){ goto RULE_180; }
+if(!Term_OverrideSubterm(&conclusion,12,&substitutions[30])){ goto RULE_180; }
+Truth conclusionTruth = Truth_Induction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 1, false, eternalize);}
+RULE_180:
+{
+if(!doublePremise) { goto RULE_181; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_181; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_181; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_181; }
+substitutions[30] = subtree;
+if(term2.atoms[0] != 58){ goto RULE_181; }
+if(term2.atoms[1] != 45){ goto RULE_181; }
+if(term2.atoms[2] != 40){ goto RULE_181; }
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_181; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 4);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_181; }
+substitutions[30] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 59;
+conclusion.atoms[1] = 45;
+conclusion.atoms[2] = 58;
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[29])){ goto RULE_181; }
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[30])){ goto RULE_181; }
+conclusion.atoms[5] = 45;
+conclusion.atoms[6] = 40;
+if(!Term_OverrideSubterm(&conclusion,11,&substitutions[28])){ goto RULE_181; }
+if(!Term_OverrideSubterm(&conclusion,12,&substitutions[30])){ goto RULE_181; }
+Truth conclusionTruth = Truth_Induction(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 1, false, eternalize);}
+RULE_181:
+{
+if(!doublePremise) { goto RULE_182; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 58){ goto RULE_182; }
+if(term1.atoms[1] != 45){ goto RULE_182; }
+if(term1.atoms[2] != 40){ goto RULE_182; }
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_182; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_182; }
+substitutions[28] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_182; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_182; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_182; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 60;
+conclusion.atoms[1] = 45;
+conclusion.atoms[2] = 58;
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[30])){ goto RULE_182; }
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[29])){ goto RULE_182; }
+conclusion.atoms[5] = 45;
+conclusion.atoms[6] = 40;
+if(!Term_OverrideSubterm(&conclusion,11,&substitutions[30])){ goto RULE_182; }
+if(!Term_OverrideSubterm(&conclusion,12,&substitutions[28])){ goto RULE_182; }
+Truth conclusionTruth = Truth_Comparison(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 1, false, eternalize);}
+RULE_182:
+{
+if(!doublePremise) { goto RULE_183; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_183; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_183; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_183; }
+substitutions[29] = subtree;
+if(term2.atoms[0] != 58){ goto RULE_183; }
+if(term2.atoms[1] != 45){ goto RULE_183; }
+if(term2.atoms[2] != 40){ goto RULE_183; }
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_183; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term2, 4);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_183; }
+substitutions[28] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 60;
+conclusion.atoms[1] = 45;
+conclusion.atoms[2] = 58;
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[30])){ goto RULE_183; }
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[29])){ goto RULE_183; }
+conclusion.atoms[5] = 45;
+conclusion.atoms[6] = 40;
+if(!Term_OverrideSubterm(&conclusion,11,&substitutions[30])){ goto RULE_183; }
+if(!Term_OverrideSubterm(&conclusion,12,&substitutions[28])){ goto RULE_183; }
+Truth conclusionTruth = Truth_Comparison(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 1, false, eternalize);}
+RULE_183:
+{
+if(!doublePremise) { goto RULE_184; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 58){ goto RULE_184; }
+if(term1.atoms[1] != 45){ goto RULE_184; }
+if(term1.atoms[2] != 40){ goto RULE_184; }
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_184; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_184; }
+substitutions[30] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_184; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_184; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_184; }
+substitutions[30] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 60;
+conclusion.atoms[1] = 45;
+conclusion.atoms[2] = 58;
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[29])){ goto RULE_184; }
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[30])){ goto RULE_184; }
+conclusion.atoms[5] = 45;
+conclusion.atoms[6] = 40;
+if(!Term_OverrideSubterm(&conclusion,11,&substitutions[28])){ goto RULE_184; }
+if(!Term_OverrideSubterm(&conclusion,12,&substitutions[30])){ goto RULE_184; }
+Truth conclusionTruth = Truth_Comparison(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 1, false, eternalize);}
+RULE_184:
+{
+if(!doublePremise) { goto RULE_185; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_185; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_185; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_185; }
+substitutions[30] = subtree;
+if(term2.atoms[0] != 58){ goto RULE_185; }
+if(term2.atoms[1] != 45){ goto RULE_185; }
+if(term2.atoms[2] != 40){ goto RULE_185; }
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_185; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 4);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_185; }
+substitutions[30] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 60;
+conclusion.atoms[1] = 45;
+conclusion.atoms[2] = 58;
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[29])){ goto RULE_185; }
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[30])){ goto RULE_185; }
+conclusion.atoms[5] = 45;
+conclusion.atoms[6] = 40;
+if(!Term_OverrideSubterm(&conclusion,11,&substitutions[28])){ goto RULE_185; }
+if(!Term_OverrideSubterm(&conclusion,12,&substitutions[30])){ goto RULE_185; }
+Truth conclusionTruth = Truth_Comparison(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 1, false, eternalize);}
+RULE_185:
+{
+if(!doublePremise) { goto RULE_186; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_186; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_186; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_186; }
+substitutions[28] = subtree;
+if(term2.atoms[0] != 58){ goto RULE_186; }
+if(term2.atoms[1] != 45){ goto RULE_186; }
+if(term2.atoms[2] != 40){ goto RULE_186; }
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_186; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term2, 4);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_186; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 59;
+conclusion.atoms[1] = 58;
+conclusion.atoms[2] = 45;
+conclusion.atoms[3] = 45;
+conclusion.atoms[4] = 40;
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[30])){ goto RULE_186; }
+if(!Term_OverrideSubterm(&conclusion,6,&substitutions[28])){ goto RULE_186; }
+if(!Term_OverrideSubterm(&conclusion,7,&substitutions[30])){ goto RULE_186; }
+if(!Term_OverrideSubterm(&conclusion,8,&substitutions[29])){ goto RULE_186; }
+Truth conclusionTruth = Truth_Induction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 1, false, eternalize);}
+RULE_186:
+{
+if(!doublePremise) { goto RULE_187; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 58){ goto RULE_187; }
+if(term1.atoms[1] != 45){ goto RULE_187; }
+if(term1.atoms[2] != 40){ goto RULE_187; }
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_187; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_187; }
+substitutions[29] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_187; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_187; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_187; }
+substitutions[28] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 59;
+conclusion.atoms[1] = 58;
+conclusion.atoms[2] = 45;
+conclusion.atoms[3] = 45;
+conclusion.atoms[4] = 40;
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[30])){ goto RULE_187; }
+if(!Term_OverrideSubterm(&conclusion,6,&substitutions[28])){ goto RULE_187; }
+if(!Term_OverrideSubterm(&conclusion,7,&substitutions[30])){ goto RULE_187; }
+if(!Term_OverrideSubterm(&conclusion,8,&substitutions[29])){ goto RULE_187; }
+Truth conclusionTruth = Truth_Induction(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 1, false, eternalize);}
+RULE_187:
+{
+if(!doublePremise) { goto RULE_188; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_188; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_188; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_188; }
+substitutions[30] = subtree;
+if(term2.atoms[0] != 58){ goto RULE_188; }
+if(term2.atoms[1] != 45){ goto RULE_188; }
+if(term2.atoms[2] != 40){ goto RULE_188; }
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_188; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term2, 4);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_188; }
+substitutions[30] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 59;
+conclusion.atoms[1] = 58;
+conclusion.atoms[2] = 45;
+conclusion.atoms[3] = 45;
+conclusion.atoms[4] = 40;
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[28])){ goto RULE_188; }
+if(!Term_OverrideSubterm(&conclusion,6,&substitutions[30])){ goto RULE_188; }
+if(!Term_OverrideSubterm(&conclusion,7,&substitutions[29])){ goto RULE_188; }
+if(!Term_OverrideSubterm(&conclusion,8,&substitutions[30])){ goto RULE_188; }
+Truth conclusionTruth = Truth_Induction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 1, false, eternalize);}
+RULE_188:
+{
+if(!doublePremise) { goto RULE_189; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 58){ goto RULE_189; }
+if(term1.atoms[1] != 45){ goto RULE_189; }
+if(term1.atoms[2] != 40){ goto RULE_189; }
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_189; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_189; }
+substitutions[30] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_189; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_189; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_189; }
+substitutions[30] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 59;
+conclusion.atoms[1] = 58;
+conclusion.atoms[2] = 45;
+conclusion.atoms[3] = 45;
+conclusion.atoms[4] = 40;
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[28])){ goto RULE_189; }
+if(!Term_OverrideSubterm(&conclusion,6,&substitutions[30])){ goto RULE_189; }
+if(!Term_OverrideSubterm(&conclusion,7,&substitutions[29])){ goto RULE_189; }
+if(!Term_OverrideSubterm(&conclusion,8,&substitutions[30])){ goto RULE_189; }
+Truth conclusionTruth = Truth_Induction(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 1, false, eternalize);}
+RULE_189:
+{
+if(!doublePremise) { goto RULE_190; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_190; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_190; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_190; }
+substitutions[28] = subtree;
+if(term2.atoms[0] != 58){ goto RULE_190; }
+if(term2.atoms[1] != 45){ goto RULE_190; }
+if(term2.atoms[2] != 40){ goto RULE_190; }
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_190; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term2, 4);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_190; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 60;
+conclusion.atoms[1] = 58;
+conclusion.atoms[2] = 45;
+conclusion.atoms[3] = 45;
+conclusion.atoms[4] = 40;
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[30])){ goto RULE_190; }
+if(!Term_OverrideSubterm(&conclusion,6,&substitutions[28])){ goto RULE_190; }
+if(!Term_OverrideSubterm(&conclusion,7,&substitutions[30])){ goto RULE_190; }
+if(!Term_OverrideSubterm(&conclusion,8,&substitutions[29])){ goto RULE_190; }
+Truth conclusionTruth = Truth_Comparison(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 1, false, eternalize);}
+RULE_190:
+{
+if(!doublePremise) { goto RULE_191; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 58){ goto RULE_191; }
+if(term1.atoms[1] != 45){ goto RULE_191; }
+if(term1.atoms[2] != 40){ goto RULE_191; }
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_191; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_191; }
+substitutions[29] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_191; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_191; }
+substitutions[30] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_191; }
+substitutions[28] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 60;
+conclusion.atoms[1] = 58;
+conclusion.atoms[2] = 45;
+conclusion.atoms[3] = 45;
+conclusion.atoms[4] = 40;
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[30])){ goto RULE_191; }
+if(!Term_OverrideSubterm(&conclusion,6,&substitutions[28])){ goto RULE_191; }
+if(!Term_OverrideSubterm(&conclusion,7,&substitutions[30])){ goto RULE_191; }
+if(!Term_OverrideSubterm(&conclusion,8,&substitutions[29])){ goto RULE_191; }
+Truth conclusionTruth = Truth_Comparison(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 1, false, eternalize);}
+RULE_191:
+{
+if(!doublePremise) { goto RULE_192; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_192; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_192; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_192; }
+substitutions[30] = subtree;
+if(term2.atoms[0] != 58){ goto RULE_192; }
+if(term2.atoms[1] != 45){ goto RULE_192; }
+if(term2.atoms[2] != 40){ goto RULE_192; }
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_192; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term2, 4);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_192; }
+substitutions[30] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 60;
+conclusion.atoms[1] = 58;
+conclusion.atoms[2] = 45;
+conclusion.atoms[3] = 45;
+conclusion.atoms[4] = 40;
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[28])){ goto RULE_192; }
+if(!Term_OverrideSubterm(&conclusion,6,&substitutions[30])){ goto RULE_192; }
+if(!Term_OverrideSubterm(&conclusion,7,&substitutions[29])){ goto RULE_192; }
+if(!Term_OverrideSubterm(&conclusion,8,&substitutions[30])){ goto RULE_192; }
+Truth conclusionTruth = Truth_Comparison(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 1, false, eternalize);}
+RULE_192:
+{
+if(!doublePremise) { goto RULE_193; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 58){ goto RULE_193; }
+if(term1.atoms[1] != 45){ goto RULE_193; }
+if(term1.atoms[2] != 40){ goto RULE_193; }
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_193; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_193; }
+substitutions[30] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_193; }
+subtree = Term_ExtractSubterm(&term2, 1);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_193; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_193; }
+substitutions[30] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 60;
+conclusion.atoms[1] = 58;
+conclusion.atoms[2] = 45;
+conclusion.atoms[3] = 45;
+conclusion.atoms[4] = 40;
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[28])){ goto RULE_193; }
+if(!Term_OverrideSubterm(&conclusion,6,&substitutions[30])){ goto RULE_193; }
+if(!Term_OverrideSubterm(&conclusion,7,&substitutions[29])){ goto RULE_193; }
+if(!Term_OverrideSubterm(&conclusion,8,&substitutions[30])){ goto RULE_193; }
+Truth conclusionTruth = Truth_Comparison(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 1, false, eternalize);}
+RULE_193:
+{
+if(!doublePremise) { goto RULE_194; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_194; }
+if(term1.atoms[1] != 41){ goto RULE_194; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_194; }
+substitutions[32] = subtree;
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_194; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_194; }
+substitutions[29] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_194; }
+if(term2.atoms[1] != 41){ goto RULE_194; }
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_194; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_194; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term2, 4);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_194; }
+substitutions[28] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 59;
+conclusion.atoms[1] = 45;
+conclusion.atoms[2] = 45;
+conclusion.atoms[3] = 41;
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[33])){ goto RULE_194; }
+conclusion.atoms[5] = 41;
+if(!Term_OverrideSubterm(&conclusion,6,&substitutions[32])){ goto RULE_194; }
+if(!Term_OverrideSubterm(&conclusion,7,&substitutions[29])){ goto RULE_194; }
+if(!Term_OverrideSubterm(&conclusion,8,&substitutions[28])){ goto RULE_194; }
+if(!Term_OverrideSubterm(&conclusion,11,&substitutions[28])){ goto RULE_194; }
+if(!Term_OverrideSubterm(&conclusion,12,&substitutions[29])){ goto RULE_194; }
+Truth conclusionTruth = Truth_Induction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 1, false, eternalize);}
+RULE_194:
+{
+if(!doublePremise) { goto RULE_195; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_195; }
+if(term1.atoms[1] != 41){ goto RULE_195; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_195; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_195; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_195; }
+substitutions[28] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_195; }
+if(term2.atoms[1] != 41){ goto RULE_195; }
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_195; }
+substitutions[32] = subtree;
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_195; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 4);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_195; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 59;
+conclusion.atoms[1] = 45;
+conclusion.atoms[2] = 45;
+conclusion.atoms[3] = 41;
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[33])){ goto RULE_195; }
+conclusion.atoms[5] = 41;
+if(!Term_OverrideSubterm(&conclusion,6,&substitutions[32])){ goto RULE_195; }
+if(!Term_OverrideSubterm(&conclusion,7,&substitutions[29])){ goto RULE_195; }
+if(!Term_OverrideSubterm(&conclusion,8,&substitutions[28])){ goto RULE_195; }
+if(!Term_OverrideSubterm(&conclusion,11,&substitutions[28])){ goto RULE_195; }
+if(!Term_OverrideSubterm(&conclusion,12,&substitutions[29])){ goto RULE_195; }
+Truth conclusionTruth = Truth_Induction(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 1, false, eternalize);}
+RULE_195:
+{
+if(!doublePremise) { goto RULE_196; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 58){ goto RULE_196; }
+if(term1.atoms[1] != 45){ goto RULE_196; }
+if(term1.atoms[2] != 40){ goto RULE_196; }
+if(term1.atoms[3] != 41){ goto RULE_196; }
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_196; }
+substitutions[32] = subtree;
+subtree = Term_ExtractSubterm(&term1, 7);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_196; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term1, 8);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_196; }
+substitutions[28] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_196; }
+if(term2.atoms[1] != 41){ goto RULE_196; }
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_196; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_196; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 4);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_196; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 59;
+conclusion.atoms[1] = 45;
+conclusion.atoms[2] = 58;
+conclusion.atoms[3] = 41;
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[33])){ goto RULE_196; }
+conclusion.atoms[5] = 45;
+conclusion.atoms[6] = 40;
+if(!Term_OverrideSubterm(&conclusion,7,&substitutions[28])){ goto RULE_196; }
+if(!Term_OverrideSubterm(&conclusion,8,&substitutions[29])){ goto RULE_196; }
+conclusion.atoms[11] = 41;
+if(!Term_OverrideSubterm(&conclusion,12,&substitutions[32])){ goto RULE_196; }
+if(!Term_OverrideSubterm(&conclusion,23,&substitutions[29])){ goto RULE_196; }
+if(!Term_OverrideSubterm(&conclusion,24,&substitutions[28])){ goto RULE_196; }
+Truth conclusionTruth = Truth_Induction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 1, false, eternalize);}
+RULE_196:
+{
+if(!doublePremise) { goto RULE_197; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_197; }
+if(term1.atoms[1] != 41){ goto RULE_197; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_197; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_197; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_197; }
+substitutions[29] = subtree;
+if(term2.atoms[0] != 58){ goto RULE_197; }
+if(term2.atoms[1] != 45){ goto RULE_197; }
+if(term2.atoms[2] != 40){ goto RULE_197; }
+if(term2.atoms[3] != 41){ goto RULE_197; }
+subtree = Term_ExtractSubterm(&term2, 4);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_197; }
+substitutions[32] = subtree;
+subtree = Term_ExtractSubterm(&term2, 7);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_197; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term2, 8);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_197; }
+substitutions[28] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 59;
+conclusion.atoms[1] = 45;
+conclusion.atoms[2] = 58;
+conclusion.atoms[3] = 41;
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[33])){ goto RULE_197; }
+conclusion.atoms[5] = 45;
+conclusion.atoms[6] = 40;
+if(!Term_OverrideSubterm(&conclusion,7,&substitutions[28])){ goto RULE_197; }
+if(!Term_OverrideSubterm(&conclusion,8,&substitutions[29])){ goto RULE_197; }
+conclusion.atoms[11] = 41;
+if(!Term_OverrideSubterm(&conclusion,12,&substitutions[32])){ goto RULE_197; }
+if(!Term_OverrideSubterm(&conclusion,23,&substitutions[29])){ goto RULE_197; }
+if(!Term_OverrideSubterm(&conclusion,24,&substitutions[28])){ goto RULE_197; }
+Truth conclusionTruth = Truth_Induction(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 1, false, eternalize);}
+RULE_197:
+{
+if(!doublePremise) { goto RULE_198; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_198; }
+if(term1.atoms[1] != 41){ goto RULE_198; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_198; }
+substitutions[32] = subtree;
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_198; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_198; }
+substitutions[28] = subtree;
+if(term2.atoms[0] != 58){ goto RULE_198; }
+if(term2.atoms[1] != 45){ goto RULE_198; }
+if(term2.atoms[2] != 40){ goto RULE_198; }
+if(term2.atoms[3] != 41){ goto RULE_198; }
+subtree = Term_ExtractSubterm(&term2, 4);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_198; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term2, 7);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_198; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 8);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_198; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 59;
+conclusion.atoms[1] = 58;
+conclusion.atoms[2] = 45;
+conclusion.atoms[3] = 45;
+conclusion.atoms[4] = 40;
+conclusion.atoms[5] = 41;
+if(!Term_OverrideSubterm(&conclusion,6,&substitutions[32])){ goto RULE_198; }
+conclusion.atoms[7] = 41;
+if(!Term_OverrideSubterm(&conclusion,8,&substitutions[33])){ goto RULE_198; }
+if(!Term_OverrideSubterm(&conclusion,11,&substitutions[29])){ goto RULE_198; }
+if(!Term_OverrideSubterm(&conclusion,12,&substitutions[28])){ goto RULE_198; }
+if(!Term_OverrideSubterm(&conclusion,15,&substitutions[28])){ goto RULE_198; }
+if(!Term_OverrideSubterm(&conclusion,16,&substitutions[29])){ goto RULE_198; }
+Truth conclusionTruth = Truth_Induction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 1, false, eternalize);}
+RULE_198:
+{
+if(!doublePremise) { goto RULE_199; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 58){ goto RULE_199; }
+if(term1.atoms[1] != 45){ goto RULE_199; }
+if(term1.atoms[2] != 40){ goto RULE_199; }
+if(term1.atoms[3] != 41){ goto RULE_199; }
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_199; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term1, 7);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_199; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 8);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_199; }
+substitutions[29] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_199; }
+if(term2.atoms[1] != 41){ goto RULE_199; }
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_199; }
+substitutions[32] = subtree;
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_199; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term2, 4);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_199; }
+substitutions[28] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 59;
+conclusion.atoms[1] = 58;
+conclusion.atoms[2] = 45;
+conclusion.atoms[3] = 45;
+conclusion.atoms[4] = 40;
+conclusion.atoms[5] = 41;
+if(!Term_OverrideSubterm(&conclusion,6,&substitutions[32])){ goto RULE_199; }
+conclusion.atoms[7] = 41;
+if(!Term_OverrideSubterm(&conclusion,8,&substitutions[33])){ goto RULE_199; }
+if(!Term_OverrideSubterm(&conclusion,11,&substitutions[29])){ goto RULE_199; }
+if(!Term_OverrideSubterm(&conclusion,12,&substitutions[28])){ goto RULE_199; }
+if(!Term_OverrideSubterm(&conclusion,15,&substitutions[28])){ goto RULE_199; }
+if(!Term_OverrideSubterm(&conclusion,16,&substitutions[29])){ goto RULE_199; }
+Truth conclusionTruth = Truth_Induction(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 1, false, eternalize);}
+RULE_199:
+{
+if(!doublePremise) { goto RULE_200; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_200; }
+if(term1.atoms[1] != 41){ goto RULE_200; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_200; }
+substitutions[32] = subtree;
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_200; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_200; }
+substitutions[29] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_200; }
+if(term2.atoms[1] != 41){ goto RULE_200; }
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_200; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_200; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term2, 4);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_200; }
+substitutions[30] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 44;
+conclusion.atoms[1] = 45;
+conclusion.atoms[2] = 45;
+conclusion.atoms[3] = 41;
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[32])){ goto RULE_200; }
+conclusion.atoms[5] = 41;
+if(!Term_OverrideSubterm(&conclusion,6,&substitutions[33])){ goto RULE_200; }
+if(!Term_OverrideSubterm(&conclusion,7,&substitutions[28])){ goto RULE_200; }
+if(!Term_OverrideSubterm(&conclusion,8,&substitutions[29])){ goto RULE_200; }
+if(!Term_OverrideSubterm(&conclusion,11,&substitutions[29])){ goto RULE_200; }
+if(!Term_OverrideSubterm(&conclusion,12,&substitutions[30])){ goto RULE_200; }
+Truth conclusionTruth = Truth_Intersection(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 1, false, eternalize);}
+RULE_200:
+{
+if(!doublePremise) { goto RULE_201; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_201; }
+if(term1.atoms[1] != 41){ goto RULE_201; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_201; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_201; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_201; }
+substitutions[30] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_201; }
+if(term2.atoms[1] != 41){ goto RULE_201; }
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_201; }
+substitutions[32] = subtree;
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_201; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 4);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_201; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 44;
+conclusion.atoms[1] = 45;
+conclusion.atoms[2] = 45;
+conclusion.atoms[3] = 41;
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[32])){ goto RULE_201; }
+conclusion.atoms[5] = 41;
+if(!Term_OverrideSubterm(&conclusion,6,&substitutions[33])){ goto RULE_201; }
+if(!Term_OverrideSubterm(&conclusion,7,&substitutions[28])){ goto RULE_201; }
+if(!Term_OverrideSubterm(&conclusion,8,&substitutions[29])){ goto RULE_201; }
+if(!Term_OverrideSubterm(&conclusion,11,&substitutions[29])){ goto RULE_201; }
+if(!Term_OverrideSubterm(&conclusion,12,&substitutions[30])){ goto RULE_201; }
+Truth conclusionTruth = Truth_Intersection(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 1, false, eternalize);}
+RULE_201:
+{
+if(!doublePremise) { goto RULE_202; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_202; }
+if(term1.atoms[1] != 41){ goto RULE_202; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_202; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_202; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_202; }
+substitutions[30] = subtree;
+if(term2.atoms[0] != 44){ goto RULE_202; }
+if(term2.atoms[1] != 45){ goto RULE_202; }
+if(term2.atoms[2] != 45){ goto RULE_202; }
+if(term2.atoms[3] != 41){ goto RULE_202; }
+subtree = Term_ExtractSubterm(&term2, 4);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_202; }
+substitutions[32] = subtree;
+if(term2.atoms[5] != 41){ goto RULE_202; }
+subtree = Term_ExtractSubterm(&term2, 6);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_202; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term2, 7);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_202; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 8);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_202; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term2, 11);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_202; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term2, 12);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_202; }
+substitutions[30] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 59;
+conclusion.atoms[1] = 44;
+conclusion.atoms[2] = 45;
+conclusion.atoms[3] = 45;
+conclusion.atoms[4] = 45;
+conclusion.atoms[5] = 41;
+if(!Term_OverrideSubterm(&conclusion,6,&substitutions[31])){ goto RULE_202; }
+conclusion.atoms[7] = 41;
+if(!Term_OverrideSubterm(&conclusion,8,&substitutions[32])){ goto RULE_202; }
+conclusion.atoms[9] = 41;
+if(!Term_OverrideSubterm(&conclusion,10,&substitutions[33])){ goto RULE_202; }
+if(!Term_OverrideSubterm(&conclusion,11,&substitutions[28])){ goto RULE_202; }
+if(!Term_OverrideSubterm(&conclusion,12,&substitutions[30])){ goto RULE_202; }
+if(!Term_OverrideSubterm(&conclusion,15,&substitutions[28])){ goto RULE_202; }
+if(!Term_OverrideSubterm(&conclusion,16,&substitutions[29])){ goto RULE_202; }
+if(!Term_OverrideSubterm(&conclusion,19,&substitutions[29])){ goto RULE_202; }
+if(!Term_OverrideSubterm(&conclusion,20,&substitutions[30])){ goto RULE_202; }
+Truth conclusionTruth = Truth_Induction(truth1,truth2);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 1, false, eternalize);}
+RULE_202:
+{
+if(!doublePremise) { goto RULE_203; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 44){ goto RULE_203; }
+if(term1.atoms[1] != 45){ goto RULE_203; }
+if(term1.atoms[2] != 45){ goto RULE_203; }
+if(term1.atoms[3] != 41){ goto RULE_203; }
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[32].atoms[0]!=0 && !Term_Equal(&substitutions[32], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_203; }
+substitutions[32] = subtree;
+if(term1.atoms[5] != 41){ goto RULE_203; }
+subtree = Term_ExtractSubterm(&term1, 6);
+if((substitutions[33].atoms[0]!=0 && !Term_Equal(&substitutions[33], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_203; }
+substitutions[33] = subtree;
+subtree = Term_ExtractSubterm(&term1, 7);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_203; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 8);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_203; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term1, 11);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_203; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term1, 12);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_203; }
+substitutions[30] = subtree;
+if(term2.atoms[0] != 45){ goto RULE_203; }
+if(term2.atoms[1] != 41){ goto RULE_203; }
+subtree = Term_ExtractSubterm(&term2, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_203; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term2, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_203; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term2, 4);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_203; }
+substitutions[30] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 59;
+conclusion.atoms[1] = 44;
+conclusion.atoms[2] = 45;
+conclusion.atoms[3] = 45;
+conclusion.atoms[4] = 45;
+conclusion.atoms[5] = 41;
+if(!Term_OverrideSubterm(&conclusion,6,&substitutions[31])){ goto RULE_203; }
+conclusion.atoms[7] = 41;
+if(!Term_OverrideSubterm(&conclusion,8,&substitutions[32])){ goto RULE_203; }
+conclusion.atoms[9] = 41;
+if(!Term_OverrideSubterm(&conclusion,10,&substitutions[33])){ goto RULE_203; }
+if(!Term_OverrideSubterm(&conclusion,11,&substitutions[28])){ goto RULE_203; }
+if(!Term_OverrideSubterm(&conclusion,12,&substitutions[30])){ goto RULE_203; }
+if(!Term_OverrideSubterm(&conclusion,15,&substitutions[28])){ goto RULE_203; }
+if(!Term_OverrideSubterm(&conclusion,16,&substitutions[29])){ goto RULE_203; }
+if(!Term_OverrideSubterm(&conclusion,19,&substitutions[29])){ goto RULE_203; }
+if(!Term_OverrideSubterm(&conclusion,20,&substitutions[30])){ goto RULE_203; }
+Truth conclusionTruth = Truth_Induction(truth2,truth1);
+NAL_DerivedEvent(RuleTable_Reduce(conclusion), conclusionOccurrence, conclusionTruth, conclusionStamp, currentTime, parentPriority, conceptPriority, occurrenceTimeOffset, validation_concept, validation_cid, 1, false, eternalize);}
+RULE_203:;
+}
+Term RuleTable_Reduce(Term term1)
+{
+bool doublePremise = false;
+goto RULE_203;
+RULE_203:
+{
+if(doublePremise) { goto RULE_204; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_204; }
+if(term1.atoms[1] != 42){ goto RULE_204; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_204; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_204; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_204; }
+substitutions[28] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[28])){ goto RULE_204; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[31])){ goto RULE_204; }
+IN_DEBUG( fputs("Reduced: ", stdout); Narsese_PrintTerm(&term1); fputs(" -> ", stdout); Narsese_PrintTerm(&conclusion); puts(""); ) 
+return conclusion;
+}
+RULE_204:
+{
+if(doublePremise) { goto RULE_205; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_205; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_205; }
+substitutions[31] = subtree;
+if(term1.atoms[2] != 42){ goto RULE_205; }
+subtree = Term_ExtractSubterm(&term1, 5);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_205; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 6);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_205; }
+substitutions[28] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[31])){ goto RULE_205; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[28])){ goto RULE_205; }
+IN_DEBUG( fputs("Reduced: ", stdout); Narsese_PrintTerm(&term1); fputs(" -> ", stdout); Narsese_PrintTerm(&conclusion); puts(""); ) 
+return conclusion;
+}
+RULE_205:
+{
+if(doublePremise) { goto RULE_206; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_206; }
+if(term1.atoms[1] != 43){ goto RULE_206; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_206; }
+substitutions[31] = subtree;
+subtree = Term_ExtractSubterm(&term1, 3);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_206; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 4);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_206; }
+substitutions[28] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[28])){ goto RULE_206; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[31])){ goto RULE_206; }
+IN_DEBUG( fputs("Reduced: ", stdout); Narsese_PrintTerm(&term1); fputs(" -> ", stdout); Narsese_PrintTerm(&conclusion); puts(""); ) 
+return conclusion;
+}
+RULE_206:
+{
+if(doublePremise) { goto RULE_207; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_207; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_207; }
+substitutions[31] = subtree;
+if(term1.atoms[2] != 43){ goto RULE_207; }
+subtree = Term_ExtractSubterm(&term1, 5);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_207; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 6);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_207; }
+substitutions[28] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[31])){ goto RULE_207; }
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[28])){ goto RULE_207; }
+IN_DEBUG( fputs("Reduced: ", stdout); Narsese_PrintTerm(&term1); fputs(" -> ", stdout); Narsese_PrintTerm(&conclusion); puts(""); ) 
+return conclusion;
+}
+RULE_207:
+{
+if(doublePremise) { goto RULE_208; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 44){ goto RULE_208; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_208; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_208; }
+substitutions[28] = subtree;
+Term conclusion = {0};
+if(!Term_OverrideSubterm(&conclusion,0,&substitutions[28])){ goto RULE_208; }
+IN_DEBUG( fputs("Reduced: ", stdout); Narsese_PrintTerm(&term1); fputs(" -> ", stdout); Narsese_PrintTerm(&conclusion); puts(""); ) 
+return conclusion;
+}
+RULE_208:
+{
+if(doublePremise) { goto RULE_209; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 61){ goto RULE_209; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_209; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_209; }
+substitutions[28] = subtree;
+Term conclusion = {0};
+if(!Term_OverrideSubterm(&conclusion,0,&substitutions[28])){ goto RULE_209; }
+IN_DEBUG( fputs("Reduced: ", stdout); Narsese_PrintTerm(&term1); fputs(" -> ", stdout); Narsese_PrintTerm(&conclusion); puts(""); ) 
+return conclusion;
+}
+RULE_209:
+{
+if(doublePremise) { goto RULE_210; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_210; }
+if(term1.atoms[1] != 43){ goto RULE_210; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_210; }
+substitutions[31] = subtree;
+if(term1.atoms[3] != 49){ goto RULE_210; }
+if(term1.atoms[4] != 49){ goto RULE_210; }
+subtree = Term_ExtractSubterm(&term1, 7);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_210; }
+substitutions[28] = subtree;
+if(term1.atoms[8] != 40){ goto RULE_210; }
+subtree = Term_ExtractSubterm(&term1, 9);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_210; }
+substitutions[29] = subtree;
+if(term1.atoms[10] != 40){ goto RULE_210; }
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+conclusion.atoms[1] = 49;
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[31])){ goto RULE_210; }
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[28])){ goto RULE_210; }
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[29])){ goto RULE_210; }
+IN_DEBUG( fputs("Reduced: ", stdout); Narsese_PrintTerm(&term1); fputs(" -> ", stdout); Narsese_PrintTerm(&conclusion); puts(""); ) 
+return conclusion;
+}
+RULE_210:
+{
+if(doublePremise) { goto RULE_211; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_211; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_211; }
+substitutions[31] = subtree;
+if(term1.atoms[2] != 43){ goto RULE_211; }
+if(term1.atoms[5] != 49){ goto RULE_211; }
+if(term1.atoms[6] != 49){ goto RULE_211; }
+subtree = Term_ExtractSubterm(&term1, 11);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_211; }
+substitutions[28] = subtree;
+if(term1.atoms[12] != 40){ goto RULE_211; }
+subtree = Term_ExtractSubterm(&term1, 13);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_211; }
+substitutions[29] = subtree;
+if(term1.atoms[14] != 40){ goto RULE_211; }
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[31])){ goto RULE_211; }
+conclusion.atoms[2] = 49;
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[28])){ goto RULE_211; }
+if(!Term_OverrideSubterm(&conclusion,6,&substitutions[29])){ goto RULE_211; }
+IN_DEBUG( fputs("Reduced: ", stdout); Narsese_PrintTerm(&term1); fputs(" -> ", stdout); Narsese_PrintTerm(&conclusion); puts(""); ) 
+return conclusion;
+}
+RULE_211:
+{
+if(doublePremise) { goto RULE_212; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_212; }
+if(term1.atoms[1] != 43){ goto RULE_212; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_212; }
+substitutions[31] = subtree;
+if(term1.atoms[3] != 49){ goto RULE_212; }
+if(term1.atoms[4] != 49){ goto RULE_212; }
+subtree = Term_ExtractSubterm(&term1, 7);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_212; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 8);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_212; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term1, 9);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_212; }
+substitutions[30] = subtree;
+if(term1.atoms[10] != 40){ goto RULE_212; }
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+conclusion.atoms[1] = 49;
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[31])){ goto RULE_212; }
+conclusion.atoms[3] = 52;
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[30])){ goto RULE_212; }
+if(!Term_OverrideSubterm(&conclusion,7,&substitutions[28])){ goto RULE_212; }
+if(!Term_OverrideSubterm(&conclusion,8,&substitutions[29])){ goto RULE_212; }
+IN_DEBUG( fputs("Reduced: ", stdout); Narsese_PrintTerm(&term1); fputs(" -> ", stdout); Narsese_PrintTerm(&conclusion); puts(""); ) 
+return conclusion;
+}
+RULE_212:
+{
+if(doublePremise) { goto RULE_213; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_213; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_213; }
+substitutions[31] = subtree;
+if(term1.atoms[2] != 43){ goto RULE_213; }
+if(term1.atoms[5] != 49){ goto RULE_213; }
+if(term1.atoms[6] != 49){ goto RULE_213; }
+subtree = Term_ExtractSubterm(&term1, 11);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_213; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 12);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_213; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term1, 13);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_213; }
+substitutions[30] = subtree;
+if(term1.atoms[14] != 40){ goto RULE_213; }
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[31])){ goto RULE_213; }
+conclusion.atoms[2] = 49;
+conclusion.atoms[5] = 52;
+if(!Term_OverrideSubterm(&conclusion,6,&substitutions[30])){ goto RULE_213; }
+if(!Term_OverrideSubterm(&conclusion,11,&substitutions[28])){ goto RULE_213; }
+if(!Term_OverrideSubterm(&conclusion,12,&substitutions[29])){ goto RULE_213; }
+IN_DEBUG( fputs("Reduced: ", stdout); Narsese_PrintTerm(&term1); fputs(" -> ", stdout); Narsese_PrintTerm(&conclusion); puts(""); ) 
+return conclusion;
+}
+RULE_213:
+{
+if(doublePremise) { goto RULE_214; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_214; }
+if(term1.atoms[1] != 43){ goto RULE_214; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_214; }
+substitutions[31] = subtree;
+if(term1.atoms[3] != 49){ goto RULE_214; }
+if(term1.atoms[4] != 49){ goto RULE_214; }
+subtree = Term_ExtractSubterm(&term1, 7);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_214; }
+substitutions[30] = subtree;
+if(term1.atoms[8] != 40){ goto RULE_214; }
+subtree = Term_ExtractSubterm(&term1, 9);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_214; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 10);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_214; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+conclusion.atoms[1] = 49;
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[31])){ goto RULE_214; }
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[30])){ goto RULE_214; }
+conclusion.atoms[4] = 52;
+if(!Term_OverrideSubterm(&conclusion,9,&substitutions[28])){ goto RULE_214; }
+if(!Term_OverrideSubterm(&conclusion,10,&substitutions[29])){ goto RULE_214; }
+IN_DEBUG( fputs("Reduced: ", stdout); Narsese_PrintTerm(&term1); fputs(" -> ", stdout); Narsese_PrintTerm(&conclusion); puts(""); ) 
+return conclusion;
+}
+RULE_214:
+{
+if(doublePremise) { goto RULE_215; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_215; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_215; }
+substitutions[31] = subtree;
+if(term1.atoms[2] != 43){ goto RULE_215; }
+if(term1.atoms[5] != 49){ goto RULE_215; }
+if(term1.atoms[6] != 49){ goto RULE_215; }
+subtree = Term_ExtractSubterm(&term1, 11);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_215; }
+substitutions[30] = subtree;
+if(term1.atoms[12] != 40){ goto RULE_215; }
+subtree = Term_ExtractSubterm(&term1, 13);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_215; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 14);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_215; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[31])){ goto RULE_215; }
+conclusion.atoms[2] = 49;
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[30])){ goto RULE_215; }
+conclusion.atoms[6] = 52;
+if(!Term_OverrideSubterm(&conclusion,13,&substitutions[28])){ goto RULE_215; }
+if(!Term_OverrideSubterm(&conclusion,14,&substitutions[29])){ goto RULE_215; }
+IN_DEBUG( fputs("Reduced: ", stdout); Narsese_PrintTerm(&term1); fputs(" -> ", stdout); Narsese_PrintTerm(&conclusion); puts(""); ) 
+return conclusion;
+}
+RULE_215:
+{
+if(doublePremise) { goto RULE_216; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_216; }
+if(term1.atoms[1] != 42){ goto RULE_216; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_216; }
+substitutions[31] = subtree;
+if(term1.atoms[3] != 48){ goto RULE_216; }
+if(term1.atoms[4] != 48){ goto RULE_216; }
+subtree = Term_ExtractSubterm(&term1, 7);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_216; }
+substitutions[28] = subtree;
+if(term1.atoms[8] != 40){ goto RULE_216; }
+subtree = Term_ExtractSubterm(&term1, 9);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_216; }
+substitutions[29] = subtree;
+if(term1.atoms[10] != 40){ goto RULE_216; }
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+conclusion.atoms[1] = 48;
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[31])){ goto RULE_216; }
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[28])){ goto RULE_216; }
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[29])){ goto RULE_216; }
+IN_DEBUG( fputs("Reduced: ", stdout); Narsese_PrintTerm(&term1); fputs(" -> ", stdout); Narsese_PrintTerm(&conclusion); puts(""); ) 
+return conclusion;
+}
+RULE_216:
+{
+if(doublePremise) { goto RULE_217; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_217; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_217; }
+substitutions[31] = subtree;
+if(term1.atoms[2] != 42){ goto RULE_217; }
+if(term1.atoms[5] != 48){ goto RULE_217; }
+if(term1.atoms[6] != 48){ goto RULE_217; }
+subtree = Term_ExtractSubterm(&term1, 11);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_217; }
+substitutions[28] = subtree;
+if(term1.atoms[12] != 40){ goto RULE_217; }
+subtree = Term_ExtractSubterm(&term1, 13);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_217; }
+substitutions[29] = subtree;
+if(term1.atoms[14] != 40){ goto RULE_217; }
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[31])){ goto RULE_217; }
+conclusion.atoms[2] = 48;
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[28])){ goto RULE_217; }
+if(!Term_OverrideSubterm(&conclusion,6,&substitutions[29])){ goto RULE_217; }
+IN_DEBUG( fputs("Reduced: ", stdout); Narsese_PrintTerm(&term1); fputs(" -> ", stdout); Narsese_PrintTerm(&conclusion); puts(""); ) 
+return conclusion;
+}
+RULE_217:
+{
+if(doublePremise) { goto RULE_218; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_218; }
+if(term1.atoms[1] != 42){ goto RULE_218; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_218; }
+substitutions[31] = subtree;
+if(term1.atoms[3] != 48){ goto RULE_218; }
+if(term1.atoms[4] != 48){ goto RULE_218; }
+subtree = Term_ExtractSubterm(&term1, 7);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_218; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 8);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_218; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term1, 9);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_218; }
+substitutions[30] = subtree;
+if(term1.atoms[10] != 40){ goto RULE_218; }
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+conclusion.atoms[1] = 48;
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[31])){ goto RULE_218; }
+conclusion.atoms[3] = 52;
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[30])){ goto RULE_218; }
+if(!Term_OverrideSubterm(&conclusion,7,&substitutions[28])){ goto RULE_218; }
+if(!Term_OverrideSubterm(&conclusion,8,&substitutions[29])){ goto RULE_218; }
+IN_DEBUG( fputs("Reduced: ", stdout); Narsese_PrintTerm(&term1); fputs(" -> ", stdout); Narsese_PrintTerm(&conclusion); puts(""); ) 
+return conclusion;
+}
+RULE_218:
+{
+if(doublePremise) { goto RULE_219; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_219; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_219; }
+substitutions[31] = subtree;
+if(term1.atoms[2] != 42){ goto RULE_219; }
+if(term1.atoms[5] != 48){ goto RULE_219; }
+if(term1.atoms[6] != 48){ goto RULE_219; }
+subtree = Term_ExtractSubterm(&term1, 11);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_219; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 12);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_219; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term1, 13);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_219; }
+substitutions[30] = subtree;
+if(term1.atoms[14] != 40){ goto RULE_219; }
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[31])){ goto RULE_219; }
+conclusion.atoms[2] = 48;
+conclusion.atoms[5] = 52;
+if(!Term_OverrideSubterm(&conclusion,6,&substitutions[30])){ goto RULE_219; }
+if(!Term_OverrideSubterm(&conclusion,11,&substitutions[28])){ goto RULE_219; }
+if(!Term_OverrideSubterm(&conclusion,12,&substitutions[29])){ goto RULE_219; }
+IN_DEBUG( fputs("Reduced: ", stdout); Narsese_PrintTerm(&term1); fputs(" -> ", stdout); Narsese_PrintTerm(&conclusion); puts(""); ) 
+return conclusion;
+}
+RULE_219:
+{
+if(doublePremise) { goto RULE_220; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_220; }
+if(term1.atoms[1] != 42){ goto RULE_220; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_220; }
+substitutions[31] = subtree;
+if(term1.atoms[3] != 48){ goto RULE_220; }
+if(term1.atoms[4] != 48){ goto RULE_220; }
+subtree = Term_ExtractSubterm(&term1, 7);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_220; }
+substitutions[28] = subtree;
+if(term1.atoms[8] != 40){ goto RULE_220; }
+subtree = Term_ExtractSubterm(&term1, 9);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_220; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term1, 10);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_220; }
+substitutions[30] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+conclusion.atoms[1] = 48;
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[31])){ goto RULE_220; }
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[28])){ goto RULE_220; }
+conclusion.atoms[4] = 52;
+if(!Term_OverrideSubterm(&conclusion,9,&substitutions[29])){ goto RULE_220; }
+if(!Term_OverrideSubterm(&conclusion,10,&substitutions[30])){ goto RULE_220; }
+IN_DEBUG( fputs("Reduced: ", stdout); Narsese_PrintTerm(&term1); fputs(" -> ", stdout); Narsese_PrintTerm(&conclusion); puts(""); ) 
+return conclusion;
+}
+RULE_220:
+{
+if(doublePremise) { goto RULE_221; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_221; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_221; }
+substitutions[31] = subtree;
+if(term1.atoms[2] != 42){ goto RULE_221; }
+if(term1.atoms[5] != 48){ goto RULE_221; }
+if(term1.atoms[6] != 48){ goto RULE_221; }
+subtree = Term_ExtractSubterm(&term1, 11);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_221; }
+substitutions[28] = subtree;
+if(term1.atoms[12] != 40){ goto RULE_221; }
+subtree = Term_ExtractSubterm(&term1, 13);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_221; }
+substitutions[29] = subtree;
+subtree = Term_ExtractSubterm(&term1, 14);
+if((substitutions[30].atoms[0]!=0 && !Term_Equal(&substitutions[30], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_221; }
+substitutions[30] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[31])){ goto RULE_221; }
+conclusion.atoms[2] = 48;
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[28])){ goto RULE_221; }
+conclusion.atoms[6] = 52;
+if(!Term_OverrideSubterm(&conclusion,13,&substitutions[29])){ goto RULE_221; }
+if(!Term_OverrideSubterm(&conclusion,14,&substitutions[30])){ goto RULE_221; }
+IN_DEBUG( fputs("Reduced: ", stdout); Narsese_PrintTerm(&term1); fputs(" -> ", stdout); Narsese_PrintTerm(&conclusion); puts(""); ) 
+return conclusion;
+}
+RULE_221:
+{
+if(doublePremise) { goto RULE_222; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_222; }
+if(term1.atoms[1] != 49){ goto RULE_222; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_222; }
+substitutions[31] = subtree;
+if(term1.atoms[3] != 52){ goto RULE_222; }
+if(term1.atoms[4] != 40){ goto RULE_222; }
+subtree = Term_ExtractSubterm(&term1, 7);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_222; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 8);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_222; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+conclusion.atoms[1] = 49;
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[31])){ goto RULE_222; }
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[28])){ goto RULE_222; }
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[29])){ goto RULE_222; }
+IN_DEBUG( fputs("Reduced: ", stdout); Narsese_PrintTerm(&term1); fputs(" -> ", stdout); Narsese_PrintTerm(&conclusion); puts(""); ) 
+return conclusion;
+}
+RULE_222:
+{
+if(doublePremise) { goto RULE_223; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_223; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_223; }
+substitutions[31] = subtree;
+if(term1.atoms[2] != 49){ goto RULE_223; }
+if(term1.atoms[5] != 52){ goto RULE_223; }
+if(term1.atoms[6] != 40){ goto RULE_223; }
+subtree = Term_ExtractSubterm(&term1, 11);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_223; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 12);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_223; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[31])){ goto RULE_223; }
+conclusion.atoms[2] = 49;
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[28])){ goto RULE_223; }
+if(!Term_OverrideSubterm(&conclusion,6,&substitutions[29])){ goto RULE_223; }
+IN_DEBUG( fputs("Reduced: ", stdout); Narsese_PrintTerm(&term1); fputs(" -> ", stdout); Narsese_PrintTerm(&conclusion); puts(""); ) 
+return conclusion;
+}
+RULE_223:
+{
+if(doublePremise) { goto RULE_224; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_224; }
+if(term1.atoms[1] != 48){ goto RULE_224; }
+subtree = Term_ExtractSubterm(&term1, 2);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_224; }
+substitutions[31] = subtree;
+if(term1.atoms[3] != 52){ goto RULE_224; }
+if(term1.atoms[4] != 40){ goto RULE_224; }
+subtree = Term_ExtractSubterm(&term1, 7);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_224; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 8);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_224; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+conclusion.atoms[1] = 48;
+if(!Term_OverrideSubterm(&conclusion,2,&substitutions[31])){ goto RULE_224; }
+if(!Term_OverrideSubterm(&conclusion,3,&substitutions[28])){ goto RULE_224; }
+if(!Term_OverrideSubterm(&conclusion,4,&substitutions[29])){ goto RULE_224; }
+IN_DEBUG( fputs("Reduced: ", stdout); Narsese_PrintTerm(&term1); fputs(" -> ", stdout); Narsese_PrintTerm(&conclusion); puts(""); ) 
+return conclusion;
+}
+RULE_224:
+{
+if(doublePremise) { goto RULE_225; }
+Term substitutions[27+NUM_ELEMENTS(Narsese_RuleTableVars)+2] = {0}; Term subtree = {0};
+if(term1.atoms[0] != 45){ goto RULE_225; }
+subtree = Term_ExtractSubterm(&term1, 1);
+if((substitutions[31].atoms[0]!=0 && !Term_Equal(&substitutions[31], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_225; }
+substitutions[31] = subtree;
+if(term1.atoms[2] != 48){ goto RULE_225; }
+if(term1.atoms[5] != 52){ goto RULE_225; }
+if(term1.atoms[6] != 40){ goto RULE_225; }
+subtree = Term_ExtractSubterm(&term1, 11);
+if((substitutions[28].atoms[0]!=0 && !Term_Equal(&substitutions[28], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_225; }
+substitutions[28] = subtree;
+subtree = Term_ExtractSubterm(&term1, 12);
+if((substitutions[29].atoms[0]!=0 && !Term_Equal(&substitutions[29], &subtree)) || Narsese_copulaEquals(subtree.atoms[0], SET_TERMINATOR)){ goto RULE_225; }
+substitutions[29] = subtree;
+Term conclusion = {0};
+conclusion.atoms[0] = 45;
+if(!Term_OverrideSubterm(&conclusion,1,&substitutions[31])){ goto RULE_225; }
+conclusion.atoms[2] = 48;
+if(!Term_OverrideSubterm(&conclusion,5,&substitutions[28])){ goto RULE_225; }
+if(!Term_OverrideSubterm(&conclusion,6,&substitutions[29])){ goto RULE_225; }
+IN_DEBUG( fputs("Reduced: ", stdout); Narsese_PrintTerm(&term1); fputs(" -> ", stdout); Narsese_PrintTerm(&conclusion); puts(""); ) 
+return conclusion;
+}
+RULE_225:;
+return term1;
+}
+
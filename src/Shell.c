@@ -47,6 +47,105 @@ void Shell_NARInit()
     assert(false, "Shell_NARInit: Ran out of operators, add more there, or decrease OPERATIONS_MAX!");
 }
 
+static void Shell_PrintConcept(Concept *c, double usefulness)
+{
+    Term left = Term_ExtractSubterm(&c->term, 1);
+    Term left_left = Term_ExtractSubterm(&left, 1);
+    Term left_right = Term_ExtractSubterm(&left, 2);
+    Term right = Term_ExtractSubterm(&c->term, 2);
+    Term right_left = Term_ExtractSubterm(&right, 1);
+    Term right_right = Term_ExtractSubterm(&right, 2);
+    if(PRINT_JSONL)
+    {
+        fputs("{\"type\": \"concept\", \"term\": ", stdout);
+        Narsese_PrintTermJSON(&c->term);
+        printf(", \"priority\": %f, \"usefulness\": %f, \"useCount\": %ld, \"lastUsed\": %ld, \"frequency\": %f, \"confidence\": %f, \"termlinks\": [", c->priority, usefulness, c->usage.useCount, c->usage.lastUsed, c->belief.truth.frequency, c->belief.truth.confidence);
+        Term termlinks[6] = { left, right, left_left, left_right, right_left, right_right };
+        for(int j=0; j<6; j++)
+        {
+            Narsese_PrintTermJSON(&termlinks[j]);
+            fputs(j < 5 ? ", " : "]}\n", stdout);
+        }
+    }
+    else
+    {
+        fputs("//", stdout);
+        Narsese_PrintTerm(&c->term);
+        printf(": { \"priority\": %f, \"usefulness\": %f, \"useCount\": %ld, \"lastUsed\": %ld, \"frequency\": %f, \"confidence\": %f, \"termlinks\": [", c->priority, usefulness, c->usage.useCount, c->usage.lastUsed, c->belief.truth.frequency, c->belief.truth.confidence);
+        fputs("\"", stdout);
+        Narsese_PrintTerm(&left);
+        fputs("\", ", stdout);
+        fputs("\"", stdout);
+        Narsese_PrintTerm(&right);
+        fputs("\", ", stdout);
+        fputs("\"", stdout);
+        Narsese_PrintTerm(&left_left);
+        fputs("\", ", stdout);
+        fputs("\"", stdout);
+        Narsese_PrintTerm(&left_right);
+        fputs("\", ", stdout);
+        fputs("\"", stdout);
+        Narsese_PrintTerm(&right_left);
+        fputs("\", ", stdout);
+        fputs("\"", stdout);
+        Narsese_PrintTerm(&right_right);
+        fputs("\"", stdout);
+        puts("]}");
+    }
+    if(c->belief.type != EVENT_TYPE_DELETED)
+    {
+        Memory_printAddedEvent(&c->belief.stamp, &c->belief, 1, true, false, false, false, false);
+    }
+    for(int opi=0; opi<OPERATIONS_MAX; opi++)
+    {
+        for(int h=0; h<c->precondition_beliefs[opi].itemsAmount; h++)
+        {
+            Implication *imp = &c->precondition_beliefs[opi].array[h];
+            Memory_printAddedImplication(&imp->stamp, &imp->term, &imp->truth, imp->occurrenceTimeOffset, 1, true, false, false);
+        }
+    }
+    for(int h=0; h<c->implication_links.itemsAmount; h++)
+    {
+        Implication *imp = &c->implication_links.array[h];
+        Memory_printAddedImplication(&imp->stamp, &imp->term, &imp->truth, imp->occurrenceTimeOffset, 1, true, false, false);
+    }
+}
+
+//Whether a belief or implication of the concept was added or revised at or after the time
+static bool Shell_ConceptChangedSince(Concept *c, long since)
+{
+    //adding to a belief uses the concept, so unused concepts only need their implication tables checked
+    if(c->usage.lastUsed >= since && c->belief.type != EVENT_TYPE_DELETED && c->belief.creationTime >= since)
+    {
+        return true;
+    }
+    for(int opi=0; opi<OPERATIONS_MAX; opi++)
+    {
+        for(int h=0; h<c->precondition_beliefs[opi].itemsAmount; h++)
+        {
+            if(c->precondition_beliefs[opi].array[h].creationTime >= since)
+            {
+                return true;
+            }
+        }
+    }
+    for(int h=0; h<c->implication_links.itemsAmount; h++)
+    {
+        if(c->implication_links.array[h].creationTime >= since)
+        {
+            return true;
+        }
+    }
+    return false;
+}
+
+static int Shell_ConceptPriorityDescending(const void *a, const void *b)
+{
+    double priority_a = (*(Concept**) a)->priority;
+    double priority_b = (*(Concept**) b)->priority;
+    return priority_a < priority_b ? 1 : (priority_a > priority_b ? -1 : 0);
+}
+
 int Shell_ProcessInput(char *line)
 {
     //trim string, for IRC etc. convenience
@@ -78,6 +177,16 @@ int Shell_ProcessInput(char *line)
             return SHELL_RESET;
         }
         else
+        if(!strcmp(line,"*format=jsonl"))
+        {
+            PRINT_JSONL = true;
+        }
+        else
+        if(!strcmp(line,"*format=text"))
+        {
+            PRINT_JSONL = false;
+        }
+        else
         if(!strcmp(line,"*volume=0"))
         {
             PRINT_EVENTS_PRIORITY_THRESHOLD = 1.0;
@@ -120,6 +229,20 @@ int Shell_ProcessInput(char *line)
             sscanf(&line[strlen("*similaritydistance=")], "%lf", &Variable_similarity_distance);
         }
         else
+        if(!strncmp("*snapshot save ", line, strlen("*snapshot save ")))
+        {
+            char *filename = &line[strlen("*snapshot save ")];
+            printf(Snapshot_Save(filename) ? "//*snapshot saved %s\n" : "//*snapshot failed %s\n", filename);
+            fflush(stdout);
+        }
+        else
+        if(!strncmp("*snapshot load ", line, strlen("*snapshot load ")))
+        {
+            char *filename = &line[strlen("*snapshot load ")];
+            printf(Snapshot_Load(filename) ? "//*snapshot loaded %s\n" : "//*snapshot failed %s\n", filename);
+            fflush(stdout);
+        }
+        else
         if(!strcmp(line,"*stats"))
         {
             puts("//*stats");
@@ -169,51 +292,68 @@ int Shell_ProcessInput(char *line)
             {
                 Concept *c = concepts.items[i].address;
                 assert(c != NULL, "Concept is null");
-                fputs("//", stdout);
-                Narsese_PrintTerm(&c->term);
-                printf(": { \"priority\": %f, \"usefulness\": %f, \"useCount\": %ld, \"lastUsed\": %ld, \"frequency\": %f, \"confidence\": %f, \"termlinks\": [", c->priority, concepts.items[i].priority, c->usage.useCount, c->usage.lastUsed, c->belief.truth.frequency, c->belief.truth.confidence);
-                Term left = Term_ExtractSubterm(&c->term, 1);
-                Term left_left = Term_ExtractSubterm(&left, 1);
-                Term left_right = Term_ExtractSubterm(&left, 2);
-                Term right = Term_ExtractSubterm(&c->term, 2);
-                Term right_left = Term_ExtractSubterm(&right, 1);
-                Term right_right = Term_ExtractSubterm(&right, 2);
-                fputs("\"", stdout);
-                Narsese_PrintTerm(&left);
-                fputs("\", ", stdout);
-                fputs("\"", stdout);
-                Narsese_PrintTerm(&right);
-                fputs("\", ", stdout);
-                fputs("\"", stdout);
-                Narsese_PrintTerm(&left_left);
-                fputs("\", ", stdout);
-                fputs("\"", stdout);
-                Narsese_PrintTerm(&left_right);
-                fputs("\", ", stdout);
-                fputs("\"", stdout);
-                Narsese_PrintTerm(&right_left);
-                fputs("\", ", stdout);
-                fputs("\"", stdout);
-                Narsese_PrintTerm(&right_right);
-                fputs("\"", stdout);
-                puts("]}");
-                if(c->belief.type != EVENT_TYPE_DELETED)
+                Shell_PrintConcept(c, concepts.items[i].priority);
+            }
+            puts("//*done");
+        }
+        else
+        if(!strncmp("*concepts_since ", line, strlen("*concepts_since ")))
+        {
+            long since = 0;
+            sscanf(&line[strlen("*concepts_since ")], "%ld", &since);
+            printf("//*concepts_since %ld currentTime=%ld\n", since, currentTime);
+            for(int i=0; i<concepts.itemsAmount; i++)
+            {
+                Concept *c = concepts.items[i].address;
+                assert(c != NULL, "Concept is null");
+                if(Shell_ConceptChangedSince(c, since))
+                {
+                    Shell_PrintConcept(c, concepts.items[i].priority);
+                }
+            }
+            puts("//*done");
+        }
+        else
+        if(!strncmp("*concepts_for ", line, strlen("*concepts_for ")))
+        {
+            //concepts sharing an atom with the query, by the inverted atom index, highest priority first
+            static Concept *matches[CONCEPTS_MAX];
+            static bool matched[CONCEPTS_MAX];
+            int matchesAmount = 0;
+            int limit = CONCEPTS_MAX;
+            char *token = strtok(&line[strlen("*concepts_for ")], " ");
+            while(token != NULL)
+            {
+                char *next = strtok(NULL, " ");
+                if(next == NULL && strspn(token, "0123456789") == strlen(token)) //trailing number is the limit
                 {
-                    Memory_printAddedEvent(&c->belief.stamp, &c->belief, 1, true, false, false, false, false);
+                    sscanf(token, "%d", &limit);
+                    break;
                 }
-                for(int opi=0; opi<OPERATIONS_MAX; opi++)
+                Atom atom = Narsese_FindAtom(token);
+                if(atom && Narsese_IsSimpleAtom(atom))
                 {
-                    for(int h=0; h<c->precondition_beliefs[opi].itemsAmount; h++)
+                    for(ConceptChainElement *elem = InvertedAtomIndex_GetConceptChain(atom); elem != NULL; elem = elem->next)
                     {
-                        Implication *imp = &c->precondition_beliefs[opi].array[h];
-                        Memory_printAddedImplication(&imp->stamp, &imp->term, &imp->truth, imp->occurrenceTimeOffset, 1, true, false, false);
+                        int index = elem->c - concept_storage;
+                        if(!matched[index])
+                        {
+                            matched[index] = true;
+                            matches[matchesAmount++] = elem->c;
+                        }
                     }
                 }
-                for(int h=0; h<c->implication_links.itemsAmount; h++)
+                token = next;
+            }
+            qsort(matches, matchesAmount, sizeof(Concept*), Shell_ConceptPriorityDescending);
+            puts("//*concepts_for");
+            for(int i=0; i<matchesAmount; i++)
+            {
+                if(i < limit)
                 {
-                    Implication *imp = &c->implication_links.array[h];
-                    Memory_printAddedImplication(&imp->stamp, &imp->term, &imp->truth, imp->occurrenceTimeOffset, 1, true, false, false);
+                    Shell_PrintConcept(matches[i], Usage_usefulness(matches[i]->usage, currentTime));
                 }
+                matched[matches[i] - concept_storage] = false;
             }
             puts("//*done");
         }
@@ -438,8 +578,8 @@ void Shell_Start()
     Shell_NARInit();
     for(;;)
     {
-        char line[1024] = {0};
-        if(fgets(line, 1024, stdin) == NULL)
+        char line[SHELL_LINE_MAX] = {0};
+        if(fgets(line, SHELL_LINE_MAX, stdin) == NULL)
         {
             if(EXIT_STATS)
             {
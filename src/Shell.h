@@ -37,11 +37,14 @@
 #define SHELL_CONTINUE 0
 #define SHELL_RESET 1
 #define SHELL_EXIT 2
+//Size of the input line buffer, longer lines are split
+#define SHELL_LINE_MAX 1024
 
 //References//
 //----------//
 #include "NAR.h"
 #include "Stats.h"
+#include "Snapshot.h"
 
 //Methods//
 //-------//
@@ -0,0 +1,352 @@
+/* 
+ * The MIT License
+ *
+ * Copyright 2020 The OpenNARS authors.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy
+ * of this software and associated documentation files (the "Software"), to deal
+ * in the Software without restriction, including without limitation the rights
+ * to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+ * copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in
+ * all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+ * THE SOFTWARE.
+ */
+
+
+#include "Snapshot.h"
+
+#define SNAPSHOT_MAGIC "ONASNAP"
+#define SNAPSHOT_VERSION 1
+
+typedef struct
+{
+    char magic[8];
+    int version;
+    //configuration the snapshot depends on:
+    int concepts_max;
+    int atoms_max;
+    int atomic_term_len_max;
+    int cycling_belief_events_max;
+    int cycling_goal_events_max;
+    int cycling_goal_events_layers;
+    int operations_max;
+    int table_size;
+    int occurrence_time_index_size;
+    int concept_size;
+    int event_size;
+    int implication_size;
+} SnapshotHeader;
+
+//Queue position of the concepts by storage slot, -1 for free slots
+static int Snapshot_conceptPosition[CONCEPTS_MAX];
+//Operations with their actions and names, kept when loading
+static Operation Snapshot_operations[OPERATIONS_MAX];
+static char Snapshot_operationNames[OPERATIONS_MAX][ATOMIC_TERM_LEN_MAX];
+
+static SnapshotHeader Snapshot_Header()
+{
+    SnapshotHeader header = { .magic = SNAPSHOT_MAGIC, .version = SNAPSHOT_VERSION, .concepts_max = CONCEPTS_MAX, .atoms_max = ATOMS_MAX,
+                              .atomic_term_len_max = ATOMIC_TERM_LEN_MAX, .cycling_belief_events_max = CYCLING_BELIEF_EVENTS_MAX,
+                              .cycling_goal_events_max = CYCLING_GOAL_EVENTS_MAX, .cycling_goal_events_layers = CYCLING_GOAL_EVENTS_LAYERS,
+                              .operations_max = OPERATIONS_MAX, .table_size = TABLE_SIZE, .occurrence_time_index_size = OCCURRENCE_TIME_INDEX_SIZE,
+                              .concept_size = sizeof(Concept), .event_size = sizeof(Event), .implication_size = sizeof(Implication) };
+    return header;
+}
+
+//Concept pointer to queue position (-1 for NULL)
+static intptr_t Snapshot_PointerToPosition(void *concept)
+{
+    if(concept == NULL)
+    {
+        return -1;
+    }
+    int position = Snapshot_conceptPosition[(Concept*) concept - concept_storage];
+    //a stale reference to a free slot gets the first free position, which is marked as invalid on load
+    return position >= 0 ? position : concepts.itemsAmount;
+}
+
+static void* Snapshot_PositionToPointer(intptr_t position)
+{
+    return position < 0 || position >= CONCEPTS_MAX ? NULL : concepts.items[position].address;
+}
+
+static bool Snapshot_Write(void *source, size_t size, FILE *f)
+{
+    return fwrite(source, size, 1, f) == 1;
+}
+
+static bool Snapshot_Read(void *dest, size_t size, FILE *f)
+{
+    return fread(dest, size, 1, f) == 1;
+}
+
+static bool Snapshot_WriteTable(Table *table, FILE *f)
+{
+    bool ok = Snapshot_Write(&table->itemsAmount, sizeof(int), f);
+    for(int i=0; ok && i<table->itemsAmount; i++)
+    {
+        Implication imp = table->array[i];
+        imp.sourceConcept = (void*) Snapshot_PointerToPosition(imp.sourceConcept);
+        ok = Snapshot_Write(&imp, sizeof(Implication), f);
+    }
+    return ok;
+}
+
+static bool Snapshot_ReadTable(Table *table, FILE *f)
+{
+    bool ok = Snapshot_Read(&table->itemsAmount, sizeof(int), f) && table->itemsAmount >= 0 && table->itemsAmount <= TABLE_SIZE;
+    for(int i=0; ok && i<table->itemsAmount; i++)
+    {
+        ok = Snapshot_Read(&table->array[i], sizeof(Implication), f);
+        table->array[i].sourceConcept = Snapshot_PositionToPointer((intptr_t) table->array[i].sourceConcept);
+    }
+    return ok;
+}
+
+static bool Snapshot_WriteQueue(PriorityQueue *queue, size_t elementSize, FILE *f)
+{
+    bool ok = Snapshot_Write(&queue->itemsAmount, sizeof(int), f);
+    for(int i=0; ok && i<queue->itemsAmount; i++)
+    {
+        ok = Snapshot_Write(&queue->items[i].priority, sizeof(double), f) && (elementSize == 0 || Snapshot_Write(queue->items[i].address, elementSize, f));
+    }
+    return ok;
+}
+
+//Items are restored in queue order (which keeps the heap property), item i uses the storage element the freshly initialized queue assigned to it
+static bool Snapshot_ReadQueue(PriorityQueue *queue, size_t elementSize, FILE *f)
+{
+    bool ok = Snapshot_Read(&queue->itemsAmount, sizeof(int), f) && queue->itemsAmount >= 0 && queue->itemsAmount <= queue->maxElements;
+    for(int i=0; ok && i<queue->itemsAmount; i++)
+    {
+        ok = Snapshot_Read(&queue->items[i].priority, sizeof(double), f) && (elementSize == 0 || Snapshot_Read(queue->items[i].address, elementSize, f));
+    }
+    return ok;
+}
+
+bool Snapshot_Save(char *filename)
+{
+    FILE *f = fopen(filename, "wb");
+    if(f == NULL)
+    {
+        return false;
+    }
+    for(int i=0; i<CONCEPTS_MAX; i++)
+    {
+        Snapshot_conceptPosition[i] = -1;
+    }
+    for(int i=0; i<concepts.itemsAmount; i++)
+    {
+        Snapshot_conceptPosition[(Concept*) concepts.items[i].address - concept_storage] = i;
+    }
+    SnapshotHeader header = Snapshot_Header();
+    bool ok = Snapshot_Write(&header, sizeof(SnapshotHeader), f);
+    //global counters
+    ok = ok && Snapshot_Write(&currentTime, sizeof(long), f) && Snapshot_Write(&base, sizeof(long), f) && Snapshot_Write(&concept_id, sizeof(int), f);
+    ok = ok && Snapshot_Write(&conceptPriorityThreshold, sizeof(double), f);
+    //atoms in order of their index
+    ok = ok && Snapshot_Write(&term_index, sizeof(int), f);
+    for(int i=0; ok && i<term_index; i++)
+    {
+        ok = Snapshot_Write(Narsese_atomNames[i], ATOMIC_TERM_LEN_MAX, f) && Snapshot_Write(Narsese_atomMeasurementNames[i], ATOMIC_TERM_LEN_MAX, f) &&
+             Snapshot_Write(&Narsese_atomValues[i], sizeof(double), f) && Snapshot_Write(&Narsese_atomHasValue[i], sizeof(bool), f);
+    }
+    //concepts in queue order, only the used part of their implication tables
+    ok = ok && Snapshot_WriteQueue(&concepts, 0, f);
+    for(int i=0; ok && i<concepts.itemsAmount; i++)
+    {
+        Concept *c = concepts.items[i].address;
+        ok = Snapshot_Write(c, offsetof(Concept, precondition_beliefs), f);
+        for(int opi=0; ok && opi<=OPERATIONS_MAX; opi++)
+        {
+            ok = Snapshot_WriteTable(&c->precondition_beliefs[opi], f);
+        }
+        ok = ok && Snapshot_WriteTable(&c->implication_links, f) && Snapshot_Write(&c->priority, sizeof(double), f) && Snapshot_Write(&c->lastSelectionTime, sizeof(long), f);
+    }
+    //event queues
+    ok = ok && Snapshot_WriteQueue(&cycling_belief_events, sizeof(Event), f);
+    for(int layer=0; ok && layer<CYCLING_GOAL_EVENTS_LAYERS; layer++)
+    {
+        ok = Snapshot_WriteQueue(&cycling_goal_events[layer], sizeof(Event), f);
+    }
+    //occurrence time index
+    ok = ok && Snapshot_Write(&occurrenceTimeIndex.itemsAmount, sizeof(int), f) && Snapshot_Write(&occurrenceTimeIndex.currentIndex, sizeof(int), f);
+    for(int i=0; ok && i<OCCURRENCE_TIME_INDEX_SIZE; i++)
+    {
+        intptr_t position = Snapshot_PointerToPosition(occurrenceTimeIndex.array[i]);
+        ok = Snapshot_Write(&position, sizeof(intptr_t), f);
+    }
+    //inverted atom index chains in their order, terminated by atom 0
+    for(int atom=1; ok && atom<ATOMS_MAX; atom++)
+    {
+        int amount = 0;
+        for(ConceptChainElement *elem = invertedAtomIndex[atom]; elem != NULL; elem = elem->next)
+        {
+            amount++;
+        }
+        if(amount > 0)
+        {
+            ok = Snapshot_Write(&atom, sizeof(int), f) && Snapshot_Write(&amount, sizeof(int), f);
+            for(ConceptChainElement *elem = invertedAtomIndex[atom]; ok && elem != NULL; elem = elem->next)
+            {
+                intptr_t position = Snapshot_PointerToPosition(elem->c);
+                ok = Snapshot_Write(&position, sizeof(intptr_t), f);
+            }
+        }
+    }
+    int end = 0;
+    ok = ok && Snapshot_Write(&end, sizeof(int), f);
+    //operations without their actions
+    for(int i=0; ok && i<OPERATIONS_MAX; i++)
+    {
+        Operation op = operations[i];
+        op.action = NULL;
+        ok = Snapshot_Write(&op, sizeof(Operation), f);
+    }
+    return fclose(f) == 0 && ok;
+}
+
+static bool Snapshot_LoadContent(FILE *f)
+{
+    bool ok = Snapshot_Read(&currentTime, sizeof(long), f) && Snapshot_Read(&base, sizeof(long), f) && Snapshot_Read(&concept_id, sizeof(int), f);
+    ok = ok && Snapshot_Read(&conceptPriorityThreshold, sizeof(double), f);
+    //atoms need to get the same index as when saved
+    int atoms = 0;
+    ok = ok && Snapshot_Read(&atoms, sizeof(int), f) && atoms >= 0 && atoms <= ATOMS_MAX;
+    for(int i=0; ok && i<atoms; i++)
+    {
+        char name[ATOMIC_TERM_LEN_MAX] = {0};
+        ok = Snapshot_Read(name, ATOMIC_TERM_LEN_MAX, f) && Snapshot_Read(Narsese_atomMeasurementNames[i], ATOMIC_TERM_LEN_MAX, f) &&
+             Snapshot_Read(&Narsese_atomValues[i], sizeof(double), f) && Snapshot_Read(&Narsese_atomHasValue[i], sizeof(bool), f);
+        name[ATOMIC_TERM_LEN_MAX-1] = 0;
+        ok = ok && Narsese_AtomicTermIndex(name) == i+1;
+    }
+    //concepts
+    ok = ok && Snapshot_ReadQueue(&concepts, 0, f);
+    for(int i=0; ok && i<concepts.itemsAmount; i++)
+    {
+        Concept *c = concepts.items[i].address;
+        ok = Snapshot_Read(c, offsetof(Concept, precondition_beliefs), f);
+        for(int opi=0; ok && opi<=OPERATIONS_MAX; opi++)
+        {
+            ok = Snapshot_ReadTable(&c->precondition_beliefs[opi], f);
+        }
+        ok = ok && Snapshot_ReadTable(&c->implication_links, f) && Snapshot_Read(&c->priority, sizeof(double), f) && Snapshot_Read(&c->lastSelectionTime, sizeof(long), f);
+        ok = ok && HashTable_Get(&HTconcepts, &c->term) == NULL;
+        if(ok)
+        {
+            HashTable_Set(&HTconcepts, &c->term, c);
+        }
+    }
+    //free slots can only be referenced by outdated implications
+    for(int i=concepts.itemsAmount; ok && i<CONCEPTS_MAX; i++)
+    {
+        ((Concept*) concepts.items[i].address)->id = -1;
+    }
+    //event queues
+    ok = ok && Snapshot_ReadQueue(&cycling_belief_events, sizeof(Event), f);
+    for(int layer=0; ok && layer<CYCLING_GOAL_EVENTS_LAYERS; layer++)
+    {
+        ok = Snapshot_ReadQueue(&cycling_goal_events[layer], sizeof(Event), f);
+    }
+    //occurrence time index
+    ok = ok && Snapshot_Read(&occurrenceTimeIndex.itemsAmount, sizeof(int), f) && Snapshot_Read(&occurrenceTimeIndex.currentIndex, sizeof(int), f);
+    for(int i=0; ok && i<OCCURRENCE_TIME_INDEX_SIZE; i++)
+    {
+        intptr_t position = -1;
+        ok = Snapshot_Read(&position, sizeof(intptr_t), f);
+        occurrenceTimeIndex.array[i] = Snapshot_PositionToPointer(position);
+    }
+    //inverted atom index, chains are rebuilt in the saved order
+    int atom = 0;
+    while(ok && Snapshot_Read(&atom, sizeof(int), f) && atom != 0)
+    {
+        int amount = 0;
+        ok = atom > 0 && atom < ATOMS_MAX && Snapshot_Read(&amount, sizeof(int), f);
+        ConceptChainElement *previous = NULL;
+        for(int i=0; ok && i<amount; i++)
+        {
+            intptr_t position = -1;
+            ok = Snapshot_Read(&position, sizeof(intptr_t), f) && conceptChainElementStack.stackpointer > 0;
+            if(ok)
+            {
+                ConceptChainElement *elem = Stack_Pop(&conceptChainElementStack);
+                *elem = (ConceptChainElement) { .c = Snapshot_PositionToPointer(position) };
+                if(previous == NULL)
+                {
+                    invertedAtomIndex[atom] = elem;
+                }
+                else
+                {
+                    previous->next = elem;
+                }
+                previous = elem;
+            }
+        }
+    }
+    ok = ok && atom == 0;
+    //operations, with the actions registered in this process
+    for(int i=0; ok && i<OPERATIONS_MAX; i++)
+    {
+        ok = Snapshot_Read(&operations[i], sizeof(Operation), f);
+        operations[i].action = Snapshot_operations[i].action;
+    }
+    return ok;
+}
+
+bool Snapshot_Load(char *filename)
+{
+    FILE *f = fopen(filename, "rb");
+    if(f == NULL)
+    {
+        return false;
+    }
+    SnapshotHeader expected = Snapshot_Header();
+    SnapshotHeader header = {0};
+    if(!Snapshot_Read(&header, sizeof(SnapshotHeader), f) || memcmp(&header, &expected, sizeof(SnapshotHeader)))
+    {
+        fclose(f);
+        return false;
+    }
+    //reset the memory, keeping operations and parameters
+    memcpy(Snapshot_operations, operations, sizeof(operations));
+    for(int i=0; i<OPERATIONS_MAX; i++)
+    {
+        if(operations[i].term.atoms[0])
+        {
+            strncpy(Snapshot_operationNames[i], Narsese_atomNames[operations[i].term.atoms[0]-1], ATOMIC_TERM_LEN_MAX-1);
+        }
+    }
+    bool restrictedConceptCreation = RESTRICTED_CONCEPT_CREATION;
+    Memory_INIT();
+    Event_INIT();
+    Narsese_INIT();
+    Cycle_INIT();
+    RESTRICTED_CONCEPT_CREATION = restrictedConceptCreation;
+    bool ok = Snapshot_LoadContent(f);
+    fclose(f);
+    if(!ok)
+    {
+        //start over with an empty memory and the operations registered before
+        NAR_INIT();
+        RESTRICTED_CONCEPT_CREATION = restrictedConceptCreation;
+        for(int i=0; i<OPERATIONS_MAX; i++)
+        {
+            if(Snapshot_operations[i].action != NULL && Snapshot_operations[i].term.atoms[0])
+            {
+                NAR_AddOperation(Snapshot_operationNames[i], Snapshot_operations[i].action);
+            }
+        }
+    }
+    return ok;
+}
@@ -0,0 +1,54 @@
+/* 
+ * The MIT License
+ *
+ * Copyright 2020 The OpenNARS authors.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy
+ * of this software and associated documentation files (the "Software"), to deal
+ * in the Software without restriction, including without limitation the rights
+ * to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+ * copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in
+ * all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+ * THE SOFTWARE.
+ */
+
+
+#ifndef H_SNAPSHOT
+#define H_SNAPSHOT
+
+////////////////////////
+// Memory snapshots   //
+////////////////////////
+//Saves and restores the concept store, the atom table, the event queues and the indices
+//as a binary image, so that a reasoner can be warm-started with exactly the saved state.
+//Pointers are stored as queue positions, and the snapshot is only compatible with
+//a build of the same configuration (Config.h), which is checked when loading.
+
+//References//
+//----------//
+#include <stdio.h>
+#include <stdint.h>
+#include <stddef.h>
+#include <string.h>
+#include "NAR.h"
+
+//Methods//
+//-------//
+//Save the memory to a snapshot file, returns whether successful
+bool Snapshot_Save(char *filename);
+//Replace the memory with the content of a snapshot file, returns whether successful
+//Registered operation actions and parameters are kept, the memory is unchanged if the file is
+//no snapshot of this configuration, and empty if it is one but could not be read completely
+bool Snapshot_Load(char *filename);
+
+#endif
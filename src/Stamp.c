@@ -143,7 +143,13 @@ bool Stamp_Equal(Stamp *a, Stamp *b)
 
 void Stamp_print(Stamp *stamp)
 {
-    fputs("Stamp=[", stdout);
+    fputs("Stamp=", stdout);
+    Stamp_printJSON(stamp);
+}
+
+void Stamp_printJSON(Stamp *stamp)
+{
+    fputs("[", stdout);
     for(int i=0; i<STAMP_SIZE; i++)
     {
         if(stamp->evidentialBase[i] == STAMP_FREE)
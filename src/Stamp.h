@@ -62,5 +62,7 @@ bool Stamp_Equal(Stamp *a, Stamp *b);
 bool Stamp_hasDuplicate(Stamp *a);
 //print stamp
 void Stamp_print(Stamp *stamp);
+//print stamp as JSON array
+void Stamp_printJSON(Stamp *stamp);
 
 #endif
@@ -65,10 +65,26 @@ void Stats_Print(long currentTime)
         }
     }
     Stats_averageConceptUsefulness /= (double) CONCEPTS_MAX;
+    int goal_events_cnt = 0;
+    for(int layer=0; layer<CYCLING_GOAL_EVENTS_LAYERS; layer++)
+    {
+        goal_events_cnt += cycling_goal_events[layer].itemsAmount;
+    }
+    long countConceptsMatchedAverage = Stats_countConceptsMatchedTotal / currentTime;
+    if(PRINT_JSONL)
+    {
+        //keys as NAR.py GetStats derives them from the text lines
+        printf("{\"type\": \"stats\", \"countConceptsMatchedTotal\": %ld, \"countConceptsMatchedMax\": %ld, \"countConceptsMatchedAverage\": %ld, ", Stats_countConceptsMatchedTotal, Stats_countConceptsMatchedMax, countConceptsMatchedAverage);
+        printf("\"currentTime\": %ld, \"total_concepts\": %d, \"DeclarativeImplicationTableMaxItems\": %d, \"TemporalImplicationTableMaxItems\": %d, ", currentTime, concepts.itemsAmount, max_declarative_implication_table_items, max_temporal_implication_table_items);
+        printf("\"current_average_concept_priority\": %f, \"current_average_concept_usefulness\": %f, \"current_belief_events_cnt\": %d, \"current_goal_events_cnt\": %d, ", Stats_averageConceptPriority, Stats_averageConceptUsefulness, cycling_belief_events.itemsAmount, goal_events_cnt);
+        printf("\"current_average_belief_event_priority\": %f, \"current_average_goal_event_priority\": %f, ", Stats_averageBeliefEventPriority, Stats_averageGoalEventPriority);
+        printf("\"Maximum_chain_length_in_concept_hashtable\": %d, \"Maximum_chain_length_in_atoms_hashtable\": %d}\n", HashTable_MaximumChainLength(&HTconcepts), HashTable_MaximumChainLength(&HTatoms));
+        fflush(stdout);
+        return;
+    }
     puts("Statistics\n----------");
     printf("countConceptsMatchedTotal:\t%ld\n", Stats_countConceptsMatchedTotal);
     printf("countConceptsMatchedMax:\t%ld\n", Stats_countConceptsMatchedMax);
-    long countConceptsMatchedAverage = Stats_countConceptsMatchedTotal / currentTime;
     printf("countConceptsMatchedAverage:\t%ld\n", countConceptsMatchedAverage);
     printf("currentTime:\t\t\t%ld\n", currentTime);
     printf("total concepts:\t\t\t%d\n", concepts.itemsAmount);
@@ -77,11 +93,6 @@ void Stats_Print(long currentTime)
     printf("current average concept priority:\t%f\n", Stats_averageConceptPriority);
     printf("current average concept usefulness:\t%f\n", Stats_averageConceptUsefulness);
     printf("current belief events cnt:\t\t%d\n", cycling_belief_events.itemsAmount);
-    int goal_events_cnt = 0;
-    for(int layer=0; layer<CYCLING_GOAL_EVENTS_LAYERS; layer++)
-    {
-        goal_events_cnt += cycling_goal_events[layer].itemsAmount;
-    }
     printf("current goal events cnt:\t\t%d\n", goal_events_cnt);
     printf("current average belief event priority:\t%f\n", Stats_averageBeliefEventPriority);
     printf("current average goal event priority:\t%f\n", Stats_averageGoalEventPriority);
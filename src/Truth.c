@@ -120,6 +120,11 @@ void Truth_Print2(Truth *truth)
     printf("{%f %f}\n", truth->frequency, truth->confidence);
 }
 
+void Truth_PrintJSON(Truth *truth)
+{
+    printf("{\"frequency\": %f, \"confidence\": %f}", truth->frequency, truth->confidence);
+}
+
 //not part of MSC:
 
 Truth Truth_Exemplification(Truth v1, Truth v2)
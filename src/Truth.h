@@ -67,6 +67,7 @@ Truth Truth_Eternalize(Truth v);
 Truth Truth_Projection(Truth v, long originalTime, long targetTime);
 void Truth_Print(Truth *truth);
 void Truth_Print2(Truth *truth);
+void Truth_PrintJSON(Truth *truth);
 Truth Truth_GoalDeduction(Truth v1, Truth v2);
 //not part of sensorimotor inference:
 Truth Truth_Abduction(Truth v1, Truth v2);
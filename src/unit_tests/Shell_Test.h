@@ -0,0 +1,160 @@
+/*
+ * The MIT License
+ *
+ * Copyright 2020 The OpenNARS authors.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy
+ * of this software and associated documentation files (the "Software"), to deal
+ * in the Software without restriction, including without limitation the rights
+ * to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+ * copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in
+ * all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+ * THE SOFTWARE.
+ */
+
+#include "./../Shell.h"
+#include <unistd.h>
+
+//Output of the last shell command run by Shell_Test_Run
+static char Shell_Test_output[100000];
+
+//Runs a shell input line with its output captured in Shell_Test_output
+static void Shell_Test_Run(char *input)
+{
+    char line[SHELL_LINE_MAX] = {0};
+    strncpy(line, input, sizeof(line)-1);
+    fflush(stdout);
+    int saved = dup(STDOUT_FILENO);
+    FILE *f = tmpfile();
+    assert(saved >= 0 && f != NULL, "Shell test: output can't be captured");
+    dup2(fileno(f), STDOUT_FILENO);
+    Shell_ProcessInput(line);
+    fflush(stdout);
+    dup2(saved, STDOUT_FILENO);
+    close(saved);
+    rewind(f);
+    size_t length = fread(Shell_Test_output, 1, sizeof(Shell_Test_output)-1, f);
+    Shell_Test_output[length] = 0;
+    fclose(f);
+}
+
+//Whether the concept of the term was printed by the last shell command
+static bool Shell_Test_Printed(char *term)
+{
+    char header[256] = {0};
+    snprintf(header, sizeof(header), "//%s: {", term);
+    return strstr(Shell_Test_output, header) != NULL;
+}
+
+void Shell_ConceptsSince_Test()
+{
+    puts(">>Shell concepts_since test start");
+    Shell_NARInit();
+    Shell_Test_Run("<a --> b>.");
+    Shell_Test_Run("<x --> y>.");
+    Shell_Test_Run("<(u &/ ^left) =/> w>.");
+    Shell_Test_Run("10");
+    long since = currentTime;
+    Shell_Test_Run("*concepts_since 0");
+    assert(Shell_Test_Printed("<a --> b>") && Shell_Test_Printed("<x --> y>") && Shell_Test_Printed("w"), "Shell concepts_since test: concepts since the start missing");
+    //revised belief, revised implication and newly created concept
+    Shell_Test_Run("<a --> b>. {0.0 0.9}");
+    Shell_Test_Run("<(u &/ ^left) =/> w>. {0.0 0.9}");
+    Shell_Test_Run("<c --> d>.");
+    char command[64] = {0};
+    snprintf(command, sizeof(command), "*concepts_since %ld", since);
+    Shell_Test_Run(command);
+    char expected_header[64] = {0};
+    snprintf(expected_header, sizeof(expected_header), "//*concepts_since %ld currentTime=%ld\n", since, currentTime);
+    assert(!strncmp(Shell_Test_output, expected_header, strlen(expected_header)), "Shell concepts_since test: header missing");
+    assert(Shell_Test_Printed("<a --> b>"), "Shell concepts_since test: revised belief missing");
+    assert(Shell_Test_Printed("w"), "Shell concepts_since test: revised implication missing");
+    assert(Shell_Test_Printed("<c --> d>"), "Shell concepts_since test: new concept missing");
+    assert(!Shell_Test_Printed("<x --> y>"), "Shell concepts_since test: unchanged concept printed");
+    assert(strstr(Shell_Test_output, "//*done") != NULL, "Shell concepts_since test: end missing");
+    //nothing changed since now
+    Shell_Test_Run("*concepts_since 1000");
+    assert(strstr(Shell_Test_output, ": {") == NULL, "Shell concepts_since test: concepts changed in the future");
+    puts("<<Shell concepts_since test successful");
+}
+
+//Number of concepts printed by the last shell command, with their priorities in printed order
+static int Shell_Test_Priorities(double *priorities, int max)
+{
+    int amount = 0;
+    for(char *p = strstr(Shell_Test_output, "\"priority\": "); p != NULL; p = strstr(p+1, "\"priority\": "))
+    {
+        if(amount < max)
+        {
+            sscanf(p + strlen("\"priority\": "), "%lf", &priorities[amount]);
+        }
+        amount++;
+    }
+    return amount;
+}
+
+void Shell_ConceptsFor_Test()
+{
+    puts(">>Shell concepts_for test start");
+    Shell_NARInit();
+    Shell_Test_Run("<cat --> animal>.");
+    Shell_Test_Run("<dog --> animal>.");
+    Shell_Test_Run("<bird --> animal>.");
+    Shell_Test_Run("<cat --> pet>.");
+    Shell_Test_Run("<sky --> blue>.");
+    Shell_Test_Run("5");
+    //atoms are found without being added
+    int atoms = term_index;
+    assert(Narsese_FindAtom("cat") == Narsese_AtomicTermIndex("cat") && Narsese_FindAtom("cat") != 0, "Shell concepts_for test: known atom not found");
+    assert(Narsese_FindAtom("unicorn") == 0 && term_index == atoms, "Shell concepts_for test: unknown atom found or added");
+    Shell_Test_Run("*concepts_for unicorn");
+    assert(term_index == atoms, "Shell concepts_for test: query added an atom");
+    assert(!strncmp(Shell_Test_output, "//*concepts_for\n//*done", strlen("//*concepts_for\n//*done")), "Shell concepts_for test: concepts of an unknown atom printed");
+    //all concepts sharing an atom with the query
+    Shell_Test_Run("*concepts_for unicorn cat");
+    assert(Shell_Test_Printed("<cat --> animal>") && Shell_Test_Printed("<cat --> pet>"), "Shell concepts_for test: concept of the atom missing");
+    assert(!Shell_Test_Printed("<dog --> animal>") && !Shell_Test_Printed("<sky --> blue>"), "Shell concepts_for test: concept without the atom printed");
+    //concepts of several atoms are printed once, highest priority first
+    double priorities[CONCEPTS_MAX];
+    Shell_Test_Run("*concepts_for animal cat");
+    int amount = Shell_Test_Priorities(priorities, CONCEPTS_MAX);
+    assert(amount >= 4 && Shell_Test_Printed("<cat --> pet>") && Shell_Test_Printed("<bird --> animal>"), "Shell concepts_for test: concepts of the atoms missing");
+    assert(strstr(strstr(Shell_Test_output, "//<cat --> animal>: {") + 1, "//<cat --> animal>: {") == NULL, "Shell concepts_for test: concept printed twice");
+    for(int i=1; i<amount; i++)
+    {
+        assert(priorities[i-1] >= priorities[i], "Shell concepts_for test: concepts not ordered by priority");
+    }
+    double highest = priorities[0];
+    //a trailing number is the limit, other numbers are atoms
+    Shell_Test_Run("*concepts_for animal cat 2");
+    assert(Shell_Test_Priorities(priorities, CONCEPTS_MAX) == 2 && priorities[0] == highest, "Shell concepts_for test: limit not applied to the highest priority concepts");
+    Shell_Test_Run("*concepts_for 2 cat");
+    assert(Shell_Test_Printed("<cat --> animal>") && Shell_Test_Printed("<cat --> pet>"), "Shell concepts_for test: leading number used as limit");
+    //a query filling the line buffer, with unknown and overlong atoms
+    char query[SHELL_LINE_MAX] = "*concepts_for";
+    for(int i=0; strlen(query) < SHELL_LINE_MAX - 100; i++)
+    {
+        sprintf(&query[strlen(query)], " unknown%d", i);
+    }
+    strcat(query, " aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa");
+    while(strlen(query) < SHELL_LINE_MAX - 8)
+    {
+        strcat(query, strlen(query) == SHELL_LINE_MAX - 9 ? "y" : " x");
+    }
+    strcat(query, " cat 1");
+    assert(strlen(query) == SHELL_LINE_MAX - 2, "Shell concepts_for test: query does not fill the line buffer");
+    Shell_Test_Run(query);
+    assert(term_index == atoms && Shell_Test_Priorities(priorities, CONCEPTS_MAX) == 1, "Shell concepts_for test: query filling the line buffer not handled");
+    assert(Shell_Test_Printed("<cat --> animal>") || Shell_Test_Printed("<cat --> pet>"), "Shell concepts_for test: concept of the last atom missing");
+    puts("<<Shell concepts_for test successful");
+}
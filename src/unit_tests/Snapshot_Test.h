@@ -0,0 +1,158 @@
+/*
+ * The MIT License
+ *
+ * Copyright 2020 The OpenNARS authors.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy
+ * of this software and associated documentation files (the "Software"), to deal
+ * in the Software without restriction, including without limitation the rights
+ * to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+ * copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in
+ * all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+ * THE SOFTWARE.
+ */
+
+#include "./../Snapshot.h"
+
+#define SNAPSHOT_TEST_FILE "Snapshot_Test.snapshot"
+#define SNAPSHOT_TEST_BROKEN_FILE "Snapshot_Test_broken.snapshot"
+#define SNAPSHOT_TEST_CONCEPTS 64
+
+//The parts of a concept which need to survive a round trip
+typedef struct
+{
+    Term term;
+    Truth belief;
+    int preconditionBeliefs[OPERATIONS_MAX+1];
+    int implicationLinks;
+    double priority;
+} SnapshotTestConcept;
+
+static SnapshotTestConcept Snapshot_Test_concepts[SNAPSHOT_TEST_CONCEPTS];
+static bool Snapshot_Test_Op_executed = false;
+
+Feedback Snapshot_Test_Op()
+{
+    Snapshot_Test_Op_executed = true;
+    return (Feedback) {0};
+}
+
+static int Snapshot_Test_Remember()
+{
+    assert(concepts.itemsAmount <= SNAPSHOT_TEST_CONCEPTS, "Snapshot test: too many concepts to remember");
+    for(int i=0; i<concepts.itemsAmount; i++)
+    {
+        Concept *c = concepts.items[i].address;
+        Snapshot_Test_concepts[i] = (SnapshotTestConcept) { .term = c->term, .belief = c->belief.truth, .implicationLinks = c->implication_links.itemsAmount, .priority = concepts.items[i].priority };
+        for(int opi=0; opi<=OPERATIONS_MAX; opi++)
+        {
+            Snapshot_Test_concepts[i].preconditionBeliefs[opi] = c->precondition_beliefs[opi].itemsAmount;
+        }
+    }
+    return concepts.itemsAmount;
+}
+
+//Writes the saved snapshot to the broken snapshot file, cut by cut bytes, with the int at offset replaced by value if offset is not negative
+static void Snapshot_Test_WriteBroken(long cut, long offset, int value)
+{
+    FILE *f = fopen(SNAPSHOT_TEST_FILE, "rb");
+    assert(f != NULL, "Snapshot test: saved snapshot missing");
+    fseek(f, 0, SEEK_END);
+    long size = ftell(f);
+    fseek(f, 0, SEEK_SET);
+    char *content = malloc(size);
+    assert(content != NULL && fread(content, size, 1, f) == 1, "Snapshot test: saved snapshot unreadable");
+    fclose(f);
+    if(offset >= 0)
+    {
+        memcpy(&content[offset], &value, sizeof(int));
+    }
+    f = fopen(SNAPSHOT_TEST_BROKEN_FILE, "wb");
+    assert(f != NULL && fwrite(content, size - cut, 1, f) == 1, "Snapshot test: broken snapshot not written");
+    fclose(f);
+    free(content);
+}
+
+void Snapshot_Test()
+{
+    puts(">>Snapshot test start");
+    NAR_INIT();
+    NAR_AddOperation("^op", Snapshot_Test_Op);
+    NAR_AddInputNarsese("<a --> b>.");
+    NAR_AddInputNarsese("<b --> c>.");
+    NAR_AddInputNarsese("<(x &/ ^op) =/> y>.");
+    NAR_Cycles(10);
+    long savedTime = currentTime;
+    int amount = Snapshot_Test_Remember();
+    assert(amount > 0, "Snapshot test: no concepts to save");
+    assert(Snapshot_Save(SNAPSHOT_TEST_FILE), "Snapshot test: saving failed");
+    //round trip: reset, register the operation again and load
+    NAR_INIT();
+    assert(concepts.itemsAmount == 0, "Snapshot test: memory not reset");
+    NAR_AddOperation("^op", Snapshot_Test_Op);
+    assert(Snapshot_Load(SNAPSHOT_TEST_FILE), "Snapshot test: loading failed");
+    assert(currentTime == savedTime, "Snapshot test: time not restored");
+    assert(concepts.itemsAmount == amount, "Snapshot test: concept amount not restored");
+    for(int i=0; i<amount; i++)
+    {
+        Concept *c = concepts.items[i].address;
+        SnapshotTestConcept *expected = &Snapshot_Test_concepts[i];
+        assert(Term_Equal(&c->term, &expected->term), "Snapshot test: concept order not restored");
+        assert(Memory_FindConceptByTerm(&expected->term) == c, "Snapshot test: concept not found by its term");
+        assert(concepts.items[i].priority == expected->priority, "Snapshot test: concept priority not restored");
+        assert(c->belief.truth.frequency == expected->belief.frequency && c->belief.truth.confidence == expected->belief.confidence, "Snapshot test: belief not restored");
+        assert(c->implication_links.itemsAmount == expected->implicationLinks, "Snapshot test: implication links not restored");
+        for(int opi=0; opi<=OPERATIONS_MAX; opi++)
+        {
+            assert(c->precondition_beliefs[opi].itemsAmount == expected->preconditionBeliefs[opi], "Snapshot test: precondition beliefs not restored");
+            for(int j=0; j<c->precondition_beliefs[opi].itemsAmount; j++)
+            {
+                Concept *source = c->precondition_beliefs[opi].array[j].sourceConcept;
+                assert(source == NULL || source->id == -1 || Memory_FindConceptByTerm(&source->term) == source, "Snapshot test: source concept of implication not restored");
+            }
+        }
+    }
+    Term ab = Narsese_Term("<a --> b>");
+    Term ac = Narsese_Term("<a --> c>");
+    assert(Memory_FindConceptByTerm(&ab) != NULL && Memory_FindConceptByTerm(&ac) != NULL, "Snapshot test: saved and derived concepts missing");
+    //continued inference uses the loaded implication and the operation registered in this process
+    Snapshot_Test_Op_executed = false;
+    NAR_AddInputBelief(Narsese_AtomicTerm("x"));
+    NAR_AddInputGoal(Narsese_AtomicTerm("y"));
+    assert(Snapshot_Test_Op_executed, "Snapshot test: loaded implication was not used to execute the operation");
+    Term cd = Narsese_Term("<c --> d>");
+    NAR_AddInputNarsese("<c --> d>.");
+    NAR_Cycles(10);
+    assert(Memory_FindConceptByTerm(&cd) != NULL && concepts.itemsAmount > amount, "Snapshot test: no inference after loading");
+    //a snapshot with a wrong magic value or of another configuration is rejected, leaving the memory unchanged
+    amount = concepts.itemsAmount;
+    Snapshot_Test_WriteBroken(0, 0, 0);
+    assert(!Snapshot_Load(SNAPSHOT_TEST_BROKEN_FILE), "Snapshot test: wrong magic value accepted");
+    assert(concepts.itemsAmount == amount && Memory_FindConceptByTerm(&cd) != NULL, "Snapshot test: memory changed by wrong magic value");
+    Snapshot_Test_WriteBroken(0, 8 + sizeof(int), CONCEPTS_MAX + 1); //concepts_max after magic and version
+    assert(!Snapshot_Load(SNAPSHOT_TEST_BROKEN_FILE), "Snapshot test: snapshot of another configuration accepted");
+    assert(concepts.itemsAmount == amount && Memory_FindConceptByTerm(&cd) != NULL, "Snapshot test: memory changed by configuration mismatch");
+    //a truncated snapshot is rejected, leaving an empty memory with the operations registered before
+    Snapshot_Test_WriteBroken(1, -1, 0);
+    assert(!Snapshot_Load(SNAPSHOT_TEST_BROKEN_FILE), "Snapshot test: truncated snapshot accepted");
+    assert(concepts.itemsAmount == 0 && Memory_FindConceptByTerm(&ab) == NULL, "Snapshot test: memory not emptied by truncated snapshot");
+    Snapshot_Test_Op_executed = false;
+    NAR_AddInputNarsese("<(x &/ ^op) =/> y>.");
+    NAR_AddInputBelief(Narsese_AtomicTerm("x"));
+    NAR_AddInputGoal(Narsese_AtomicTerm("y"));
+    assert(Snapshot_Test_Op_executed, "Snapshot test: operation not registered after truncated snapshot");
+    assert(!Snapshot_Load("Snapshot_Test_missing.snapshot"), "Snapshot test: missing file accepted");
+    remove(SNAPSHOT_TEST_FILE);
+    remove(SNAPSHOT_TEST_BROKEN_FILE);
+    puts("<<Snapshot test successful");
+}
@@ -33,6 +33,8 @@
 #include "Table_Test.h"
 #include "HashTable_Test.h"
 #include "UDP_Test.h"
+#include "Snapshot_Test.h"
+#include "Shell_Test.h"
 
 void Run_Unit_Tests()
 {
@@ -47,4 +49,7 @@ void Run_Unit_Tests()
     Stack_Test();
     HashTable_Test();
     UDP_Test();
+    Snapshot_Test();
+    Shell_ConceptsSince_Test();
+    Shell_ConceptsFor_Test();
 }